@@ -0,0 +1,103 @@
+""" Benchmark of the throughput of a batch of COMBINE/OMEX archives
+
+Executes archives with FBA simulations of a synthetic model, which consists of several copies of the textbook model,
+once with one process per archive (the command-line program), and once as a batch, with a pool of worker processes
+which share a cache of models. The throughput of each is reported.
+
+Usage::
+
+    python benchmarks/batch_throughput.py [number of copies of the textbook model] [number of archives] [number of workers]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.batch import BatchItem, exec_batch
+from biosimulators_utils.combine import data_model as combine_data_model
+from biosimulators_utils.combine.io import CombineArchiveWriter
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.sedml.io import SedmlSimulationWriter
+from loopless_fva import build_synthetic_model, MODEL_FILENAME
+import cobra.io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+
+
+def build_archive(dirname, name, model_filename, reaction_id):
+    """ Build an archive with an FBA simulation of a model """
+    archive_dirname = os.path.join(dirname, name)
+    os.mkdir(archive_dirname)
+    shutil.copyfile(model_filename, os.path.join(archive_dirname, 'model.xml'))
+
+    doc = sedml_data_model.SedDocument()
+    doc.models.append(sedml_data_model.Model(id='model', source='model.xml',
+                                             language=sedml_data_model.ModelLanguage.SBML.value))
+    doc.simulations.append(sedml_data_model.SteadyStateSimulation(
+        id='sim', algorithm=sedml_data_model.Algorithm(kisao_id='KISAO_0000437')))
+    doc.tasks.append(sedml_data_model.Task(id='task', model=doc.models[0], simulation=doc.simulations[0]))
+    doc.data_generators.append(sedml_data_model.DataGenerator(
+        id='data_gen_flux',
+        variables=[sedml_data_model.Variable(
+            id='var_flux',
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@flux".format(reaction_id),
+            target_namespaces=NAMESPACES,
+            task=doc.tasks[0])],
+        math='var_flux'))
+    doc.outputs.append(sedml_data_model.Report(id='report', data_sets=[
+        sedml_data_model.DataSet(id='data_set_flux', label='flux', data_generator=doc.data_generators[0])]))
+    SedmlSimulationWriter().run(doc, os.path.join(archive_dirname, 'sim.sedml'),
+                                validate_targets_with_model_sources=False)
+
+    archive = combine_data_model.CombineArchive(contents=[
+        combine_data_model.CombineArchiveContent('model.xml', combine_data_model.CombineArchiveContentFormat.SBML.value),
+        combine_data_model.CombineArchiveContent('sim.sedml', combine_data_model.CombineArchiveContentFormat.SED_ML.value),
+    ])
+    archive_filename = os.path.join(dirname, name + '.omex')
+    CombineArchiveWriter().run(archive, archive_dirname, archive_filename)
+    return archive_filename
+
+
+def main(n_copies=4, n_archives=8, workers=2):
+    dirname = tempfile.mkdtemp()
+    try:
+        model = build_synthetic_model(cobra.io.read_sbml_model(MODEL_FILENAME), n_copies)
+        model_filename = os.path.join(dirname, 'model.xml')
+        cobra.io.write_sbml_model(model, model_filename)
+        archive_filenames = [
+            build_archive(dirname, 'archive_{}'.format(i_archive), model_filename, model.reactions[i_archive].id)
+            for i_archive in range(n_archives)]
+
+        print('{} archives of a model of {} reactions ({} CPUs)'.format(
+            n_archives, len(model.reactions), os.cpu_count()))
+
+        start = time.perf_counter()
+        for i_archive, archive_filename in enumerate(archive_filenames):
+            subprocess.run([sys.executable, '-m', 'biosimulators_cobrapy',
+                            '-i', archive_filename, '-o', os.path.join(dirname, 'out_process_{}'.format(i_archive))],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        process_throughput = n_archives / (time.perf_counter() - start)
+        print('  {:<28} {:>7.2f} archives/s'.format('one process per archive', process_throughput))
+
+        summary = exec_batch([BatchItem(archive_filename, os.path.join(dirname, 'out_batch_{}'.format(i_archive)))
+                              for i_archive, archive_filename in enumerate(archive_filenames)],
+                             workers=workers)
+        print('  {:<28} {:>7.2f} archives/s ({:.2f}x), {} of {} succeeded, model cache hit rate {:.2f}'.format(
+            'batch of {} worker(s)'.format(workers), summary['throughput'], summary['throughput'] / process_throughput,
+            summary['succeeded'], summary['archives'], summary['modelCache']['hitRate'] or 0.))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,125 @@
+""" Benchmark of the scheduling of the reactions of FVA over worker processes
+
+Compares the fixed chunking of :obj:`cobra.flux_analysis.flux_variability_analysis`, which divides the reactions
+into one contiguous chunk per process, with the dynamic scheduling of
+:obj:`biosimulators_cobrapy.variability.flux_variability_analysis`, which hands out chunks of decreasing estimated
+cost, most costly reactions first, on a synthetic model which consists of several copies of the textbook model.
+
+The time of each reaction and the overhead of handing out a chunk are measured, and the schedules are replayed
+for 1 to 32 processes by assigning each chunk to the first idle worker, which is how the queue of the pool hands
+out chunks. This shows how each strategy scales independently of the number of cores of the machine. With
+``--run``, FVA is also executed with each number of processes up to the number of cores, and the wall time and
+utilization of the workers are reported.
+
+Usage::
+
+    python benchmarks/fva_scheduling.py [number of copies of the textbook model] [--run]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import pool
+from biosimulators_cobrapy import variability
+from cobra.util.solver import fix_objective_as_constraint
+from loopless_fva import build_synthetic_model, MODEL_FILENAME
+from optlang.symbolics import Zero
+import cobra.io
+import heapq
+import os
+import sys
+import time
+
+PROCESSES = (1, 2, 4, 8, 16, 32)
+
+NUM_OVERHEAD_CHUNKS = 200
+
+
+def measure_reaction_times(model):
+    """ Measure the time of minimizing and maximizing the flux of each reaction """
+    times = []
+    with model:
+        fix_objective_as_constraint(model, fraction=1.)
+        model.objective = Zero
+        for reaction in model.reactions:
+            result = variability._analyze_variability(
+                model.solver, [(reaction.id, reaction.forward_variable.name, reaction.reverse_variable.name,
+                                ('min', 'max'))], None)
+            times.append(result[-1])
+    return times
+
+
+def measure_chunk_overhead(model):
+    """ Measure the overhead of handing out a chunk to a worker of the pool and collecting its result """
+    worker_pool = pool.get_worker_pool(2)
+    key = pool.get_problem_key('benchmark', model.solver)
+    list(worker_pool.imap_unordered(variability._analyze_variability, key, model.solver, [([], None)] * 2))
+    start = time.perf_counter()
+    list(worker_pool.imap_unordered(variability._analyze_variability, key, model.solver,
+                                    [([], None)] * NUM_OVERHEAD_CHUNKS))
+    overhead = (time.perf_counter() - start) / NUM_OVERHEAD_CHUNKS
+    pool.close_worker_pools()
+    return overhead
+
+
+def get_fixed_chunks(reactions, processes):
+    """ Divide reactions into chunks as :obj:`cobra.flux_analysis.flux_variability_analysis` does """
+    chunk_size = max(len(reactions) // processes, 1)
+    return [reactions[i_reaction:i_reaction + chunk_size] for i_reaction in range(0, len(reactions), chunk_size)]
+
+
+def simulate_schedule(chunks, times, processes, overhead):
+    """ Get the makespan of assigning each chunk, in order, to the first idle worker """
+    workers = [0.] * processes
+    for chunk in chunks:
+        heapq.heappush(workers, heapq.heappop(workers) + overhead + sum(times[i_reaction] for i_reaction in chunk))
+    return max(workers)
+
+
+def main(n_copies=8, run=False):
+    model = build_synthetic_model(cobra.io.read_sbml_model(MODEL_FILENAME), n_copies)
+    reactions = list(range(len(model.reactions)))
+
+    times = measure_reaction_times(model)
+    costs = [variability.get_variability_cost(reaction) for reaction in model.reactions]
+    overhead = measure_chunk_overhead(model)
+    serial_time = sum(times)
+    print('{} reactions: serial time {:.3f} s, slowest reaction {:.2f} ms, median reaction {:.2f} ms, '
+          'chunk overhead {:.2f} ms'.format(
+              len(reactions), serial_time, 1e3 * max(times), 1e3 * sorted(times)[len(times) // 2], 1e3 * overhead))
+
+    print()
+    print('Replayed schedules (speedup over the serial time, and efficiency):')
+    print('  {:>9}  {:>24}  {:>24}'.format('processes', 'fixed chunks (COBRApy)', 'dynamic chunks'))
+    for processes in PROCESSES:
+        results = []
+        for chunks in [get_fixed_chunks(reactions, processes),
+                       variability.get_variability_chunks(reactions, costs, processes)]:
+            makespan = simulate_schedule(chunks, times, processes, overhead)
+            speedup = serial_time / makespan
+            results.append('{:>7.2f}x {:>5.0%} {:>4} chunks'.format(speedup, speedup / processes, len(chunks)))
+        print('  {:>9}  {:>24}  {:>24}'.format(processes, *results))
+
+    if run:
+        print()
+        print('Executed FVA (wall time and utilization of the workers):')
+        for processes in PROCESSES:
+            if processes > os.cpu_count():
+                break
+            start = time.perf_counter()
+            cobra.flux_analysis.flux_variability_analysis(model, processes=processes)
+            cobra_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            solution = variability.flux_variability_analysis(model, processes=processes, model_key='benchmark',
+                                                             prepass=False)
+            duration = time.perf_counter() - start
+            print('  {:>9}  COBRApy {:>7.2f} s  dynamic {:>7.2f} s  utilization {:>5.0%}'.format(
+                processes, cobra_duration, duration, solution.attrs['scheduler']['utilization']))
+        pool.close_worker_pools()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:] if arg != '--run'], run='--run' in sys.argv[1:])
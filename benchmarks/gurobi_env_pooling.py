@@ -0,0 +1,68 @@
+""" Benchmark of the per-task overhead of setting up Gurobi with and without pooling the Gurobi environment
+
+Usage::
+
+    python benchmarks/gurobi_env_pooling.py [number of tasks]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.gurobi import is_gurobi_available, start_gurobi_env, close_gurobi_env, set_gurobi_solver
+from biosimulators_utils.licensing.gurobi import GurobiLicenseManager
+import cobra.io
+import os
+import sys
+import time
+
+MODEL_FILENAME = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'textbook.xml')
+
+
+def run_without_pooling(model, n_tasks):
+    """ Set up the Gurobi license and environment for each task, as each task did before pooling """
+    start = time.perf_counter()
+    for _ in range(n_tasks):
+        GurobiLicenseManager().is_package_available()
+        with GurobiLicenseManager():
+            task_model = model.copy()
+            task_model.solver = 'gurobi'
+            task_model.slim_optimize()
+    return (time.perf_counter() - start) / n_tasks
+
+
+def run_with_pooling(model, n_tasks):
+    """ Set up the Gurobi environment once and reuse it for each task """
+    start = time.perf_counter()
+    for _ in range(n_tasks):
+        is_gurobi_available()
+        start_gurobi_env()
+        task_model = model.copy()
+        set_gurobi_solver(task_model)
+        task_model.slim_optimize()
+    duration = (time.perf_counter() - start) / n_tasks
+    close_gurobi_env()
+    return duration
+
+
+def main(n_tasks=50):
+    if not is_gurobi_available():
+        print('Gurobi is not installed and licensed; skipping benchmark.')
+        return
+
+    # start from another solver, as each task does before its solver is set to Gurobi
+    model = cobra.io.read_sbml_model(MODEL_FILENAME)
+    model.solver = 'glpk'
+
+    without_pooling = run_without_pooling(model, n_tasks)
+    with_pooling = run_with_pooling(model, n_tasks)
+
+    print('Mean time per task ({} tasks):'.format(n_tasks))
+    print('  Without pooling: {:.2f} ms'.format(without_pooling * 1e3))
+    print('  With pooling:    {:.2f} ms'.format(with_pooling * 1e3))
+    print('  Saved:           {:.2f} ms'.format((without_pooling - with_pooling) * 1e3))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
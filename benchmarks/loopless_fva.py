@@ -0,0 +1,91 @@
+""" Benchmark of the speed and agreement of the loopless FVA methods
+
+Compares the CycleFreeFlux (``cycleFreeFlux``) and Fast-SNP (``fastSNP``) methods with the exact MILP of
+Schellenberger et al. (2011), which constrains every internal reaction, on the bundled textbook model and
+on larger synthetic models which consist of several copies of the textbook model.
+
+Usage::
+
+    python benchmarks/loopless_fva.py [largest number of copies of the textbook model]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.variability import flux_variability_analysis
+import cobra.flux_analysis
+import cobra.flux_analysis.loopless
+import cobra.io
+import numpy
+import os
+import sys
+import time
+
+MODEL_FILENAME = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'textbook.xml')
+
+FRACTION_OF_OPTIMUM = 0.9
+
+
+def build_synthetic_model(model, n_copies):
+    """ Build a model which consists of independent copies of a model, with the sum of their objectives """
+    synthetic_model = cobra.Model('{}_x{}'.format(model.id, n_copies))
+    objective = {}
+    for i_copy in range(n_copies):
+        copy = model.copy()
+        for metabolite in copy.metabolites:
+            metabolite.id = '{}_{}'.format(metabolite.id, i_copy)
+        for reaction in copy.reactions:
+            reaction.id = '{}_{}'.format(reaction.id, i_copy)
+        copy.repair()
+        synthetic_model.add_reactions([reaction.copy() for reaction in copy.reactions])
+        for reaction in model.reactions:
+            if reaction.objective_coefficient:
+                objective[synthetic_model.reactions.get_by_id('{}_{}'.format(reaction.id, i_copy))] = \
+                    reaction.objective_coefficient
+    synthetic_model.objective = objective
+    return synthetic_model
+
+
+def run_milp(model):
+    """ Execute loopless FVA with the MILP which constrains every internal reaction """
+    with model:
+        cobra.flux_analysis.loopless.add_loopless(model, method='original')
+        return cobra.flux_analysis.flux_variability_analysis(model, fraction_of_optimum=FRACTION_OF_OPTIMUM,
+                                                             processes=1)
+
+
+def run_method(model, method):
+    """ Execute loopless FVA with a method of :obj:`flux_variability_analysis` """
+    return flux_variability_analysis(model, fraction_of_optimum=FRACTION_OF_OPTIMUM, loopless=method, processes=1)
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(max_copies=2):
+    model = cobra.io.read_sbml_model(MODEL_FILENAME)
+
+    n_copies = 1
+    while n_copies <= max_copies:
+        synthetic_model = build_synthetic_model(model, n_copies) if n_copies > 1 else model
+        milp_solution, milp_duration = time_call(run_milp, synthetic_model)
+
+        print('{} copies ({} reactions):'.format(n_copies, len(synthetic_model.reactions)))
+        print('  {:<15} {:>9.2f} s'.format('MILP', milp_duration))
+        for method in ['cycleFreeFlux', 'fastSNP']:
+            solution, duration = time_call(run_method, synthetic_model, method)
+            difference = numpy.abs(solution.loc[milp_solution.index].values - milp_solution.values)
+            print('  {:<15} {:>9.2f} s  {:>6.1f}x faster  max. difference {:.3g}, {} of {} bounds differ by > 1e-6'.format(
+                method, duration, milp_duration / duration, numpy.nanmax(difference),
+                int(numpy.sum(difference > 1e-6)), difference.size))
+
+        n_copies *= 2
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,95 @@
+""" Benchmark of sharing a model among the tasks of a SED document
+
+Executes FBA, pFBA, and FVA on the same model, as three tasks of a document, with a separate model for each task
+and with a model shared through a :obj:`biosimulators_cobrapy.model_cache.ModelCache`, on a synthetic model which
+consists of several copies of the textbook model. The total time and the peak of the memory allocated by Python
+(:obj:`tracemalloc`) are reported.
+
+Usage::
+
+    python benchmarks/model_cache.py [number of copies of the textbook model]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.core import exec_sed_task
+from biosimulators_cobrapy.model_cache import ModelCache
+from biosimulators_utils.config import get_config
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from loopless_fva import build_synthetic_model, MODEL_FILENAME
+import cobra.io
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ALGORITHMS = (
+    ('FBA', 'KISAO_0000437'),
+    ('pFBA', 'KISAO_0000528'),
+    ('FVA', 'KISAO_0000526'),
+)
+
+NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+
+
+def build_tasks(model_filename, model):
+    """ Build a task and variables for each algorithm """
+    model_ = sedml_data_model.Model(source=model_filename, language=sedml_data_model.ModelLanguage.SBML.value)
+    reaction_id = model.reactions[0].id
+    tasks = []
+    for _, kisao_id in ALGORITHMS:
+        task = sedml_data_model.Task(
+            model=model_,
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(kisao_id=kisao_id)))
+        attr = 'minFlux' if kisao_id == 'KISAO_0000526' else 'flux'
+        variables = [sedml_data_model.Variable(
+            id='flux',
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@{}".format(reaction_id, attr),
+            target_namespaces=NAMESPACES,
+            task=task)]
+        tasks.append((task, variables))
+    return tasks
+
+
+def run(tasks, model_cache):
+    """ Execute the tasks, and get the total time and the peak memory """
+    config = get_config()
+    config.LOG = False
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for task, variables in tasks:
+        exec_sed_task(task, variables, config=config, model_cache=model_cache)
+    duration = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak_memory
+
+
+def main(n_copies=8):
+    model = build_synthetic_model(cobra.io.read_sbml_model(MODEL_FILENAME), n_copies)
+    fid, model_filename = tempfile.mkstemp(suffix='.xml')
+    os.close(fid)
+    try:
+        cobra.io.write_sbml_model(model, model_filename)
+        tasks = build_tasks(model_filename, model)
+
+        print('{} reactions, tasks: {}'.format(len(model.reactions), ', '.join(name for name, _ in ALGORITHMS)))
+        for name, model_cache in [('model per task', None), ('shared model', ModelCache(1))]:
+            duration, peak_memory = run(tasks, model_cache)
+            print('  {:<15} {:>7.2f} s  peak memory {:>7.1f} MB'.format(name, duration, peak_memory / 1e6))
+    finally:
+        os.remove(model_filename)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
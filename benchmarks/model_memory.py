@@ -0,0 +1,109 @@
+""" Benchmark of the memory of the models of the tasks of a SED document
+
+Executes FBA and pFBA on each of several models, model by model, as the tasks of a document, with an unbounded
+cache of models, with the look-ahead of the cache, which releases each model after its last task, and with a limit
+on the estimated resident size of the cache, on synthetic models which consist of several copies of the textbook
+model. Each configuration is executed in a separate process, and the time and the peak resident size of the process
+are reported.
+
+Usage::
+
+    python benchmarks/model_memory.py [number of models] [number of copies of the textbook model]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.core import exec_sed_task
+from biosimulators_cobrapy.model_cache import ModelCache, get_model_schedule, estimate_model_size
+from biosimulators_utils.config import get_config
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from loopless_fva import build_synthetic_model, MODEL_FILENAME
+import cobra.io
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+
+
+def build_doc(model_filenames, reaction_id):
+    """ Build a document with an FBA and a pFBA task for each model """
+    doc = sedml_data_model.SedDocument()
+    for i_model, model_filename in enumerate(model_filenames):
+        model = sedml_data_model.Model(id='model_{}'.format(i_model), source=model_filename,
+                                       language=sedml_data_model.ModelLanguage.SBML.value)
+        doc.models.append(model)
+        for kisao_id in ['KISAO_0000437', 'KISAO_0000528']:
+            task = sedml_data_model.Task(
+                id='task_{}'.format(len(doc.tasks)),
+                model=model,
+                simulation=sedml_data_model.SteadyStateSimulation(
+                    algorithm=sedml_data_model.Algorithm(kisao_id=kisao_id)))
+            variables = [sedml_data_model.Variable(
+                id='flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@flux".format(reaction_id),
+                target_namespaces=NAMESPACES,
+                task=task)]
+            doc.tasks.append(task)
+            doc.data_generators.append(sedml_data_model.DataGenerator(variables=variables))
+    return doc
+
+
+def run(doc, mode, result_queue):
+    """ Execute the tasks of a document, and get the time and the peak resident size """
+    if mode == 'unbounded':
+        model_cache = ModelCache()
+    elif mode == 'look-ahead':
+        model_cache = ModelCache(schedule=get_model_schedule(doc))
+    else:
+        model_cache = ModelCache(max_size=int(1.5 * estimate_model_size(doc.models[0].source)))
+
+    config = get_config()
+    config.LOG = False
+    start = time.perf_counter()
+    for task, data_generator in zip(doc.tasks, doc.data_generators):
+        model_cache.release_unused_models(task)
+        exec_sed_task(task, data_generator.variables, config=config, model_cache=model_cache)
+    duration = time.perf_counter() - start
+    result_queue.put((duration, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024))
+
+
+def main(n_models=3, n_copies=16):
+    dirname = tempfile.mkdtemp()
+    try:
+        model = build_synthetic_model(cobra.io.read_sbml_model(MODEL_FILENAME), n_copies)
+        model_filenames = []
+        for i_model in range(n_models):
+            model_filename = os.path.join(dirname, 'model_{}.xml'.format(i_model))
+            cobra.io.write_sbml_model(model, model_filename)
+            with open(model_filename, 'a') as file:
+                file.write('\n' * i_model)
+            model_filenames.append(model_filename)
+        doc = build_doc(model_filenames, model.reactions[0].id)
+
+        print('{} models of {} reactions ({:.0f} MB estimated resident size each), FBA and pFBA of each model'.format(
+            n_models, len(model.reactions), estimate_model_size(model_filenames[0]) / 1e6))
+        context = multiprocessing.get_context('spawn')
+        for mode in ['unbounded', 'look-ahead', 'size limit (1.5 models)']:
+            result_queue = context.Queue()
+            process = context.Process(target=run, args=(doc, mode, result_queue))
+            process.start()
+            duration, peak_resident_size = result_queue.get()
+            process.join()
+            print('  {:<23} {:>7.2f} s  peak resident size {:>7.1f} MB'.format(mode, duration, peak_resident_size / 1e6))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,125 @@
+""" Benchmark of the report formats for large scans
+
+Writes a report of a scan with many data sets (e.g., the fluxes of all reactions) and many points (e.g., the
+knockouts of a screen) in the CSV and HDF5 formats of BioSimulators-utils, and in the columnar Arrow IPC and
+Parquet formats of :obj:`biosimulators_cobrapy.reports`, and reports the time to write the report, the size of the
+file, and the time to read back the report and a single data set. For the columnar formats, the report is also
+written point by point as the points arrive, as a screen produces them.
+
+The HDF5 format of BioSimulators-utils records the ids, labels, and shapes of the data sets as attributes of the
+report, which HDF5 limits to 64 KB, so HDF5 reports of several thousand data sets fail to write.
+
+Usage::
+
+    python benchmarks/report_formats.py [number of data sets] [number of points]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import reports
+from biosimulators_utils.report.data_model import DataSetResults, ReportFormat
+from biosimulators_utils.report.io import ReportReader, ReportWriter
+from biosimulators_utils.sedml import data_model as sedml_data_model
+import numpy
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+FORMATS = (
+    ReportFormat.csv,
+    ReportFormat.h5,
+    reports.ColumnarReportFormat.arrow,
+    reports.ColumnarReportFormat.parquet,
+)
+
+
+def build_report(n_data_sets, n_points):
+    """ Build a report and random results of its data sets """
+    report = sedml_data_model.Report(
+        id='scan',
+        data_sets=[sedml_data_model.DataSet(id='data_set_{}'.format(i_data_set), label='R_{}'.format(i_data_set))
+                   for i_data_set in range(n_data_sets)])
+    rand = numpy.random.default_rng(0)
+    values = rand.normal(size=(n_data_sets, n_points))
+    data_set_results = DataSetResults({data_set.id: value for data_set, value in zip(report.data_sets, values)})
+    return report, data_set_results
+
+
+def get_size(dirname):
+    """ Get the total size of the files in a directory """
+    return sum(os.path.getsize(os.path.join(dir_path, filename))
+               for dir_path, _, filenames in os.walk(dirname)
+               for filename in filenames)
+
+
+def write(report, data_set_results, dirname, format):
+    """ Write a report, and get the time """
+    start = time.perf_counter()
+    if isinstance(format, reports.ColumnarReportFormat):
+        reports.write_columnar_report(report, data_set_results, dirname, report.id, format=format)
+    else:
+        ReportWriter().run(report, data_set_results, dirname, report.id, format=format)
+    return time.perf_counter() - start
+
+
+def write_points(report, data_set_results, dirname, format):
+    """ Write a report point by point, and get the time """
+    n_points = len(next(iter(data_set_results.values())))
+    filename = reports.get_columnar_report_filename(dirname, report.id, format)
+    start = time.perf_counter()
+    with reports.ColumnarReportWriter(report, filename, format=format) as writer:
+        for i_point in range(n_points):
+            writer.write({data_set_id: value[i_point] for data_set_id, value in data_set_results.items()})
+    return time.perf_counter() - start
+
+
+def read(report, dirname, format):
+    """ Read a report, and get the time """
+    start = time.perf_counter()
+    if isinstance(format, reports.ColumnarReportFormat):
+        reports.read_columnar_report(report, dirname, report.id, format=format)
+    else:
+        ReportReader().run(report, dirname, report.id, format=format)
+    return time.perf_counter() - start
+
+
+def main(n_data_sets=10000, n_points=1000):
+    report, data_set_results = build_report(n_data_sets, n_points)
+    single_data_set_report = sedml_data_model.Report(id=report.id, data_sets=report.data_sets[:1])
+    n_bytes = 8 * n_data_sets * n_points
+
+    print('{} data sets x {} points ({:.1f} MB of float64 values)'.format(n_data_sets, n_points, n_bytes / 1e6))
+    print('  {:<8} {:>9} {:>11} {:>10} {:>10} {:>15} {:>15}'.format(
+        'format', 'write (s)', 'write MB/s', 'size (MB)', 'read (s)', 'read 1 set (s)', 'by point (s)'))
+    for format in FORMATS:
+        dirname = tempfile.mkdtemp()
+        try:
+            try:
+                write_duration = write(report, data_set_results, dirname, format)
+            except OSError as exception:
+                print('  {:<8} failed: {}'.format(format.value, exception))
+                continue
+            size = get_size(dirname)
+            read_duration = read(report, dirname, format)
+            read_single_duration = read(single_data_set_report, dirname, format)
+            if isinstance(format, reports.ColumnarReportFormat):
+                shutil.rmtree(dirname)
+                os.mkdir(dirname)
+                write_points_duration = '{:>15.2f}'.format(write_points(report, data_set_results, dirname, format))
+            else:
+                write_points_duration = '{:>15}'.format('-')
+        finally:
+            shutil.rmtree(dirname)
+
+        print('  {:<8} {:>9.2f} {:>11.1f} {:>10.1f} {:>10.2f} {:>15.3f} {}'.format(
+            format.value, write_duration, n_bytes / 1e6 / write_duration, size / 1e6,
+            read_duration, read_single_duration, write_points_duration))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,122 @@
+""" Benchmark of the throughput of tasks which share a preprocessed model across threads
+
+Executes FBA tasks with different glucose uptake bounds of a synthetic model, which consists of several copies of the
+textbook model, with one shared preprocessed task: one by one with the shared model, and concurrently by several
+threads in thread-safe mode, in which each thread executes the tasks with its own copy of the model. The time of the
+copies, which is paid once per thread, is reported separately from the throughput of the tasks.
+
+Threads only increase throughput with solvers which release the interpreter lock while they solve (e.g., Gurobi).
+GLPK (swiglpk) holds the lock, so with GLPK the throughput of several threads is at most that of one thread.
+
+Usage::
+
+    python benchmarks/thread_throughput.py [number of copies of the textbook model] [number of tasks] [solver]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.core import exec_sed_task, preprocess_sed_task
+from biosimulators_cobrapy.threads import ThreadModelCopies
+from biosimulators_utils.config import get_config
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from loopless_fva import build_synthetic_model, MODEL_FILENAME
+import cobra.io
+import concurrent.futures
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+
+
+def build_tasks(model_filename, reaction_id, n_tasks, solver):
+    """ Build FBA tasks with different lower bounds of a reaction """
+    tasks = []
+    for i_task in range(n_tasks):
+        task = sedml_data_model.Task(
+            id='task_{}'.format(i_task),
+            model=sedml_data_model.Model(
+                source=model_filename,
+                language=sedml_data_model.ModelLanguage.SBML.value,
+                changes=[sedml_data_model.ModelAttributeChange(
+                    target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@fbc:lowerFluxBound".format(
+                        reaction_id),
+                    target_namespaces=NAMESPACES,
+                    new_value=str(-1. - i_task % 10))]),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(
+                    kisao_id='KISAO_0000437',
+                    changes=[sedml_data_model.AlgorithmParameterChange(kisao_id='KISAO_0000553', new_value=solver)])))
+        variables = [sedml_data_model.Variable(
+            id='obj',
+            target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']",
+            target_namespaces=NAMESPACES,
+            task=task)]
+        tasks.append((task, variables))
+    return tasks
+
+
+def main(n_copies=16, n_tasks=200, solver='GLPK'):
+    n_copies = int(n_copies)
+    n_tasks = int(n_tasks)
+    dirname = tempfile.mkdtemp()
+    try:
+        model = build_synthetic_model(cobra.io.read_sbml_model(MODEL_FILENAME), n_copies)
+        model_filename = os.path.join(dirname, 'model.xml')
+        cobra.io.write_sbml_model(model, model_filename)
+        tasks = build_tasks(model_filename, 'EX_glc__D_e_0', n_tasks, solver)
+
+        config = get_config()
+        config.LOG = False
+        preprocessed_task = preprocess_sed_task(*tasks[0], config=config)
+
+        print('{} FBA tasks of a model of {} reactions with {} ({} CPUs)'.format(
+            n_tasks, len(model.reactions), solver, os.cpu_count()))
+
+        start = time.perf_counter()
+        for task, variables in tasks:
+            exec_sed_task(task, variables, preprocessed_task=preprocessed_task, config=config)
+        serial_throughput = n_tasks / (time.perf_counter() - start)
+        print('  {:<22} {:>10} {:>9.1f} tasks/s'.format('shared model', '-', serial_throughput))
+
+        for n_threads in [1, 2, 4, 8]:
+            model_copies = ThreadModelCopies()
+            copied = threading.Barrier(n_threads + 1)
+
+            def copy_model(_):
+                model_copies.get(preprocessed_task['model']['model'])
+                copied.wait()
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+                # make the copies of the threads first, so that the time of the copies is reported separately
+                start = time.perf_counter()
+                futures = [executor.submit(copy_model, i_thread) for i_thread in range(n_threads)]
+                copied.wait()
+                copy_duration = time.perf_counter() - start
+                for future in futures:
+                    future.result()
+
+                start = time.perf_counter()
+                list(executor.map(
+                    lambda task_variables: exec_sed_task(*task_variables, preprocessed_task=preprocessed_task,
+                                                         config=config, thread_model_copies=model_copies),
+                    tasks))
+                throughput = n_tasks / (time.perf_counter() - start)
+
+            print('  {:<22} {:>8.2f} s {:>9.1f} tasks/s ({:.2f}x)'.format(
+                '{} thread(s), copies'.format(n_threads), copy_duration, throughput, throughput / serial_throughput))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,109 @@
+""" Benchmark of the resolution of the targets of variables
+
+Resolves the targets of the variables of the fluxes of several numbers of reactions of synthetic models, which consist
+of several copies of the textbook model, by evaluating the XPath of each target against the SBML file of the model and
+enumerating the targets which FBA supports, and with the index of the targets of variables of
+:obj:`biosimulators_cobrapy.variables`, and reports the time of each.
+
+Usage::
+
+    python benchmarks/variable_targets.py [number of copies of the textbook model]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.data_model import KISAO_ALGORITHMS_PARAMETERS_MAP
+from biosimulators_cobrapy.model_cache import prepare_model
+from biosimulators_cobrapy.utils import validate_variables, get_results_paths_for_variables
+from biosimulators_cobrapy.variables import VariableTargetIndex
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.sedml import validation
+from loopless_fva import build_synthetic_model, MODEL_FILENAME
+import cobra.io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+
+
+def resolve_with_xpaths(prepared_model, method, variables):
+    """ Resolve the targets of variables by evaluating their XPaths and enumerating the targets of the method """
+    model_etree = prepared_model['model_etree']
+    sbml_fbc_uri = prepared_model['sbml_fbc_uri']
+    objective_sbml_fbc_ids = list(prepared_model['objectives'].keys())
+    target_sbml_id_map = validation.validate_target_xpaths(variables, model_etree, attr='id')
+    target_sbml_fbc_id_map = validation.validate_target_xpaths(variables, model_etree, attr={
+        'namespace': {'prefix': prepared_model['sbml_fbc_prefix'], 'uri': sbml_fbc_uri},
+        'name': 'id',
+    })
+    validate_variables(prepared_model['model'], prepared_model['active_objective_sbml_fbc_id'], objective_sbml_fbc_ids,
+                       method, variables, target_sbml_id_map, target_sbml_fbc_id_map, sbml_fbc_uri)
+    return get_results_paths_for_variables(prepared_model['model'], prepared_model['active_objective_sbml_fbc_id'],
+                                           objective_sbml_fbc_ids, method, variables,
+                                           target_sbml_id_map, target_sbml_fbc_id_map)
+
+
+def resolve_with_index(prepared_model, method, variables):
+    """ Resolve the targets of variables with the index of the targets of variables """
+    index = prepared_model['variable_target_index']
+    return {
+        variable.target: index.get_results_path(method, index.resolve_target(variable))
+        for variable in variables
+    }
+
+
+def main(n_copies=32):
+    dirname = tempfile.mkdtemp()
+    try:
+        model = build_synthetic_model(cobra.io.read_sbml_model(MODEL_FILENAME), n_copies)
+        model_filename = os.path.join(dirname, 'model.xml')
+        cobra.io.write_sbml_model(model, model_filename)
+
+        start = time.perf_counter()
+        prepared_model = prepare_model(model_filename)
+        prepare_duration = time.perf_counter() - start
+        start = time.perf_counter()
+        VariableTargetIndex(prepared_model['model'], prepared_model['model_etree'], prepared_model['sbml_fbc_uri'],
+                            prepared_model['active_objective_sbml_fbc_id'])
+        index_duration = time.perf_counter() - start
+        method = KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000437']
+
+        print('Model of {} reactions: prepared in {:.2f} s, of which the index of the targets of variables takes '
+              '{:.3f} s'.format(len(model.reactions), prepare_duration, index_duration))
+        print('  {:>11} {:>11} {:>11} {:>8}'.format('variables', 'XPaths (s)', 'index (s)', 'speedup'))
+        for n_variables in [1, 10, 100, 1000, len(model.reactions)]:
+            variables = [
+                sedml_data_model.Variable(
+                    id='flux_{}'.format(reaction.id),
+                    target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@flux".format(
+                        reaction.id),
+                    target_namespaces=NAMESPACES)
+                for reaction in model.reactions[:n_variables]
+            ]
+
+            start = time.perf_counter()
+            xpath_results_paths = resolve_with_xpaths(prepared_model, method, variables)
+            xpath_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index_results_paths = resolve_with_index(prepared_model, method, variables)
+            index_duration = time.perf_counter() - start
+
+            assert index_results_paths == xpath_results_paths
+            print('  {:>11} {:>11.3f} {:>11.4f} {:>7.0f}x'.format(
+                n_variables, xpath_duration, index_duration, xpath_duration / index_duration))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
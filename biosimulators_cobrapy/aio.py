@@ -0,0 +1,313 @@
+""" Asyncio interface for executing SED tasks and COMBINE/OMEX archives, e.g., from asynchronous job services
+
+Solves are run in a bounded pool of worker threads so that they don't block the event loop. The number of
+solves which can be queued is also bounded so that callers wait (backpressure) rather than queueing
+unlimited work.
+
+BioSimulators utils captures the standard output and error of archives for their logs at the level of the file
+descriptors of the process. Because such captures can't be nested or overlap, archives whose output is captured (i.e.,
+``config.LOG`` is true, which is the default) are executed one at a time. To execute archives concurrently, disable
+their logs (``config.LOG = False``).
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .core import exec_sed_task, exec_sedml_docs_in_combine_archive
+from .threads import ThreadModelCopies
+from biosimulators_utils.config import get_config
+import asyncio
+import concurrent.futures
+import enum
+import functools
+import os
+import threading
+import time
+import weakref
+
+__all__ = [
+    'BoundedExecutor',
+    'ExecutionCancelledError',
+    'ProgressEventType',
+    'ProgressEvent',
+    'get_default_executor',
+    'aexec_sed_task',
+    'aexec_sedml_docs_in_combine_archive',
+    'astream_sedml_docs_in_combine_archive',
+]
+
+
+class BoundedExecutor(object):
+    """ Pool of worker threads for executing solves from asyncio, with a bound on the number of solves which
+    can be running or queued
+
+    Attributes:
+        max_workers (:obj:`int`): maximum number of solves which can run concurrently
+        max_pending (:obj:`int`): maximum number of solves which can be running or queued. Callers of :obj:`run` wait
+            until the number of pending solves is below this limit.
+        model_copies (:obj:`ThreadModelCopies`): copies of the models of shared preprocessed tasks for the worker
+            threads
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        """
+        Args:
+            max_workers (:obj:`int`, optional): maximum number of solves which can run concurrently; defaults to the
+                number of CPUs
+            max_pending (:obj:`int`, optional): maximum number of solves which can be running or queued; defaults to
+                :obj:`max_workers`
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                               thread_name_prefix='biosimulators-cobrapy')
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.model_copies = ThreadModelCopies()
+
+    async def run(self, func, *args, **kwargs):
+        """ Run a function in a worker thread
+
+        Args:
+            func (:obj:`types.FunctionType`): function
+            *args (:obj:`list`): positional arguments to the function
+            **kwargs (:obj:`dict`): keyword arguments to the function
+
+        Returns:
+            :obj:`object`: result of the function
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop, None)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        """ Shut down the worker threads
+
+        Args:
+            wait (:obj:`bool`, optional): whether to wait for running solves to finish
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class ExecutionCancelledError(Exception):
+    """ Exception raised for tasks which were not executed because the execution of their archive was cancelled """
+    pass
+
+
+class ProgressEventType(str, enum.Enum):
+    """ Type of a progress event """
+    task_started = 'task_started'
+    task_succeeded = 'task_succeeded'
+    task_failed = 'task_failed'
+    archive_succeeded = 'archive_succeeded'
+    archive_failed = 'archive_failed'
+
+
+class ProgressEvent(object):
+    """ Progress of the execution of a COMBINE/OMEX archive
+
+    Attributes:
+        type (:obj:`ProgressEventType`): type
+        task_id (:obj:`str`): id of the task, for events of tasks
+        duration (:obj:`float`): duration of the task in seconds, for events of completed tasks
+        exception (:obj:`Exception`): exception, for events of failures
+        results (:obj:`SedDocumentResults`): results of the archive, for events of completed archives
+        log (:obj:`CombineArchiveLog`): log of the archive, for events of completed archives
+    """
+
+    def __init__(self, type, task_id=None, duration=None, exception=None, results=None, log=None):
+        """
+        Args:
+            type (:obj:`ProgressEventType`): type
+            task_id (:obj:`str`, optional): id of the task, for events of tasks
+            duration (:obj:`float`, optional): duration of the task in seconds, for events of completed tasks
+            exception (:obj:`Exception`, optional): exception, for events of failures
+            results (:obj:`SedDocumentResults`, optional): results of the archive, for events of completed archives
+            log (:obj:`CombineArchiveLog`, optional): log of the archive, for events of completed archives
+        """
+        self.type = type
+        self.task_id = task_id
+        self.duration = duration
+        self.exception = exception
+        self.results = results
+        self.log = log
+
+
+_default_executor = None
+
+_log_capture_lock = threading.Lock()
+# :obj:`threading.Lock`: lock which serializes the execution of archives whose standard output and error are captured
+
+
+def get_default_executor():
+    """ Get the executor which is shared by calls which don't specify an executor
+
+    Returns:
+        :obj:`BoundedExecutor`: executor
+    """
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = BoundedExecutor()
+    return _default_executor
+
+
+async def aexec_sed_task(task, variables, preprocessed_task=None, log=None, config=None, simulator_config=None,
+                         executor=None, timeout=None):
+    """ Execute a task in a worker thread
+
+    Cancelling the call, or exceeding its timeout, returns control to the caller immediately. A solve which has
+    already started runs to completion in its worker thread; a solve which is still queued is never started.
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        preprocessed_task (:obj:`dict`, optional): preprocessed information about the task. Concurrent calls can
+            share preprocessed tasks: each worker thread executes the task with its own copy of the model of the
+            preprocessed task.
+        log (:obj:`TaskLog`, optional): log for the task
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
+        executor (:obj:`BoundedExecutor`, optional): executor; defaults to the shared executor
+        timeout (:obj:`float`, optional): maximum time to wait for the task in seconds
+
+    Returns:
+        :obj:`tuple`:
+
+            :obj:`VariableResults`: results of variables
+            :obj:`TaskLog`: log
+
+    Raises:
+        :obj:`asyncio.TimeoutError`: if the task doesn't complete within :obj:`timeout`
+    """
+    executor = executor or get_default_executor()
+    return await asyncio.wait_for(
+        executor.run(exec_sed_task, task, variables, preprocessed_task=preprocessed_task, log=log, config=config,
+                     simulator_config=simulator_config,
+                     thread_model_copies=executor.model_copies if preprocessed_task is not None else None),
+        timeout)
+
+
+async def aexec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None, simulator_config=None,
+                                              executor=None, timeout=None, events=None):
+    """ Execute the SED tasks defined in a COMBINE/OMEX archive in a worker thread and save the outputs
+
+    Cancelling the call, or exceeding its timeout, returns control to the caller immediately and stops the
+    execution of the archive before its next task. The task which is running when the call is cancelled runs to
+    completion in its worker thread.
+
+    Archives whose standard output and error are captured (``config.LOG``) are executed one at a time, because the
+    output is captured process-wide; while an archive waits for another, it occupies its worker thread.
+
+    Args:
+        archive_filename (:obj:`str`): path to COMBINE/OMEX archive
+        out_dir (:obj:`str`): path to store the outputs of the archive
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
+        executor (:obj:`BoundedExecutor`, optional): executor; defaults to the shared executor
+        timeout (:obj:`float`, optional): maximum time to wait for the archive in seconds
+        events (:obj:`asyncio.Queue`, optional): queue to which to put a :obj:`ProgressEvent` when each task starts
+            and finishes
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`SedDocumentResults`: results
+            * :obj:`CombineArchiveLog`: log
+
+    Raises:
+        :obj:`asyncio.TimeoutError`: if the archive doesn't complete within :obj:`timeout`
+    """
+    executor = executor or get_default_executor()
+    config = config or get_config()
+    loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+
+    def emit(event):
+        if events is not None:
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+    def task_executer(task, variables, preprocessed_task=None, log=None, config=None, simulator_config=None, deadline=None,
+                      model_cache=None, incremental_store=None):
+        if cancelled.is_set():
+            raise ExecutionCancelledError('Task `{}` was not executed because the execution was cancelled.'.format(task.id))
+
+        emit(ProgressEvent(ProgressEventType.task_started, task_id=task.id))
+        start = time.time()
+        try:
+            result = exec_sed_task(task, variables, preprocessed_task=preprocessed_task, log=log, config=config,
+                                   simulator_config=simulator_config, deadline=deadline, model_cache=model_cache,
+                                   incremental_store=incremental_store)
+        except Exception as exception:
+            emit(ProgressEvent(ProgressEventType.task_failed, task_id=task.id, duration=time.time() - start,
+                               exception=exception))
+            raise
+        emit(ProgressEvent(ProgressEventType.task_succeeded, task_id=task.id, duration=time.time() - start))
+        return result
+
+    def exec_archive():
+        if config.LOG:
+            with _log_capture_lock:
+                return exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config,
+                                                          simulator_config=simulator_config, task_executer=task_executer)
+        return exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config,
+                                                  simulator_config=simulator_config, task_executer=task_executer)
+
+    try:
+        return await asyncio.wait_for(executor.run(exec_archive), timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        cancelled.set()
+        raise
+
+
+async def astream_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None, simulator_config=None,
+                                                executor=None, timeout=None):
+    """ Execute the SED tasks defined in a COMBINE/OMEX archive in a worker thread, save the outputs, and yield
+    the progress of the execution
+
+    Args:
+        archive_filename (:obj:`str`): path to COMBINE/OMEX archive
+        out_dir (:obj:`str`): path to store the outputs of the archive
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
+        executor (:obj:`BoundedExecutor`, optional): executor; defaults to the shared executor
+        timeout (:obj:`float`, optional): maximum time to wait for the archive in seconds
+
+    Yields:
+        :obj:`ProgressEvent`: an event when each task starts and finishes, followed by an event with the results
+        and log of the archive, or with the exception which stopped its execution
+    """
+    events = asyncio.Queue()
+    archive = asyncio.ensure_future(aexec_sedml_docs_in_combine_archive(
+        archive_filename, out_dir, config=config, simulator_config=simulator_config,
+        executor=executor, timeout=timeout, events=events))
+
+    try:
+        while True:
+            next_event = asyncio.ensure_future(events.get())
+            await asyncio.wait([next_event, archive], return_when=asyncio.FIRST_COMPLETED)
+            if next_event.done():
+                yield next_event.result()
+                continue
+
+            next_event.cancel()
+            break
+
+        # yield events which were put on the queue after the archive completed
+        while not events.empty():
+            yield events.get_nowait()
+
+        try:
+            results, log = archive.result()
+        except Exception as exception:
+            yield ProgressEvent(ProgressEventType.archive_failed, exception=exception)
+        else:
+            yield ProgressEvent(ProgressEventType.archive_succeeded, results=results, log=log)
+
+    finally:
+        if not archive.done():
+            archive.cancel()
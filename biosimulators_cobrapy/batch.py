@@ -0,0 +1,360 @@
+""" Batch execution of many COMBINE/OMEX archives
+
+Rather than executing each archive of a batch in a separate process (e.g., by running the command-line program once
+per archive), which starts the interpreter, imports the package, and reads the models of each archive anew, the
+archives of a batch are executed by a pool of worker processes. Each worker executes many archives, and the SED
+documents of the archives which a worker executes share a cache of models, so that archives which use the same model
+(e.g., several simulations of a genome-scale model) read the model and set up its optimization problem once per
+worker, within the limits of the cache (``MODEL_CACHE_MAX_MODELS`` and ``MODEL_CACHE_MAX_SIZE``).
+
+The CPUs are divided among the workers: each worker runs the parallel methods of its tasks (e.g., flux variability
+analysis) with its share of the CPUs by default, rather than with all of the CPUs.
+
+Failures are isolated per archive. An archive which fails is recorded as failed, and the other archives are executed
+as usual. An archive whose worker process terminates (e.g., because it ran out of memory) is executed again alone; if
+its worker terminates again, it is recorded as failed. Nothing else bounds the execution of an archive, so unattended
+batches should set a time budget for each archive (``ARCHIVE_TIMEOUT``); otherwise, an archive which hangs occupies its
+worker indefinitely.
+
+The batch is described by a manifest, a CSV file with an ``archive`` and an ``out_dir`` column, whose paths are
+relative to the directory of the manifest. The summary of the batch (its throughput and the status, duration, and
+error of each archive) is saved as JSON::
+
+    biosimulators-cobrapy-batch manifest.csv --workers 8 --summary summary.json
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .config import get_simulator_config
+from .core import exec_sedml_docs_in_combine_archive
+from .model_cache import ModelCache
+from biosimulators_utils.log.data_model import Status
+import argparse
+import cobra
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+__all__ = [
+    'BatchItem',
+    'read_batch_manifest',
+    'exec_batch',
+    'write_batch_summary',
+    'main',
+]
+
+BatchItem = collections.namedtuple('BatchItem', ['archive', 'out_dir'])
+BatchItem.__doc__ += ': archive of a batch and the directory in which to save its outputs'
+
+WORKER_TERMINATED_ERROR = 'The worker process which executed the archive terminated unexpectedly (e.g., it ran out of memory).'
+# :obj:`str`: error of archives whose worker process terminated
+
+_worker_simulator_config = None
+_worker_model_cache = None
+
+
+def read_batch_manifest(filename):
+    """ Read the manifest of a batch
+
+    Args:
+        filename (:obj:`str`): path to a CSV file with an ``archive`` and an ``out_dir`` column. Relative paths are
+            relative to the directory of the manifest.
+
+    Returns:
+        :obj:`list` of :obj:`BatchItem`: archives and the directories in which to save their outputs
+
+    Raises:
+        :obj:`ValueError`: if the manifest doesn't have the columns, or a row doesn't have an archive or an output
+            directory
+    """
+    dirname = os.path.dirname(os.path.abspath(filename))
+    items = []
+    with open(filename, 'r', newline='') as file:
+        reader = csv.DictReader(file)
+        missing_columns = set(['archive', 'out_dir']).difference(reader.fieldnames or [])
+        if missing_columns:
+            raise ValueError('Manifest `{}` must have the columns `archive` and `out_dir`. It is missing {}.'.format(
+                filename, ', '.join('`{}`'.format(column) for column in sorted(missing_columns))))
+
+        for row in reader:
+            archive = (row['archive'] or '').strip()
+            out_dir = (row['out_dir'] or '').strip()
+            if not archive or not out_dir:
+                raise ValueError('Line {} of manifest `{}` must have an archive and an output directory.'.format(
+                    reader.line_num, filename))
+            items.append(BatchItem(os.path.join(dirname, archive), os.path.join(dirname, out_dir)))
+    return items
+
+
+def exec_batch(items, workers=None, config=None, simulator_config=None, archive_executer=None):
+    """ Execute the archives of a batch with a pool of worker processes
+
+    Args:
+        items (:obj:`list` of :obj:`BatchItem`): archives and the directories in which to save their outputs
+        workers (:obj:`int`, optional): number of worker processes; defaults to the number of CPUs
+        config (:obj:`Config`, optional): BioSimulators common configuration; defaults to the configuration of the
+            environment of the workers
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration; defaults to the
+            configuration of the environment of the workers
+        archive_executer (:obj:`types.FunctionType`, optional): module-level function to execute each archive;
+            defaults to :obj:`exec_sedml_docs_in_combine_archive`
+
+    Returns:
+        :obj:`dict`: summary of the batch: the numbers of archives, of succeeded and failed archives, of workers, and
+        of the processes of the parallel methods of each worker, the time budget of each archive, the duration and
+        throughput of the batch, the statistics of the caches of models of the workers, and the archive, output
+        directory, status, duration, worker, and error of each archive, in the order of the items
+    """
+    workers = workers or os.cpu_count() or 1
+    worker_processes = max(1, (os.cpu_count() or 1) // workers)
+    archive_timeout = (simulator_config or get_simulator_config()).ARCHIVE_TIMEOUT
+    archive_executer = archive_executer or exec_sedml_docs_in_combine_archive
+    start = time.perf_counter()
+
+    results = [None] * len(items)
+    queue = collections.deque(range(len(items)))
+    suspects = collections.deque()
+    in_flight = {}
+    executor = None
+
+    try:
+        while queue or suspects or in_flight:
+            if executor is None:
+                executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(simulator_config, worker_processes))
+
+            # execute the archives whose workers terminated alone, to determine which of them terminated the workers
+            if suspects:
+                if not in_flight:
+                    i_item = suspects.popleft()
+                    in_flight[executor.submit(_exec_archive, archive_executer, items[i_item], config)] = (i_item, True)
+            else:
+                while queue and len(in_flight) < workers:
+                    i_item = queue.popleft()
+                    in_flight[executor.submit(_exec_archive, archive_executer, items[i_item], config)] = (i_item, False)
+
+            done, _ = concurrent.futures.wait(list(in_flight.keys()), return_when=concurrent.futures.FIRST_COMPLETED)
+
+            terminated = False
+            for future in done:
+                i_item, alone = in_flight.pop(future)
+                try:
+                    results[i_item] = future.result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    terminated = True
+                    if alone:
+                        results[i_item] = _get_result(items[i_item], 'failed', None, None, WORKER_TERMINATED_ERROR)
+                    else:
+                        suspects.append(i_item)
+                except Exception as exception:
+                    results[i_item] = _get_result(items[i_item], 'failed', None, None, '{}: {}'.format(
+                        exception.__class__.__name__, str(exception)))
+
+            # when a worker terminates, the pool stops, and the archives which it was executing are executed again
+            if terminated:
+                for i_item, _ in in_flight.values():
+                    suspects.append(i_item)
+                in_flight.clear()
+                executor.shutdown(wait=True)
+                executor = None
+
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    duration = time.perf_counter() - start
+    return _summarize(results, workers, worker_processes, archive_timeout, duration)
+
+
+def _init_worker(simulator_config, processes):
+    """ Initialize a worker process of a batch, and its cache of models
+
+    Args:
+        simulator_config (:obj:`SimulatorConfig`): COBRApy-specific configuration; :obj:`None` for the configuration
+            of the environment
+        processes (:obj:`int`): default number of processes of the parallel methods (e.g., flux variability analysis)
+            of the worker
+    """
+    global _worker_simulator_config
+    global _worker_model_cache
+
+    # spawned workers inherit the spawn start method, but the capture of the standard output and error of archives
+    # starts processes which must inherit open files, so workers use the default start method of the platform
+    multiprocessing.set_start_method(None, force=True)
+
+    # limit the processes of the parallel methods of each worker to its share of the CPUs, so that the workers don't
+    # each start a process per CPU
+    cobra.Configuration().processes = processes
+
+    _worker_simulator_config = simulator_config or get_simulator_config()
+    _worker_model_cache = ModelCache(_worker_simulator_config.MODEL_CACHE_MAX_MODELS,
+                                     max_size=_worker_simulator_config.MODEL_CACHE_MAX_SIZE)
+
+
+def _exec_archive(archive_executer, item, config):
+    """ Execute an archive of a batch in a worker process
+
+    Args:
+        archive_executer (:obj:`types.FunctionType`): function to execute the archive
+        item (:obj:`BatchItem`): archive and the directory in which to save its outputs
+        config (:obj:`Config`): BioSimulators common configuration; :obj:`None` for the configuration of the
+            environment
+
+    Returns:
+        :obj:`dict`: archive, output directory, status, duration, worker, and error of the archive
+    """
+    start = time.perf_counter()
+    try:
+        _, log = archive_executer(item.archive, item.out_dir, config=config,
+                                  simulator_config=_worker_simulator_config,
+                                  model_cache=_worker_model_cache)
+    except Exception as exception:
+        error = '{}: {}'.format(exception.__class__.__name__, str(exception) or traceback.format_exc(limit=1))
+        status = 'failed'
+    else:
+        if log is not None and log.status == Status.FAILED:
+            status = 'failed'
+            error = str(log.exception) if log.exception else 'The archive did not execute successfully.'
+        else:
+            status = 'succeeded'
+            error = None
+
+    result = _get_result(item, status, time.perf_counter() - start, os.getpid(), error)
+    result['modelCache'] = _worker_model_cache.get_stats()
+    return result
+
+
+def _get_result(item, status, duration, worker, error):
+    """ Get the result of an archive of a batch
+
+    Args:
+        item (:obj:`BatchItem`): archive and the directory in which to save its outputs
+        status (:obj:`str`): ``succeeded`` or ``failed``
+        duration (:obj:`float`): duration of the execution of the archive in seconds
+        worker (:obj:`int`): process id of the worker which executed the archive
+        error (:obj:`str`): error of the archive, if it failed
+
+    Returns:
+        :obj:`dict`: archive, output directory, status, duration, worker, and error of the archive
+    """
+    return {
+        'archive': item.archive,
+        'outDir': item.out_dir,
+        'status': status,
+        'duration': duration,
+        'worker': worker,
+        'error': error,
+    }
+
+
+def _summarize(results, workers, worker_processes, archive_timeout, duration):
+    """ Summarize the results of the archives of a batch
+
+    Args:
+        results (:obj:`list` of :obj:`dict`): result of each archive
+        workers (:obj:`int`): number of worker processes
+        worker_processes (:obj:`int`): default number of processes of the parallel methods of each worker
+        archive_timeout (:obj:`float`): time budget of each archive in seconds; :obj:`None` for no limit
+        duration (:obj:`float`): duration of the batch in seconds
+
+    Returns:
+        :obj:`dict`: summary of the batch
+    """
+    # the statistics of the cache of each worker are cumulative, so the statistics of the last archive of each worker
+    # are those of the worker
+    worker_model_cache_stats = {}
+    for result in results:
+        model_cache_stats = result.pop('modelCache', None)
+        if model_cache_stats is not None:
+            worker_model_cache_stats[result['worker']] = model_cache_stats
+    hits = sum(stats['hits'] for stats in worker_model_cache_stats.values())
+    misses = sum(stats['misses'] for stats in worker_model_cache_stats.values())
+
+    num_succeeded = sum(1 for result in results if result['status'] == 'succeeded')
+    return {
+        'archives': len(results),
+        'succeeded': num_succeeded,
+        'failed': len(results) - num_succeeded,
+        'workers': workers,
+        'workerProcesses': worker_processes,
+        'archiveTimeout': archive_timeout,
+        'duration': duration,
+        'throughput': len(results) / duration if duration else None,
+        'modelCache': {
+            'hits': hits,
+            'misses': misses,
+            'hitRate': hits / (hits + misses) if hits + misses else None,
+        },
+        'results': results,
+    }
+
+
+def write_batch_summary(summary, filename):
+    """ Save the summary of a batch as JSON
+
+    Args:
+        summary (:obj:`dict`): summary of the batch
+        filename (:obj:`str`): path to save the summary
+    """
+    dirname = os.path.dirname(filename)
+    if dirname and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with open(filename, 'w') as file:
+        json.dump(summary, file, indent=2)
+
+
+def main(args=None):
+    """ Execute the archives of a batch from the command line
+
+    Args:
+        args (:obj:`list` of :obj:`str`, optional): command-line arguments; defaults to :obj:`sys.argv`
+
+    Returns:
+        :obj:`int`: exit status: ``0`` if all of the archives succeeded, ``1`` otherwise
+    """
+    parser = argparse.ArgumentParser(
+        prog='biosimulators-cobrapy-batch',
+        description='Execute the COMBINE/OMEX archives of a batch with a pool of worker processes.')
+    parser.add_argument('manifest', help='path to a CSV file with an `archive` and an `out_dir` column')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('-s', '--summary', default=None,
+                        help='path to save the summary of the batch as JSON (default: `batch-summary.json` in the '
+                        'directory of the manifest)')
+    parsed_args = parser.parse_args(args)
+
+    items = read_batch_manifest(parsed_args.manifest)
+    summary = exec_batch(items, workers=parsed_args.workers)
+    if summary['archiveTimeout'] is None:
+        print('Warning: no time budget was set for the archives (ARCHIVE_TIMEOUT). An archive which hangs occupies its '
+              'worker indefinitely, so unattended batches should set ARCHIVE_TIMEOUT.', file=sys.stderr)
+    summary_filename = parsed_args.summary or os.path.join(os.path.dirname(os.path.abspath(parsed_args.manifest)),
+                                                           'batch-summary.json')
+    write_batch_summary(summary, summary_filename)
+
+    print('{} of {} archives succeeded, {} failed, in {:.1f} s ({:.2f} archives/s) with {} workers'.format(
+        summary['succeeded'], summary['archives'], summary['failed'], summary['duration'],
+        summary['throughput'] or 0., summary['workers']), file=sys.stderr)
+    for result in summary['results']:
+        if result['status'] != 'succeeded':
+            print('  Failed: {}: {}'.format(result['archive'], result['error'].split('\n')[0]), file=sys.stderr)
+    print('Summary saved to {}'.format(summary_filename), file=sys.stderr)
+
+    return 0 if summary['failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,329 @@
+""" Persistent cache of the results of SED tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .solvers import get_available_solvers
+from biosimulators_utils.report.data_model import VariableResults
+import cobra
+import cobra.util.solver
+import hashlib
+import importlib.metadata
+import json
+import numpy
+import optlang
+import os
+import tempfile
+import time
+
+__all__ = [
+    'ResultCache',
+    'get_result_cache',
+    'get_file_hash',
+    'get_solver_id',
+    'get_solver_ids',
+    'get_result_cache_key',
+]
+
+SOLVER_PACKAGES = {
+    'cplex': 'cplex',
+    'glpk': 'swiglpk',
+    'gurobi': 'gurobipy',
+}
+
+
+class ResultCache(object):
+    """ Persistent cache of the results of SED tasks, stored as a directory of ``.npz`` files
+
+    Attributes:
+        dirname (:obj:`str`): path to the directory of the cache
+        max_size (:obj:`int`): maximum size of the cache in bytes; :obj:`None` for no limit
+        max_age (:obj:`float`): maximum age of entries in seconds; :obj:`None` for no limit
+        hits (:obj:`int`): number of lookups which were found in the cache
+        misses (:obj:`int`): number of lookups which were not found in the cache
+    """
+    EXTENSION = '.npz'
+
+    def __init__(self, dirname, max_size=None, max_age=None):
+        """
+        Args:
+            dirname (:obj:`str`): path to the directory of the cache
+            max_size (:obj:`int`, optional): maximum size of the cache in bytes; :obj:`None` for no limit
+            max_age (:obj:`float`, optional): maximum age of entries in seconds; :obj:`None` for no limit
+        """
+        self.dirname = dirname
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+    def get_filename(self, key):
+        """ Get the path to the file for a key
+
+        Args:
+            key (:obj:`str`): key
+
+        Returns:
+            :obj:`str`: path to the file for the key
+        """
+        return os.path.join(self.dirname, key + self.EXTENSION)
+
+    def get(self, key, variables):
+        """ Get the results of the variables of a task from the cache
+
+        Args:
+            key (:obj:`str`): key for the task
+            variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+
+        Returns:
+            :obj:`VariableResults`: results of the variables, or :obj:`None` if the results are not in the cache
+        """
+        filename = self.get_filename(key)
+
+        try:
+            if self.max_age is not None and time.time() - os.path.getmtime(filename) > self.max_age:
+                os.remove(filename)
+                raise FileNotFoundError(filename)
+
+            with numpy.load(filename, allow_pickle=False) as entry:
+                target_results = {
+                    target: entry['result_{}'.format(i_target)]
+                    for i_target, target in enumerate(entry['targets'].tolist())
+                }
+
+            variable_results = VariableResults()
+            for variable in variables:
+                variable_results[variable.id] = target_results[variable.target]
+
+        except (OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+
+        os.utime(filename)
+        self.hits += 1
+        return variable_results
+
+    def get_metadata(self, key):
+        """ Get the metadata of the results of a task from the cache
+
+        Args:
+            key (:obj:`str`): key for the task
+
+        Returns:
+            :obj:`dict`: metadata, or :obj:`None` if the results are not in the cache or have no metadata
+        """
+        try:
+            with numpy.load(self.get_filename(key), allow_pickle=False) as entry:
+                return json.loads(entry['metadata'].item())
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def set(self, key, variables, variable_results, metadata=None):
+        """ Save the results of the variables of a task to the cache
+
+        Args:
+            key (:obj:`str`): key for the task
+            variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+            variable_results (:obj:`VariableResults`): results of the variables
+            metadata (:obj:`dict`, optional): JSON-serializable metadata about the results (e.g., about how they were
+                computed)
+        """
+        targets = []
+        arrays = {}
+        for variable in variables:
+            if variable.target not in arrays:
+                arrays['result_{}'.format(len(targets))] = numpy.asarray(variable_results[variable.id])
+                targets.append(variable.target)
+        arrays['targets'] = numpy.array(targets, dtype=str)
+        if metadata is not None:
+            arrays['metadata'] = numpy.array(json.dumps(metadata, default=str))
+
+        # write to a temporary file and then move the file so that concurrent readers never see partial entries
+        fid, temp_filename = tempfile.mkstemp(dir=self.dirname, suffix='.tmp')
+        with os.fdopen(fid, 'wb') as file:
+            numpy.savez(file, **arrays)
+        os.replace(temp_filename, self.get_filename(key))
+
+        self.evict()
+
+    def evict(self):
+        """ Remove expired entries and the least recently used entries until the size of the cache is within its limit """
+        if self.max_size is None and self.max_age is None:
+            return
+
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.dirname):
+            if not entry.name.endswith(self.EXTENSION):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if self.max_age is not None and now - stat.st_mtime > self.max_age:
+                self._remove(entry.path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        if self.max_size is not None:
+            size = sum(entry_size for _, entry_size, _ in entries)
+            for _, entry_size, filename in sorted(entries):
+                if size <= self.max_size:
+                    break
+                self._remove(filename)
+                size -= entry_size
+
+    def get_stats(self):
+        """ Get statistics about the usage of the cache
+
+        Returns:
+            :obj:`dict`: numbers of hits and misses, and the hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRate': self.hits / lookups if lookups else None,
+        }
+
+    @staticmethod
+    def _remove(filename):
+        """ Remove an entry, tolerating entries which were concurrently removed by other processes
+
+        Args:
+            filename (:obj:`str`): path to the entry
+        """
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
+
+
+_result_caches = {}
+
+
+def get_result_cache(simulator_config):
+    """ Get the result cache for a configuration. The cache is shared by all tasks executed by the process
+    so that its statistics accumulate across tasks.
+
+    Args:
+        simulator_config (:obj:`SimulatorConfig`): configuration
+
+    Returns:
+        :obj:`ResultCache`: result cache, or :obj:`None` if caching is disabled
+    """
+    if not simulator_config.RESULT_CACHE_PATH:
+        return None
+
+    key = (
+        os.path.abspath(simulator_config.RESULT_CACHE_PATH),
+        simulator_config.RESULT_CACHE_MAX_SIZE,
+        simulator_config.RESULT_CACHE_MAX_AGE,
+    )
+    cache = _result_caches.get(key, None)
+    if cache is None:
+        cache = _result_caches[key] = ResultCache(*key)
+    return cache
+
+
+def get_file_hash(filename):
+    """ Get a hash of the content of a file
+
+    Args:
+        filename (:obj:`str`): path to the file
+
+    Returns:
+        :obj:`str`: SHA-256 hash of the content of the file
+    """
+    hash = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            hash.update(block)
+    return hash.hexdigest()
+
+
+def get_solver_id(model):
+    """ Get the name and version of the solver of a model
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+
+    Returns:
+        :obj:`str`: name and version of the solver
+    """
+    return _get_solver_id(cobra.util.solver.interface_to_str(model.problem))
+
+
+def get_solver_ids():
+    """ Get the names and versions of the available solvers, among which the solver of each task is selected
+
+    Returns:
+        :obj:`list` of :obj:`str`: name and version of each available solver
+    """
+    return [_get_solver_id(solver.value) for solver in get_available_solvers()]
+
+
+def _get_solver_id(solver):
+    """ Get the name and version of a solver
+
+    Args:
+        solver (:obj:`str`): name of the solver (e.g., ``glpk``)
+
+    Returns:
+        :obj:`str`: name and version of the solver
+    """
+    try:
+        version = importlib.metadata.version(SOLVER_PACKAGES.get(solver, solver))
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    return '{} {} (optlang {}, cobra {})'.format(solver, version, optlang.__version__, cobra.__version__)
+
+
+def get_result_cache_key(model_hash, changes, algorithm, substitution_policy, solver_ids, variables):
+    """ Get a canonical key for the results of a task. The key is determined from the task as it is described, before
+    the task is preprocessed, so that the results of tasks can be looked up without reading their models.
+
+    Args:
+        model_hash (:obj:`str`): hash of the content of the model
+        changes (:obj:`list` of :obj:`ModelAttributeChange`): changes applied to the model
+        algorithm (:obj:`Algorithm`): algorithm of the simulation of the task, and its parameters
+        substitution_policy (:obj:`AlgorithmSubstitutionPolicy`): policy for substituting the algorithm
+        solver_ids (:obj:`list` of :obj:`str`): names and versions of the solvers among which the solver of the task is
+            selected
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+
+    Returns:
+        :obj:`str`: key
+    """
+    task = {
+        'model': model_hash,
+        'changes': [[getattr(change, 'target', None), _get_canonical_value(getattr(change, 'new_value', None))]
+                    for change in changes],
+        'algorithm': algorithm.kisao_id,
+        'parameters': [[change.kisao_id, change.new_value] for change in algorithm.changes],
+        'substitutionPolicy': str(substitution_policy),
+        'solvers': sorted(solver_ids),
+        'targets': sorted(set(variable.target for variable in variables)),
+    }
+    return hashlib.sha256(json.dumps(task, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _get_canonical_value(value):
+    """ Get the canonical form of the new value of a model change, so that equal numbers (e.g., ``1`` and ``1.0``)
+    have the same form
+
+    Args:
+        value (:obj:`str`): new value
+
+    Returns:
+        :obj:`float` or :obj:`str`: canonical value
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
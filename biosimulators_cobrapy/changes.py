@@ -0,0 +1,151 @@
+""" Index of the targets of model changes
+
+The index maps the SBML ids and attributes which model changes can target to the reactions, and through them to
+the variables and objective coefficients of the optimization problem, once per model. Each change is then applied
+directly to the optimization problem, without reading the SBML file again:
+
+* The lower and upper flux bounds of a reaction set the bounds of its variables.
+* The value of a flux bound parameter sets the corresponding bound of each reaction which shares the parameter.
+* The coefficient of a flux objective of the active objective sets the coefficients of the variables of its reaction
+  in the objective.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from cobra.util.context import get_context
+from lxml import etree
+import functools
+
+__all__ = [
+    'MODEL_CHANGE_TARGETS',
+    'ModelChangeIndex',
+    'apply_model_change',
+]
+
+MODEL_CHANGE_TARGETS = (
+    ('lower flux bound of a reaction',
+     "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='<reaction id>']/@fbc:lowerFluxBound"),
+    ('upper flux bound of a reaction',
+     "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='<reaction id>']/@fbc:upperFluxBound"),
+    ('value of a flux bound parameter',
+     "/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='<parameter id>']/@value"),
+    ('coefficient of a reaction in the active objective',
+     "/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='<objective id>']"
+     "/fbc:listOfFluxObjectives/fbc:fluxObjective[@fbc:reaction='<reaction id>']/@fbc:coefficient"),
+)
+# :obj:`tuple` of :obj:`tuple`: description and pattern of the XPaths of the targets of supported model changes
+
+FLUX_BOUND_ATTRIBUTES = {
+    'lowerFluxBound': 'lower_bound',
+    'upperFluxBound': 'upper_bound',
+}
+# :obj:`dict`: dictionary that maps the SBML-FBC flux bound attributes to the attributes of COBRApy reactions
+
+
+class ModelChangeIndex(object):
+    """ Index of the model objects whose attributes can be changed
+
+    Attributes:
+        reactions (:obj:`dict` of :obj:`str` to :obj:`cobra.core.reaction.Reaction`): dictionary that maps the SBML
+            id of each reaction to the reaction
+        parameter_bounds (:obj:`dict` of :obj:`str` to :obj:`list` of :obj:`tuple`): dictionary that maps the SBML id
+            of each flux bound parameter to the reactions and the bound (``lower_bound`` or ``upper_bound``) of each
+            reaction which is set by the parameter
+        active_objective_sbml_fbc_id (:obj:`str`): SBML-FBC id of the active objective
+        sbml_ids (:obj:`set` of :obj:`str`): SBML ids of the reactions and flux bound parameters
+    """
+
+    def __init__(self, model, model_etree, sbml_fbc_uri, active_objective_sbml_fbc_id):
+        """
+        Args:
+            model (:obj:`cobra.core.model.Model`): model
+            model_etree (:obj:`lxml.etree._ElementTree`): element tree of the SBML file of the model
+            sbml_fbc_uri (:obj:`str`): URI of the SBML-FBC package
+            active_objective_sbml_fbc_id (:obj:`str`): SBML-FBC id of the active objective
+        """
+        self.reactions = {'R_' + reaction.id: reaction for reaction in model.reactions}
+
+        self.parameter_bounds = {}
+        sbml_uri = etree.QName(model_etree.getroot()).namespace
+        for reaction_element in model_etree.iterfind('.//{{{}}}listOfReactions/{{{}}}reaction'.format(sbml_uri, sbml_uri)):
+            reaction = self.reactions.get(reaction_element.get('id'), None)
+            if reaction is None:
+                continue
+            for sbml_attr, attr_name in FLUX_BOUND_ATTRIBUTES.items():
+                parameter_id = reaction_element.get('{{{}}}{}'.format(sbml_fbc_uri, sbml_attr))
+                if parameter_id:
+                    self.parameter_bounds.setdefault(parameter_id, []).append((reaction, attr_name))
+
+        self.active_objective_sbml_fbc_id = active_objective_sbml_fbc_id
+        self.sbml_ids = set(self.reactions.keys()) | set(self.parameter_bounds.keys())
+
+    def get_change_obj_attrs(self, change, sbml_id, model_etree, sbml_fbc_uri):
+        """ Get the model objects and attributes which a model change sets
+
+        Args:
+            change (:obj:`ModelAttributeChange`): model change
+            sbml_id (:obj:`str`): SBML id of the target of the change
+            model_etree (:obj:`lxml.etree._ElementTree`): element tree of the SBML file of the model
+            sbml_fbc_uri (:obj:`str`): URI of the SBML-FBC package
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: model object and the name of the attribute of each object which the change
+                sets, or :obj:`None` if the change isn't supported
+        """
+        x_path, _, attr = change.target.rpartition('/@')
+        ns, _, attr = attr.rpartition(':')
+        ns_uri = change.target_namespaces.get(ns, None) if ns else None
+
+        reaction = self.reactions.get(sbml_id, None)
+        if reaction is not None:
+            if ns_uri == sbml_fbc_uri and attr in FLUX_BOUND_ATTRIBUTES:
+                return [(reaction, FLUX_BOUND_ATTRIBUTES[attr])]
+            return None
+
+        parameter_bounds = self.parameter_bounds.get(sbml_id, None)
+        if parameter_bounds is not None:
+            if ns_uri in [None, etree.QName(model_etree.getroot()).namespace] and attr == 'value':
+                return list(parameter_bounds)
+            return None
+
+        if ns_uri == sbml_fbc_uri and attr == 'coefficient':
+            element = model_etree.xpath(x_path, namespaces=change.target_namespaces)[0]
+            if etree.QName(element) == etree.QName(sbml_fbc_uri, 'fluxObjective'):
+                objective_element = element.getparent().getparent()
+                reaction = self.reactions.get(element.get('{{{}}}reaction'.format(sbml_fbc_uri)), None)
+                if (
+                    reaction is not None
+                    and objective_element.get('{{{}}}id'.format(sbml_fbc_uri)) == self.active_objective_sbml_fbc_id
+                ):
+                    return [(reaction, 'objective_coefficient')]
+
+        return None
+
+
+def apply_model_change(obj_attrs, new_value):
+    """ Apply a model change to the optimization problem of a model. If the model is in a context (``with model:``),
+    the change is reverted when the context exits.
+
+    Args:
+        obj_attrs (:obj:`list` of :obj:`tuple`): model object and the name of the attribute of each object which the
+            change sets
+        new_value (:obj:`float`): new value
+    """
+    for obj, attr_name in obj_attrs:
+        if attr_name == 'objective_coefficient':
+            # set the coefficients directly, rather than through :obj:`cobra.util.solver.set_objective`, which copies
+            # the objective
+            objective = obj.model.solver.objective
+            context = get_context(obj)
+            if context:
+                context(functools.partial(objective.set_linear_coefficients,
+                                          objective.get_linear_coefficients([obj.forward_variable, obj.reverse_variable])))
+            objective.set_linear_coefficients({
+                obj.forward_variable: new_value,
+                obj.reverse_variable: -new_value,
+            })
+        else:
+            setattr(obj, attr_name, new_value)
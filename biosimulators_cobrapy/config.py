@@ -0,0 +1,132 @@
+""" Configuration for the COBRApy-specific features of BioSimulators-COBRApy
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .reports import ColumnarReportFormat
+import os
+
+__all__ = ['SimulatorConfig', 'get_simulator_config']
+
+
+class SimulatorConfig(object):
+    """ Configuration for the COBRApy-specific features of BioSimulators-COBRApy
+
+    Attributes:
+        RESULT_CACHE_PATH (:obj:`str`): path to a directory in which to cache the results of tasks; :obj:`None`
+            to disable caching
+        RESULT_CACHE_MAX_SIZE (:obj:`int`): maximum size of the result cache in bytes; :obj:`None` for no limit
+        RESULT_CACHE_MAX_AGE (:obj:`float`): maximum age of entries of the result cache in seconds; :obj:`None` for no limit
+        TASK_TIMEOUT (:obj:`float`): time budget for each task in seconds; :obj:`None` for no limit
+        ARCHIVE_TIMEOUT (:obj:`float`): time budget for each COMBINE/OMEX archive in seconds; :obj:`None` for no limit
+        MODEL_CACHE_MAX_MODELS (:obj:`int`): maximum number of models which the tasks of a SED document share; ``0`` to
+            read the model of each task separately; :obj:`None` for no limit
+        MODEL_CACHE_MAX_SIZE (:obj:`int`): maximum estimated resident size in bytes of the models which the tasks of a
+            SED document share; :obj:`None` for no limit
+        COLUMNAR_REPORT_FORMATS (:obj:`list` of :obj:`ColumnarReportFormat`): columnar formats in which to save reports,
+            in addition to the formats of the BioSimulators configuration
+        INCREMENTAL (:obj:`bool`): whether to store the results of tasks in the output directory and reuse them when
+            SED documents are executed again, for the tasks which didn't change
+        METRICS (:obj:`bool`): whether to record metrics of the execution of tasks (e.g., the durations of solves)
+        METRICS_PATH (:obj:`str`): path to a file to which to save the metrics, in the text exposition format of
+            Prometheus, after each SED document; :obj:`None` to not save the metrics. Enables metrics.
+        METRICS_PORT (:obj:`int`): port of the local host from which to serve the metrics over HTTP; :obj:`None` to not
+            serve the metrics. Enables metrics.
+    """
+
+    def __init__(self,
+                 RESULT_CACHE_PATH=None,
+                 RESULT_CACHE_MAX_SIZE=None,
+                 RESULT_CACHE_MAX_AGE=None,
+                 TASK_TIMEOUT=None,
+                 ARCHIVE_TIMEOUT=None,
+                 MODEL_CACHE_MAX_MODELS=1,
+                 MODEL_CACHE_MAX_SIZE=None,
+                 COLUMNAR_REPORT_FORMATS=None,
+                 INCREMENTAL=False,
+                 METRICS=False,
+                 METRICS_PATH=None,
+                 METRICS_PORT=None):
+        """
+        Args:
+            RESULT_CACHE_PATH (:obj:`str`, optional): path to a directory in which to cache the results of tasks; :obj:`None`
+                to disable caching
+            RESULT_CACHE_MAX_SIZE (:obj:`int`, optional): maximum size of the result cache in bytes; :obj:`None` for no limit
+            RESULT_CACHE_MAX_AGE (:obj:`float`, optional): maximum age of entries of the result cache in seconds;
+                :obj:`None` for no limit
+            TASK_TIMEOUT (:obj:`float`, optional): time budget for each task in seconds; :obj:`None` for no limit
+            ARCHIVE_TIMEOUT (:obj:`float`, optional): time budget for each COMBINE/OMEX archive in seconds;
+                :obj:`None` for no limit
+            MODEL_CACHE_MAX_MODELS (:obj:`int`, optional): maximum number of models which the tasks of a SED document
+                share; ``0`` to read the model of each task separately; :obj:`None` for no limit
+            MODEL_CACHE_MAX_SIZE (:obj:`int`, optional): maximum estimated resident size in bytes of the models which
+                the tasks of a SED document share; :obj:`None` for no limit
+            COLUMNAR_REPORT_FORMATS (:obj:`list` of :obj:`ColumnarReportFormat`, optional): columnar formats in which to
+                save reports, in addition to the formats of the BioSimulators configuration
+            INCREMENTAL (:obj:`bool`, optional): whether to store the results of tasks in the output directory and
+                reuse them when SED documents are executed again, for the tasks which didn't change
+            METRICS (:obj:`bool`, optional): whether to record metrics of the execution of tasks (e.g., the durations
+                of solves)
+            METRICS_PATH (:obj:`str`, optional): path to a file to which to save the metrics, in the text exposition
+                format of Prometheus, after each SED document; :obj:`None` to not save the metrics. Enables metrics.
+            METRICS_PORT (:obj:`int`, optional): port of the local host from which to serve the metrics over HTTP;
+                :obj:`None` to not serve the metrics. Enables metrics.
+        """
+        self.RESULT_CACHE_PATH = RESULT_CACHE_PATH
+        self.RESULT_CACHE_MAX_SIZE = RESULT_CACHE_MAX_SIZE
+        self.RESULT_CACHE_MAX_AGE = RESULT_CACHE_MAX_AGE
+        self.TASK_TIMEOUT = TASK_TIMEOUT
+        self.ARCHIVE_TIMEOUT = ARCHIVE_TIMEOUT
+        self.MODEL_CACHE_MAX_MODELS = MODEL_CACHE_MAX_MODELS
+        self.MODEL_CACHE_MAX_SIZE = MODEL_CACHE_MAX_SIZE
+        self.COLUMNAR_REPORT_FORMATS = COLUMNAR_REPORT_FORMATS or []
+        self.INCREMENTAL = INCREMENTAL
+        self.METRICS = METRICS
+        self.METRICS_PATH = METRICS_PATH
+        self.METRICS_PORT = METRICS_PORT
+
+
+def get_simulator_config():
+    """ Get the configuration for the COBRApy-specific features of BioSimulators-COBRApy from environment variables
+
+    Returns:
+        :obj:`SimulatorConfig`: configuration
+    """
+    return SimulatorConfig(
+        RESULT_CACHE_PATH=os.environ.get('RESULT_CACHE_PATH', None) or None,
+        RESULT_CACHE_MAX_SIZE=_get_optional_env_var('RESULT_CACHE_MAX_SIZE', int),
+        RESULT_CACHE_MAX_AGE=_get_optional_env_var('RESULT_CACHE_MAX_AGE', float),
+        TASK_TIMEOUT=_get_optional_env_var('TASK_TIMEOUT', float),
+        ARCHIVE_TIMEOUT=_get_optional_env_var('ARCHIVE_TIMEOUT', float),
+        MODEL_CACHE_MAX_MODELS=_get_optional_env_var('MODEL_CACHE_MAX_MODELS', int, 1),
+        MODEL_CACHE_MAX_SIZE=_get_optional_env_var('MODEL_CACHE_MAX_SIZE', int),
+        COLUMNAR_REPORT_FORMATS=[
+            ColumnarReportFormat(format.strip().lower())
+            for format in os.environ.get('COLUMNAR_REPORT_FORMATS', '').split(',')
+            if format.strip()
+        ],
+        INCREMENTAL=os.environ.get('INCREMENTAL', '0').strip().lower() in ['1', 'true'],
+        METRICS=os.environ.get('METRICS', '0').strip().lower() in ['1', 'true'],
+        METRICS_PATH=os.environ.get('METRICS_PATH', None) or None,
+        METRICS_PORT=_get_optional_env_var('METRICS_PORT', int),
+    )
+
+
+def _get_optional_env_var(name, type, default=None):
+    """ Get the value of an optional environment variable
+
+    Args:
+        name (:obj:`str`): name of the environment variable
+        type (:obj:`type`): type of the value of the environment variable
+        default (:obj:`object`, optional): value if the variable is not set
+
+    Returns:
+        :obj:`object`: value of the environment variable, or :obj:`default` if the variable is not set
+    """
+    value = os.environ.get(name, '').strip()
+    if value:
+        return type(value)
+    return default
@@ -9,30 +9,44 @@
 from biosimulators_utils.licensing.gurobi import GurobiLicenseManager
 GurobiLicenseManager().save_keys_to_license_file()
 
+from .cache import get_result_cache, get_file_hash, get_solver_ids, get_result_cache_key  # noqa: E402
+from .changes import MODEL_CHANGE_TARGETS, apply_model_change  # noqa: E402
+from .config import get_simulator_config  # noqa: E402
 from .data_model import KISAO_ALGORITHMS_PARAMETERS_MAP  # noqa: E402
-from .utils import (get_objective_sbml_fbc_ids, set_simulation_method_arg,  # noqa: E402
-                    apply_variables_to_simulation_method_args, validate_variables,
-                    get_results_of_variables, get_results_paths_for_variables)
+from .gurobi import start_gurobi_env, set_solver  # noqa: E402
+from .incremental import get_incremental_store, get_task_fingerprint  # noqa: E402
+from .metrics import get_metrics  # noqa: E402
+from .model_cache import ModelCache, get_model_schedule, prepare_model, estimate_model_size  # noqa: E402
+from .reports import write_columnar_report  # noqa: E402
+from .objectives import get_objective_required_results, get_objective_values, evaluate_objectives  # noqa: E402
+from .solvers import select_solver  # noqa: E402
+from .timeouts import TimeLimitExceededError, get_deadline, get_remaining_time, is_expired, solver_time_limit  # noqa: E402
+from .utils import (set_simulation_method_arg,  # noqa: E402
+                    apply_variables_to_simulation_method_args, validate_variables, format_invalid_targets,
+                    get_results_of_variables, get_results_paths_for_variables, get_required_results)
 from biosimulators_utils.combine.exec import exec_sedml_docs_in_archive  # noqa: E402
 from biosimulators_utils.config import get_config, Config  # noqa: F401, E402
 from biosimulators_utils.log.data_model import CombineArchiveLog, TaskLog, StandardOutputErrorCapturerLevel  # noqa: F401, E402
-from biosimulators_utils.model_lang.sbml.utils import get_package_namespace as get_sbml_package_namespace  # noqa: E402
 from biosimulators_utils.viz.data_model import VizFormat  # noqa: F401, E402
 from biosimulators_utils.report.data_model import ReportFormat, VariableResults, SedDocumentResults  # noqa: F401, E402
 from biosimulators_utils.sedml import validation  # noqa: E402
 from biosimulators_utils.sedml.data_model import (Task, ModelLanguage, ModelAttributeChange, SteadyStateSimulation,  # noqa: F401, E402
-                                                  Variable)
+                                                  Variable, SedDocument, Report, Plot2D, Plot3D)
 from biosimulators_utils.sedml.exec import exec_sed_doc as base_exec_sed_doc  # noqa: E402
+from biosimulators_utils.sedml.exec import get_report_for_plot2d, get_report_for_plot3d  # noqa: E402
+from biosimulators_utils.sedml.io import SedmlSimulationReader  # noqa: E402
 from biosimulators_utils.simulator.utils import get_algorithm_substitution_policy  # noqa: E402
 from biosimulators_utils.utils.core import raise_errors_warnings  # noqa: E402
 from biosimulators_utils.warnings import warn, BioSimulatorsWarning  # noqa: E402
-from biosimulators_utils.xml.utils import get_namespaces_for_xml_doc  # noqa: E402
+from cobra.util.solver import interface_to_str  # noqa: E402
 from kisao.data_model import AlgorithmSubstitutionPolicy, ALGORITHM_SUBSTITUTION_POLICY_LEVELS  # noqa: E402
 from kisao.utils import get_preferred_substitute_algorithm_by_ids  # noqa: E402
-from lxml import etree  # noqa: E402
-import cobra.io  # noqa: E402
+import cobra.exceptions  # noqa: E402
 import copy  # noqa: E402
+import functools  # noqa: E402
+import numpy  # noqa: E402
 import os  # noqa: E402
+import time  # noqa: E402
 
 __all__ = [
     'exec_sedml_docs_in_combine_archive',
@@ -42,7 +56,8 @@ __all__ = [
 ]
 
 
-def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
+def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None, simulator_config=None, task_executer=None,
+                                       model_cache=None):
     """ Execute the SED tasks defined in a COMBINE/OMEX archive and save the outputs
 
     Args:
@@ -55,6 +70,10 @@ def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
               with reports at keys ``{ relative-path-to-SED-ML-file-within-archive }/{ report.id }`` within the HDF5 file
 
         config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
+        task_executer (:obj:`types.FunctionType`, optional): function to execute each task; defaults to :obj:`exec_sed_task`
+        model_cache (:obj:`ModelCache`, optional): cache of models which the SED documents of the archive share with
+            other archives (e.g., the archives of a batch); by default, each document has its own cache
 
     Returns:
         :obj:`tuple`:
@@ -62,7 +81,11 @@ def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
             * :obj:`SedDocumentResults`: results
             * :obj:`CombineArchiveLog`: log
     """
-    return exec_sedml_docs_in_archive(exec_sed_doc, archive_filename, out_dir,
+    simulator_config = simulator_config or get_simulator_config()
+    deadline = get_deadline(simulator_config.ARCHIVE_TIMEOUT)
+    sed_doc_executer = functools.partial(exec_sed_doc, simulator_config=simulator_config, task_executer=task_executer,
+                                         deadline=deadline, model_cache=model_cache)
+    return exec_sedml_docs_in_archive(sed_doc_executer, archive_filename, out_dir,
                                       apply_xml_model_changes=True,
                                       config=config)
 
@@ -70,9 +93,28 @@ def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
 def exec_sed_doc(doc, working_dir, base_out_path, rel_out_path=None,
                  apply_xml_model_changes=True,
                  log=None, indent=0, pretty_print_modified_xml_models=False,
-                 log_level=StandardOutputErrorCapturerLevel.c, config=None):
+                 log_level=StandardOutputErrorCapturerLevel.c, config=None, simulator_config=None, task_executer=None,
+                 deadline=None, model_cache=None):
     """ Execute the tasks specified in a SED document and generate the specified outputs
 
+    The tasks of the document share a :obj:`ModelCache`, so that tasks which execute different algorithms on the
+    same model read the model and set up its optimization problem only once. Models are released as soon as no
+    remaining task of the document references them, and the memory of the models is freed when the document finishes.
+
+    In addition to the report formats of :obj:`config`, the reports are saved in the columnar formats of
+    :obj:`simulator_config` (``{base_out_path}/{rel_out_path}/{report.id}.{format}``). BioSimulators utils computes
+    the data generators of reports, which can combine the variables of several tasks, from the results of all of the
+    tasks of the document, which it holds in memory. Therefore, each columnar report is written once the document has
+    been executed, from the results in memory, rather than streamed to its file as its tasks or iterations finish.
+
+    In incremental mode (:obj:`SimulatorConfig.INCREMENTAL`), the results of the tasks are stored in
+    ``{base_out_path}/.incremental/{rel_out_path}``, and tasks which didn't change since the document was last
+    executed reuse their stored results. After the document is executed successfully, the results of the tasks which
+    were not executed or reused (e.g., tasks which were removed from the document) are removed from the store.
+
+    When metrics are enabled, they are saved to :obj:`SimulatorConfig.METRICS_PATH` after the document is executed,
+    including when its execution fails.
+
     Args:
         doc (:obj:`SedDocument` or :obj:`str`): SED document or a path to SED-ML file which defines a SED document
         working_dir (:obj:`str`): working directory of the SED document (path relative to which models are located)
@@ -92,7 +134,13 @@ def exec_sed_doc(doc, working_dir, base_out_path, rel_out_path=None,
         pretty_print_modified_xml_models (:obj:`bool`, optional): if :obj:`True`, pretty print modified XML models
         log_level (:obj:`StandardOutputErrorCapturerLevel`, optional): level at which to log output
         config (:obj:`Config`, optional): BioSimulators common configuration
-        simulator_config (:obj:`SimulatorConfig`, optional): tellurium configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
+        task_executer (:obj:`types.FunctionType`, optional): function to execute each task; defaults to :obj:`exec_sed_task`
+        deadline (:obj:`float`, optional): deadline of the time budget of the archive which contains the document on
+            the :obj:`time.monotonic` clock
+        model_cache (:obj:`ModelCache`, optional): cache of models which the document shares with other documents
+            (e.g., the documents of a batch of archives). The models of the shared cache are kept when the document
+            finishes, within the limits of the cache. By default, the tasks of the document share a new cache.
 
     Returns:
         :obj:`tuple`:
@@ -100,17 +148,77 @@ def exec_sed_doc(doc, working_dir, base_out_path, rel_out_path=None,
             * :obj:`ReportResults`: results of each report
             * :obj:`SedDocumentLog`: log of the document
     """
-    return base_exec_sed_doc(exec_sed_task, doc, working_dir, base_out_path,
-                             rel_out_path=rel_out_path,
-                             apply_xml_model_changes=apply_xml_model_changes,
-                             log=log,
-                             indent=indent,
-                             pretty_print_modified_xml_models=pretty_print_modified_xml_models,
-                             log_level=log_level,
-                             config=config)
-
-
-def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None):
+    simulator_config = simulator_config or get_simulator_config()
+
+    # read the document to look ahead at the models which its tasks reference
+    if not isinstance(doc, SedDocument):
+        doc = SedmlSimulationReader().run(doc, config=config or get_config())
+
+    metrics = get_metrics(simulator_config)
+
+    shared_model_cache = model_cache is not None
+    if not shared_model_cache:
+        model_cache = ModelCache(simulator_config.MODEL_CACHE_MAX_MODELS, max_size=simulator_config.MODEL_CACHE_MAX_SIZE,
+                                 schedule=get_model_schedule(doc))
+    incremental_store = get_incremental_store(base_out_path, rel_out_path) if simulator_config.INCREMENTAL else None
+    task_executer = functools.partial(task_executer or exec_sed_task, simulator_config=simulator_config, deadline=deadline,
+                                      model_cache=model_cache, incremental_store=incremental_store)
+
+    # collect the results of the reports to save them in the columnar formats
+    columnar_report_formats = simulator_config.COLUMNAR_REPORT_FORMATS
+    collect_results = True
+    if columnar_report_formats:
+        config = copy.copy(config or get_config())
+        collect_results = config.COLLECT_SED_DOCUMENT_RESULTS
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+
+    try:
+        report_results, log = base_exec_sed_doc(task_executer, doc, working_dir, base_out_path,
+                                                rel_out_path=rel_out_path,
+                                                apply_xml_model_changes=apply_xml_model_changes,
+                                                log=log,
+                                                indent=indent,
+                                                pretty_print_modified_xml_models=pretty_print_modified_xml_models,
+                                                log_level=log_level,
+                                                config=config)
+
+        if columnar_report_formats:
+            for output in doc.outputs:
+                if isinstance(output, Report):
+                    report = output
+                elif isinstance(output, Plot2D) and config.SAVE_PLOT_DATA:
+                    report = get_report_for_plot2d(output)
+                elif isinstance(output, Plot3D) and config.SAVE_PLOT_DATA:
+                    report = get_report_for_plot3d(output)
+                else:
+                    continue
+
+                data_set_results = report_results.get(output.id, None)
+                if data_set_results is not None:
+                    for format in columnar_report_formats:
+                        start = time.perf_counter()
+                        write_columnar_report(report, data_set_results, base_out_path,
+                                              os.path.join(rel_out_path, output.id) if rel_out_path else output.id,
+                                              format=format)
+                        if metrics:
+                            metrics.report_write_duration.observe(time.perf_counter() - start, format=format.value)
+
+            if not collect_results:
+                report_results = None
+    finally:
+        if not shared_model_cache:
+            model_cache.clear()
+        if metrics and simulator_config.METRICS_PATH:
+            metrics.registry.write(simulator_config.METRICS_PATH)
+
+    if incremental_store:
+        incremental_store.prune()
+
+    return report_results, log
+
+
+def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None, simulator_config=None, deadline=None,
+                  model_cache=None, incremental_store=None, thread_model_copies=None):
     ''' Execute a task and save its results
 
     Args:
@@ -121,6 +229,22 @@ def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None
             for repeated calls to this method.
         log (:obj:`TaskLog`, optional): log for the task
         config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
+        deadline (:obj:`float`, optional): deadline of the time budget of the archive which contains the task on the
+            :obj:`time.monotonic` clock. The budget of the task is the earlier of this deadline and the task timeout
+            of :obj:`simulator_config`. If the budget runs out, the results which were computed before the budget ran
+            out are returned, the other results are NaN, and the task is logged as timed out.
+        model_cache (:obj:`ModelCache`, optional): cache of the models shared by the tasks of a SED document. The
+            changes of the task are applied to the shared model in a context which reverts them when the task
+            finishes.
+        incremental_store (:obj:`IncrementalStore`, optional): store of the results of the tasks of the SED document
+            from its previous executions. If the store contains the results of the task, the results are reused
+            without executing the task. Otherwise, the results of the task are saved to the store.
+        thread_model_copies (:obj:`ThreadModelCopies`, optional): copies of shared models for the threads which execute
+            tasks concurrently. If provided, the task is executed with the copy of its model for the current thread,
+            and neither :obj:`preprocessed_task` nor its model is modified, so that threads can execute tasks which
+            share preprocessed tasks concurrently. Because preprocessing sets up the shared model (e.g., its solver),
+            tasks which are executed with copies must be preprocessed before they are executed.
 
     Returns:
         :obj:`tuple`:
@@ -129,32 +253,82 @@ def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None
             :obj:`TaskLog`: log
 
     Raises:
-        :obj:`ValueError`: if the task or an aspect of the task is not valid, or the requested output variables
-            could not be recorded
+        :obj:`ValueError`: if the task or an aspect of the task is not valid, the requested output variables
+            could not be recorded, or :obj:`thread_model_copies` is provided without :obj:`preprocessed_task`
         :obj:`NotImplementedError`: if the task is not of a supported type or involves an unsuported feature
     '''
+    if thread_model_copies and preprocessed_task is None:
+        raise ValueError('Task `{}` must be preprocessed (`preprocess_sed_task`) before it is executed with copies of '
+                         'its model for threads, because preprocessing sets up the shared model.'.format(task.id))
+
     config = config or get_config()
+    simulator_config = simulator_config or get_simulator_config()
 
     if config.LOG and not log:
         log = TaskLog()
 
+    metrics = get_metrics(simulator_config)
+
+    deadline = get_deadline(simulator_config.TASK_TIMEOUT, deadline)
+    time_limit = get_remaining_time(deadline)
+
+    # reuse the results of the task from the previous execution of its document if the task didn't change
+    if incremental_store:
+        fingerprint = get_task_fingerprint(task, variables, config)
+        variable_results = incremental_store.get(fingerprint, variables)
+        if variable_results is not None:
+            if config.LOG:
+                metadata = incremental_store.get_metadata(fingerprint) or {}
+                log.algorithm = metadata.get('algorithm', None)
+                log.simulator_details = dict(metadata.get('simulatorDetails', None) or {},
+                                             incremental={'fingerprint': fingerprint, 'hit': True})
+            return variable_results, log
+
+    # look up the results of the task in the cache before the task is preprocessed, so that hits don't read the model
+    result_cache = get_result_cache(simulator_config)
+    result_cache_key = None
+    if result_cache and os.path.isfile(task.model.source):
+        result_cache_key = get_result_cache_key(get_file_hash(task.model.source), task.model.changes,
+                                                task.simulation.algorithm, config.ALGORITHM_SUBSTITUTION_POLICY,
+                                                get_solver_ids(), variables)
+        variable_results = result_cache.get(result_cache_key, variables)
+        if metrics:
+            metrics.result_cache_lookups.inc(result='hit' if variable_results is not None else 'miss')
+        if variable_results is not None:
+            metadata = result_cache.get_metadata(result_cache_key) or {}
+            if incremental_store:
+                incremental_store.set(fingerprint, variables, variable_results, metadata=metadata)
+            if config.LOG:
+                # the statistics of the caches of the execution which computed the results don't apply to this execution
+                log.algorithm = metadata.get('algorithm', None)
+                log.simulator_details = {
+                    key: value for key, value in (metadata.get('simulatorDetails', None) or {}).items()
+                    if key not in ['modelCache', 'threadModelCopies', 'resultCache']
+                }
+                log.simulator_details['resultCache'] = dict(result_cache.get_stats(), hit=True)
+                if incremental_store:
+                    log.simulator_details['incremental'] = {'fingerprint': fingerprint, 'hit': False}
+            return variable_results, log
+
     if preprocessed_task is None:
-        preprocessed_task = preprocess_sed_task(task, variables, config=config)
+        if model_cache:
+            model_cache.release_unused_models(task)
+        preprocessed_task = preprocess_sed_task(task, variables, config=config, model_cache=model_cache,
+                                                simulator_config=simulator_config)
 
-    # get model
+    # get model, or the copy of the model for the current thread, and set its solver in case the model is shared with
+    # a task which uses another solver
     cobra_model = preprocessed_task['model']['model']
+    if thread_model_copies:
+        cobra_model = thread_model_copies.get(cobra_model)
+    if interface_to_str(cobra_model.problem) != preprocessed_task['simulation']['solver']:
+        set_solver(cobra_model, preprocessed_task['simulation']['solver'])
 
-    # modify model
+    # validate the changes of the model
     if task.model.changes:
         raise_errors_warnings(validation.validate_model_change_types(task.model.changes, (ModelAttributeChange, )),
                               error_summary='Changes for model `{}` are not supported.'.format(task.model.id))
 
-        model_change_obj_attr_map = preprocessed_task['model']['model_change_obj_attr_map']
-        for change in task.model.changes:
-            model_obj, attr_name = model_change_obj_attr_map[change.target]
-            new_value = float(change.new_value)
-            setattr(model_obj, attr_name, new_value)
-
     # Load the simulation method specified by ``sim.algorithm``
     method_props = preprocessed_task['simulation']['method_props']
     method_kw_args = copy.copy(preprocessed_task['simulation']['method_kw_args'])
@@ -163,21 +337,102 @@ def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None
     variable_xpath_sbml_id_map = preprocessed_task['model']['variable_xpath_sbml_id_map']
     apply_variables_to_simulation_method_args(variable_xpath_sbml_id_map, method_props, variables, method_kw_args)
 
-    # execute simulation
-    with GurobiLicenseManager():
-        solution = method_props['method'](cobra_model, **method_kw_args)
-
-        # check that solution was optimal
-        if method_props['check_status'] and solution.status != 'optimal':
-            raise cobra.exceptions.OptimizationError("A solution could not be found. The solver status was `{}`.".format(
-                solution.status))
-
-        if method_props['kisao_id'] in ['KISAO_0000527', 'KISAO_0000528']:
-            solution.objective_value = cobra_model.optimize().objective_value
+    timed_out = False
+    scheduler_stats = None
+    prepass_stats = None
+
+    # determine which results are needed to record the variables
+    variable_target_results_path_map = preprocessed_task['model']['variable_target_results_path_map']
+    required_results = get_required_results(variable_target_results_path_map)
+    objectives = preprocessed_task['model']['objectives']
+    objective_ids = sorted(required_results.get('objective_values', ()))
+    required_results = get_objective_required_results(method_props, required_results, objectives)
+
+    method_args = []
+    if method_props['partial_solution']:
+        method_args.append(required_results)
+    method_call_kw_args = dict(method_kw_args)
+    if method_props['time_budget']:
+        method_call_kw_args['deadline'] = deadline
+    if method_props['worker_pool']:
+        method_call_kw_args['model_key'] = preprocessed_task['model']['source_hash']
+
+    # modify the model in a context, which reverts the changes for the other tasks which share the model, and
+    # execute simulation, limiting each solve to the remaining time of the budget of the task
+    with cobra_model:
+        model_change_obj_attr_map = preprocessed_task['model']['model_change_obj_attr_map']
+        for change in task.model.changes:
+            obj_attrs = model_change_obj_attr_map[change.target]
+            if thread_model_copies:
+                obj_attrs = thread_model_copies.get_change_obj_attrs(cobra_model, obj_attrs)
+            apply_model_change(obj_attrs, float(change.new_value))
+
+        solve_start = time.perf_counter()
+        solve_status = 'failed'
+        try:
+            if is_expired(deadline):
+                raise TimeLimitExceededError('The time budget ran out before the task started.')
+
+            with solver_time_limit(cobra_model, deadline):
+                solution = method_props['method'](cobra_model, *method_args, **method_call_kw_args)
+
+                # check that solution was optimal
+                if method_props['check_status'] and solution.status == 'time_limit':
+                    raise TimeLimitExceededError()
+                if method_props['check_status'] and solution.status != 'optimal':
+                    raise cobra.exceptions.OptimizationError(
+                        "A solution could not be found. The solver status was `{}`.".format(solution.status))
+
+                if method_props['kisao_id'] in ['KISAO_0000527', 'KISAO_0000528'] and 'objective_value' in required_results:
+                    solution.objective_value = cobra_model.slim_optimize()
+
+                # compute the values of the requested inactive objectives from the solution of the active objective
+                if objective_ids:
+                    solution.objective_values = get_objective_values(cobra_model, method_props, solution,
+                                                                     objectives, objective_ids)
+                    if is_expired(deadline):
+                        raise TimeLimitExceededError('The time budget ran out while computing the inactive objectives.',
+                                                     partial_solution=solution)
+
+            solve_status = 'succeeded'
+
+        except TimeLimitExceededError as exception:
+            timed_out = True
+            solve_status = 'timed_out'
+            solution = exception.partial_solution
+            if (
+                solution is not None and objective_ids and not solution.objective_values
+                and method_props['inactive_objectives'] == 'evaluate'
+            ):
+                solution.objective_values = evaluate_objectives(solution, objectives, objective_ids)
+
+        except cobra.exceptions.OptimizationError:
+            if not is_expired(deadline):
+                raise
+            timed_out = True
+            solve_status = 'timed_out'
+            solution = None
+
+        finally:
+            if metrics:
+                metrics.solve_duration.observe(time.perf_counter() - solve_start, algorithm=method_props['kisao_id'])
+                metrics.solves.inc(algorithm=method_props['kisao_id'], status=solve_status)
+
+    # get the statistics of the pre-pass of the method and of the scheduling of its work over the workers (e.g.,
+    # of FVA)
+    if solution is not None:
+        scheduler_stats = getattr(solution, 'attrs', {}).get('scheduler', None)
+        prepass_stats = getattr(solution, 'attrs', {}).get('prepass', None)
 
     # Get the results of each variable
-    variable_results = get_results_of_variables(preprocessed_task['model']['variable_target_results_path_map'],
-                                                variables, solution)
+    if solution is None:
+        variable_results = VariableResults({variable.id: numpy.array(numpy.nan) for variable in variables})
+    else:
+        variable_results = get_results_of_variables(variable_target_results_path_map, variables, solution)
+
+    if timed_out:
+        warn('Task `{}` ran out of its time budget of {:.3g} s. Results which could not be computed in time are NaN.'.format(
+            task.id, time_limit), BioSimulatorsWarning)
 
     # log action
     if config.LOG:
@@ -185,13 +440,42 @@ def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None
         log.simulator_details = {
             'method': method_props['raw_method'].__module__ + '.' + method_props['raw_method'].__name__,
             'arguments': method_kw_args,
+            'solver': preprocessed_task['simulation']['solver'],
+            'solverSelectionReason': preprocessed_task['simulation']['solver_selection_reason'],
         }
+        if result_cache_key:
+            log.simulator_details['resultCache'] = dict(result_cache.get_stats(), hit=False)
+        if model_cache:
+            log.simulator_details['modelCache'] = dict(model_cache.get_stats(),
+                                                       hit=preprocessed_task['model']['model_cache_hit'])
+        if thread_model_copies:
+            log.simulator_details['threadModelCopies'] = thread_model_copies.get_stats()
+        if scheduler_stats is not None:
+            log.simulator_details['scheduler'] = scheduler_stats
+        if prepass_stats is not None:
+            log.simulator_details['prepass'] = prepass_stats
+        if time_limit is not None:
+            log.simulator_details['timeLimit'] = time_limit
+            log.simulator_details['timedOut'] = timed_out
+
+    # save the results of the task for the next execution of its document, and for other executions of the task
+    if not timed_out:
+        metadata = {
+            'algorithm': preprocessed_task['simulation']['algorithm_kisao_id'],
+            'simulatorDetails': log.simulator_details if config.LOG else None,
+        }
+        if incremental_store:
+            incremental_store.set(fingerprint, variables, variable_results, metadata=metadata)
+        if result_cache_key:
+            result_cache.set(result_cache_key, variables, variable_results, metadata=metadata)
+    if incremental_store and config.LOG:
+        log.simulator_details['incremental'] = {'fingerprint': fingerprint, 'hit': False}
 
     # Return the results of each variable and log
     return variable_results, log
 
 
-def preprocess_sed_task(task, variables, config=None):
+def preprocess_sed_task(task, variables, config=None, model_cache=None, simulator_config=None):
     """ Preprocess a SED task, including its possible model changes and variables. This is useful for avoiding
     repeatedly initializing tasks on repeated calls of :obj:`exec_sed_task`.
 
@@ -199,11 +483,15 @@ def preprocess_sed_task(task, variables, config=None):
         task (:obj:`Task`): task
         variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
         config (:obj:`Config`, optional): BioSimulators common configuration
+        model_cache (:obj:`ModelCache`, optional): cache of the models shared by the tasks of a SED document
+        simulator_config (:obj:`SimulatorConfig`, optional): COBRApy-specific configuration
 
     Returns:
         :obj:`dict`: preprocessed information about the task
     """
+    start = time.perf_counter()
     config = config or get_config()
+    metrics = get_metrics(simulator_config or get_simulator_config())
 
     model = task.model
     sim = task.simulation
@@ -220,58 +508,73 @@ def preprocess_sed_task(task, variables, config=None):
     # check model source exists
     if model.source and not os.path.isfile(model.source):
         raise FileNotFoundError('Model source `{}` is not a file.'.format(model.source))
-    model_etree = etree.parse(model.source)
-    namespaces = get_namespaces_for_xml_doc(model_etree)
-    sbml_fbc_prefix, sbml_fbc_uri = get_sbml_package_namespace('fbc', namespaces)
 
-    # Read the model
-    cobra_model = cobra.io.read_sbml_model(model.source)
+    # read the model, or get the model from the cache of the models of the SED document
+    source_hash = get_file_hash(model.source)
+    prepared_model = model_cache.get(source_hash, model_id=model.id) if model_cache else None
+    model_cache_hit = prepared_model is not None
+    if model_cache and metrics:
+        metrics.model_cache_lookups.inc(result='hit' if model_cache_hit else 'miss')
+    if not model_cache_hit:
+        model_load_start = time.perf_counter()
+        prepared_model = prepare_model(model.source)
+        if metrics:
+            metrics.model_load_duration.observe(time.perf_counter() - model_load_start)
+        if model_cache:
+            model_cache.set(source_hash, prepared_model, size=estimate_model_size(model.source), model_id=model.id)
+
+    model_etree = prepared_model['model_etree']
+    sbml_fbc_prefix = prepared_model['sbml_fbc_prefix']
+    sbml_fbc_uri = prepared_model['sbml_fbc_uri']
+    cobra_model = prepared_model['model']
+    active_objective_sbml_fbc_id = prepared_model['active_objective_sbml_fbc_id']
+    objectives = prepared_model['objectives']
+    objective_sbml_fbc_ids = list(objectives.keys())
 
     # preprocess model changes
     model_change_sbml_id_map = validation.validate_target_xpaths(
         model.changes, model_etree, attr='id')
     model_change_obj_attr_map = {}
-    sbml_id_model_obj_map = {'R_' + reaction.id: reaction for reaction in cobra_model.reactions}
+    model_change_index = prepared_model['model_change_index']
     invalid_changes = []
     for change in model.changes:
-        sbml_id = model_change_sbml_id_map[change.target]
-        model_obj = sbml_id_model_obj_map.get(sbml_id, None)
-
-        attr_name = None
-
-        if model_obj is not None:
-            _, _, attr = change.target.partition('/@')
-            ns, _, attr = attr.partition(':')
-            if change.target_namespaces.get(ns, None) == sbml_fbc_uri:
-                if attr == 'lowerFluxBound':
-                    attr_name = 'lower_bound'
-                elif attr == 'upperFluxBound':
-                    attr_name = 'upper_bound'
-
-        if attr_name:
-            model_change_obj_attr_map[change.target] = (model_obj, attr_name)
-        else:
+        obj_attrs = model_change_index.get_change_obj_attrs(
+            change, model_change_sbml_id_map[change.target], model_etree, sbml_fbc_uri)
+        if obj_attrs is None:
             invalid_changes.append(change.target)
+        else:
+            model_change_obj_attr_map[change.target] = obj_attrs
 
     if invalid_changes:
-        valid_changes = []
-        for reaction in cobra_model.reactions:
-            valid_changes.append(
-                "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@fbc:lowerFluxBound".format(reaction.id))
-            valid_changes.append(
-                "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']/@fbc:upperFluxBound".format(reaction.id))
-
-        msg = 'The following changes are invalid:\n  {}\n\nThe following targets are valid:\n  {}'.format(
-            '\n  '.join(sorted(invalid_changes)),
-            '\n  '.join(sorted(valid_changes)),
+        msg = (
+            'The following changes are invalid:\n  - {}\n\n'
+            'The targets of changes should match one of the following patterns of XPaths:\n  - {}'
+        ).format(
+            format_invalid_targets(invalid_changes, model_change_sbml_id_map, model_change_index.sbml_ids),
+            '\n  - '.join('{}: `{}`'.format(description, target) for description, target in MODEL_CHANGE_TARGETS),
         )
         raise ValueError(msg)
 
-    # preprocess variables
-    variable_xpath_sbml_id_map = validation.validate_target_xpaths(
-        variables, model_etree, attr='id')
-    variable_xpath_sbml_fbc_id_map = validation.validate_target_xpaths(
-        variables,
+    # preprocess variables: resolve the targets which have the usual form with the index of the model, and evaluate
+    # the XPaths of the other targets
+    variable_target_index = prepared_model['variable_target_index']
+    resolved_variable_targets = {}
+    unresolved_variables = []
+    for variable in variables:
+        resolved_target = variable_target_index.resolve_target(variable)
+        if resolved_target is None:
+            unresolved_variables.append(variable)
+        else:
+            resolved_variable_targets[variable.target] = resolved_target
+
+    variable_xpath_sbml_id_map = {target: resolved_target[1]
+                                  for target, resolved_target in resolved_variable_targets.items()}
+    variable_xpath_sbml_fbc_id_map = {target: resolved_target[2]
+                                      for target, resolved_target in resolved_variable_targets.items()}
+    variable_xpath_sbml_id_map.update(validation.validate_target_xpaths(
+        unresolved_variables, model_etree, attr='id'))
+    variable_xpath_sbml_fbc_id_map.update(validation.validate_target_xpaths(
+        unresolved_variables,
         model_etree,
         attr={
             'namespace': {
@@ -280,10 +583,10 @@ def preprocess_sed_task(task, variables, config=None):
             },
             'name': 'id',
         }
-    )
+    ))
 
-    # get the SBML-FBC id of the active objective
-    active_objective_sbml_fbc_id, objective_sbml_fbc_ids = get_objective_sbml_fbc_ids(model.source)
+    # set up the process-wide Gurobi environment before any Gurobi model is created
+    start_gurobi_env()
 
     # Load the simulation method specified by ``sim.algorithm``
     algorithm_substitution_policy = get_algorithm_substitution_policy(config=config)
@@ -319,23 +622,43 @@ def preprocess_sed_task(task, variables, config=None):
                 else:
                     raise
 
+    # select the solver, unless it was specified by ``sim.algorithm.changes``
     solver_change = next((change for change in sim.algorithm.changes if change.kisao_id == 'KISAO_0000553'), None)
-    if solver_change is None and GurobiLicenseManager().is_package_available():
-        cobra_model.solver = 'gurobi'
-
-    # validate variables
-    validate_variables(cobra_model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
-                       method_props, variables, variable_xpath_sbml_id_map, variable_xpath_sbml_fbc_id_map,
-                       sbml_fbc_uri)
-    variable_target_results_path_map = get_results_paths_for_variables(cobra_model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
-                                                                       method_props, variables,
-                                                                       variable_xpath_sbml_id_map, variable_xpath_sbml_fbc_id_map)
+    if solver_change is None:
+        solver, solver_selection_reason = select_solver(cobra_model, method_props, method_kw_args)
+        if solver.value != interface_to_str(cobra_model.problem):
+            set_solver(cobra_model, solver.value)
+    else:
+        solver_selection_reason = 'specified by the algorithm parameter KISAO_0000553'
+
+    # validate variables, enumerating the targets which the method supports only for the targets which couldn't be
+    # resolved with the index of the model, or which the method doesn't support
+    variable_target_results_path_map = {}
+    for target, resolved_target in resolved_variable_targets.items():
+        results_path = variable_target_index.get_results_path(method_props, resolved_target)
+        if results_path is not None:
+            variable_target_results_path_map[target] = results_path
+    other_variables = [variable for variable in variables if variable.target not in variable_target_results_path_map]
+    if other_variables:
+        validate_variables(cobra_model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
+                           method_props, other_variables, variable_xpath_sbml_id_map, variable_xpath_sbml_fbc_id_map,
+                           sbml_fbc_uri)
+        variable_target_results_path_map.update(get_results_paths_for_variables(
+            cobra_model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
+            method_props, other_variables,
+            variable_xpath_sbml_id_map, variable_xpath_sbml_fbc_id_map))
+
+    if metrics:
+        metrics.preprocess_duration.observe(time.perf_counter() - start)
 
     # Return processed information about the task
     return {
         'model': {
             'model': cobra_model,
+            'source_hash': source_hash,
+            'model_cache_hit': model_cache_hit,
             'active_objective_sbml_fbc_id': active_objective_sbml_fbc_id,
+            'objectives': objectives,
             'model_change_obj_attr_map': model_change_obj_attr_map,
             'variable_target_results_path_map': variable_target_results_path_map,
             'variable_xpath_sbml_id_map': variable_xpath_sbml_id_map,
@@ -343,6 +666,8 @@ def preprocess_sed_task(task, variables, config=None):
         },
         'simulation': {
             'algorithm_kisao_id': exec_kisao_id,
+            'solver': interface_to_str(cobra_model.problem),
+            'solver_selection_reason': solver_selection_reason,
             'method_props': method_props,
             'method_kw_args': method_kw_args,
         }
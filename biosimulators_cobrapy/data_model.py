@@ -7,13 +7,17 @@ to COBRApy methods and their arguments
 :License: MIT
 """
 
+from .sampling import achr_sample, optgp_sample
+from .utils import optimize, pfba
+from .variability import flux_variability_analysis, geometric_fba
 from biosimulators_utils.data_model import ValueType
 import cobra
 import cobra.flux_analysis
+import cobra.sampling
 import collections
 import enum
 
-__all__ = ['Solver', 'KISAO_ALGORITHMS_PARAMETERS_MAP']
+__all__ = ['Solver', 'LooplessMethod', 'KISAO_ALGORITHMS_PARAMETERS_MAP']
 
 
 class Solver(str, enum.Enum):
@@ -23,12 +27,24 @@ class Solver(str, enum.Enum):
     gurobi = 'gurobi'
 
 
+class LooplessMethod(enum.Enum):
+    """ Method for removing thermodynamically infeasible loops from the solutions of FVA """
+    false = False
+    true = True
+    cyclefreeflux = 'cycleFreeFlux'
+    fastsnp = 'fastSNP'
+
+
 KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
     ('KISAO_0000437', {
         'kisao_id': 'KISAO_0000437',
         'name': 'flux-balance analysis (FBA)',
-        'method': lambda model, **args: model.optimize(**args),
+        'method': optimize,
         'raw_method': cobra.Model.optimize,
+        'partial_solution': True,
+        'time_budget': False,
+        'worker_pool': False,
+        'inactive_objectives': 'optimize',
         'parameters': {
             'KISAO_0000553':  {
                 'name': 'solver',
@@ -48,12 +64,14 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
                     (
                         [
                             (None, objective_sbml_fbc_id, None,
-                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else None, None)
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
                             for objective_sbml_fbc_id in objective_sbml_fbc_ids
                         ] +
                         [
                             (None, objective_sbml_fbc_id, 'value',
-                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else None, None)
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
                             for objective_sbml_fbc_id in objective_sbml_fbc_ids
                         ]
                     ),
@@ -121,8 +139,12 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
     ('KISAO_0000528', {
         'kisao_id': 'KISAO_0000528',
         'name': 'parsimonious flux-balance analysis (pFBA)',
-        'method': cobra.flux_analysis.pfba,
+        'method': pfba,
         'raw_method': cobra.flux_analysis.pfba,
+        'partial_solution': True,
+        'time_budget': False,
+        'worker_pool': False,
+        'inactive_objectives': 'optimize',
         'parameters': {
             'KISAO_0000531': {
                 'name': 'fraction of optimum',
@@ -148,12 +170,14 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
                     (
                         [
                             (None, objective_sbml_fbc_id, None,
-                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else None, None)
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
                             for objective_sbml_fbc_id in objective_sbml_fbc_ids
                         ] +
                         [
                             (None, objective_sbml_fbc_id, 'value',
-                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else None, None)
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
                             for objective_sbml_fbc_id in objective_sbml_fbc_ids
                         ]
                     ),
@@ -221,8 +245,12 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
     ('KISAO_0000527', {
         'kisao_id': 'KISAO_0000527',
         'name': 'geometric flux-balance analysis (gFBA)',
-        'method': cobra.flux_analysis.geometric_fba,
+        'method': geometric_fba,
         'raw_method': cobra.flux_analysis.geometric_fba,
+        'partial_solution': False,
+        'time_budget': True,
+        'worker_pool': True,
+        'inactive_objectives': 'optimize',
         'parameters': {
             'KISAO_0000209': {
                 'name': 'epsilon',
@@ -260,12 +288,14 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
                     (
                         [
                             (None, objective_sbml_fbc_id, None,
-                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else None, None)
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
                             for objective_sbml_fbc_id in objective_sbml_fbc_ids
                         ] +
                         [
                             (None, objective_sbml_fbc_id, 'value',
-                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else None, None)
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
                             for objective_sbml_fbc_id in objective_sbml_fbc_ids
                         ]
                     ),
@@ -333,14 +363,20 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
     ('KISAO_0000526', {
         'kisao_id': 'KISAO_0000526',
         'name': 'flux variability analysis (FVA)',
-        'method': cobra.flux_analysis.flux_variability_analysis,
+        'method': flux_variability_analysis,
         'raw_method': cobra.flux_analysis.flux_variability_analysis,
+        'partial_solution': False,
+        'time_budget': True,
+        'worker_pool': True,
+        'inactive_objectives': None,
         'parameters': {
             'KISAO_0000532': {
                 'name': 'loopless',
-                'description': 'Whether to return only loopless solutions.',
+                'description': ('Whether to return only loopless solutions (`true`, `false`), or the method for '
+                                'removing loops (`cycleFreeFlux`, which is used for `true`, or `fastSNP`).'),
                 'alg_arg': 'loopless',
-                'type': ValueType.boolean,
+                'type': ValueType.string,
+                'enum': LooplessMethod,
             },
             'KISAO_0000531': {
                 'name': 'fraction of optimum',
@@ -376,11 +412,11 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
                 'target': r'^/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction(\[.*?\])?/@minFlux?$',
                 'get_target_results_paths': lambda model, active_obj_fbc_id, objective_sbml_fbc_ids:
                 [
-                    ('R_' + reaction.id, None, 'minFlux', 'loc', (reaction.id, 'minimum'))
+                    ('R_' + reaction.id, None, 'minFlux', 'minimum', (reaction.id,))
                     for reaction in model.reactions
                 ] +
                 [
-                    (reaction.id, None, 'minFlux', 'loc', (reaction.id, 'minimum'))
+                    (reaction.id, None, 'minFlux', 'minimum', (reaction.id,))
                     for reaction in model.reactions
                 ],
             },
@@ -390,14 +426,184 @@ KISAO_ALGORITHMS_PARAMETERS_MAP = collections.OrderedDict([
                 'target': r'^/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction(\[.*?\])?/@maxFlux?$',
                 'get_target_results_paths': lambda model, active_obj_fbc_id, objective_sbml_fbc_ids:
                 [
-                    ('R_' + reaction.id, None, 'maxFlux', 'loc', (reaction.id, 'maximum'))
+                    ('R_' + reaction.id, None, 'maxFlux', 'maximum', (reaction.id,))
                     for reaction in model.reactions
                 ] +
                 [
-                    (reaction.id, None, 'maxFlux', 'loc', (reaction.id, 'minimum'))
+                    (reaction.id, None, 'maxFlux', 'maximum', (reaction.id,))
                     for reaction in model.reactions
                 ],
             },
         ],
     }),
+    ('KISAO_0000588', {
+        'kisao_id': 'KISAO_0000588',
+        'name': 'flux sampling (optGpSampler)',
+        'method': optgp_sample,
+        'raw_method': cobra.sampling.sample,
+        'partial_solution': True,
+        'time_budget': True,
+        'worker_pool': False,
+        'inactive_objectives': 'evaluate',
+        'parameters': {
+            'KISAO_0000326': {
+                'name': 'number of samples',
+                'description': 'Number of flux samples.',
+                'alg_arg': 'n',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000684': {
+                'name': 'thinning',
+                'description': 'Number of steps of the sampling chains between successive samples.',
+                'alg_arg': 'thinning',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000488': {
+                'name': 'seed',
+                'description': 'Seed for the random number generators of the sampling chains.',
+                'alg_arg': 'seed',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000529': {
+                'name': 'processes',
+                'description': 'Number of sampling chains, each executed by a parallel process.',
+                'alg_arg': 'processes',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000553': {
+                'name': 'solver',
+                'description': 'Convex optimization solver to use (e.g., CPLEX, GLPK).',
+                'model_arg': 'solver',
+                'type': ValueType.string,
+                'enum': Solver,
+            },
+        },
+        'check_status': True,
+        'variables': [
+            {
+                'description': 'objective value',
+                'target_type': 'objective',
+                'target': r'^/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective(\[.*?\])?(/@value)?$',
+                'get_target_results_paths': lambda model, active_obj_fbc_id, objective_sbml_fbc_ids:
+                    (
+                        [
+                            (None, objective_sbml_fbc_id, None,
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
+                            for objective_sbml_fbc_id in objective_sbml_fbc_ids
+                        ] +
+                        [
+                            (None, objective_sbml_fbc_id, 'value',
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
+                            for objective_sbml_fbc_id in objective_sbml_fbc_ids
+                        ]
+                    ),
+            },
+            {
+                'description': 'reaction flux',
+                'target_type': 'reaction',
+                'target': r'^/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction(\[.*?\])?(/@flux)?$',
+                'get_target_results_paths': lambda model, active_obj_fbc_id, objective_sbml_fbc_ids:
+                    [
+                        ('R_' + reaction.id, None, None, 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ] +
+                    [
+                        ('R_' + reaction.id, None, 'flux', 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ] +
+                    [
+                        (reaction.id, None, None, 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ] +
+                    [
+                        (reaction.id, None, 'flux', 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ],
+            },
+        ],
+    }),
+    ('KISAO_0000590', {
+        'kisao_id': 'KISAO_0000590',
+        'name': 'artificial centering hit-and-run (ACHR) flux sampling',
+        'method': achr_sample,
+        'raw_method': cobra.sampling.sample,
+        'partial_solution': True,
+        'time_budget': True,
+        'worker_pool': False,
+        'inactive_objectives': 'evaluate',
+        'parameters': {
+            'KISAO_0000326': {
+                'name': 'number of samples',
+                'description': 'Number of flux samples.',
+                'alg_arg': 'n',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000684': {
+                'name': 'thinning',
+                'description': 'Number of steps of the sampling chains between successive samples.',
+                'alg_arg': 'thinning',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000488': {
+                'name': 'seed',
+                'description': 'Seed for the random number generators of the sampling chains.',
+                'alg_arg': 'seed',
+                'type': ValueType.integer,
+            },
+            'KISAO_0000553': {
+                'name': 'solver',
+                'description': 'Convex optimization solver to use (e.g., CPLEX, GLPK).',
+                'model_arg': 'solver',
+                'type': ValueType.string,
+                'enum': Solver,
+            },
+        },
+        'check_status': True,
+        'variables': [
+            {
+                'description': 'objective value',
+                'target_type': 'objective',
+                'target': r'^/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective(\[.*?\])?(/@value)?$',
+                'get_target_results_paths': lambda model, active_obj_fbc_id, objective_sbml_fbc_ids:
+                    (
+                        [
+                            (None, objective_sbml_fbc_id, None,
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
+                            for objective_sbml_fbc_id in objective_sbml_fbc_ids
+                        ] +
+                        [
+                            (None, objective_sbml_fbc_id, 'value',
+                                'objective_value' if objective_sbml_fbc_id == active_obj_fbc_id else 'objective_values',
+                                None if objective_sbml_fbc_id == active_obj_fbc_id else (objective_sbml_fbc_id,))
+                            for objective_sbml_fbc_id in objective_sbml_fbc_ids
+                        ]
+                    ),
+            },
+            {
+                'description': 'reaction flux',
+                'target_type': 'reaction',
+                'target': r'^/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction(\[.*?\])?(/@flux)?$',
+                'get_target_results_paths': lambda model, active_obj_fbc_id, objective_sbml_fbc_ids:
+                    [
+                        ('R_' + reaction.id, None, None, 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ] +
+                    [
+                        ('R_' + reaction.id, None, 'flux', 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ] +
+                    [
+                        (reaction.id, None, None, 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ] +
+                    [
+                        (reaction.id, None, 'flux', 'fluxes', (reaction.id,))
+                        for reaction in model.reactions
+                    ],
+            },
+        ],
+    }),
 ])
@@ -0,0 +1,214 @@
+""" Process-wide pooling of the Gurobi environment
+
+Setting up a Gurobi environment checks the license, which adds latency to each task when it is repeated
+for every task. Instead, the environment is set up once per process, reused by every model and task,
+and closed when the process exits.
+
+OptLang creates Gurobi problems in the default environment of Gurobi. Therefore, :obj:`set_gurobi_solver` builds
+the Gurobi problem of a model in the process-wide environment itself, and hands it to OptLang
+(:obj:`optlang.gurobi_interface.Model`). Problems which it can't build (e.g., problems with ranged constraints) are
+cloned by COBRApy into the default environment. Because this sets the attribute of COBRApy models which holds their
+solver, it is only used with the versions of COBRApy and OptLang which it has been tested with; with other versions,
+the solver of the model is set through COBRApy, and its problem is created in the default environment. Models which
+are copied or unpickled (e.g., the copies of models for threads and for worker processes) are created by OptLang in
+the default environment.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.licensing.gurobi import GurobiLicenseManager
+import atexit
+import cobra
+import optlang
+import re
+import threading
+
+__all__ = [
+    'is_gurobi_available',
+    'start_gurobi_env',
+    'close_gurobi_env',
+    'set_solver',
+    'set_gurobi_solver',
+]
+
+SUPPORTED_VERSIONS = {
+    'cobra': ((0, 31), (1, 0)),
+    'optlang': ((1, 5), (2, 0)),
+}
+# :obj:`dict`: dictionary that maps COBRApy and OptLang to the minimum (inclusive) and maximum (exclusive) versions with
+#     which :obj:`set_gurobi_solver` creates problems in the process-wide environment
+
+_GUROBI_VARIABLE_TYPES = {
+    'continuous': 'C',
+    'integer': 'I',
+    'binary': 'B',
+}
+# :obj:`dict`: dictionary that maps the types of OptLang variables to the types of Gurobi variables
+
+_lock = threading.Lock()
+_is_available = None
+_env = None
+
+
+def is_gurobi_available():
+    """ Determine whether Gurobi is installed and licensed. The result is determined once per process.
+
+    Returns:
+        :obj:`bool`: whether Gurobi is installed and licensed
+    """
+    global _is_available
+    if _is_available is None:
+        _is_available = bool(GurobiLicenseManager().is_package_available())
+    return _is_available
+
+
+def start_gurobi_env():
+    """ Set up the process-wide Gurobi environment, if it hasn't already been set up
+
+    Returns:
+        :obj:`gurobipy.Env`: Gurobi environment, or :obj:`None` if Gurobi is not available
+    """
+    global _env
+
+    if _env is not None or not is_gurobi_available():
+        return _env
+
+    with _lock:
+        if _env is None:
+            import gurobipy
+
+            keys = GurobiLicenseManager().get_keys_from_env_vars()
+            if keys:
+                env = gurobipy.Env(params=keys)
+            else:
+                env = gurobipy.Env()
+
+            env.setParam('OutputFlag', 0)
+            _env = env
+
+            atexit.register(close_gurobi_env)
+
+    return _env
+
+
+def close_gurobi_env():
+    """ Close the process-wide Gurobi environment, if it has been set up """
+    global _env
+
+    with _lock:
+        if _env is not None:
+            _env.dispose()
+            _env = None
+
+            atexit.unregister(close_gurobi_env)
+
+
+def set_solver(cobra_model, solver):
+    """ Set the solver of a model, creating Gurobi problems in the process-wide Gurobi environment
+
+    Args:
+        cobra_model (:obj:`cobra.core.model.Model`): model
+        solver (:obj:`str`): id of the solver (e.g., ``glpk``, ``gurobi``)
+    """
+    if solver == 'gurobi':
+        set_gurobi_solver(cobra_model)
+    else:
+        cobra_model.solver = solver
+
+
+def set_gurobi_solver(cobra_model):
+    """ Set the solver of a model to Gurobi, creating its problem in the process-wide Gurobi environment
+
+    Args:
+        cobra_model (:obj:`cobra.core.model.Model`): model
+    """
+    env = start_gurobi_env()
+    if env is None or not _is_env_supported():
+        cobra_model.solver = 'gurobi'
+        return
+
+    from optlang import gurobi_interface
+
+    solver = cobra_model.solver
+    solver.update()
+
+    problem = _build_gurobi_problem(solver, env)
+    if problem is None:
+        cobra_model.solver = 'gurobi'
+        return
+
+    gurobi_solver = gurobi_interface.Model(problem=problem)
+    gurobi_solver.configuration = gurobi_interface.Configuration.clone(solver.configuration, problem=gurobi_solver)
+    cobra_model._solver = gurobi_solver
+
+
+def _build_gurobi_problem(solver, env):
+    """ Build a Gurobi problem in an environment with the variables, linear constraints, and linear objective of the
+    problem of a solver
+
+    Args:
+        solver (:obj:`optlang.interface.Model`): problem of a solver
+        env (:obj:`gurobipy.Env`): Gurobi environment
+
+    Returns:
+        :obj:`gurobipy.Model`: Gurobi problem, or :obj:`None` if the problem has constraints or an objective which
+            can't be built (e.g., ranged constraints, nonlinear expressions, or an objective with an offset)
+    """
+    import gurobipy
+
+    objective = solver.objective
+    if not objective.is_Linear or float(objective.expression.subs({variable: 0 for variable in objective.variables})):
+        return None
+
+    problem = gurobipy.Model(env=env)
+    problem.params.OutputFlag = 0
+
+    gurobi_variables = {}
+    for variable in solver.variables:
+        gurobi_variables[variable.name] = problem.addVar(
+            lb=-gurobipy.GRB.INFINITY if variable.lb is None else variable.lb,
+            ub=gurobipy.GRB.INFINITY if variable.ub is None else variable.ub,
+            vtype=_GUROBI_VARIABLE_TYPES[variable.type],
+            name=variable.name)
+
+    def get_linear_expression(expression):
+        coefficients = expression.get_linear_coefficients(expression.variables)
+        return gurobipy.LinExpr([float(coefficient) for coefficient in coefficients.values()],
+                                [gurobi_variables[variable.name] for variable in coefficients.keys()])
+
+    for constraint in solver.constraints:
+        if not constraint.is_Linear:
+            return None
+        if constraint.lb is not None and constraint.ub is not None:
+            if constraint.lb != constraint.ub:
+                return None
+            sense, rhs = gurobipy.GRB.EQUAL, constraint.lb
+        elif constraint.lb is not None:
+            sense, rhs = gurobipy.GRB.GREATER_EQUAL, constraint.lb
+        elif constraint.ub is not None:
+            sense, rhs = gurobipy.GRB.LESS_EQUAL, constraint.ub
+        else:
+            return None
+        problem.addLConstr(get_linear_expression(constraint), sense, rhs, constraint.name)
+
+    problem.setObjective(get_linear_expression(objective),
+                         gurobipy.GRB.MAXIMIZE if objective.direction == 'max' else gurobipy.GRB.MINIMIZE)
+    problem.update()
+    return problem
+
+
+def _is_env_supported():
+    """ Determine whether the installed versions of COBRApy and OptLang are supported by :obj:`set_gurobi_solver`
+
+    Returns:
+        :obj:`bool`: whether the installed versions of COBRApy and OptLang are supported
+    """
+    for package in [cobra, optlang]:
+        version = tuple(int(part) for part in re.findall(r'\d+', package.__version__)[:2])
+        min_version, max_version = SUPPORTED_VERSIONS[package.__name__]
+        if not (min_version <= version < max_version):
+            return False
+    return True
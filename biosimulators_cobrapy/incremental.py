@@ -0,0 +1,160 @@
+""" Incremental re-execution of SED documents
+
+When a SED document (or an archive) is executed again after editing some of its tasks or outputs, only the tasks
+which changed need to be executed again. In incremental mode, the results of each task are stored in the output
+directory, keyed by a fingerprint of the task: the content of its model, its model changes, its simulation and
+algorithm, the targets of its variables, and the versions of the software which executes it. When the document is
+executed again, tasks whose fingerprints are in the store reuse the stored results without reading their models.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from ._version import __version__
+from .cache import ResultCache, SOLVER_PACKAGES, get_file_hash
+from .solvers import get_available_solvers
+import cobra
+import functools
+import hashlib
+import importlib.metadata
+import json
+import optlang
+import os
+
+__all__ = [
+    'IncrementalStore',
+    'get_incremental_store',
+    'get_task_fingerprint',
+]
+
+INCREMENTAL_DIRNAME = '.incremental'
+# :obj:`str`: name of the directory within the output directory in which the results of tasks are stored
+
+
+class IncrementalStore(ResultCache):
+    """ Store of the results of the tasks of a SED document, keyed by the fingerprints of the tasks
+
+    Attributes:
+        used_keys (:obj:`set` of :obj:`str`): fingerprints of the tasks whose results were read or saved since the
+            store was created
+    """
+
+    def __init__(self, dirname):
+        """
+        Args:
+            dirname (:obj:`str`): path to the directory of the store
+        """
+        super(IncrementalStore, self).__init__(dirname)
+        self.used_keys = set()
+
+    def get(self, key, variables):
+        """ Get the results of the variables of a task from the store
+
+        Args:
+            key (:obj:`str`): fingerprint of the task
+            variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+
+        Returns:
+            :obj:`VariableResults`: results of the variables, or :obj:`None` if the results are not in the store
+        """
+        variable_results = super(IncrementalStore, self).get(key, variables)
+        if variable_results is not None:
+            self.used_keys.add(key)
+        return variable_results
+
+    def set(self, key, variables, variable_results, metadata=None):
+        """ Save the results of the variables of a task to the store
+
+        Args:
+            key (:obj:`str`): fingerprint of the task
+            variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+            variable_results (:obj:`VariableResults`): results of the variables
+            metadata (:obj:`dict`, optional): JSON-serializable metadata about the results
+        """
+        super(IncrementalStore, self).set(key, variables, variable_results, metadata=metadata)
+        self.used_keys.add(key)
+
+    def prune(self):
+        """ Remove the results of the tasks which were not read or saved (e.g., tasks which were removed from the
+        document or whose fingerprints changed)
+
+        Returns:
+            :obj:`int`: number of removed entries
+        """
+        num_removed = 0
+        for entry in os.scandir(self.dirname):
+            if entry.name.endswith(self.EXTENSION) and entry.name[:-len(self.EXTENSION)] not in self.used_keys:
+                self._remove(entry.path)
+                num_removed += 1
+        return num_removed
+
+
+def get_incremental_store(base_out_path, rel_out_path=None):
+    """ Get the store of the results of the tasks of a SED document
+
+    Args:
+        base_out_path (:obj:`str`): path to store the outputs of the document
+        rel_out_path (:obj:`str`, optional): path relative to :obj:`base_out_path` to store the outputs of the document
+
+    Returns:
+        :obj:`IncrementalStore`: store (``{ base_out_path }/.incremental/{ rel_out_path }``)
+    """
+    return IncrementalStore(os.path.join(base_out_path, INCREMENTAL_DIRNAME, rel_out_path or ''))
+
+
+def get_task_fingerprint(task, variables, config):
+    """ Get a fingerprint of a task, which changes when the results of the task could change
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        config (:obj:`Config`): BioSimulators common configuration
+
+    Returns:
+        :obj:`str`: fingerprint
+    """
+    model = task.model
+    sim = task.simulation
+    fingerprint = {
+        'model': {
+            'source': get_file_hash(model.source),
+            'language': model.language,
+            'changes': [
+                [change.__class__.__name__, getattr(change, 'target', None), getattr(change, 'new_value', None)]
+                for change in model.changes
+            ],
+        },
+        'simulation': {
+            'type': sim.__class__.__name__,
+            'algorithm': sim.algorithm.kisao_id,
+            'parameters': [[change.kisao_id, change.new_value] for change in sim.algorithm.changes],
+            'substitutionPolicy': str(config.ALGORITHM_SUBSTITUTION_POLICY),
+        },
+        'targets': sorted(set(variable.target for variable in variables)),
+        'software': _get_software_versions(),
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_software_versions():
+    """ Get the versions of the software which executes tasks, including the available solvers, among which the
+    solver of each task is selected
+
+    Returns:
+        :obj:`tuple` of :obj:`tuple`: name and version of each package
+    """
+    versions = [
+        ('biosimulators_cobrapy', __version__),
+        ('cobra', cobra.__version__),
+        ('optlang', optlang.__version__),
+    ]
+    for solver in get_available_solvers():
+        try:
+            version = importlib.metadata.version(SOLVER_PACKAGES.get(solver.value, solver.value))
+        except importlib.metadata.PackageNotFoundError:
+            version = None
+        versions.append((solver.value, version))
+    return tuple(versions)
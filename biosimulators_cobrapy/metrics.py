@@ -0,0 +1,506 @@
+""" Metrics of the execution of tasks, for monitoring long-running workers
+
+The metrics are counters and histograms, which are recorded in a process-wide registry when metrics are enabled
+(:obj:`SimulatorConfig.METRICS`, :obj:`SimulatorConfig.METRICS_PATH`, or :obj:`SimulatorConfig.METRICS_PORT`), and
+exported in the text exposition format of `Prometheus <https://prometheus.io>`_ or
+`OpenMetrics <https://openmetrics.io>`_, to a file (e.g., for the textfile collector of the Prometheus node exporter)
+or from an HTTP endpoint of the local host (``http://127.0.0.1:{port}/metrics``).
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.warnings import warn, BioSimulatorsWarning
+import contextlib
+import http.server
+import math
+import os
+import tempfile
+import threading
+import time
+
+__all__ = [
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'Metrics',
+    'get_metrics',
+]
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1., 2.5, 5., 10., 25., 50., 100., 250.)
+# :obj:`tuple` of :obj:`float`: default upper bounds of the buckets of histograms of durations in seconds
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+
+class Metric(object):
+    """ A family of metrics with the same name, whose members are distinguished by the values of their labels
+
+    Attributes:
+        name (:obj:`str`): name
+        documentation (:obj:`str`): description
+        labelnames (:obj:`tuple` of :obj:`str`): names of the labels
+        type (:obj:`str`): type (e.g., ``counter``)
+    """
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Args:
+            name (:obj:`str`): name
+            documentation (:obj:`str`): description
+            labelnames (:obj:`tuple` of :obj:`str`, optional): names of the labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _get_label_values(self, labels):
+        """ Get the values of the labels of a member of the family
+
+        Args:
+            labels (:obj:`dict`): value of each label
+
+        Returns:
+            :obj:`tuple` of :obj:`str`: values of the labels, in the order of :obj:`labelnames`
+
+        Raises:
+            :obj:`ValueError`: if the labels are not the labels of the family
+        """
+        if set(labels.keys()) != set(self.labelnames):
+            raise ValueError('Metric `{}` has labels {}, not {}.'.format(
+                self.name, sorted(self.labelnames), sorted(labels.keys())))
+        return tuple(str(labels[labelname]) for labelname in self.labelnames)
+
+    def get_samples(self, openmetrics=False):
+        """ Get the samples of the members of the family
+
+        Args:
+            openmetrics (:obj:`bool`, optional): whether to get the samples for the OpenMetrics format
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: name, labels (:obj:`list` of :obj:`tuple` of the name and value of each
+            label), and value of each sample
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    def expose(self, openmetrics=False):
+        """ Get the text exposition of the family
+
+        Args:
+            openmetrics (:obj:`bool`, optional): whether to use the OpenMetrics format, rather than the Prometheus
+                format
+
+        Returns:
+            :obj:`str`: text exposition
+        """
+        # Prometheus names counters by their samples (``{name}_total``); OpenMetrics names them without the suffix
+        name = self.name
+        if self.type == 'counter' and not openmetrics:
+            name += '_total'
+
+        lines = [
+            '# HELP {} {}'.format(name, _escape(self.documentation)),
+            '# TYPE {} {}'.format(name, self.type),
+        ]
+        for sample_name, labels, value in self.get_samples(openmetrics=openmetrics):
+            if labels:
+                sample_name += '{' + ','.join('{}="{}"'.format(label, _escape(label_value, quotes=True))
+                                              for label, label_value in labels) + '}'
+            lines.append('{} {}'.format(sample_name, _format_value(value)))
+        return '\n'.join(lines) + '\n'
+
+
+class Counter(Metric):
+    """ A family of counters, such as of the number of solves """
+    type = 'counter'
+
+    def inc(self, amount=1., **labels):
+        """ Increment a counter
+
+        Args:
+            amount (:obj:`float`, optional): amount to increment the counter by
+            **labels: value of each label of the counter
+
+        Raises:
+            :obj:`ValueError`: if the amount is negative, or the labels are not the labels of the family
+        """
+        if amount < 0:
+            raise ValueError('Counters can only be incremented by non-negative amounts.')
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.) + amount
+
+    def get(self, **labels):
+        """ Get the value of a counter
+
+        Args:
+            **labels: value of each label of the counter
+
+        Returns:
+            :obj:`float`: value
+        """
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            return self._values.get(label_values, 0.)
+
+    def get_samples(self, openmetrics=False):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            (self.name + '_total', list(zip(self.labelnames, label_values)), value)
+            for label_values, value in values
+        ]
+
+
+class Histogram(Metric):
+    """ A family of histograms, such as of the durations of solves
+
+    Attributes:
+        buckets (:obj:`tuple` of :obj:`float`): upper bounds of the buckets, ending with infinity
+    """
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            name (:obj:`str`): name
+            documentation (:obj:`str`): description
+            labelnames (:obj:`tuple` of :obj:`str`, optional): names of the labels
+            buckets (:obj:`tuple` of :obj:`float`, optional): upper bounds of the buckets
+        """
+        super(Histogram, self).__init__(name, documentation, labelnames=labelnames)
+        buckets = sorted(float(bucket) for bucket in buckets)
+        if not buckets or buckets[-1] != math.inf:
+            buckets.append(math.inf)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        """ Record an observation, such as a duration in seconds
+
+        Args:
+            value (:obj:`float`): value
+            **labels: value of each label of the histogram
+        """
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            bucket_counts, total = self._values.get(label_values, (None, 0.))
+            if bucket_counts is None:
+                bucket_counts = [0] * len(self.buckets)
+            for i_bucket, bucket in enumerate(self.buckets):
+                if value <= bucket:
+                    bucket_counts[i_bucket] += 1
+                    break
+            self._values[label_values] = (bucket_counts, total + value)
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        """ Record the duration in seconds of a block of code
+
+        Args:
+            **labels: value of each label of the histogram
+        """
+        self._get_label_values(labels)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels):
+        """ Get the number of observations of a histogram
+
+        Args:
+            **labels: value of each label of the histogram
+
+        Returns:
+            :obj:`int`: number of observations
+        """
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            bucket_counts, _ = self._values.get(label_values, (None, 0.))
+            return sum(bucket_counts) if bucket_counts else 0
+
+    def get_samples(self, openmetrics=False):
+        with self._lock:
+            values = sorted((label_values, (list(bucket_counts), total))
+                            for label_values, (bucket_counts, total) in self._values.items())
+
+        samples = []
+        for label_values, (bucket_counts, total) in values:
+            labels = list(zip(self.labelnames, label_values))
+            count = 0
+            for bucket, bucket_count in zip(self.buckets, bucket_counts):
+                count += bucket_count
+                samples.append((self.name + '_bucket', labels + [('le', _format_value(bucket))], count))
+            samples.append((self.name + '_count', labels, count))
+            samples.append((self.name + '_sum', labels, total))
+        return samples
+
+
+class MetricsRegistry(object):
+    """ Registry of families of metrics, which exports them in the text exposition format of Prometheus or OpenMetrics
+
+    Attributes:
+        metrics (:obj:`dict`): dictionary that maps the name of each family to the family
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, documentation, labelnames=()):
+        """ Get a family of counters, registering it if it isn't registered
+
+        Args:
+            name (:obj:`str`): name, without the suffix ``_total``
+            documentation (:obj:`str`): description
+            labelnames (:obj:`tuple` of :obj:`str`, optional): names of the labels
+
+        Returns:
+            :obj:`Counter`: family of counters
+        """
+        return self._register(Counter, name, documentation, labelnames=labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """ Get a family of histograms, registering it if it isn't registered
+
+        Args:
+            name (:obj:`str`): name
+            documentation (:obj:`str`): description
+            labelnames (:obj:`tuple` of :obj:`str`, optional): names of the labels
+            buckets (:obj:`tuple` of :obj:`float`, optional): upper bounds of the buckets
+
+        Returns:
+            :obj:`Histogram`: family of histograms
+        """
+        return self._register(Histogram, name, documentation, labelnames=labelnames, buckets=buckets)
+
+    def _register(self, cls, name, documentation, **kwargs):
+        """ Get a family of metrics, registering it if it isn't registered
+
+        Args:
+            cls (:obj:`type`): type of the family
+            name (:obj:`str`): name
+            documentation (:obj:`str`): description
+            **kwargs: other arguments of the constructor of the family
+
+        Returns:
+            :obj:`Metric`: family of metrics
+
+        Raises:
+            :obj:`ValueError`: if another type of family or a family with other labels has the same name
+        """
+        with self._lock:
+            metric = self.metrics.get(name, None)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, documentation, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(kwargs['labelnames']):
+                raise ValueError('Metric `{}` is already registered as a {} with labels {}.'.format(
+                    name, metric.type, sorted(metric.labelnames)))
+            return metric
+
+    def expose(self, openmetrics=False):
+        """ Get the text exposition of the metrics
+
+        Args:
+            openmetrics (:obj:`bool`, optional): whether to use the OpenMetrics format, rather than the Prometheus
+                format
+
+        Returns:
+            :obj:`str`: text exposition
+        """
+        with self._lock:
+            metrics = sorted(self.metrics.values(), key=lambda metric: metric.name)
+        text = ''.join(metric.expose(openmetrics=openmetrics) for metric in metrics)
+        if openmetrics:
+            text += '# EOF\n'
+        return text
+
+    def write(self, filename, openmetrics=False):
+        """ Save the text exposition of the metrics to a file. The file is replaced atomically, so that collectors
+        never read a partially written file.
+
+        Args:
+            filename (:obj:`str`): path to the file
+            openmetrics (:obj:`bool`, optional): whether to use the OpenMetrics format, rather than the Prometheus
+                format
+        """
+        dirname = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(dirname, exist_ok=True)
+        fid, temp_filename = tempfile.mkstemp(dir=dirname, prefix='.' + os.path.basename(filename) + '.')
+        try:
+            with os.fdopen(fid, 'w') as file:
+                file.write(self.expose(openmetrics=openmetrics))
+            os.replace(temp_filename, filename)
+        except BaseException:
+            os.remove(temp_filename)
+            raise
+
+    def serve(self, port, host='127.0.0.1'):
+        """ Serve the text exposition of the metrics over HTTP (``http://{host}:{port}/metrics``) from a daemon thread.
+        The OpenMetrics format is served to clients which accept it, and the Prometheus format to the others.
+
+        Args:
+            port (:obj:`int`): port; ``0`` to choose a free port
+            host (:obj:`str`, optional): host name or address
+
+        Returns:
+            :obj:`http.server.ThreadingHTTPServer`: server; its address is :obj:`http.server.ThreadingHTTPServer.server_address`
+        """
+        registry = self
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ['/', '/metrics']:
+                    self.send_error(404)
+                    return
+
+                openmetrics = 'application/openmetrics-text' in self.headers.get('Accept', '')
+                body = registry.expose(openmetrics=openmetrics).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name='biosimulators-cobrapy-metrics', daemon=True)
+        thread.start()
+        return server
+
+
+class Metrics(object):
+    """ Metrics of the execution of tasks
+
+    Attributes:
+        registry (:obj:`MetricsRegistry`): registry of the metrics
+        preprocess_duration (:obj:`Histogram`): durations of the preprocessing of tasks
+        model_load_duration (:obj:`Histogram`): durations of the reading of models, and of the set up of their
+            optimization problems
+        model_cache_lookups (:obj:`Counter`): lookups of models in the caches of models, by result (``hit`` or
+            ``miss``)
+        result_cache_lookups (:obj:`Counter`): lookups of the results of tasks in the result cache, by result
+        solve_duration (:obj:`Histogram`): durations of the simulation methods, by algorithm (KiSAO id)
+        solves (:obj:`Counter`): executions of the simulation methods, by algorithm and status (``succeeded``,
+            ``failed``, or ``timed_out``)
+        report_write_duration (:obj:`Histogram`): durations of the writing of columnar reports, by format
+        servers (:obj:`dict`): dictionary that maps the port of each HTTP server of the metrics to the server
+    """
+
+    def __init__(self, registry=None):
+        """
+        Args:
+            registry (:obj:`MetricsRegistry`, optional): registry of the metrics
+        """
+        self.registry = registry = registry or MetricsRegistry()
+        self.preprocess_duration = registry.histogram(
+            'biosimulators_cobrapy_preprocess_duration_seconds', 'Duration of the preprocessing of tasks.')
+        self.model_load_duration = registry.histogram(
+            'biosimulators_cobrapy_model_load_duration_seconds',
+            'Duration of the reading of models and of the set up of their optimization problems.')
+        self.model_cache_lookups = registry.counter(
+            'biosimulators_cobrapy_model_cache_lookups', 'Lookups of models in the caches of models.', ('result',))
+        self.result_cache_lookups = registry.counter(
+            'biosimulators_cobrapy_result_cache_lookups', 'Lookups of the results of tasks in the result cache.',
+            ('result',))
+        self.solve_duration = registry.histogram(
+            'biosimulators_cobrapy_solve_duration_seconds', 'Duration of the simulation methods of tasks.',
+            ('algorithm',))
+        self.solves = registry.counter(
+            'biosimulators_cobrapy_solves', 'Executions of the simulation methods of tasks.', ('algorithm', 'status'))
+        self.report_write_duration = registry.histogram(
+            'biosimulators_cobrapy_report_write_duration_seconds', 'Duration of the writing of columnar reports.',
+            ('format',))
+        self.servers = {}
+        self._lock = threading.Lock()
+
+    def serve(self, port):
+        """ Serve the metrics from an HTTP endpoint of the local host, unless they are already served from the port
+
+        Args:
+            port (:obj:`int`): port
+
+        Returns:
+            :obj:`http.server.ThreadingHTTPServer`: server, or :obj:`None` if the port is not available
+        """
+        with self._lock:
+            server = self.servers.get(port, None)
+            if server is None:
+                try:
+                    server = self.registry.serve(port)
+                except OSError as exception:
+                    warn('Metrics could not be served from port {}: {}'.format(port, str(exception)), BioSimulatorsWarning)
+                self.servers[port] = server
+            return server
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics(simulator_config):
+    """ Get the metrics of the process for a configuration. The metrics are shared by all tasks executed by the
+    process, so that they accumulate across tasks, documents, and archives.
+
+    If :obj:`SimulatorConfig.METRICS_PORT` is set, the metrics are served from that port of the local host.
+
+    Args:
+        simulator_config (:obj:`SimulatorConfig`): configuration
+
+    Returns:
+        :obj:`Metrics`: metrics, or :obj:`None` if metrics are disabled
+    """
+    if not (simulator_config.METRICS or simulator_config.METRICS_PATH or simulator_config.METRICS_PORT is not None):
+        return None
+
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+    if simulator_config.METRICS_PORT is not None:
+        _metrics.serve(simulator_config.METRICS_PORT)
+    return _metrics
+
+
+def _escape(value, quotes=False):
+    """ Escape the text of a description or the value of a label
+
+    Args:
+        value (:obj:`str`): text
+        quotes (:obj:`bool`, optional): whether to escape double quotes
+
+    Returns:
+        :obj:`str`: escaped text
+    """
+    value = value.replace('\\', '\\\\').replace('\n', '\\n')
+    if quotes:
+        value = value.replace('"', '\\"')
+    return value
+
+
+def _format_value(value):
+    """ Format the value of a sample
+
+    Args:
+        value (:obj:`float`): value
+
+    Returns:
+        :obj:`str`: formatted value
+    """
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    return repr(float(value))
@@ -0,0 +1,331 @@
+""" Cache of the models of the tasks of a SED document
+
+Documents often execute several algorithms (e.g., FBA, pFBA, and FVA) on the same model with the same changes as
+separate tasks. Rather than reading and converting the model and setting up its optimization problem for each
+task, the tasks of a document share a cache of prepared models, keyed by the hash of the content of the model.
+Each task applies its changes to the shared model in a context, which reverts the changes when the task finishes.
+Because tasks set up and change the shared models, a cache must not be used by several threads at once; threads
+instead execute tasks which have been preprocessed with copies of their models (:obj:`ThreadModelCopies`).
+
+Genome-scale models occupy hundreds of megabytes once read, so the cache bounds the estimated resident size of its
+models, and releases models as soon as no remaining task of the document references them. The remaining tasks are
+determined from a schedule of the models which each task of the document references (:obj:`get_model_schedule`).
+Because the objects of COBRApy models reference each other, released models are only freed by the cyclic garbage
+collector, after which the memory allocator keeps the freed memory, so the cache collects released models and
+returns the freed memory to the operating system (:obj:`free_memory`).
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .changes import ModelChangeIndex
+from .objectives import get_objectives
+from .variables import VariableTargetIndex
+from biosimulators_utils.model_lang.sbml.utils import get_package_namespace as get_sbml_package_namespace
+from biosimulators_utils.sedml.data_model import RepeatedTask
+from biosimulators_utils.sedml.utils import get_models_referenced_by_task
+from biosimulators_utils.xml.utils import get_namespaces_for_xml_doc
+from lxml import etree
+import cobra.io
+import collections
+import ctypes
+import ctypes.util
+import functools
+import gc
+import os
+
+__all__ = [
+    'ModelCache',
+    'ModelSchedule',
+    'get_model_schedule',
+    'prepare_model',
+    'estimate_model_size',
+    'free_memory',
+    'get_resident_size',
+]
+
+MODEL_SIZE_PER_SBML_BYTE = 16
+# :obj:`int`: estimated resident size of a prepared model (element tree, COBRApy model, and optimization problem)
+# per byte of its SBML file. Measured from the growth of the resident memory of a process which prepares copies of
+# the textbook model with 760 and 3,040 reactions (15 and 16 bytes per byte).
+
+ModelSchedule = collections.namedtuple('ModelSchedule', ['task_positions', 'model_last_positions'])
+ModelSchedule.__doc__ = """ Schedule of the models which the tasks of a SED document reference
+
+Attributes:
+    task_positions (:obj:`dict` of :obj:`str` to :obj:`int`): dictionary that maps the id of each task to the
+        position, in the order of execution, of the first top-level task which executes it
+    model_last_positions (:obj:`dict` of :obj:`str` to :obj:`int`): dictionary that maps the id of each model to
+        the position of the last top-level task which references it
+"""
+
+
+class ModelCache(object):
+    """ In-memory cache of prepared models, which evicts the least recently used models
+
+    Attributes:
+        max_models (:obj:`int`): maximum number of models in the cache; :obj:`None` for no limit
+        max_size (:obj:`int`): maximum estimated resident size of the models in the cache in bytes; :obj:`None` for
+            no limit
+        schedule (:obj:`ModelSchedule`): schedule of the models which the tasks of the SED document reference;
+            :obj:`None` to keep models until they are evicted
+        models (:obj:`collections.OrderedDict` of :obj:`str` to :obj:`dict`): dictionary that maps the hash of the
+            content of each model to the prepared model, from the least to the most recently used
+        sizes (:obj:`dict` of :obj:`str` to :obj:`int`): dictionary that maps the hash of the content of each model
+            to its estimated resident size in bytes
+        model_ids (:obj:`dict` of :obj:`str` to :obj:`set` of :obj:`str`): dictionary that maps the hash of the
+            content of each model to the ids of the SED models which it was prepared for
+        size (:obj:`int`): estimated resident size of the models in the cache in bytes
+        hits (:obj:`int`): number of lookups which were found in the cache
+        misses (:obj:`int`): number of lookups which were not found in the cache
+        evictions (:obj:`int`): number of models which were evicted to respect the limits of the cache
+        releases (:obj:`int`): number of models which were released because no remaining task references them
+    """
+
+    def __init__(self, max_models=None, max_size=None, schedule=None):
+        """
+        Args:
+            max_models (:obj:`int`, optional): maximum number of models in the cache; :obj:`None` for no limit
+            max_size (:obj:`int`, optional): maximum estimated resident size of the models in the cache in bytes;
+                :obj:`None` for no limit
+            schedule (:obj:`ModelSchedule`, optional): schedule of the models which the tasks of the SED document
+                reference; :obj:`None` to keep models until they are evicted
+        """
+        self.max_models = max_models
+        self.max_size = max_size
+        self.schedule = schedule
+        self.models = collections.OrderedDict()
+        self.sizes = {}
+        self.model_ids = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.releases = 0
+        self._position = 0
+
+    def get(self, key, model_id=None):
+        """ Get a prepared model from the cache
+
+        Args:
+            key (:obj:`str`): hash of the content of the model
+            model_id (:obj:`str`, optional): id of the SED model which the model is needed for
+
+        Returns:
+            :obj:`dict`: prepared model (see :obj:`prepare_model`), or :obj:`None` if the model is not in the cache
+        """
+        prepared_model = self.models.get(key, None)
+        if prepared_model is None:
+            self.misses += 1
+            return None
+
+        self.models.move_to_end(key)
+        if model_id is not None:
+            self.model_ids[key].add(model_id)
+        self.hits += 1
+        return prepared_model
+
+    def set(self, key, prepared_model, size=0, model_id=None):
+        """ Save a prepared model to the cache, evicting the least recently used models beyond the limits. Models
+        which alone exceed the size limit are not saved.
+
+        Args:
+            key (:obj:`str`): hash of the content of the model
+            prepared_model (:obj:`dict`): prepared model (see :obj:`prepare_model`)
+            size (:obj:`int`, optional): estimated resident size of the model in bytes (see :obj:`estimate_model_size`)
+            model_id (:obj:`str`, optional): id of the SED model which the model was prepared for
+        """
+        if self.max_models == 0 or (self.max_size is not None and size > self.max_size):
+            return
+
+        self.remove(key)
+        self.models[key] = prepared_model
+        self.sizes[key] = size
+        self.model_ids[key] = set() if model_id is None else set([model_id])
+        self.size += size
+        num_evicted = 0
+        while (
+            (self.max_models is not None and len(self.models) > self.max_models)
+            or (self.max_size is not None and self.size > self.max_size)
+        ):
+            self.remove(next(iter(self.models.keys())))
+            num_evicted += 1
+        if num_evicted:
+            self.evictions += num_evicted
+            free_memory()
+
+    def remove(self, key):
+        """ Remove a model from the cache
+
+        Args:
+            key (:obj:`str`): hash of the content of the model
+        """
+        if self.models.pop(key, None) is not None:
+            self.size -= self.sizes.pop(key)
+            self.model_ids.pop(key)
+
+    def release_unused_models(self, task):
+        """ Release the models which no task of the document references from the start of the execution of a task
+        onward, according to the schedule of the cache
+
+        Args:
+            task (:obj:`Task`): task which is starting
+
+        Returns:
+            :obj:`int`: number of released models
+        """
+        if self.schedule is None or task.id not in self.schedule.task_positions:
+            return 0
+
+        # the positions of the tasks of repeated tasks are the positions of the first repeated tasks which execute
+        # them, so that the position of the execution never moves past tasks which still have to be executed
+        self._position = max(self._position, self.schedule.task_positions[task.id])
+
+        num_released = 0
+        for key, model_ids in list(self.model_ids.items()):
+            if model_ids and all(
+                self.schedule.model_last_positions.get(model_id, self._position) < self._position
+                for model_id in model_ids
+            ):
+                self.remove(key)
+                num_released += 1
+        if num_released:
+            self.releases += num_released
+            free_memory()
+        return num_released
+
+    def clear(self):
+        """ Remove all models from the cache, and free their memory """
+        if self.models:
+            for key in list(self.models.keys()):
+                self.remove(key)
+            free_memory()
+
+    def get_stats(self):
+        """ Get statistics about the usage of the cache
+
+        Returns:
+            :obj:`dict`: numbers of hits and misses, the hit rate, the number and estimated resident size of the
+            cached models, and the numbers of evicted and released models
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRate': self.hits / lookups if lookups else None,
+            'models': len(self.models),
+            'size': self.size,
+            'evictions': self.evictions,
+            'releases': self.releases,
+            'residentSize': get_resident_size(),
+        }
+
+
+def get_model_schedule(doc):
+    """ Get the schedule of the models which the tasks of a SED document reference, in the order in which the
+    tasks are executed
+
+    Args:
+        doc (:obj:`SedDocument`): SED document
+
+    Returns:
+        :obj:`ModelSchedule`: schedule
+    """
+    task_positions = {}
+    model_last_positions = {}
+    for position, task in enumerate(doc.tasks):
+        for model in get_models_referenced_by_task(task):
+            model_last_positions[model.id] = position
+
+        tasks = [task]
+        while tasks:
+            task = tasks.pop()
+            task_positions.setdefault(task.id, position)
+            if isinstance(task, RepeatedTask):
+                tasks.extend(sub_task.task for sub_task in task.sub_tasks)
+
+    return ModelSchedule(task_positions, model_last_positions)
+
+
+def prepare_model(source):
+    """ Read a model and index the information about the model which is needed to preprocess its tasks
+
+    Args:
+        source (:obj:`str`): path to the SBML file of the model
+
+    Returns:
+        :obj:`dict`: element tree of the SBML file, prefix and URI of the SBML-FBC package, model, SBML-FBC id of the
+            active objective, objectives, and indices of the targets of model changes and variables
+    """
+    model_etree = etree.parse(source)
+    namespaces = get_namespaces_for_xml_doc(model_etree)
+    sbml_fbc_prefix, sbml_fbc_uri = get_sbml_package_namespace('fbc', namespaces)
+
+    # Read the model
+    cobra_model = cobra.io.read_sbml_model(source)
+
+    # get the objectives from the SBML file, rather than reading it again with libSBML
+    active_objective_sbml_fbc_id, objectives = get_objectives(model_etree, sbml_fbc_uri)
+
+    return {
+        'model_etree': model_etree,
+        'sbml_fbc_prefix': sbml_fbc_prefix,
+        'sbml_fbc_uri': sbml_fbc_uri,
+        'model': cobra_model,
+        'active_objective_sbml_fbc_id': active_objective_sbml_fbc_id,
+        'objectives': objectives,
+        'model_change_index': ModelChangeIndex(cobra_model, model_etree, sbml_fbc_uri, active_objective_sbml_fbc_id),
+        'variable_target_index': VariableTargetIndex(cobra_model, model_etree, sbml_fbc_uri,
+                                                     active_objective_sbml_fbc_id),
+    }
+
+
+def estimate_model_size(source):
+    """ Estimate the resident size of a prepared model from the size of its SBML file
+
+    Args:
+        source (:obj:`str`): path to the SBML file of the model
+
+    Returns:
+        :obj:`int`: estimated resident size of the prepared model in bytes
+    """
+    return MODEL_SIZE_PER_SBML_BYTE * os.path.getsize(source)
+
+
+def free_memory():
+    """ Collect released models, and return the freed memory to the operating system, if the C library supports it
+    (glibc)
+    """
+    gc.collect()
+    malloc_trim = _get_malloc_trim()
+    if malloc_trim is not None:
+        malloc_trim(0)
+
+
+def get_resident_size():
+    """ Get the resident size of the process
+
+    Returns:
+        :obj:`int`: resident size of the process in bytes, or :obj:`None` if it cannot be determined (only Linux is
+        supported)
+    """
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):  # pragma: no cover: depends on the operating system
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_malloc_trim():
+    """ Get the function of the C library which returns the free memory of the heap to the operating system
+
+    Returns:
+        :obj:`ctypes._CFuncPtr`: function, or :obj:`None` if the C library doesn't provide it
+    """
+    try:
+        return ctypes.CDLL(ctypes.util.find_library('c')).malloc_trim
+    except (OSError, AttributeError, TypeError):  # pragma: no cover: depends on the C library
+        return None
@@ -0,0 +1,209 @@
+""" Objectives of constraint-based models
+
+The objectives of a model are parsed once from the SBML file which is read to preprocess a task. The values of
+objectives other than the active objective are then computed from the solution of the active objective:
+
+* For optimization methods (e.g., FBA), each inactive objective is optimized by swapping the coefficients and the
+  direction of the objective of the optimization problem of the model, which reuses the problem and the warm state
+  of the solver, rather than rebuilding the problem from the SBML file.
+* For sampling methods, each inactive objective is evaluated at each sample.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from cobra.io.sbml import F_REPLACE
+from lxml import etree
+import collections
+import numpy
+
+__all__ = [
+    'Objective',
+    'get_objectives',
+    'get_objective_required_results',
+    'optimize_objectives',
+    'evaluate_objectives',
+    'get_objective_values',
+]
+
+OBJECTIVE_DIRECTIONS = {
+    'maximize': 'max',
+    'minimize': 'min',
+}
+# :obj:`dict`: dictionary that maps the types of SBML-FBC objectives to the directions of optlang objectives
+
+
+class Objective(object):
+    """ Objective of a model
+
+    Attributes:
+        id (:obj:`str`): SBML-FBC id
+        direction (:obj:`str`): direction (``max`` or ``min``)
+        coefficients (:obj:`dict` of :obj:`str` to :obj:`float`): dictionary that maps the id of each reaction of the
+            objective to its coefficient
+    """
+
+    def __init__(self, id, direction, coefficients):
+        """
+        Args:
+            id (:obj:`str`): SBML-FBC id
+            direction (:obj:`str`): direction (``max`` or ``min``)
+            coefficients (:obj:`dict` of :obj:`str` to :obj:`float`): dictionary that maps the id of each reaction of
+                the objective to its coefficient
+        """
+        self.id = id
+        self.direction = direction
+        self.coefficients = coefficients
+
+
+def get_objectives(model_etree, sbml_fbc_uri):
+    """ Get the objectives of a model
+
+    Args:
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree of the SBML file of the model
+        sbml_fbc_uri (:obj:`str`): URI of the SBML-FBC package
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`str`: SBML-FBC id of the active objective
+            * :obj:`collections.OrderedDict` of :obj:`str` to :obj:`Objective`: dictionary that maps the SBML-FBC id of
+              each objective to the objective
+    """
+    sbml_uri = etree.QName(model_etree.getroot()).namespace
+    get_reaction_id = F_REPLACE['F_REACTION']
+
+    objectives = collections.OrderedDict()
+    active_objective_sbml_fbc_id = None
+    objectives_element = model_etree.find('{{{}}}model/{{{}}}listOfObjectives'.format(sbml_uri, sbml_fbc_uri))
+    if objectives_element is not None:
+        active_objective_sbml_fbc_id = objectives_element.get('{{{}}}activeObjective'.format(sbml_fbc_uri))
+        for objective_element in objectives_element.iterfind('{{{}}}objective'.format(sbml_fbc_uri)):
+            coefficients = {}
+            for flux_objective_element in objective_element.iterfind(
+                    '{{{}}}listOfFluxObjectives/{{{}}}fluxObjective'.format(sbml_fbc_uri, sbml_fbc_uri)):
+                reaction_id = get_reaction_id(flux_objective_element.get('{{{}}}reaction'.format(sbml_fbc_uri)))
+                coefficient = flux_objective_element.get('{{{}}}coefficient'.format(sbml_fbc_uri))
+                coefficients[reaction_id] = float(coefficient)
+
+            id = objective_element.get('{{{}}}id'.format(sbml_fbc_uri))
+            direction = OBJECTIVE_DIRECTIONS[objective_element.get('{{{}}}type'.format(sbml_fbc_uri))]
+            objectives[id] = Objective(id, direction, coefficients)
+
+    return active_objective_sbml_fbc_id, objectives
+
+
+def get_objective_required_results(method_props, required_results, objectives):
+    """ Get the results which are needed to compute the values of the requested inactive objectives
+
+    Args:
+        method_props (:obj:`dict`): properties of the simulation method
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+        objectives (:obj:`dict` of :obj:`str` to :obj:`Objective`): dictionary that maps the SBML-FBC id of each
+            objective to the objective
+
+    Returns:
+        :obj:`dict`: dictionary that maps the type of each needed result to the ids of the model objects whose values
+            are needed, including the fluxes of the reactions of the requested inactive objectives which are evaluated
+            at each sample
+    """
+    objective_ids = required_results.get('objective_values', ())
+    if not objective_ids or method_props['inactive_objectives'] != 'evaluate':
+        return required_results
+
+    required_results = dict(required_results)
+    required_results['fluxes'] = set(required_results.get('fluxes', ()))
+    for objective_id in objective_ids:
+        required_results['fluxes'].update(objectives[objective_id].coefficients.keys())
+    return required_results
+
+
+def optimize_objectives(model, objectives, objective_ids):
+    """ Optimize objectives of a model by swapping the coefficients and direction of the objective of its
+    optimization problem, one objective after another, and then restore the objective
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        objectives (:obj:`dict` of :obj:`str` to :obj:`Objective`): dictionary that maps the SBML-FBC id of each
+            objective to the objective
+        objective_ids (:obj:`collections.abc.Iterable` of :obj:`str`): SBML-FBC ids of the objectives to optimize
+
+    Returns:
+        :obj:`dict` of :obj:`str` to :obj:`float`: dictionary that maps the SBML-FBC id of each objective to its optimal
+            value, or NaN if the objective could not be optimized
+    """
+    solver_objective = model.solver.objective
+    prev_direction = solver_objective.direction
+    prev_coefficients = {
+        variable: coefficient
+        for variable, coefficient in solver_objective.get_linear_coefficients(model.variables).items()
+        if coefficient
+    }
+
+    values = {}
+    coefficients = prev_coefficients
+    try:
+        for objective_id in objective_ids:
+            objective = objectives[objective_id]
+            new_coefficients = {variable: 0. for variable in coefficients}
+            for reaction_id, coefficient in objective.coefficients.items():
+                reaction = model.reactions.get_by_id(reaction_id)
+                new_coefficients[reaction.forward_variable] = coefficient
+                new_coefficients[reaction.reverse_variable] = -coefficient
+            solver_objective.set_linear_coefficients(new_coefficients)
+            solver_objective.direction = objective.direction
+            coefficients = new_coefficients
+
+            values[objective_id] = model.slim_optimize(error_value=numpy.nan)
+
+    finally:
+        restored_coefficients = {variable: 0. for variable in coefficients}
+        restored_coefficients.update(prev_coefficients)
+        solver_objective.set_linear_coefficients(restored_coefficients)
+        solver_objective.direction = prev_direction
+
+    return values
+
+
+def evaluate_objectives(solution, objectives, objective_ids):
+    """ Evaluate objectives at the fluxes of a solution
+
+    Args:
+        solution (:obj:`SlimSolution`): solution which contains the fluxes of the reactions of the objectives
+        objectives (:obj:`dict` of :obj:`str` to :obj:`Objective`): dictionary that maps the SBML-FBC id of each
+            objective to the objective
+        objective_ids (:obj:`collections.abc.Iterable` of :obj:`str`): SBML-FBC ids of the objectives to evaluate
+
+    Returns:
+        :obj:`dict` of :obj:`str` to :obj:`numpy.ndarray`: dictionary that maps the SBML-FBC id of each objective to its
+            value at each sample
+    """
+    values = {}
+    for objective_id in objective_ids:
+        value = 0.
+        for reaction_id, coefficient in objectives[objective_id].coefficients.items():
+            value = value + coefficient * solution.get_result('fluxes', (reaction_id,))
+        values[objective_id] = value
+    return values
+
+
+def get_objective_values(model, method_props, solution, objectives, objective_ids):
+    """ Get the values of the requested inactive objectives for a solution of the active objective
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        method_props (:obj:`dict`): properties of the simulation method
+        solution (:obj:`SlimSolution` or :obj:`cobra.core.solution.Solution`): solution of the active objective
+        objectives (:obj:`dict` of :obj:`str` to :obj:`Objective`): dictionary that maps the SBML-FBC id of each
+            objective to the objective
+        objective_ids (:obj:`collections.abc.Iterable` of :obj:`str`): SBML-FBC ids of the objectives
+
+    Returns:
+        :obj:`dict`: dictionary that maps the SBML-FBC id of each objective to its value
+    """
+    if method_props['inactive_objectives'] == 'evaluate':
+        return evaluate_objectives(solution, objectives, objective_ids)
+    return optimize_objectives(model, objectives, objective_ids)
@@ -0,0 +1,409 @@
+""" Persistent pool of worker processes which is shared by the tasks of a run
+
+Rather than starting a pool of processes for each call of a parallel method, as
+:obj:`cobra.flux_analysis.flux_variability_analysis` does, the pool is started once per process and
+number of workers, and reused by all of the FVA, gFBA, and knockout screening tasks of a run.
+
+Optimization problems are pushed to the workers once. The first time that a worker receives work for a problem,
+it loads the problem from a file written by the parent process and keeps it. Each call then only sends the bounds
+of the variables and constraints which differ from the pushed problem (e.g., the bounds changed by the model
+changes of a task, or by an iteration of gFBA), which the worker applies for the call and then reverts.
+
+Objects which are only needed by one task (e.g., the sampler of a task) are released by the task when it finishes.
+Releasing an object removes its file, and each worker drops its copy of the object the next time it is called.
+The files of objects which calls are still using (i.e., whose iterators of results haven't been exhausted or closed)
+are neither evicted nor removed by releases until the calls finish, because workers may still need to load them.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+import atexit
+import collections
+import hashlib
+import multiprocessing
+import os
+import pickle
+import shutil
+import signal
+import tempfile
+import threading
+
+__all__ = [
+    'WorkerPool',
+    'get_worker_pool',
+    'close_worker_pools',
+    'get_problem_key',
+    'get_problem_bounds',
+    'set_problem_bounds',
+]
+
+WORKER_PROBLEM_CACHE_SIZE = 8
+# :obj:`int`: maximum number of problems which each worker keeps
+
+PUSHED_PROBLEM_CACHE_SIZE = 32
+# :obj:`int`: maximum number of pushed problems which each pool keeps available to its workers
+
+_pools = {}
+_pools_lock = threading.Lock()
+_worker_problems = collections.OrderedDict()
+
+
+class WorkerPool(object):
+    """ Persistent pool of worker processes, which threads can share
+
+    Attributes:
+        processes (:obj:`int`): number of worker processes
+    """
+
+    def __init__(self, processes):
+        """
+        Args:
+            processes (:obj:`int`): number of worker processes
+        """
+        self.processes = processes
+        self._pool = multiprocessing.Pool(processes, initializer=_init_worker)
+        self._dirname = tempfile.mkdtemp()
+        self._pushed_problems = collections.OrderedDict()
+        self._num_pushes = 0
+        self._num_users = collections.Counter()
+        self._released_keys = set()
+        self._lock = threading.RLock()
+
+    def push_problem(self, key, problem):
+        """ Make an optimization problem available to the workers, unless it has already been pushed
+
+        Args:
+            key (:obj:`str`): key of the problem
+            problem (:obj:`optlang.interface.Model` or :obj:`cobra.core.model.Model`): problem
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the problem was pushed, :obj:`False` if it had already been pushed
+        """
+        return self._push(key, problem, get_problem_bounds)
+
+    def push_data(self, key, data):
+        """ Make read-only data (e.g., the warmup points of a flux sampler) available to the workers, unless it has
+        already been pushed
+
+        Args:
+            key (:obj:`str`): key of the data
+            data (:obj:`object`): data
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the data was pushed, :obj:`False` if it had already been pushed
+        """
+        return self._push(key, data, lambda data: {})
+
+    def _push(self, key, obj, get_bounds):
+        """ Make an object available to the workers, unless it has already been pushed
+
+        Args:
+            key (:obj:`str`): key of the object
+            obj (:obj:`object`): object
+            get_bounds (:obj:`types.FunctionType`): function which gets the bounds of the object
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the object was pushed, :obj:`False` if it had already been pushed
+        """
+        with self._lock:
+            if key in self._pushed_problems:
+                self._pushed_problems.move_to_end(key)
+                self._released_keys.discard(key)
+                return False
+
+            # evict the least recently used objects which no calls are using; while calls use all of the objects,
+            # more objects than the limit are kept
+            while len(self._pushed_problems) >= PUSHED_PROBLEM_CACHE_SIZE:
+                unused_key = next((other_key for other_key in self._pushed_problems
+                                   if not self._num_users[other_key]), None)
+                if unused_key is None:
+                    break
+                self._remove(unused_key)
+
+            # each push has its own file, so that workers can tell whether their copy is from the current push
+            self._num_pushes += 1
+            filename = os.path.join(self._dirname, '{}.{}.pkl'.format(
+                hashlib.sha256(key.encode()).hexdigest(), self._num_pushes))
+            with open(filename, 'wb') as file:
+                pickle.dump(obj, file)
+            self._pushed_problems[key] = (filename, get_bounds(obj))
+            return True
+
+    def release(self, key):
+        """ Remove a pushed object which is no longer needed, once the calls which use it have finished. Workers
+        drop their copies of the object the next time they are called.
+
+        Args:
+            key (:obj:`str`): key of the object
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the object was released, :obj:`False` if it wasn't pushed
+        """
+        with self._lock:
+            if key not in self._pushed_problems:
+                return False
+            if self._num_users[key]:
+                self._released_keys.add(key)
+            else:
+                self._remove(key)
+            return True
+
+    def _remove(self, key):
+        """ Remove a pushed object
+
+        Args:
+            key (:obj:`str`): key of the object
+        """
+        filename, _ = self._pushed_problems.pop(key)
+        self._released_keys.discard(key)
+        os.remove(filename)
+
+    def _end_use(self, key):
+        """ Record that a call which used a pushed object has finished, and remove the object if it was released
+        while the call was using it
+
+        Args:
+            key (:obj:`str`): key of the object
+        """
+        with self._lock:
+            self._num_users[key] -= 1
+            if self._num_users[key] <= 0:
+                del self._num_users[key]
+                if key in self._released_keys:
+                    self._remove(key)
+
+    def imap_unordered(self, func, key, problem, args_list):
+        """ Call a function on each of the workers with the current state of an optimization problem
+
+        Args:
+            func (:obj:`types.FunctionType`): module-level function whose first argument is an optimization problem
+            key (:obj:`str`): key of the problem
+            problem (:obj:`optlang.interface.Model` or :obj:`cobra.core.model.Model`): problem in its current state
+            args_list (:obj:`list` of :obj:`tuple`): additional arguments for each call of :obj:`func`
+
+        Returns:
+            :obj:`iterator`: results of the calls, in the order in which they complete
+        """
+        with self._lock:
+            self.push_problem(key, problem)
+            filename, pushed_bounds = self._pushed_problems[key]
+            self._num_users[key] += 1
+
+        bounds = get_problem_bounds(problem)
+        changed_bounds = {
+            name: value
+            for name, value in bounds.items()
+            if pushed_bounds.get(name, None) != value
+        }
+
+        return _PoolResults(self, key, self._pool.imap_unordered(
+            _call_worker,
+            [(func, key, filename, changed_bounds, args) for args in args_list]))
+
+    def imap_unordered_with_data(self, func, key, data, args_list):
+        """ Call a function on each of the workers with read-only data
+
+        Args:
+            func (:obj:`types.FunctionType`): module-level function whose first argument is the data
+            key (:obj:`str`): key of the data
+            data (:obj:`object`): data
+            args_list (:obj:`list` of :obj:`tuple`): additional arguments for each call of :obj:`func`
+
+        Returns:
+            :obj:`iterator`: results of the calls, in the order in which they complete
+        """
+        with self._lock:
+            self.push_data(key, data)
+            filename, _ = self._pushed_problems[key]
+            self._num_users[key] += 1
+        return _PoolResults(self, key, self._pool.imap_unordered(
+            _call_worker,
+            [(func, key, filename, {}, args) for args in args_list]))
+
+    def close(self):
+        """ Stop the worker processes and remove the pushed problems """
+        self._pool.terminate()
+        self._pool.join()
+        shutil.rmtree(self._dirname, ignore_errors=True)
+        self._pushed_problems.clear()
+        self._num_users.clear()
+        self._released_keys.clear()
+
+
+class _PoolResults(object):
+    """ Iterator over the results of the calls of a :obj:`WorkerPool` which use a pushed object, which records that
+    the calls have finished using the object when it is exhausted or closed
+    """
+
+    def __init__(self, pool, key, results):
+        """
+        Args:
+            pool (:obj:`WorkerPool`): pool
+            key (:obj:`str`): key of the object which the calls use
+            results (:obj:`iterator`): results of the calls
+        """
+        self._pool = pool
+        self._key = key
+        self._results = results
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._results)
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        """ Record that the calls have finished using the object """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool._end_use(self._key)
+
+    def __del__(self):
+        # e.g., when a caller stops iterating over the results because a call raised an exception
+        self.close()
+
+
+def get_worker_pool(processes):
+    """ Get the pool with a number of worker processes, starting it the first time that it is needed
+
+    Args:
+        processes (:obj:`int`): number of worker processes
+
+    Returns:
+        :obj:`WorkerPool`: pool
+    """
+    with _pools_lock:
+        pool = _pools.get(processes, None)
+        if pool is None:
+            if not _pools:
+                atexit.register(close_worker_pools)
+            pool = _pools[processes] = WorkerPool(processes)
+        return pool
+
+
+def close_worker_pools():
+    """ Stop all of the worker pools """
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.close()
+    atexit.unregister(close_worker_pools)
+
+
+def get_problem_key(model_key, problem):
+    """ Get a key for the structure of an optimization problem, which is used to identify problems which have
+    already been pushed to the workers
+
+    The key covers the names of the variables and constraints, the coefficients of the constraints, and the objective,
+    because these aren't sent with each call. The bounds of the variables and constraints are excluded, because the
+    bounds which differ from those of the pushed problem are sent with each call.
+
+    Args:
+        model_key (:obj:`str`): key of the model of the problem (e.g., hash of its source)
+        problem (:obj:`optlang.interface.Model` or :obj:`cobra.core.model.Model`): problem
+
+    Returns:
+        :obj:`str`: key
+    """
+    structure = hashlib.sha256()
+    for variable in problem.variables:
+        structure.update(variable.name.encode() + b'\n')
+    for constraint in problem.constraints:
+        # e.g., the objective of a model is folded into a constraint with a constant name by gFBA
+        structure.update(constraint.name.encode() + b'\n')
+        coefficients = constraint.get_linear_coefficients(constraint.variables)
+        structure.update(repr(sorted((variable.name, float(coefficient))
+                                     for variable, coefficient in coefficients.items())).encode() + b'\n')
+    structure.update(problem.objective.direction.encode() + b'\n')
+    structure.update(str(problem.objective.expression).encode())
+    return '{}:{}'.format(model_key, structure.hexdigest())
+
+
+def get_problem_bounds(problem):
+    """ Get the bounds of the variables and constraints of an optimization problem
+
+    Args:
+        problem (:obj:`optlang.interface.Model` or :obj:`cobra.core.model.Model`): problem
+
+    Returns:
+        :obj:`dict`: dictionary that maps a tuple of the type (``variable`` or ``constraint``) and name of each
+            variable and constraint to a tuple of its lower and upper bounds
+    """
+    bounds = {}
+    for variable in problem.variables:
+        bounds[('variable', variable.name)] = (variable.lb, variable.ub)
+    for constraint in problem.constraints:
+        bounds[('constraint', constraint.name)] = (constraint.lb, constraint.ub)
+    return bounds
+
+
+def set_problem_bounds(problem, bounds):
+    """ Set the bounds of variables and constraints of an optimization problem
+
+    Args:
+        problem (:obj:`optlang.interface.Model` or :obj:`cobra.core.model.Model`): problem
+        bounds (:obj:`dict`): dictionary that maps a tuple of the type (``variable`` or ``constraint``) and name of
+            each variable and constraint to a tuple of its lower and upper bounds
+    """
+    for (type, name), (lb, ub) in bounds.items():
+        if type == 'variable':
+            problem.variables[name].set_bounds(lb, ub)
+        else:
+            constraint = problem.constraints[name]
+            # set the bounds in an order which never makes the lower bound greater than the upper bound
+            if lb is not None and constraint.ub is not None and lb > constraint.ub:
+                constraint.ub = ub
+                constraint.lb = lb
+            else:
+                constraint.lb = lb
+                constraint.ub = ub
+
+
+def _init_worker():
+    """ Restore the default handler of ``SIGTERM`` in a worker process, so that :obj:`WorkerPool.close` can stop
+    the worker even if the parent process had installed a handler (e.g., the command-line application) which the
+    worker inherited
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _call_worker(item):
+    """ Call a function in a worker process with the problem of a call
+
+    Args:
+        item (:obj:`tuple`): function, key of the problem, path to the pushed problem, bounds which differ from the
+            pushed problem, and additional arguments to the function
+
+    Returns:
+        :obj:`object`: result of the function
+    """
+    func, key, filename, changed_bounds, args = item
+
+    # drop the problems which have been released or evicted by the parent process
+    for other_key, (other_filename, _) in list(_worker_problems.items()):
+        if not os.path.isfile(other_filename):
+            _worker_problems.pop(other_key)
+
+    pushed_filename, problem = _worker_problems.pop(key, (None, None))
+    if pushed_filename != filename:
+        with open(filename, 'rb') as file:
+            problem = pickle.load(file)
+    _worker_problems[key] = (filename, problem)
+    while len(_worker_problems) > WORKER_PROBLEM_CACHE_SIZE:
+        _worker_problems.popitem(last=False)
+
+    pushed_bounds = {}
+    for type, name in changed_bounds.keys():
+        obj = problem.variables[name] if type == 'variable' else problem.constraints[name]
+        pushed_bounds[(type, name)] = (obj.lb, obj.ub)
+    set_problem_bounds(problem, changed_bounds)
+    try:
+        return func(problem, *args)
+    finally:
+        set_problem_bounds(problem, pushed_bounds)
@@ -0,0 +1,258 @@
+""" Columnar (Apache Arrow IPC and Parquet) reports
+
+Each data set of a report is a column of float64 values, and each point of the report (e.g., each knockout of a
+screen) is a row. Unlike the CSV reports of BioSimulators-utils, in which each data set is a row of text, the
+columns can be written and read back without formatting and parsing each value, and with only the data sets
+which are needed.
+
+:obj:`ColumnarReportWriter` writes the points of a report as they arrive, in batches of rows (record batches of
+Arrow IPC files and row groups of Parquet files), so that the points don't have to be held in memory until the
+report is complete. The reports of SED documents are the exception: BioSimulators utils computes them from the
+results of all of the tasks of a document, which it holds in memory, so they are written with a single call of
+:obj:`write_columnar_report` once the document has been executed.
+
+Writing and reading columnar reports requires the optional ``pyarrow`` package
+(``pip install biosimulators_cobrapy[arrow]``).
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.report.data_model import DataSetResults
+import enum
+import numpy
+import os
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ModuleNotFoundError:  # pragma: no cover: depends on whether the optional package is installed
+    pyarrow = None
+
+__all__ = [
+    'ColumnarReportFormat',
+    'ColumnarReportWriter',
+    'write_columnar_report',
+    'read_columnar_report',
+    'get_columnar_report_filename',
+]
+
+BATCH_MAX_BYTES = 1 << 26
+# :obj:`int`: maximum size in bytes of the points which are buffered before they are written as a batch
+
+
+class ColumnarReportFormat(str, enum.Enum):
+    """ Columnar report format """
+    arrow = 'arrow'
+    parquet = 'parquet'
+
+
+def get_columnar_report_filename(base_path, rel_path, format):
+    """ Get the path to the file of a columnar report
+
+    Args:
+        base_path (:obj:`str`): parent directory of the report
+        rel_path (:obj:`str`): path of the report relative to :obj:`base_path`, without extension
+        format (:obj:`ColumnarReportFormat`): report format
+
+    Returns:
+        :obj:`str`: path to the file of the report (``{ base_path }/{ rel_path }.{ format }``)
+    """
+    return os.path.join(base_path, os.path.relpath(rel_path, '.') + '.' + ColumnarReportFormat(format).value)
+
+
+class ColumnarReportWriter(object):
+    """ Writer of a columnar report, which writes the points of the report as they arrive
+
+    Attributes:
+        report (:obj:`Report`): report
+        filename (:obj:`str`): path to the file of the report
+        format (:obj:`ColumnarReportFormat`): report format
+        batch_size (:obj:`int`): number of points which are buffered before they are written as a batch
+        schema (:obj:`pyarrow.Schema`): schema of the report
+        num_points (:obj:`int`): number of points which have been written or buffered
+    """
+
+    def __init__(self, report, filename, format=ColumnarReportFormat.parquet, batch_size=None, data_set_shapes=None):
+        """
+        Args:
+            report (:obj:`Report`): report
+            filename (:obj:`str`): path to the file of the report
+            format (:obj:`ColumnarReportFormat`, optional): report format
+            batch_size (:obj:`int`, optional): number of points which are buffered before they are written as a batch;
+                defaults to the number of points whose size is :obj:`BATCH_MAX_BYTES`
+            data_set_shapes (:obj:`dict` of :obj:`str` to :obj:`tuple`, optional): dictionary that maps the id of each
+                multidimensional data set to its shape, which is recorded in the metadata of its column
+
+        Raises:
+            :obj:`ModuleNotFoundError`: if ``pyarrow`` is not installed
+        """
+        if pyarrow is None:
+            raise ModuleNotFoundError('pyarrow must be installed to write reports in the {} format. '
+                                      'Run `pip install biosimulators_cobrapy[arrow]`.'.format(ColumnarReportFormat(format).value))
+
+        self.report = report
+        self.filename = filename
+        self.format = ColumnarReportFormat(format)
+        self.batch_size = batch_size or max(BATCH_MAX_BYTES // (8 * max(len(report.data_sets), 1)), 1)
+        self.schema = self._get_schema(report, data_set_shapes or {})
+        self.num_points = 0
+
+        out_dir = os.path.dirname(filename)
+        if out_dir and not os.path.isdir(out_dir):
+            os.makedirs(out_dir)
+
+        if self.format == ColumnarReportFormat.arrow:
+            self._writer = pyarrow.ipc.new_file(filename, self.schema)
+        else:
+            self._writer = pyarrow.parquet.ParquetWriter(filename, self.schema)
+        self._blocks = []
+        self._num_buffered_points = 0
+
+    @staticmethod
+    def _get_schema(report, data_set_shapes):
+        """ Get the schema of a report
+
+        Args:
+            report (:obj:`Report`): report
+            data_set_shapes (:obj:`dict` of :obj:`str` to :obj:`tuple`): dictionary that maps the id of each
+                multidimensional data set to its shape
+
+        Returns:
+            :obj:`pyarrow.Schema`: schema
+        """
+        fields = []
+        for data_set in report.data_sets:
+            metadata = {
+                'sedmlLabel': data_set.label or '',
+                'sedmlName': data_set.name or '',
+            }
+            if data_set.id in data_set_shapes:
+                metadata['shape'] = ','.join(str(dim_len) for dim_len in data_set_shapes[data_set.id])
+            fields.append(pyarrow.field(data_set.id, pyarrow.float64(), metadata=metadata))
+        return pyarrow.schema(fields, metadata={'sedmlId': report.id or '', 'sedmlName': report.name or ''})
+
+    def write(self, data_set_results):
+        """ Write points of the report
+
+        Args:
+            data_set_results (:obj:`DataSetResults`): dictionary that maps the id of each data set to its values at
+                the points (a scalar for a single point). Data sets which are missing or shorter than the others are
+                padded with NaN.
+        """
+        values = [data_set_results.get(data_set.id, None) for data_set in self.report.data_sets]
+
+        # block of the data sets (rows) at the points (columns); NumPy converts missing data sets to NaN
+        try:
+            block = numpy.array(values, dtype=numpy.float64).reshape((len(values), -1))
+        except (ValueError, TypeError):
+            block = None
+
+        if block is None or not block.shape[1]:
+            num_points = max([1] + [numpy.size(value) for value in values if value is not None])
+            block = numpy.full((len(values), num_points), numpy.nan)
+            for i_data_set, value in enumerate(values):
+                if value is not None:
+                    value = numpy.asarray(value, dtype=numpy.float64).ravel()
+                    block[i_data_set, :value.size] = value
+
+        num_points = block.shape[1]
+        self._blocks.append(block)
+        self._num_buffered_points += num_points
+        self.num_points += num_points
+        if self._num_buffered_points >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """ Write the buffered points as batches of at most :obj:`batch_size` points """
+        if not self._num_buffered_points:
+            return
+
+        block = numpy.concatenate(self._blocks, axis=1) if len(self._blocks) > 1 else self._blocks[0]
+        for start in range(0, self._num_buffered_points, self.batch_size):
+            batch = pyarrow.record_batch([pyarrow.array(column[start:start + self.batch_size]) for column in block],
+                                         schema=self.schema)
+            self._writer.write_batch(batch)
+
+        self._blocks = []
+        self._num_buffered_points = 0
+
+    def close(self):
+        """ Write the buffered points and close the file """
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+def write_columnar_report(report, data_set_results, base_path, rel_path, format=ColumnarReportFormat.parquet):
+    """ Write a report as a columnar file
+
+    Multidimensional data sets (e.g., of nested repeated tasks) are flattened in C order, and their shapes are
+    recorded in the metadata of their columns.
+
+    Args:
+        report (:obj:`Report`): report
+        data_set_results (:obj:`DataSetResults`): results of the data sets
+        base_path (:obj:`str`): parent directory of the report
+        rel_path (:obj:`str`): path of the report relative to :obj:`base_path`, without extension
+        format (:obj:`ColumnarReportFormat`, optional): report format
+
+    Returns:
+        :obj:`str`: path to the file of the report
+    """
+    data_set_shapes = {}
+    for data_set in report.data_sets:
+        value = data_set_results.get(data_set.id, None)
+        if value is not None and numpy.ndim(value) > 1:
+            data_set_shapes[data_set.id] = numpy.shape(value)
+
+    filename = get_columnar_report_filename(base_path, rel_path, format)
+    with ColumnarReportWriter(report, filename, format=format, data_set_shapes=data_set_shapes) as writer:
+        writer.write(data_set_results)
+    return filename
+
+
+def read_columnar_report(report, base_path, rel_path, format=ColumnarReportFormat.parquet):
+    """ Read the data sets of a columnar report
+
+    Args:
+        report (:obj:`Report`): report; only the data sets of the report are read
+        base_path (:obj:`str`): parent directory of the report
+        rel_path (:obj:`str`): path of the report relative to :obj:`base_path`, without extension
+        format (:obj:`ColumnarReportFormat`, optional): report format
+
+    Returns:
+        :obj:`DataSetResults`: results of the data sets. Multidimensional data sets are restored to their shapes.
+
+    Raises:
+        :obj:`ModuleNotFoundError`: if ``pyarrow`` is not installed
+    """
+    if pyarrow is None:
+        raise ModuleNotFoundError('pyarrow must be installed to read reports in the {} format. '
+                                  'Run `pip install biosimulators_cobrapy[arrow]`.'.format(ColumnarReportFormat(format).value))
+
+    filename = get_columnar_report_filename(base_path, rel_path, format)
+    data_set_ids = [data_set.id for data_set in report.data_sets]
+    if ColumnarReportFormat(format) == ColumnarReportFormat.arrow:
+        with pyarrow.OSFile(filename, 'rb') as file:
+            table = pyarrow.ipc.open_file(file).read_all().select(data_set_ids)
+    else:
+        table = pyarrow.parquet.read_table(filename, columns=data_set_ids)
+
+    results = DataSetResults()
+    for field, column in zip(table.schema, table.columns):
+        value = column.to_numpy()
+        shape = (field.metadata or {}).get(b'shape', None)
+        if shape:
+            shape = tuple(int(dim_len) for dim_len in shape.decode().split(','))
+            value = value[:int(numpy.prod(shape))].reshape(shape)
+        results[field.name] = value
+    return results
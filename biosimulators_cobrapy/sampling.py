@@ -0,0 +1,358 @@
+""" Flux sampling with parallel chains
+
+Samples are drawn by hit-and-run chains which start from the warmup points of a COBRApy sampler. The optGpSampler
+(OptGP) runs one chain per process, each from its own starting point, on the persistent pool of workers of
+:obj:`biosimulators_cobrapy.pool`; artificial centering hit-and-run (ACHR) runs a single chain. Each chain is advanced
+in chunks of samples by the public :obj:`cobra.sampling.ACHRSampler.sample` method, and resumes from its state
+(current point, center, number of samples, and random number generator) at the end of the previous chunk. This
+allows the time budget of a task to be checked between chunks, and allows samples to be streamed to a file.
+
+Only :obj:`write_flux_samples_report` streams the samples to a file. The simulations of SED tasks
+(:obj:`optgp_sample` and :obj:`achr_sample`) only keep the samples of the recorded reactions, but keep all of their
+samples in memory until the task finishes.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .pool import get_worker_pool
+from .solution import SlimSolution
+from .timeouts import TimeLimitExceededError, is_expired
+from biosimulators_utils.config import get_config
+from biosimulators_utils.report.data_model import DataSetResults
+import cobra.sampling
+import copy
+import h5py
+import math
+import numpy
+import os
+import uuid
+
+__all__ = [
+    'optgp_sample',
+    'achr_sample',
+    'write_flux_samples_report',
+    'read_flux_samples_report',
+]
+
+CHUNK_SIZE = 1000
+# :obj:`int`: number of samples which are drawn by each chunk of the chains
+
+
+def optgp_sample(model, required_results, n=1000, thinning=100, seed=None, processes=None, deadline=None):
+    """ Sample the fluxes of a model with the optGpSampler (OptGP), running one chain per process
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+        n (:obj:`int`, optional): number of samples
+        thinning (:obj:`int`, optional): number of steps of the chains between successive samples
+        seed (:obj:`int`, optional): seed for the random number generators of the chains
+        processes (:obj:`int`, optional): number of chains, each run by a worker process
+        deadline (:obj:`float`, optional): deadline on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`SlimSolution`: solution whose fluxes are arrays of the samples of each reaction, and whose objective
+            value is an array of the objective value of each sample
+
+    Raises:
+        :obj:`TimeLimitExceededError`: if the deadline passes before all of the samples are drawn; the exception
+            holds the samples which were drawn
+    """
+    return _sample(model, 'optgp', required_results, n=n, thinning=thinning, seed=seed, processes=processes,
+                   deadline=deadline)
+
+
+def achr_sample(model, required_results, n=1000, thinning=100, seed=None, deadline=None):
+    """ Sample the fluxes of a model with artificial centering hit-and-run (ACHR)
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+        n (:obj:`int`, optional): number of samples
+        thinning (:obj:`int`, optional): number of steps of the chain between successive samples
+        seed (:obj:`int`, optional): seed for the random number generator of the chain
+        deadline (:obj:`float`, optional): deadline on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`SlimSolution`: solution whose fluxes are arrays of the samples of each reaction, and whose objective
+            value is an array of the objective value of each sample
+
+    Raises:
+        :obj:`TimeLimitExceededError`: if the deadline passes before all of the samples are drawn; the exception
+            holds the samples which were drawn
+    """
+    return _sample(model, 'achr', required_results, n=n, thinning=thinning, seed=seed, deadline=deadline)
+
+
+def _sample(model, method, required_results, n=1000, thinning=100, seed=None, processes=None, deadline=None):
+    """ Sample the fluxes of a model, only keeping the results needed to record the desired variables
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        method (:obj:`str`): sampler (``optgp`` or ``achr``)
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+        n (:obj:`int`, optional): number of samples
+        thinning (:obj:`int`, optional): number of steps of the chains between successive samples
+        seed (:obj:`int`, optional): seed for the random number generators of the chains
+        processes (:obj:`int`, optional): number of chains of OptGP
+        deadline (:obj:`float`, optional): deadline on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`SlimSolution`: solution
+
+    Raises:
+        :obj:`TimeLimitExceededError`: if the deadline passes before all of the samples are drawn
+    """
+    # samplers can't be built for infeasible models
+    model.slim_optimize()
+    status = model.solver.status
+    if status != 'optimal':
+        return SlimSolution(status)
+
+    reactions = model.reactions.get_by_any(sorted(required_results.get('fluxes', ())))
+    objective_coefficients = _get_objective_coefficients(model) if 'objective_value' in required_results else None
+
+    flux_chunks = []
+    objective_chunks = []
+    num_samples = 0
+    for sample_chunk in _iter_sample_chunks(model, method, n, thinning, seed, processes, deadline):
+        flux_chunks.append(_get_fluxes(model, reactions, sample_chunk))
+        if objective_coefficients is not None:
+            objective_chunks.append(sample_chunk.dot(objective_coefficients))
+        num_samples += sample_chunk.shape[0]
+
+    solution = SlimSolution(
+        status,
+        objective_value=numpy.concatenate(objective_chunks) if objective_chunks else numpy.nan,
+        reaction_index={reaction.id: i_reaction for i_reaction, reaction in enumerate(reactions)},
+        fluxes=numpy.concatenate(flux_chunks, axis=1) if flux_chunks else numpy.full((len(reactions), 0), numpy.nan),
+    )
+
+    if num_samples < n:
+        raise TimeLimitExceededError('The time budget ran out after drawing {} of {} samples.'.format(num_samples, n),
+                                     partial_solution=solution)
+    return solution
+
+
+def write_flux_samples_report(model, base_path, rel_path, n=1000, method='optgp', thinning=100, seed=None,
+                              processes=None, deadline=None):
+    """ Sample the fluxes of all of the reactions of a model, and save the samples as an HDF5 report with one data
+    set for each reaction. The samples are written as each chunk is drawn, so that the samples never have to fit
+    into memory.
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        base_path (:obj:`str`): directory in which to save the HDF5 file of reports
+        rel_path (:obj:`str`): key of the report within the HDF5 file
+        n (:obj:`int`, optional): number of samples
+        method (:obj:`str`, optional): sampler (``optgp`` or ``achr``)
+        thinning (:obj:`int`, optional): number of steps of the chains between successive samples
+        seed (:obj:`int`, optional): seed for the random number generators of the chains
+        processes (:obj:`int`, optional): number of chains of OptGP
+        deadline (:obj:`float`, optional): deadline on the :obj:`time.monotonic` clock; when it passes, the report
+            contains the samples which were drawn
+
+    Returns:
+        :obj:`int`: number of samples which were saved
+
+    Raises:
+        :obj:`ValueError`: if the model is infeasible
+    """
+    model.slim_optimize()
+    if model.solver.status != 'optimal':
+        raise ValueError('The fluxes of the model cannot be sampled because the model is not feasible. '
+                         'The solver status was `{}`.'.format(model.solver.status))
+
+    reactions = list(model.reactions)
+    data_set_ids = ['R_' + reaction.id for reaction in reactions]
+
+    if not os.path.isdir(base_path):
+        os.makedirs(base_path)
+    rel_path = '/'.join(os.path.relpath(rel_path, '.').split(os.path.sep))
+
+    num_samples = 0
+    with h5py.File(os.path.join(base_path, get_config().H5_REPORTS_PATH), 'a') as file:
+        if rel_path in file:
+            del file[rel_path]
+        data_set = file.create_dataset(rel_path, shape=(len(reactions), 0), maxshape=(len(reactions), None),
+                                       dtype=numpy.float64, chunks=(len(reactions), min(n, CHUNK_SIZE)),
+                                       compression="gzip")
+
+        for sample_chunk in _iter_sample_chunks(model, method, n, thinning, seed, processes, deadline):
+            fluxes = _get_fluxes(model, reactions, sample_chunk)
+            data_set.resize(num_samples + fluxes.shape[1], axis=1)
+            data_set[:, num_samples:num_samples + fluxes.shape[1]] = fluxes
+            num_samples += fluxes.shape[1]
+
+        data_set.attrs['_type'] = 'Report'
+        data_set.attrs['uri'] = rel_path
+        data_set.attrs['sedmlId'] = rel_path.split('/')[-1]
+        data_set.attrs['sedmlDataSetIds'] = data_set_ids
+        data_set.attrs['sedmlDataSetNames'] = [reaction.name or '' for reaction in reactions]
+        data_set.attrs['sedmlDataSetLabels'] = data_set_ids
+        data_set.attrs['sedmlDataSetDataTypes'] = ['float64'] * len(reactions)
+        data_set.attrs['sedmlDataSetShapes'] = [str(num_samples)] * len(reactions)
+
+        group_ids = rel_path.split('/')[0:-1]
+        for i_group in range(len(group_ids)):
+            uri = '/'.join(group_ids[0:i_group + 1])
+            file[uri].attrs['uri'] = uri
+            file[uri].attrs['combineArchiveLocation'] = uri
+
+    return num_samples
+
+
+def read_flux_samples_report(base_path, rel_path):
+    """ Read the samples of a report saved by :obj:`write_flux_samples_report`
+
+    Args:
+        base_path (:obj:`str`): directory of the HDF5 file of reports
+        rel_path (:obj:`str`): key of the report within the HDF5 file
+
+    Returns:
+        :obj:`DataSetResults`: dictionary that maps the SBML id of each reaction to its samples
+    """
+    rel_path = '/'.join(os.path.relpath(rel_path, '.').split(os.path.sep))
+    with h5py.File(os.path.join(base_path, get_config().H5_REPORTS_PATH), 'r') as file:
+        data_set = file[rel_path]
+        return DataSetResults(zip(data_set.attrs['sedmlDataSetIds'], data_set[:]))
+
+
+def _iter_sample_chunks(model, method, n, thinning, seed, processes, deadline):
+    """ Draw samples of the solver variables of a model in chunks
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): feasible model
+        method (:obj:`str`): sampler (``optgp`` or ``achr``)
+        n (:obj:`int`): number of samples
+        thinning (:obj:`int`): number of steps of the chains between successive samples
+        seed (:obj:`int`): seed for the random number generators of the chains
+        processes (:obj:`int`): number of chains of OptGP
+        deadline (:obj:`float`): deadline on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`iterator` of :obj:`numpy.ndarray`: samples of each chunk (samples x solver variables)
+    """
+    if method == 'optgp':
+        num_chains = processes or 1
+    elif method == 'achr':
+        num_chains = 1
+    else:
+        raise NotImplementedError('Sampler `{}` is not supported.'.format(method))
+
+    if seed is None:
+        seed = int(numpy.random.SeedSequence().entropy % numpy.iinfo(numpy.int32).max)
+
+    # each chain is advanced with the public API of COBRApy's ACHR sampler, which resumes from the current point,
+    # center, and number of samples of the sampler; COBRApy's samplers seed NumPy's global random number generator,
+    # so its state is restored afterwards, so that sampling doesn't change the random numbers of the caller
+    caller_random_state = numpy.random.get_state()
+    try:
+        sampler = cobra.sampling.ACHRSampler(model, thinning=thinning, seed=seed)
+    finally:
+        numpy.random.set_state(caller_random_state)
+
+    # the state of each chain: its current point, its center, its number of samples, and its random number generator
+    chains = []
+    for i_chain in range(num_chains):
+        random_state = numpy.random.RandomState((seed + i_chain) % numpy.iinfo(numpy.int32).max)
+        if method == 'optgp':
+            # like the optGpSampler, each chain starts from its own point, between the center of the warmup points
+            # and a random warmup point
+            warmup_point = sampler.warmup[random_state.randint(sampler.n_warmup), :]
+            prev = sampler.center + 0.95 * (warmup_point - sampler.center)
+            chains.append((prev, sampler.center, max(sampler.n_samples, 1), random_state.get_state()))
+        else:
+            chains.append((sampler.prev, sampler.center, sampler.n_samples, random_state.get_state()))
+
+    if num_chains > 1:
+        pool = get_worker_pool(num_chains)
+        key = 'sampler:' + uuid.uuid4().hex
+
+    try:
+        num_samples = 0
+        while num_samples < n and not is_expired(deadline):
+            chunk_size = min(CHUNK_SIZE, n - num_samples)
+            chain_chunk_size = int(math.ceil(chunk_size / num_chains))
+            if num_chains > 1:
+                results = sorted(pool.imap_unordered_with_data(
+                    _run_chain, key, sampler,
+                    [(i_chain, chain, chain_chunk_size) for i_chain, chain in enumerate(chains)]),
+                    key=lambda result: result[0])
+            else:
+                results = [_run_chain(sampler, 0, chains[0], chain_chunk_size)]
+
+            chains = [chain for _, chain, _ in results]
+            samples = numpy.vstack([chain_samples for _, _, chain_samples in results])[0:chunk_size, :]
+            num_samples += samples.shape[0]
+            yield samples
+    finally:
+        # the sampler is only needed by this task
+        if num_chains > 1:
+            pool.release(key)
+
+
+def _run_chain(sampler, i_chain, chain, n):
+    """ Advance a hit-and-run chain to draw a number of samples
+
+    Args:
+        sampler (:obj:`cobra.sampling.ACHRSampler`): sampler which holds the warmup points and the constraints
+        i_chain (:obj:`int`): index of the chain
+        chain (:obj:`tuple`): current point, center, number of samples, and state of the random number generator
+            of the chain
+        n (:obj:`int`): number of samples
+
+    Returns:
+        :obj:`tuple`: index of the chain, state of the chain after the samples, and samples (samples x solver
+            variables)
+    """
+    chain_sampler = copy.copy(sampler)
+    chain_sampler.prev, chain_sampler.center, chain_sampler.n_samples, random_state = chain
+
+    # the steps of COBRApy's samplers use NumPy's global random number generator; its state is restored afterwards,
+    # as for the creation of the sampler
+    caller_random_state = numpy.random.get_state()
+    numpy.random.set_state(random_state)
+    try:
+        samples = chain_sampler.sample(n, fluxes=False).values
+        chain = (chain_sampler.prev, chain_sampler.center, chain_sampler.n_samples, numpy.random.get_state())
+    finally:
+        numpy.random.set_state(caller_random_state)
+
+    return i_chain, chain, samples
+
+
+def _get_fluxes(model, reactions, samples):
+    """ Get the fluxes of reactions from samples of the solver variables of a model
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        reactions (:obj:`list` of :obj:`cobra.core.reaction.Reaction`): reactions
+        samples (:obj:`numpy.ndarray`): samples of the solver variables (samples x solver variables)
+
+    Returns:
+        :obj:`numpy.ndarray`: fluxes of the reactions (reactions x samples)
+    """
+    variable_index = {variable.name: i_variable for i_variable, variable in enumerate(model.variables)}
+    fwd_idx = numpy.array([variable_index[reaction.forward_variable.name] for reaction in reactions], dtype=int)
+    rev_idx = numpy.array([variable_index[reaction.reverse_variable.name] for reaction in reactions], dtype=int)
+    return (samples[:, fwd_idx] - samples[:, rev_idx]).T
+
+
+def _get_objective_coefficients(model):
+    """ Get the coefficients of the solver variables of a model in its objective
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+
+    Returns:
+        :obj:`numpy.ndarray`: coefficient of each solver variable
+    """
+    coefficients = model.solver.objective.get_linear_coefficients(model.variables)
+    return numpy.array([coefficients[variable] for variable in model.variables], dtype=float)
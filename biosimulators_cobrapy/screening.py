@@ -0,0 +1,400 @@
+""" Screening of reaction and gene knockouts
+
+A screen executes the simulation of a task for each of a set of knockouts, each of which is described by SED model
+changes which set both flux bounds of one or more reactions to zero. Knockouts of genes are knockouts of the reactions
+which can't proceed without the genes, according to the gene-protein-reaction rules of the reactions. The wild-type
+model is simulated once. Knockouts of reactions which carry no flux in the wild-type solution are not simulated,
+because the wild-type solution remains an optimal solution of the knocked-out model, unless the values of inactive
+objectives are recorded, because the optima of inactive objectives can depend on reactions which carry no flux in the
+wild-type solution. The other knockouts are simulated by the persistent pool of workers of
+:obj:`biosimulators_cobrapy.pool`, which solve successive knockouts of the same problem starting from the solution of
+the previous knockout.
+
+Screens are executed by calling :obj:`exec_knockout_screen` directly. SED documents can't describe screens, so the
+tasks of COMBINE/OMEX archives and of :obj:`biosimulators_cobrapy.core.exec_sed_task` are never executed as screens.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .changes import apply_model_change
+from .core import preprocess_sed_task
+from .data_model import KISAO_ALGORITHMS_PARAMETERS_MAP
+from .objectives import optimize_objectives
+from .pool import get_worker_pool, get_problem_key
+from .reports import ColumnarReportFormat, write_columnar_report
+from .utils import get_required_results, get_results_of_variables
+from biosimulators_utils.config import get_config
+from biosimulators_utils.log.data_model import TaskLog
+from biosimulators_utils.report.data_model import DataSetResults, ReportFormat, VariableResults
+from biosimulators_utils.report.io import ReportWriter
+from biosimulators_utils.sedml import validation
+from biosimulators_utils.sedml.data_model import DataSet, ModelAttributeChange, Report, Variable
+from biosimulators_utils.utils.core import raise_errors_warnings
+from cobra.manipulation import knock_out_model_genes
+import cobra
+import cobra.io
+import copy
+import itertools
+import numpy
+
+__all__ = [
+    'get_reaction_knockouts',
+    'get_gene_knockouts',
+    'exec_knockout_screen',
+    'write_knockout_screen_report',
+]
+
+SCREENING_ALGORITHMS = ('KISAO_0000437', 'KISAO_0000528')
+# :obj:`tuple` of :obj:`str`: KiSAO ids of the algorithms which can be screened
+
+ZERO_FLUX_TOLERANCE = 1e-9
+# :obj:`float`: maximum absolute wild-type flux of reactions whose knockouts are not simulated
+
+CHUNKS_PER_PROCESS = 4
+# :obj:`int`: number of chunks of knockouts into which a screen divides the work of each process
+
+SBML_FBC_NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+# :obj:`dict`: namespaces of the targets of the model changes of knockouts
+
+
+def get_reaction_knockouts(model_source, reaction_ids=None, order=1):
+    """ Get the model changes for the knockouts of all combinations of a number of reactions
+
+    Args:
+        model_source (:obj:`str`): path to the SBML model
+        reaction_ids (:obj:`list` of :obj:`str`, optional): SBML ids of the reactions to knock out (e.g., ``R_PGK``);
+            defaults to all reactions
+        order (:obj:`int`, optional): number of reactions which are knocked out together (e.g., 1 for single
+            knockouts, 2 for double knockouts)
+
+    Returns:
+        :obj:`dict`: dictionary that maps the id of each knockout (e.g., ``R_PGK`` or ``R_PGK+R_TALA``) to a list of
+            its model changes
+    """
+    if reaction_ids is None:
+        model = cobra.io.read_sbml_model(model_source)
+        reaction_ids = ['R_' + reaction.id for reaction in model.reactions]
+
+    knockouts = {}
+    for knockout_reaction_ids in itertools.combinations(reaction_ids, order):
+        knockouts['+'.join(knockout_reaction_ids)] = _get_reaction_knockout_changes(knockout_reaction_ids)
+    return knockouts
+
+
+def get_gene_knockouts(model_source, gene_ids=None, order=1):
+    """ Get the model changes for the knockouts of all combinations of a number of genes
+
+    The changes of each knockout set both flux bounds to zero of each reaction which can't proceed without the genes,
+    according to the evaluation of the gene-protein-reaction rules of the reactions by COBRApy. For example, a
+    reaction which is catalyzed by isozymes is only knocked out when the genes of all of the isozymes are knocked out.
+    Knockouts which don't knock out any reaction have no changes.
+
+    Args:
+        model_source (:obj:`str`): path to the SBML model
+        gene_ids (:obj:`list` of :obj:`str`, optional): SBML ids of the genes to knock out (e.g., ``G_b0351``);
+            defaults to all genes
+        order (:obj:`int`, optional): number of genes which are knocked out together (e.g., 1 for single knockouts,
+            2 for double knockouts)
+
+    Returns:
+        :obj:`dict`: dictionary that maps the id of each knockout (e.g., ``G_b0351`` or ``G_b0351+G_b1241``) to a list
+            of its model changes
+
+    Raises:
+        :obj:`ValueError`: if a gene is not a gene of the model
+    """
+    model = cobra.io.read_sbml_model(model_source)
+    if gene_ids is None:
+        gene_ids = ['G_' + gene.id for gene in model.genes]
+
+    # COBRApy reads the ids of genes without the prefix of their SBML ids
+    cobra_gene_ids = {}
+    for gene_id in gene_ids:
+        cobra_gene_id = gene_id[2:] if gene_id.startswith('G_') else gene_id
+        if cobra_gene_id not in model.genes:
+            raise ValueError('Gene `{}` is not a gene of the model.'.format(gene_id))
+        cobra_gene_ids[gene_id] = cobra_gene_id
+
+    knockouts = {}
+    for knockout_gene_ids in itertools.combinations(gene_ids, order):
+        with model:
+            reactions = knock_out_model_genes(model, [cobra_gene_ids[gene_id] for gene_id in knockout_gene_ids])
+        knockouts['+'.join(knockout_gene_ids)] = _get_reaction_knockout_changes(
+            sorted('R_' + reaction.id for reaction in reactions))
+    return knockouts
+
+
+def _get_reaction_knockout_changes(reaction_ids):
+    """ Get the model changes for the knockout of reactions
+
+    Args:
+        reaction_ids (:obj:`list` of :obj:`str`): SBML ids of the reactions
+
+    Returns:
+        :obj:`list` of :obj:`ModelAttributeChange`: changes which set both flux bounds of the reactions to zero
+    """
+    changes = []
+    for reaction_id in reaction_ids:
+        for attr in ['lowerFluxBound', 'upperFluxBound']:
+            changes.append(ModelAttributeChange(
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='{}']/@fbc:{}".format(reaction_id, attr),
+                target_namespaces=SBML_FBC_NAMESPACES,
+                new_value='0',
+            ))
+    return changes
+
+
+def exec_knockout_screen(task, variables, knockouts, processes=1, skip_zero_flux_knockouts=True, log=None, config=None):
+    """ Execute the simulation of a task for each of a set of knockouts
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        knockouts (:obj:`dict`): dictionary that maps the id of each knockout to a list of model changes which set
+            both flux bounds of one or more reactions to zero (e.g., from :obj:`get_reaction_knockouts` or
+            :obj:`get_gene_knockouts`)
+        processes (:obj:`int`, optional): number of worker processes
+        skip_zero_flux_knockouts (:obj:`bool`, optional): if :obj:`True`, use the wild-type results for knockouts
+            of reactions which carry no flux in the wild-type solution, rather than simulating them. Knockouts are
+            not skipped if :obj:`variables` include the values of inactive objectives.
+        log (:obj:`TaskLog`, optional): log for the screen
+        config (:obj:`Config`, optional): BioSimulators common configuration
+
+    Returns:
+        :obj:`tuple`:
+
+            :obj:`VariableResults`: results of variables, with one element for each knockout in the order of
+                :obj:`knockouts`. Results of knockouts which are infeasible are NaN.
+            :obj:`TaskLog`: log
+
+    Raises:
+        :obj:`ValueError`: if a knockout doesn't set both flux bounds of its reactions to zero, or the wild-type
+            model is infeasible
+        :obj:`NotImplementedError`: if the algorithm of the task can't be screened
+    """
+    config = config or get_config()
+
+    if config.LOG and not log:
+        log = TaskLog()
+
+    # preprocess the task with the changes of all of the knockouts, to map their targets to reactions
+    raise_errors_warnings(validation.validate_model_change_types(task.model.changes, (ModelAttributeChange, )),
+                          error_summary='Changes for model `{}` are not supported.'.format(task.model.id))
+    knockout_changes = {}
+    for changes in knockouts.values():
+        for change in changes:
+            knockout_changes[change.target] = change
+    screen_task = copy.copy(task)
+    screen_task.model = copy.copy(task.model)
+    task_change_targets = set(change.target for change in task.model.changes)
+    screen_task.model.changes = list(task.model.changes) + [
+        change for target, change in knockout_changes.items()
+        if target not in task_change_targets
+    ]
+    preprocessed_task = preprocess_sed_task(screen_task, variables, config=config)
+
+    method_props = preprocessed_task['simulation']['method_props']
+    if method_props['kisao_id'] not in SCREENING_ALGORITHMS:
+        raise NotImplementedError('Knockout screens of {} are not supported. Screens of the following algorithms are supported:\n  {}'.format(
+            method_props['name'],
+            '\n  '.join(sorted('{}: {}'.format(kisao_id, KISAO_ALGORITHMS_PARAMETERS_MAP[kisao_id]['name'])
+                               for kisao_id in SCREENING_ALGORITHMS))))
+    method_kw_args = preprocessed_task['simulation']['method_kw_args']
+
+    # apply the changes of the wild-type model
+    cobra_model = preprocessed_task['model']['model']
+    model_change_obj_attr_map = preprocessed_task['model']['model_change_obj_attr_map']
+    for change in task.model.changes:
+        apply_model_change(model_change_obj_attr_map[change.target], float(change.new_value))
+
+    # get the reactions of each knockout
+    knockout_reactions = []
+    for knockout_id, changes in knockouts.items():
+        bounds = {}
+        for change in changes:
+            for reaction, attr_name in model_change_obj_attr_map[change.target]:
+                bounds.setdefault(reaction, {})[attr_name] = float(change.new_value)
+
+        for reaction, reaction_bounds in bounds.items():
+            if reaction_bounds != {'lower_bound': 0., 'upper_bound': 0.}:
+                raise ValueError('Knockout `{}` must set both flux bounds of reaction `{}` to zero.'.format(knockout_id, reaction.id))
+
+        knockout_reactions.append(sorted(
+            (reaction.id, reaction.forward_variable.name, reaction.reverse_variable.name)
+            for reaction in bounds.keys()
+        ))
+
+    # simulate the wild-type model, including the fluxes of the knocked-out reactions
+    variable_target_results_path_map = preprocessed_task['model']['variable_target_results_path_map']
+    required_results = get_required_results(variable_target_results_path_map)
+    result_variables = [Variable(id=variable.id, target=variable.target) for variable in variables]
+
+    wild_type_required_results = copy.deepcopy(required_results)
+    wild_type_required_results.setdefault('fluxes', set()).update(
+        reaction_id for reactions in knockout_reactions for reaction_id, _, _ in reactions)
+    objectives = preprocessed_task['model']['objectives']
+    wild_type_solution = _solve(cobra_model, method_props['kisao_id'], wild_type_required_results, method_kw_args, objectives)
+    if wild_type_solution.status != 'optimal':
+        raise ValueError('The wild-type model is not feasible. The solver status was `{}`.'.format(wild_type_solution.status))
+    wild_type_results = get_results_of_variables(variable_target_results_path_map, result_variables, wild_type_solution)
+
+    # determine which knockouts need to be simulated. Knockouts are only skipped when the values of inactive objectives
+    # are not needed, because the inactive objectives are optimized for each knockout, and their optima can depend on
+    # the knocked-out reactions even if they carry no flux in the wild-type solution.
+    knockout_results = [None] * len(knockout_reactions)
+    knockouts_to_solve = []
+    skip_zero_flux_knockouts = skip_zero_flux_knockouts and 'objective_values' not in required_results
+    for i_knockout, reactions in enumerate(knockout_reactions):
+        if skip_zero_flux_knockouts and all(
+            abs(wild_type_solution.get_result('fluxes', (reaction_id,))) <= ZERO_FLUX_TOLERANCE
+            for reaction_id, _, _ in reactions
+        ):
+            knockout_results[i_knockout] = wild_type_results
+        else:
+            knockouts_to_solve.append((i_knockout, reactions))
+
+    # simulate the knockouts
+    solve_args = (method_props['kisao_id'], required_results, method_kw_args, objectives,
+                  variable_target_results_path_map, result_variables)
+    if processes > 1 and len(knockouts_to_solve) > 1:
+        num_chunks = min(processes * CHUNKS_PER_PROCESS, len(knockouts_to_solve))
+        chunks = [knockouts_to_solve[i_chunk::num_chunks] for i_chunk in range(num_chunks)]
+        pool = get_worker_pool(processes)
+        problem_key = get_problem_key(preprocessed_task['model']['source_hash'], cobra_model)
+        chunk_results = pool.imap_unordered(_solve_knockouts, problem_key, cobra_model,
+                                            [(chunk,) + solve_args for chunk in chunks])
+    else:
+        chunk_results = [_solve_knockouts(cobra_model, knockouts_to_solve, *solve_args)]
+
+    for chunk_result in chunk_results:
+        for i_knockout, results in chunk_result:
+            knockout_results[i_knockout] = results
+
+    # stack the results of the knockouts
+    variable_results = VariableResults()
+    for variable in variables:
+        variable_results[variable.id] = numpy.array([results[variable.id] for results in knockout_results], dtype=float)
+
+    # log action
+    if config.LOG:
+        log.algorithm = preprocessed_task['simulation']['algorithm_kisao_id']
+        log.simulator_details = {
+            'method': 'biosimulators_cobrapy.screening.exec_knockout_screen',
+            'simulationMethod': method_props['raw_method'].__module__ + '.' + method_props['raw_method'].__name__,
+            'arguments': method_kw_args,
+            'knockouts': list(knockouts.keys()),
+            'simulatedKnockouts': len(knockouts_to_solve),
+            'skippedKnockouts': len(knockout_reactions) - len(knockouts_to_solve),
+            'processes': processes,
+        }
+
+    return variable_results, log
+
+
+def _solve(model, kisao_id, required_results, method_kw_args, objectives):
+    """ Simulate a model
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        kisao_id (:obj:`str`): KiSAO id of the algorithm
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result to the ids of the model
+            objects whose values are needed
+        method_kw_args (:obj:`dict`): keyword arguments for the simulation method
+        objectives (:obj:`dict` of :obj:`str` to :obj:`Objective`): dictionary that maps the SBML-FBC id of each
+            objective to the objective
+
+    Returns:
+        :obj:`SlimSolution`: solution
+    """
+    method_props = KISAO_ALGORITHMS_PARAMETERS_MAP[kisao_id]
+    solution = method_props['method'](model, required_results, **method_kw_args)
+    if solution.status == 'optimal' and kisao_id == 'KISAO_0000528' and 'objective_value' in required_results:
+        solution.objective_value = model.slim_optimize()
+    if solution.status == 'optimal' and 'objective_values' in required_results:
+        solution.objective_values = optimize_objectives(model, objectives, sorted(required_results['objective_values']))
+    return solution
+
+
+def _solve_knockouts(model, knockouts, kisao_id, required_results, method_kw_args, objectives, target_results_path_map,
+                     variables):
+    """ Simulate a list of knockouts of a model, one after another
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        knockouts (:obj:`list` of :obj:`tuple`): index of each knockout, and the id and the names of the forward and
+            reverse variables of each of its reactions
+        kisao_id (:obj:`str`): KiSAO id of the algorithm
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result to the ids of the model
+            objects whose values are needed
+        method_kw_args (:obj:`dict`): keyword arguments for the simulation method
+        objectives (:obj:`dict` of :obj:`str` to :obj:`Objective`): dictionary that maps the SBML-FBC id of each
+            objective to the objective
+        target_results_path_map (:obj:`dict`): path to results of desired variables
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: index and :obj:`VariableResults` of each knockout
+    """
+    results = []
+    for i_knockout, reactions in knockouts:
+        # the bounds are changed through the solver, rather than through the reactions, because the bounds of the
+        # reactions don't reflect bounds which were applied to the solver by the pool
+        knocked_out_variables = [
+            model.variables[variable_name]
+            for _, forward_variable_name, reverse_variable_name in reactions
+            for variable_name in (forward_variable_name, reverse_variable_name)
+        ]
+        prev_bounds = [(variable.lb, variable.ub) for variable in knocked_out_variables]
+        for variable in knocked_out_variables:
+            variable.set_bounds(0., 0.)
+
+        try:
+            solution = _solve(model, kisao_id, required_results, method_kw_args, objectives)
+        finally:
+            for variable, (lb, ub) in zip(knocked_out_variables, prev_bounds):
+                variable.set_bounds(lb, ub)
+
+        if solution.status == 'optimal':
+            variable_results = get_results_of_variables(target_results_path_map, variables, solution)
+        else:
+            variable_results = VariableResults({variable.id: numpy.array(numpy.nan) for variable in variables})
+        results.append((i_knockout, variable_results))
+    return results
+
+
+def write_knockout_screen_report(results, knockouts, variables, base_path, rel_path, format=ReportFormat.h5):
+    """ Save the results of a knockout screen as a report with one data set for each variable, whose elements are
+    the results of the knockouts in the order of :obj:`knockouts`
+
+    Args:
+        results (:obj:`VariableResults`): results of :obj:`exec_knockout_screen`
+        knockouts (:obj:`dict`): dictionary that maps the id of each knockout to its model changes
+        variables (:obj:`list` of :obj:`Variable`): variables
+        base_path (:obj:`str`): path to save the report
+
+            * CSV, Arrow, Parquet: parent directory to save the report
+            * HDF5: file to save the report
+
+        rel_path (:obj:`str`): path to save the report relative to :obj:`base_path`
+
+            * CSV, Arrow, Parquet: relative path to :obj:`base_path`
+            * HDF5: key within HDF5 file
+
+        format (:obj:`ReportFormat` or :obj:`ColumnarReportFormat`, optional): report format
+    """
+    report = Report(
+        id='knockout_screen',
+        name='Knockouts: ' + ', '.join(knockouts.keys()),
+        data_sets=[DataSet(id=variable.id, label=variable.id, name=variable.name) for variable in variables],
+    )
+    data_set_results = DataSetResults({variable.id: results[variable.id] for variable in variables})
+    if isinstance(format, ColumnarReportFormat):
+        write_columnar_report(report, data_set_results, base_path, rel_path, format=format)
+    else:
+        ReportWriter().run(report, data_set_results, base_path, rel_path, format=format)
@@ -0,0 +1,202 @@
+""" Lightweight solutions of constraint-based models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.report.data_model import VariableResults
+import numpy
+
+__all__ = ['SlimSolution', 'BlockVariableResults', 'stack_results']
+
+
+class SlimSolution(object):
+    """ Lightweight solution of a constraint-based model which holds the values needed to record the desired
+    variables in numpy arrays, rather than in :obj:`pandas.Series` for every reaction and metabolite
+
+    Attributes:
+        status (:obj:`str`): status of the solver
+        objective_value (:obj:`float`): value of the objective
+        objective_values (:obj:`dict` of :obj:`str` to :obj:`float`): dictionary that maps the SBML-FBC id of each
+            requested inactive objective to its value
+        reaction_index (:obj:`dict`): dictionary that maps the id of each reaction to its position in the arrays of the
+            values of reactions
+        metabolite_index (:obj:`dict`): dictionary that maps the id of each metabolite to its position in the arrays of the
+            values of metabolites
+        fluxes (:obj:`numpy.ndarray`): flux of each reaction
+        reduced_costs (:obj:`numpy.ndarray`): reduced cost of each reaction
+        shadow_prices (:obj:`numpy.ndarray`): shadow price of each metabolite
+        minimum (:obj:`numpy.ndarray`): minimum flux of each reaction
+        maximum (:obj:`numpy.ndarray`): maximum flux of each reaction
+    """
+    __slots__ = (
+        'status',
+        'objective_value',
+        'objective_values',
+        'reaction_index',
+        'metabolite_index',
+        'fluxes',
+        'reduced_costs',
+        'shadow_prices',
+        'minimum',
+        'maximum',
+    )
+
+    REACTION_RESULT_TYPES = ('fluxes', 'reduced_costs', 'minimum', 'maximum')
+    METABOLITE_RESULT_TYPES = ('shadow_prices',)
+    OBJECTIVE_RESULT_TYPES = ('objective_values',)
+
+    def __init__(self, status, objective_value=numpy.nan, objective_values=None, reaction_index=None, metabolite_index=None,
+                 fluxes=None, reduced_costs=None, shadow_prices=None, minimum=None, maximum=None):
+        """
+        Args:
+            status (:obj:`str`): status of the solver
+            objective_value (:obj:`float`, optional): value of the objective
+            objective_values (:obj:`dict` of :obj:`str` to :obj:`float`, optional): dictionary that maps the SBML-FBC
+                id of each requested inactive objective to its value
+            reaction_index (:obj:`dict`, optional): dictionary that maps the id of each reaction to its position in the
+                arrays of the values of reactions
+            metabolite_index (:obj:`dict`, optional): dictionary that maps the id of each metabolite to its position in
+                the arrays of the values of metabolites
+            fluxes (:obj:`numpy.ndarray`, optional): flux of each reaction
+            reduced_costs (:obj:`numpy.ndarray`, optional): reduced cost of each reaction
+            shadow_prices (:obj:`numpy.ndarray`, optional): shadow price of each metabolite
+            minimum (:obj:`numpy.ndarray`, optional): minimum flux of each reaction
+            maximum (:obj:`numpy.ndarray`, optional): maximum flux of each reaction
+        """
+        self.status = status
+        self.objective_value = objective_value
+        self.objective_values = objective_values if objective_values is not None else {}
+        self.reaction_index = reaction_index if reaction_index is not None else {}
+        self.metabolite_index = metabolite_index if metabolite_index is not None else {}
+        self.fluxes = fluxes
+        self.reduced_costs = reduced_costs
+        self.shadow_prices = shadow_prices
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def get_result(self, result_type, result_name=None):
+        """ Get the value of a result
+
+        Args:
+            result_type (:obj:`str`): type of the result (e.g., ``fluxes``)
+            result_name (:obj:`tuple`, optional): name of the result, whose first element is the id of a reaction,
+                metabolite, or inactive objective
+
+        Returns:
+            :obj:`float`: value of the result
+
+        Raises:
+            :obj:`KeyError`: if the solution doesn't contain the result
+        """
+        values = getattr(self, result_type)
+        if not result_name:
+            return values
+
+        if values is None:
+            raise KeyError('Solution does not contain `{}`'.format(result_type))
+
+        if result_type in self.OBJECTIVE_RESULT_TYPES:
+            # objectives which weren't computed (e.g., because the time budget ran out) are NaN
+            return values.get(result_name[0], numpy.nan)
+
+        if result_type in self.REACTION_RESULT_TYPES:
+            index = self.reaction_index
+        else:
+            index = self.metabolite_index
+        return values[index[result_name[0]]]
+
+    def get_results(self, result_type, result_names):
+        """ Get the values of results of the same type as one contiguous array
+
+        Args:
+            result_type (:obj:`str`): type of the results (e.g., ``fluxes``)
+            result_names (:obj:`list` of :obj:`tuple`): name of each result, whose first element is the id of a
+                reaction, metabolite, or inactive objective
+
+        Returns:
+            :obj:`numpy.ndarray`: array whose first dimension indexes the results, and whose other dimensions (e.g.,
+                samples) are those of each result
+
+        Raises:
+            :obj:`KeyError`: if the solution doesn't contain the results
+        """
+        values = getattr(self, result_type)
+        if values is None:
+            raise KeyError('Solution does not contain `{}`'.format(result_type))
+
+        if result_type in self.OBJECTIVE_RESULT_TYPES:
+            # objectives which weren't computed (e.g., because the time budget ran out) are NaN
+            return stack_results([values.get(result_name[0], numpy.nan) for result_name in result_names])
+
+        if result_type in self.REACTION_RESULT_TYPES:
+            index = self.reaction_index
+        else:
+            index = self.metabolite_index
+        return numpy.take(values, [index[result_name[0]] for result_name in result_names], axis=0)
+
+
+class BlockVariableResults(VariableResults):
+    """ Results of variables whose values are stored in one contiguous array for each type of result (e.g., one
+    array for the fluxes of all of the variables which record fluxes), rather than in a separate array for each
+    variable. The value of each variable is a view of its element (or row) of the array of its type, so that
+    writers which understand the blocks can write each block at once, and other consumers can use the results as
+    :obj:`VariableResults`.
+
+    Attributes:
+        blocks (:obj:`dict` of :obj:`str` to :obj:`numpy.ndarray`): dictionary that maps each type of result to the
+            array of the values of the variables of the type
+        block_variable_ids (:obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`): dictionary that maps each type
+            of result to the ids of the variables whose values are the elements (or rows) of its block, in order
+    """
+
+    def __init__(self, blocks=None, block_variable_ids=None):
+        """
+        Args:
+            blocks (:obj:`dict` of :obj:`str` to :obj:`numpy.ndarray`, optional): dictionary that maps each type of
+                result to the array of the values of the variables of the type
+            block_variable_ids (:obj:`dict` of :obj:`str` to :obj:`list` of :obj:`str`, optional): dictionary that
+                maps each type of result to the ids of the variables whose values are the elements (or rows) of its
+                block, in order
+        """
+        super(BlockVariableResults, self).__init__()
+        self.blocks = blocks if blocks is not None else {}
+        self.block_variable_ids = block_variable_ids if block_variable_ids is not None else {}
+        for result_type, variable_ids in self.block_variable_ids.items():
+            block = self.blocks[result_type]
+            for offset, variable_id in enumerate(variable_ids):
+                self[variable_id] = block[offset, ...]
+
+    @property
+    def offsets(self):
+        """ Get the type of the result and the position in the block of the type of each variable whose value is
+        stored in a block
+
+        Returns:
+            :obj:`dict` of :obj:`str` to :obj:`tuple`: dictionary that maps the id of each variable whose value is
+                stored in a block to the type of its result and its position in the block of the type
+        """
+        return {
+            variable_id: (result_type, offset)
+            for result_type, variable_ids in self.block_variable_ids.items()
+            for offset, variable_id in enumerate(variable_ids)
+        }
+
+
+def stack_results(values):
+    """ Stack the values of results into one contiguous array
+
+    Args:
+        values (:obj:`list`): value of each result
+
+    Returns:
+        :obj:`numpy.ndarray`: array whose first dimension indexes the results. Scalar values (e.g., NaN for results
+            which weren't computed) are broadcast to the shape of the other values.
+    """
+    try:
+        return numpy.array(values)
+    except ValueError:
+        shape = numpy.broadcast_shapes(*(numpy.shape(value) for value in values))
+        return numpy.stack([numpy.broadcast_to(value, shape) for value in values])
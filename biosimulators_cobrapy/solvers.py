@@ -0,0 +1,271 @@
+""" Selection of the optimization solver for each task
+
+The solver is chosen among the installed solvers based on the type of the problem of the algorithm (e.g.,
+loopless FVA with Fast-SNP is a mixed-integer problem) and a prediction of the time that each solver would need to
+execute the algorithm on the model: the time to build the problem of the model once, plus the time to solve it
+for each of the optimizations of the algorithm. The prediction is based on a small timing calibration of each solver,
+which is run once per process on built-in linear problems of two sizes.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .data_model import Solver
+from .gurobi import is_gurobi_available
+from .variability import MILP_LOOPLESS_METHODS, get_loopless_method
+import cobra.util.solver
+import numpy
+import optlang.symbolics
+import time
+
+__all__ = [
+    'get_available_solvers',
+    'calibrate_solvers',
+    'get_problem_type',
+    'estimate_num_solves',
+    'select_solver',
+]
+
+CALIBRATION_PROBLEM_SIZES = ((50, 100), (200, 400))
+# :obj:`tuple` of :obj:`tuple`: numbers of constraints and variables of the problems used to calibrate solvers
+
+CALIBRATION_PROBLEM_DENSITY = 0.05
+# :obj:`float`: fraction of non-zero coefficients of the problems used to calibrate solvers
+
+CALIBRATION_REPEATS = 3
+# :obj:`int`: number of times each calibration problem is built and solved; the fastest times are used
+
+MILP_SOLVER_PREFERENCE = (Solver.gurobi, Solver.cplex, Solver.glpk)
+# :obj:`tuple` of :obj:`Solver`: solvers in order of preference for mixed-integer problems, for which the
+#   calibration with linear problems isn't informative
+
+_calibration = None
+
+
+def get_available_solvers():
+    """ Get the supported solvers which are installed (and licensed)
+
+    Returns:
+        :obj:`list` of :obj:`Solver`: available solvers
+    """
+    solvers = []
+    for solver in Solver:
+        if solver.value not in cobra.util.solver.solvers:
+            continue
+        if solver == Solver.gurobi and not is_gurobi_available():
+            continue
+        solvers.append(solver)
+    return solvers
+
+
+def calibrate_solvers(solvers=None):
+    """ Measure the time each solver needs to build and to solve linear problems of two sizes, and fit
+    linear models of each time as a function of the number of non-zero coefficients of the problem.
+    The calibration is run once per process.
+
+    Args:
+        solvers (:obj:`list` of :obj:`Solver`, optional): solvers to calibrate; defaults to the available solvers
+
+    Returns:
+        :obj:`dict`: dictionary that maps each solver to a dictionary which maps ``build`` and ``solve`` to a tuple
+            of the fixed time to build (or solve) a problem in seconds, and the additional time per non-zero
+            coefficient in seconds
+    """
+    global _calibration
+
+    if _calibration is None:
+        _calibration = {}
+
+    for solver in (solvers if solvers is not None else get_available_solvers()):
+        if solver not in _calibration:
+            _calibration[solver] = _calibrate_solver(solver)
+
+    return _calibration
+
+
+def _calibrate_solver(solver):
+    """ Measure the time a solver needs to build and to solve built-in linear problems of two sizes
+
+    Each problem is built once per repeat, and then solved for several objectives, as algorithms such as FVA
+    solve the problem of a model many times after building it once.
+
+    Args:
+        solver (:obj:`Solver`): solver
+
+    Returns:
+        :obj:`dict`: dictionary which maps ``build`` and ``solve`` to a tuple of the fixed time to build (or solve)
+            a problem in seconds, and the additional time per non-zero coefficient in seconds
+    """
+    interface = cobra.util.solver.solvers[solver.value]
+    random_state = numpy.random.RandomState(0)
+
+    num_non_zeros = []
+    build_durations = []
+    solve_durations = []
+    for num_constraints, num_variables in CALIBRATION_PROBLEM_SIZES:
+        coefficients = random_state.rand(num_constraints, num_variables)
+        coefficients[random_state.rand(num_constraints, num_variables) > CALIBRATION_PROBLEM_DENSITY] = 0.
+        objective_coefficients = random_state.rand(CALIBRATION_REPEATS, num_variables)
+
+        build_duration = numpy.inf
+        solve_duration = numpy.inf
+        for _ in range(CALIBRATION_REPEATS):
+            start = time.perf_counter()
+            problem = interface.Model()
+            variables = [interface.Variable('x_{}'.format(i_var), lb=0., ub=1.) for i_var in range(num_variables)]
+            constraints = [interface.Constraint(optlang.symbolics.Zero, ub=1., name='c_{}'.format(i_constraint))
+                           for i_constraint in range(num_constraints)]
+            problem.add(variables)
+            problem.add(constraints)
+            problem.update()
+            for constraint, row in zip(constraints, coefficients):
+                constraint.set_linear_coefficients({
+                    variables[i_var]: row[i_var] for i_var in numpy.flatnonzero(row)
+                })
+            problem.objective = interface.Objective(optlang.symbolics.Zero, direction='max')
+            problem.update()
+            build_duration = min(build_duration, time.perf_counter() - start)
+
+            for coefficients_of_objective in objective_coefficients:
+                start = time.perf_counter()
+                problem.objective.set_linear_coefficients(dict(zip(variables, coefficients_of_objective)))
+                problem.optimize()
+                solve_duration = min(solve_duration, time.perf_counter() - start)
+
+        num_non_zeros.append(numpy.count_nonzero(coefficients) + num_variables)
+        build_durations.append(build_duration)
+        solve_durations.append(solve_duration)
+
+    return {
+        'build': _fit_duration(num_non_zeros, build_durations),
+        'solve': _fit_duration(num_non_zeros, solve_durations),
+    }
+
+
+def _fit_duration(num_non_zeros, durations):
+    """ Fit a linear model of the duration of an operation as a function of the number of non-zero coefficients of
+    the problem, from measurements for two problems
+
+    Args:
+        num_non_zeros (:obj:`list` of :obj:`int`): numbers of non-zero coefficients of the problems
+        durations (:obj:`list` of :obj:`float`): durations of the operation for the problems in seconds
+
+    Returns:
+        :obj:`tuple` of :obj:`float`: fixed duration in seconds, and the additional duration per non-zero coefficient
+            in seconds
+    """
+    time_per_non_zero = max((durations[1] - durations[0]) / (num_non_zeros[1] - num_non_zeros[0]), 0.)
+    fixed_time = max(durations[0] - time_per_non_zero * num_non_zeros[0], 0.)
+    return (float(fixed_time), float(time_per_non_zero))
+
+
+def _predict_duration(calibration, num_non_zeros, num_solves):
+    """ Predict the time a solver needs to build the problem of a model once and solve it several times
+
+    Args:
+        calibration (:obj:`dict`): calibration of the solver (see :obj:`calibrate_solvers`)
+        num_non_zeros (:obj:`int`): number of non-zero coefficients of the problem
+        num_solves (:obj:`int`): number of times the problem is solved
+
+    Returns:
+        :obj:`float`: predicted time in seconds
+    """
+    build_time, build_time_per_non_zero = calibration['build']
+    solve_time, solve_time_per_non_zero = calibration['solve']
+    return (build_time + build_time_per_non_zero * num_non_zeros) + num_solves * (solve_time + solve_time_per_non_zero * num_non_zeros)
+
+
+def get_problem_type(method_props, method_kw_args):
+    """ Get the type of the optimization problems which an algorithm solves
+
+    Args:
+        method_props (:obj:`dict`): properties of the simulation method
+        method_kw_args (:obj:`dict`): keyword arguments for the simulation method
+
+    Returns:
+        :obj:`str`: ``LP`` or ``MILP``
+    """
+    if method_props['kisao_id'] == 'KISAO_0000526':
+        if get_loopless_method(method_kw_args.get('loopless', False)) in MILP_LOOPLESS_METHODS:
+            return 'MILP'
+    return 'LP'
+
+
+def estimate_num_solves(method_props, method_kw_args, num_reactions):
+    """ Estimate the number of optimization problems which an algorithm solves
+
+    Args:
+        method_props (:obj:`dict`): properties of the simulation method
+        method_kw_args (:obj:`dict`): keyword arguments for the simulation method
+        num_reactions (:obj:`int`): number of reactions of the model
+
+    Returns:
+        :obj:`int`: estimated number of optimization problems
+    """
+    kisao_id = method_props['kisao_id']
+    if kisao_id == 'KISAO_0000528':
+        # FBA and the minimization of the total flux
+        return 2
+    if kisao_id == 'KISAO_0000526':
+        # FBA and the minimization and maximization of each reaction
+        return 1 + 2 * len(method_kw_args.get('reaction_list', None) or range(num_reactions))
+    if kisao_id == 'KISAO_0000527':
+        # pFBA and FVA of all reactions for the first two iterations, the minimum number of iterations
+        return 2 * (2 + 2 * num_reactions)
+    if kisao_id in ['KISAO_0000588', 'KISAO_0000590']:
+        # FBA and the minimization and maximization of each forward and reverse variable for the warmup points
+        return 1 + 4 * num_reactions
+    return 1
+
+
+def select_solver(model, method_props, method_kw_args, solvers=None, calibration=None):
+    """ Select the solver which is predicted to execute an algorithm on a model the fastest
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        method_props (:obj:`dict`): properties of the simulation method
+        method_kw_args (:obj:`dict`): keyword arguments for the simulation method
+        solvers (:obj:`list` of :obj:`Solver`, optional): solvers to choose among; defaults to the available solvers
+        calibration (:obj:`dict`, optional): dictionary that maps each solver to its times to build and to solve a
+            problem (see :obj:`calibrate_solvers`); defaults to the calibration of this process
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`Solver`: selected solver
+            * :obj:`str`: reason for the selection
+    """
+    if solvers is None:
+        solvers = get_available_solvers()
+    if not solvers:
+        raise ValueError('No solver is available.')
+
+    problem_type = get_problem_type(method_props, method_kw_args)
+    if problem_type == 'MILP':
+        solver = next(solver for solver in MILP_SOLVER_PREFERENCE if solver in solvers)
+        return solver, '{} is the preferred available solver for the MILP problems of {}'.format(
+            solver.value, method_props['name'])
+
+    if len(solvers) == 1:
+        return solvers[0], '{} is the only available solver'.format(solvers[0].value)
+
+    if calibration is None:
+        calibration = calibrate_solvers(solvers)
+
+    num_non_zeros = sum(len(reaction.metabolites) for reaction in model.reactions) + len(model.reactions)
+    num_solves = estimate_num_solves(method_props, method_kw_args, len(model.reactions))
+
+    predicted_durations = {
+        solver: _predict_duration(calibration[solver], num_non_zeros, num_solves)
+        for solver in solvers
+    }
+
+    solver = min(solvers, key=lambda solver: predicted_durations[solver])
+    return solver, (
+        '{} is predicted to be the fastest solver for {} LP problem(s) with {} non-zero coefficients ({})'
+    ).format(
+        solver.value, num_solves, num_non_zeros,
+        ', '.join('{}: {:.3g} s'.format(other_solver.value, predicted_durations[other_solver]) for other_solver in solvers),
+    )
@@ -0,0 +1,86 @@
+""" Thread-safe execution of tasks which share preprocessed models
+
+:obj:`exec_sed_task` applies the changes of a task to its model, and sets the solver and the time limit of the model,
+while it executes the task. Threads which execute tasks with the same preprocessed task, or with preprocessed tasks
+which share a model through a :obj:`ModelCache`, therefore can't execute them concurrently with the shared model.
+
+In thread-safe mode, the preprocessed tasks and their models are not modified. Instead, each thread executes tasks
+with its own copy of each shared model. The copy is made the first time that the thread executes a task of the model,
+and is reused by the following tasks of the thread, so the cost of the copy is paid once per thread and model. The
+copies of a model are released when the model and the threads are released.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+import threading
+import weakref
+
+__all__ = [
+    'ThreadModelCopies',
+]
+
+
+class ThreadModelCopies(object):
+    """ Copies of shared models for each of the threads which execute tasks concurrently
+
+    Attributes:
+        copies (:obj:`int`): number of copies which have been made
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.copies = 0
+
+    def get(self, model):
+        """ Get the copy of a shared model for the current thread, copying the model the first time that the thread
+        needs it
+
+        Args:
+            model (:obj:`cobra.core.model.Model`): shared model
+
+        Returns:
+            :obj:`cobra.core.model.Model`: copy of the model for the current thread
+        """
+        models = getattr(self._local, 'models', None)
+        if models is None:
+            models = self._local.models = weakref.WeakKeyDictionary()
+
+        model_copy = models.get(model, None)
+        if model_copy is None:
+            # copy one model at a time, because the problems of the solvers aren't guaranteed to be safe to read
+            # concurrently
+            with self._lock:
+                model_copy = model.copy()
+                self.copies += 1
+            models[model] = model_copy
+        return model_copy
+
+    def get_change_obj_attrs(self, model_copy, obj_attrs):
+        """ Get the objects of the copy of a model which a model change sets
+
+        Args:
+            model_copy (:obj:`cobra.core.model.Model`): copy of the model for the current thread
+            obj_attrs (:obj:`list` of :obj:`tuple`): reaction of the shared model and the name of the attribute of each
+                reaction which the change sets
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: reaction of the copy of the model and the name of the attribute of each
+                reaction which the change sets
+        """
+        return [(model_copy.reactions.get_by_id(obj.id), attr_name) for obj, attr_name in obj_attrs]
+
+    def get_stats(self):
+        """ Get statistics about the copies
+
+        Returns:
+            :obj:`dict`: number of copies which have been made, and number of copies of the current thread
+        """
+        models = getattr(self._local, 'models', None)
+        return {
+            'copies': self.copies,
+            'threadCopies': len(models) if models is not None else 0,
+        }
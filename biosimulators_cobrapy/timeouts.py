@@ -0,0 +1,124 @@
+""" Time budgets for tasks and archives
+
+Budgets are tracked as deadlines on the :obj:`time.monotonic` clock. The remaining time of the budget of
+a task is passed to the solver as its time limit, so that a solve which would exceed the budget is
+interrupted by the solver rather than left to run.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+import contextlib
+import math
+import time
+
+__all__ = [
+    'TimeLimitExceededError',
+    'get_deadline',
+    'get_remaining_time',
+    'is_expired',
+    'get_solver_timeout',
+    'solver_time_limit',
+]
+
+
+class TimeLimitExceededError(Exception):
+    """ Exception raised when a simulation method exceeds its time budget
+
+    Attributes:
+        partial_solution (:obj:`object`): solution of the part of the method which was completed before the
+            budget ran out, or :obj:`None` if no results were completed
+    """
+
+    def __init__(self, message='The time budget was exceeded.', partial_solution=None):
+        """
+        Args:
+            message (:obj:`str`, optional): message
+            partial_solution (:obj:`object`, optional): solution of the part of the method which was completed
+                before the budget ran out
+        """
+        super(TimeLimitExceededError, self).__init__(message)
+        self.partial_solution = partial_solution
+
+
+def get_deadline(timeout=None, deadline=None):
+    """ Get the deadline of a budget, which is the earlier of a timeout from now and an existing deadline (e.g.,
+    of the archive which contains a task)
+
+    Args:
+        timeout (:obj:`float`, optional): time budget in seconds
+        deadline (:obj:`float`, optional): existing deadline on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`float`: deadline on the :obj:`time.monotonic` clock, or :obj:`None` if there is no budget
+    """
+    if timeout is not None:
+        timeout_deadline = time.monotonic() + timeout
+        if deadline is None or timeout_deadline < deadline:
+            deadline = timeout_deadline
+    return deadline
+
+
+def get_remaining_time(deadline):
+    """ Get the time remaining until a deadline
+
+    Args:
+        deadline (:obj:`float`): deadline on the :obj:`time.monotonic` clock, or :obj:`None` for no budget
+
+    Returns:
+        :obj:`float`: remaining time in seconds (zero if the deadline has passed), or :obj:`None` if there is no budget
+    """
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.)
+
+
+def is_expired(deadline):
+    """ Determine whether a deadline has passed
+
+    Args:
+        deadline (:obj:`float`): deadline on the :obj:`time.monotonic` clock, or :obj:`None` for no budget
+
+    Returns:
+        :obj:`bool`: :obj:`True` if the deadline has passed
+    """
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def get_solver_timeout(deadline):
+    """ Get the time limit for a solve which must complete by a deadline
+
+    Args:
+        deadline (:obj:`float`): deadline on the :obj:`time.monotonic` clock, or :obj:`None` for no budget
+
+    Returns:
+        :obj:`int`: time limit in seconds, or :obj:`None` for no limit
+    """
+    if deadline is None:
+        return None
+    # solvers such as GLPK only accept whole numbers of seconds
+    return max(int(math.ceil(get_remaining_time(deadline))), 1)
+
+
+@contextlib.contextmanager
+def solver_time_limit(model, deadline):
+    """ Limit the time of each solve of a model to the time remaining until a deadline, and restore the
+    previous limit on exit
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        deadline (:obj:`float`): deadline on the :obj:`time.monotonic` clock, or :obj:`None` for no budget
+    """
+    if deadline is None:
+        yield
+        return
+
+    configuration = model.solver.configuration
+    prev_timeout = configuration.timeout
+    configuration.timeout = get_solver_timeout(deadline)
+    try:
+        yield
+    finally:
+        configuration.timeout = prev_timeout
@@ -6,10 +6,14 @@
 :License: MIT
 """
 
-from biosimulators_utils.report.data_model import VariableResults
+from .gurobi import set_solver
+from .solution import SlimSolution, BlockVariableResults, stack_results
+from biosimulators_utils.data_model import ValueType
 from biosimulators_utils.sedml.data_model import Variable  # noqa: F401
 from biosimulators_utils.utils.core import validate_str_value, parse_value
 import cobra  # noqa: F401
+import cobra.flux_analysis
+import difflib
 import libsbml
 import numpy
 
@@ -18,10 +22,21 @@ __all__ = [
     'set_simulation_method_arg',
     'apply_variables_to_simulation_method_args',
     'validate_variables',
+    'format_invalid_targets',
     'get_results_paths_for_variables',
+    'get_required_results',
+    'get_solution',
+    'optimize',
+    'pfba',
     'get_results_of_variables',
 ]
 
+MAX_INVALID_TARGETS_IN_ERRORS = 10
+# :obj:`int`: maximum number of invalid targets of model changes or variables which are listed in error messages
+
+MAX_SUGGESTED_IDS = 3
+# :obj:`int`: maximum number of similar valid ids which are suggested for each invalid target in error messages
+
 
 def get_objective_sbml_fbc_ids(model_source):
     """ Get the SBML-FBC id of the active objective
@@ -81,6 +96,14 @@ def set_simulation_method_arg(method_props, argument_change, model, model_method
         raise ValueError(msg)
     enum = parameter.get('enum', None)
     if enum:
+        # enumerations which include booleans (e.g., loopless methods, which were booleans) accept every spelling
+        # of a boolean (e.g., ``1`` and ``0``)
+        if (
+            any(isinstance(member.value, bool) for member in enum)
+            and validate_str_value(value, ValueType.boolean)
+        ):
+            value = str(parse_value(value, ValueType.boolean)).lower()
+
         if value.lower() not in enum.__members__:
             msg = ("`{}` is not a valid value for parameter {} ({}) of {} ({}). "
                    "The value of {} must be one of the following:\n  - {}").format(
@@ -96,6 +119,8 @@ def set_simulation_method_arg(method_props, argument_change, model, model_method
 
     if 'alg_arg' in parameter:
         model_method_kw_args[parameter['alg_arg']] = parsed_value
+    elif parameter['model_arg'] == 'solver':
+        set_solver(model, parsed_value)
     else:
         setattr(model, parameter['model_arg'], parsed_value)
 
@@ -167,12 +192,20 @@ def validate_variables(model, active_objective_sbml_fbc_id, objective_sbml_fbc_i
             method['name'], method['kisao_id']))
 
     if invalid_targets:
+        valid_ids = set()
+        for sbml_id, fbc_id, _ in possible_target_results_path_map:
+            valid_ids.add(sbml_id or fbc_id)
+        target_id_map = {
+            target: target_sbml_id_map.get(target, None) or target_sbml_fbc_id_map.get(target, None)
+            for target in invalid_targets
+        }
+
         msg = (
             "{} ({}) doesn't support variables with the following target XPaths:\n  - {}\n\n"
             "The targets of variables should match one of the following patterns of XPaths:\n  - {}"
         ).format(
             method['name'], method['kisao_id'],
-            '\n  - '.join(sorted('`' + target + '`' for target in invalid_targets)),
+            format_invalid_targets(invalid_targets, target_id_map, valid_ids),
             '\n  - '.join(sorted('{}: `{}`'.format(
                 variable_pattern['description'], variable_pattern['target'])
                 for variable_pattern in method['variables']))
@@ -180,6 +213,47 @@ def validate_variables(model, active_objective_sbml_fbc_id, objective_sbml_fbc_i
         raise ValueError(msg)
 
 
+def format_invalid_targets(invalid_targets, target_id_map, valid_ids):
+    """ Format a list of invalid targets of model changes or variables for an error message
+
+    At most :obj:`MAX_INVALID_TARGETS_IN_ERRORS` targets are listed. Targets whose model objects aren't valid targets
+    are listed with the valid ids which are prefixes of, or the most similar to, the ids of their objects.
+
+    Args:
+        invalid_targets (:obj:`collections.abc.Collection` of :obj:`str`): invalid targets
+        target_id_map (:obj:`dict` of :obj:`str` to :obj:`str`): dictionary that maps each target to the id of the
+            corresponding model object
+        valid_ids (:obj:`dict` or :obj:`set` of :obj:`str`): ids of the model objects which can be targeted
+            (e.g., a dictionary of the model objects by id)
+
+    Returns:
+        :obj:`str`: invalid targets, one per line
+    """
+    invalid_targets = sorted(invalid_targets)
+
+    lines = []
+    for target in invalid_targets[:MAX_INVALID_TARGETS_IN_ERRORS]:
+        line = '`' + target + '`'
+
+        target_id = target_id_map.get(target, None)
+        if target_id and target_id not in valid_ids:
+            # valid ids which are prefixes of the id (e.g., the reaction of a flux bound parameter), then similar ids
+            similar_ids = [target_id[:i] for i in range(len(target_id) - 1, 0, -1) if target_id[:i] in valid_ids]
+            for similar_id in difflib.get_close_matches(target_id, valid_ids, n=MAX_SUGGESTED_IDS):
+                if similar_id not in similar_ids:
+                    similar_ids.append(similar_id)
+            similar_ids = similar_ids[:MAX_SUGGESTED_IDS]
+            if similar_ids:
+                line += ' (similar valid ids: {})'.format(', '.join('`' + id + '`' for id in similar_ids))
+
+        lines.append(line)
+
+    if len(invalid_targets) > MAX_INVALID_TARGETS_IN_ERRORS:
+        lines.append('and {} more'.format(len(invalid_targets) - MAX_INVALID_TARGETS_IN_ERRORS))
+
+    return '\n  - '.join(lines)
+
+
 def get_results_paths_for_variables(model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
                                     method, variables, target_sbml_id_map, target_sbml_fbc_id_map):
     """ Get the path to results for the desired variables
@@ -216,30 +290,163 @@ def get_results_paths_for_variables(model, active_objective_sbml_fbc_id, objecti
     return target_results_path_map
 
 
+def get_required_results(target_results_path_map):
+    """ Get the types of results, and the model objects of each type, which are needed to record the desired variables
+
+    Args:
+        target_results_path_map (:obj:`dict`): path to results of desired variables
+
+    Returns:
+        :obj:`dict`: dictionary that maps the type of each needed result (e.g., ``fluxes``) to the ids of the model
+            objects (e.g., reactions) whose values are needed
+    """
+    required_results = {}
+    for result_type, result_name in target_results_path_map.values():
+        if result_type:
+            ids = required_results.setdefault(result_type, set())
+            if result_name:
+                ids.add(result_name[0])
+    return required_results
+
+
+def get_solution(model, required_results):
+    """ Get a solution of a model which only contains the results needed to record the desired variables. This
+    avoids retrieving primal and dual values which are not needed, and avoids building :obj:`pandas.Series`
+    for every reaction and metabolite.
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model whose solver has been optimized
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+
+    Returns:
+        :obj:`SlimSolution`: solution
+    """
+    status = model.solver.status
+    if status != 'optimal':
+        return SlimSolution(status)
+
+    reaction_ids = set()
+    for result_type in SlimSolution.REACTION_RESULT_TYPES:
+        reaction_ids.update(required_results.get(result_type, ()))
+    reactions = model.reactions.get_by_any(sorted(reaction_ids))
+    metabolites = model.metabolites.get_by_any(sorted(required_results.get('shadow_prices', ())))
+
+    solution = SlimSolution(
+        status,
+        objective_value=model.solver.objective.value,
+        reaction_index={rxn.id: i_rxn for i_rxn, rxn in enumerate(reactions)},
+        metabolite_index={met.id: i_met for i_met, met in enumerate(metabolites)},
+    )
+
+    if 'fluxes' in required_results:
+        var_primals = model.solver.primal_values
+        solution.fluxes = numpy.fromiter(
+            (var_primals[rxn.id] - var_primals[rxn.reverse_id] for rxn in reactions),
+            dtype=float, count=len(reactions))
+
+    duals_available = not model.solver.is_integer
+
+    if 'reduced_costs' in required_results:
+        if duals_available:
+            var_duals = model.solver.reduced_costs
+            solution.reduced_costs = numpy.fromiter(
+                (var_duals[rxn.id] - var_duals[rxn.reverse_id] for rxn in reactions),
+                dtype=float, count=len(reactions))
+        else:
+            solution.reduced_costs = numpy.full((len(reactions),), numpy.nan)
+
+    if 'shadow_prices' in required_results:
+        if duals_available:
+            constr_duals = model.solver.shadow_prices
+            solution.shadow_prices = numpy.fromiter(
+                (constr_duals[met.id] for met in metabolites),
+                dtype=float, count=len(metabolites))
+        else:
+            solution.shadow_prices = numpy.full((len(metabolites),), numpy.nan)
+
+    return solution
+
+
+def optimize(model, required_results):
+    """ Execute flux-balance analysis (FBA), only retrieving the results needed to record the desired variables
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+
+    Returns:
+        :obj:`SlimSolution`: solution
+    """
+    model.slim_optimize()
+    return get_solution(model, required_results)
+
+
+def pfba(model, required_results, fraction_of_optimum=1.0):
+    """ Execute parsimonious flux-balance analysis (pFBA), only retrieving the results needed to record the
+    desired variables
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        required_results (:obj:`dict`): dictionary that maps the type of each needed result (e.g., ``fluxes``) to
+            the ids of the model objects (e.g., reactions) whose values are needed
+        fraction_of_optimum (:obj:`float`, optional): lower bound on the objective value relative to the optimal
+            FBA solution
+
+    Returns:
+        :obj:`SlimSolution`: solution
+    """
+    with model:
+        cobra.flux_analysis.parsimonious.add_pfba(model, fraction_of_optimum=fraction_of_optimum)
+        model.slim_optimize()
+        return get_solution(model, required_results)
+
+
 def get_results_of_variables(target_results_path_map, variables, solution):
     """ Get the results of the desired variables
 
+    The results of the variables which record the values of model objects (e.g., the fluxes of reactions) are
+    gathered into one contiguous array for each type of result, rather than into a separate array for each
+    variable (see :obj:`BlockVariableResults`).
+
     Args:
         target_results_path_map (:obj:`dict`): path to results of desired variables
         variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
-        solution (:obj:`cobra.core.solution.Solution`): solution of method
+        solution (:obj:`SlimSolution`, :obj:`cobra.core.solution.Solution`, or :obj:`pandas.DataFrame`): solution of method
 
     Returns:
-        :obj:`VariableResults`: the results of desired variables
+        :obj:`BlockVariableResults`: the results of desired variables
     """
-    variable_results = VariableResults()
+    # group the variables by the types of their results
+    result_names = {}
+    block_variable_ids = {}
+    other_variables = []
     for variable in variables:
         result_type, result_name = target_results_path_map[variable.target]
-        if result_type:
-            result = getattr(solution, result_type)
-            if result_name:
-                if hasattr(result, 'get'):
-                    result = result.get(*result_name)
-                else:
-                    result = result[result_name]
+        if result_type and result_name:
+            result_names.setdefault(result_type, []).append(result_name)
+            block_variable_ids.setdefault(result_type, []).append(variable.id)
+        else:
+            other_variables.append((variable.id, result_type))
+
+    # get the results of each type at once
+    blocks = {}
+    for result_type, type_result_names in result_names.items():
+        if isinstance(solution, SlimSolution):
+            blocks[result_type] = solution.get_results(result_type, type_result_names)
         else:
-            result = numpy.nan
+            result = getattr(solution, result_type)
+            if hasattr(result, 'get'):
+                blocks[result_type] = stack_results([result.get(*result_name) for result_name in type_result_names])
+            else:
+                blocks[result_type] = stack_results([result[result_name] for result_name in type_result_names])
 
-        variable_results[variable.id] = numpy.array(result)
+    variable_results = BlockVariableResults(blocks, block_variable_ids)
+    for variable_id, result_type in other_variables:
+        if result_type:
+            variable_results[variable_id] = numpy.array(getattr(solution, result_type))
+        else:
+            variable_results[variable_id] = numpy.array(numpy.nan)
 
     return variable_results
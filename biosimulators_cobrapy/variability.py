@@ -0,0 +1,689 @@
+""" Flux variability analysis (FVA) and geometric flux-balance analysis (gFBA) with a persistent pool of workers
+
+These follow :obj:`cobra.flux_analysis.flux_variability_analysis` and :obj:`cobra.flux_analysis.geometric_fba`,
+but distribute the reactions over the persistent pool of :obj:`biosimulators_cobrapy.pool`, rather than over
+a pool of processes which is started and stopped for each call, and stop when the time budget of the task runs out.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .pool import get_worker_pool, get_problem_key
+from .timeouts import TimeLimitExceededError, is_expired, get_solver_timeout, solver_time_limit
+from cobra.flux_analysis.parsimonious import add_pfba
+from cobra.util.solver import fix_objective_as_constraint
+from optlang.symbolics import Zero
+import cobra
+import cobra.flux_analysis
+import numpy
+import os
+import pandas
+import time
+import uuid
+
+__all__ = [
+    'flux_variability_analysis',
+    'get_variability_cost',
+    'get_variability_chunks',
+    'get_loopless_method',
+    'geometric_fba',
+]
+
+GUIDED_CHUNKS_PER_PROCESS = 2
+# :obj:`int`: FVA hands out chunks of the remaining reactions divided by this number times the number of processes,
+#   so that the chunks get smaller as the analysis nears its end
+
+MAX_CHUNKS_PER_PROCESS = 32
+# :obj:`int`: each chunk has at least the number of reactions divided by this number times the number of processes,
+#   which bounds the overhead of handing out chunks
+
+LOOPLESS_FVA_BATCH_SIZE = 64
+# :obj:`int`: number of reactions whose loopless variability is analyzed between checks of the time budget of a task
+
+LOOPLESS_METHODS = ('cycleFreeFlux', 'fastSNP')
+# :obj:`tuple` of :obj:`str`: methods of :obj:`cobra.flux_analysis.flux_variability_analysis` for removing loops
+
+MILP_LOOPLESS_METHODS = ('fastSNP',)
+# :obj:`tuple` of :obj:`str`: loopless methods which solve mixed-integer problems
+
+PREPASS_MAX_ROUNDS = 16
+# :obj:`int`: maximum number of LPs which the pre-pass of FVA solves for each direction to find blocked reactions
+
+PREPASS_TOLERANCE = 1e-9
+# :obj:`float`: tolerance for fluxes at their bounds and for non-zero fluxes in the pre-pass of FVA
+
+
+def flux_variability_analysis(model, reaction_list=None, loopless=False, fraction_of_optimum=1.0, pfba_factor=None,
+                              processes=None, deadline=None, model_key=None, prepass=True):
+    """ Execute flux variability analysis (FVA)
+
+    Loopless FVA is delegated to :obj:`cobra.flux_analysis.flux_variability_analysis`. With a time budget, loopless
+    FVA is executed in batches of reactions, and the analysis stops before the next batch once the budget has run out.
+    Loops are removed either by post-processing the solution of each LP with CycleFreeFlux (``cycleFreeFlux``, the
+    method used for ``True``), or by solving the MILP of Fast-SNP, which only constrains the reactions which can
+    be part of a loop (``fastSNP``).
+
+    Unless loops are removed, a pre-pass first determines the minimum and maximum fluxes which don't need an LP of
+    their own (see :obj:`_prepass_variability`), and only the remaining minima and maxima are solved.
+
+    With multiple processes, the reactions are ordered by their estimated cost, most costly first, and handed out in
+    chunks which get smaller as the analysis nears its end. Idle workers take the next chunk from the
+    queue of the pool, so that workers which drew cheap reactions pick up the work of the others, and the last
+    chunks are small enough that workers finish at about the same time.
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        reaction_list (:obj:`list` of :obj:`str`, optional): ids of the reactions to analyze; defaults to all reactions
+        loopless (:obj:`bool` or :obj:`str`, optional): whether to return only loopless solutions, or the method
+            for removing loops (``cycleFreeFlux`` or ``fastSNP``)
+        fraction_of_optimum (:obj:`float`, optional): lower bound on the objective value relative to the optimal
+            FBA solution
+        pfba_factor (:obj:`float`, optional): upper bound on the total sum of absolute fluxes relative to the smallest
+            feasible sum of absolute fluxes
+        processes (:obj:`int`, optional): number of worker processes; defaults to the number configured for COBRApy
+        deadline (:obj:`float`, optional): deadline of the time budget on the :obj:`time.monotonic` clock
+        model_key (:obj:`str`, optional): key of the model (e.g., hash of its source), which is used to push the
+            optimization problem of the model to the workers only once for all of the tasks of the model
+        prepass (:obj:`bool`, optional): whether to determine the minimum and maximum fluxes which don't need an LP
+            of their own before solving the others
+
+    Returns:
+        :obj:`pandas.DataFrame`: minimum and maximum flux of each reaction. Unless loops are removed, the
+            ``scheduler`` entry of its :obj:`pandas.DataFrame.attrs` holds the number of chunks, the wall time,
+            and the number of chunks and reactions, busy time, and utilization of each worker, and the ``prepass``
+            entry holds the number of reactions and bounds which the pre-pass determined and the number of LPs which
+            it saved.
+
+    Raises:
+        :obj:`ValueError`: if :obj:`loopless` is not a loopless method
+        :obj:`TimeLimitExceededError`: if the budget ran out before all of the reactions were analyzed. The
+            ``partial_solution`` of the exception contains the minimum and maximum flux of each reaction that was
+            analyzed and NaN for the other reactions.
+    """
+    loopless = get_loopless_method(loopless)
+
+    if reaction_list is None:
+        reaction_ids = [reaction.id for reaction in model.reactions]
+    else:
+        reaction_ids = [reaction.id for reaction in model.reactions.get_by_any(reaction_list)]
+
+    if processes is None:
+        processes = cobra.Configuration().processes
+    processes = max(min(processes, len(reaction_ids)), 1)
+
+    if loopless is not None:
+        return _loopless_flux_variability_analysis(model, reaction_ids, loopless, fraction_of_optimum,
+                                                   pfba_factor, processes, deadline)
+
+    solution = pandas.DataFrame(numpy.nan, index=reaction_ids, columns=['minimum', 'maximum'])
+
+    prob = model.problem
+    with model:
+        cobra_reactions = model.reactions.get_by_any(reaction_ids)
+
+        model.slim_optimize(error_value=None, message='There is no optimal solution for the chosen objective!')
+        optimal_fluxes = _get_net_fluxes(model, cobra_reactions)
+
+        # constrain the objective to its fraction of the optimum
+        objective_value = fraction_of_optimum * model.solver.objective.value
+        if model.solver.objective.direction == 'max':
+            optimum_is_feasible = model.solver.objective.value >= objective_value
+            objective_constraint = prob.Constraint(model.solver.objective.expression, lb=objective_value,
+                                                   name='fva_old_objective_constraint')
+        else:
+            optimum_is_feasible = model.solver.objective.value <= objective_value
+            objective_constraint = prob.Constraint(model.solver.objective.expression, ub=objective_value,
+                                                   name='fva_old_objective_constraint')
+        model.add_cons_vars([objective_constraint])
+
+        # feasible solutions of the FVA problem, whose fluxes at their bounds are minima or maxima
+        points = [optimal_fluxes] if optimum_is_feasible else []
+
+        # constrain the total flux to a factor of its minimum
+        if pfba_factor is not None:
+            with model:
+                add_pfba(model, fraction_of_optimum=0)
+                flux_sum = model.slim_optimize(error_value=None)
+                points = [_get_net_fluxes(model, cobra_reactions)]
+                flux_sum_constraint = prob.Constraint(model.solver.objective.expression, ub=pfba_factor * flux_sum,
+                                                      name='flux_sum_constraint')
+            model.add_cons_vars([flux_sum_constraint])
+
+        # determine the minima and maxima which don't need LPs of their own
+        if prepass and not is_expired(deadline):
+            prepass_minimum, prepass_maximum, prepass_stats = _prepass_variability(model, cobra_reactions, points)
+            solution.attrs['prepass'] = prepass_stats
+        else:
+            prepass_minimum = numpy.full((len(reaction_ids),), numpy.nan)
+            prepass_maximum = numpy.full((len(reaction_ids),), numpy.nan)
+
+        problem_key = get_problem_key(model_key or uuid.uuid4().hex, model.solver)
+        model.objective = Zero
+
+        reactions = []
+        for reaction, minimum, maximum in zip(cobra_reactions, prepass_minimum, prepass_maximum):
+            directions = tuple(direction for direction, value in (('min', minimum), ('max', maximum))
+                               if numpy.isnan(value))
+            if directions:
+                reactions.append((reaction.id, reaction.forward_variable.name, reaction.reverse_variable.name,
+                                  directions))
+        cobra_reactions = model.reactions.get_by_any([reaction[0] for reaction in reactions])
+
+        start = time.perf_counter()
+        if processes > 1 and len(reactions) > 1:
+            costs = [get_variability_cost(reaction) for reaction in cobra_reactions]
+            chunks = get_variability_chunks(reactions, costs, processes)
+            pool = get_worker_pool(processes)
+            chunk_results = pool.imap_unordered(_analyze_variability, problem_key, model.solver,
+                                                [(chunk, deadline) for chunk in chunks])
+        else:
+            chunks = [reactions] if reactions else []
+            chunk_results = [_analyze_variability(model.solver, reactions, deadline)] if reactions else []
+
+        timed_out = False
+        worker_stats = {}
+        for chunk_reaction_ids, minimum, maximum, chunk_timed_out, worker_id, busy_time in chunk_results:
+            solution.loc[chunk_reaction_ids, 'minimum'] = minimum
+            solution.loc[chunk_reaction_ids, 'maximum'] = maximum
+            timed_out = timed_out or chunk_timed_out
+
+            stats = worker_stats.setdefault(worker_id, {'chunks': 0, 'reactions': 0, 'busyTime': 0.})
+            stats['chunks'] += 1
+            stats['reactions'] += len(chunk_reaction_ids)
+            stats['busyTime'] += busy_time
+        wall_time = time.perf_counter() - start
+
+    solution['minimum'] = solution['minimum'].fillna(pandas.Series(prepass_minimum, index=reaction_ids))
+    solution['maximum'] = solution['maximum'].fillna(pandas.Series(prepass_maximum, index=reaction_ids))
+    solution.attrs['scheduler'] = _get_scheduler_stats(processes, len(chunks), wall_time, worker_stats)
+
+    if timed_out:
+        raise TimeLimitExceededError(
+            'The time budget ran out after analyzing {} of {} reactions.'.format(
+                int(solution.notnull().all(axis=1).sum()), len(reaction_ids)),
+            partial_solution=solution)
+
+    return solution
+
+
+def get_variability_cost(reaction):
+    """ Estimate the relative cost of determining the variability of a reaction. The estimate is the number of
+    reactions which share a metabolite with the reaction, which is cheap to compute and tracks how much of the
+    network the solver has to traverse to minimize and maximize the flux of the reaction. Reactions whose bounds are
+    fixed are estimated to be cheap.
+
+    Args:
+        reaction (:obj:`cobra.core.reaction.Reaction`): reaction
+
+    Returns:
+        :obj:`float`: estimated relative cost
+    """
+    if reaction.lower_bound == reaction.upper_bound:
+        return 1.
+    return 1. + sum(len(metabolite.reactions) for metabolite in reaction.metabolites)
+
+
+def get_variability_chunks(reactions, costs, processes):
+    """ Divide the reactions of FVA into chunks for dynamic scheduling. The reactions are ordered by their
+    estimated cost, most costly first. Each chunk has the number of remaining reactions divided by
+    :obj:`GUIDED_CHUNKS_PER_PROCESS` times the number of processes, and at least the number of reactions divided by
+    :obj:`MAX_CHUNKS_PER_PROCESS` times the number of processes. The sizes of the chunks don't depend on the
+    estimated costs, so that inaccurate estimates only affect the order of the reactions.
+
+    Args:
+        reactions (:obj:`list`): reactions
+        costs (:obj:`list` of :obj:`float`): estimated cost of each reaction
+        processes (:obj:`int`): number of processes
+
+    Returns:
+        :obj:`list` of :obj:`list`: chunks of reactions, in the order in which they should be handed out
+    """
+    order = sorted(range(len(reactions)), key=lambda i_reaction: -costs[i_reaction])
+    min_chunk_size = max(len(reactions) // (MAX_CHUNKS_PER_PROCESS * processes), 1)
+
+    chunks = []
+    i_start = 0
+    while i_start < len(order):
+        chunk_size = max((len(order) - i_start) // (GUIDED_CHUNKS_PER_PROCESS * processes), min_chunk_size)
+        chunks.append([reactions[i_reaction] for i_reaction in order[i_start:i_start + chunk_size]])
+        i_start += chunk_size
+    return chunks
+
+
+def _get_scheduler_stats(processes, num_chunks, wall_time, worker_stats):
+    """ Get statistics about the scheduling of the reactions of FVA over the workers
+
+    Args:
+        processes (:obj:`int`): number of processes
+        num_chunks (:obj:`int`): number of chunks
+        wall_time (:obj:`float`): wall time of the analysis of the reactions in seconds
+        worker_stats (:obj:`dict`): dictionary that maps the id of each worker which analyzed a chunk to its number of
+            chunks and reactions and its busy time
+
+    Returns:
+        :obj:`dict`: number of processes and chunks, wall time, overall utilization, and number of chunks and
+            reactions, busy time, and utilization of each worker
+    """
+    workers = []
+    for i_worker, worker_id in enumerate(sorted(worker_stats.keys())):
+        stats = dict(worker_stats[worker_id], worker=i_worker)
+        stats['utilization'] = stats['busyTime'] / wall_time if wall_time else 1.
+        workers.append(stats)
+
+    busy_time = sum(stats['busyTime'] for stats in workers)
+    return {
+        'processes': processes,
+        'chunks': num_chunks,
+        'wallTime': wall_time,
+        'utilization': busy_time / (processes * wall_time) if wall_time else 1.,
+        'workers': workers,
+    }
+
+
+def _analyze_variability(problem, reactions, deadline):
+    """ Minimize and maximize the flux of each of a list of reactions
+
+    Args:
+        problem (:obj:`optlang.interface.Model`): optimization problem with a zero objective, whose solutions are
+            constrained to a fraction of the optimum of the objective of the model
+        reactions (:obj:`list` of :obj:`tuple`): id, names of the forward and reverse variables, and directions
+            (``min`` and/or ``max``) to optimize of each reaction
+        deadline (:obj:`float`): deadline of the time budget on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`list` of :obj:`str`: ids of the reactions
+            * :obj:`numpy.ndarray`: minimum flux of each reaction, or NaN if it wasn't requested or the budget ran
+              out first
+            * :obj:`numpy.ndarray`: maximum flux of each reaction, or NaN if it wasn't requested or the budget ran
+              out first
+            * :obj:`bool`: whether the budget ran out
+            * :obj:`int`: id of the process which analyzed the reactions
+            * :obj:`float`: time spent analyzing the reactions in seconds
+    """
+    start = time.perf_counter()
+    minimum = numpy.full((len(reactions),), numpy.nan)
+    maximum = numpy.full((len(reactions),), numpy.nan)
+    timed_out = False
+
+    objective = problem.objective
+    prev_timeout = problem.configuration.timeout
+    try:
+        for i_reaction, (_, forward_variable_name, reverse_variable_name, directions) in enumerate(reactions):
+            forward_variable = problem.variables[forward_variable_name]
+            reverse_variable = problem.variables[reverse_variable_name]
+            objective.set_linear_coefficients({forward_variable: 1., reverse_variable: -1.})
+
+            for direction, values in (('min', minimum), ('max', maximum)):
+                if direction not in directions:
+                    continue
+                if is_expired(deadline):
+                    timed_out = True
+                    break
+
+                problem.configuration.timeout = get_solver_timeout(deadline)
+                objective.direction = direction
+                status = problem.optimize()
+                if status == 'optimal':
+                    values[i_reaction] = objective.value
+                elif status == 'time_limit':
+                    timed_out = True
+                    break
+                else:
+                    raise cobra.exceptions.OptimizationError(
+                        'The variability of reaction `{}` could not be determined. The solver status was `{}`.'.format(
+                            reactions[i_reaction][0], status))
+
+            objective.set_linear_coefficients({forward_variable: 0., reverse_variable: 0.})
+            if timed_out:
+                break
+    finally:
+        problem.configuration.timeout = prev_timeout
+
+    return ([reaction_id for reaction_id, _, _, _ in reactions], minimum, maximum, timed_out,
+            os.getpid(), time.perf_counter() - start)
+
+
+def _get_net_fluxes(model, reactions):
+    """ Get the net fluxes of reactions in the current solution of the optimization problem of a model
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model whose problem has been solved
+        reactions (:obj:`list` of :obj:`cobra.core.reaction.Reaction`): reactions
+
+    Returns:
+        :obj:`numpy.ndarray`: net flux of each reaction
+    """
+    primal_values = model.solver.primal_values
+    return numpy.fromiter(
+        (primal_values[reaction.forward_variable.name] - primal_values[reaction.reverse_variable.name]
+         for reaction in reactions),
+        dtype=float, count=len(reactions))
+
+
+def _prepass_variability(model, reactions, points):
+    """ Determine the minimum and maximum fluxes of reactions which don't need LPs of their own
+
+    * The minimum and maximum flux of each reaction whose bounds are fixed are its bounds.
+    * The minimum and maximum flux of each blocked reaction are zero. Blocked reactions which can only carry flux in
+      one direction are found together with a few LPs (see :obj:`_find_blocked_reactions`).
+    * A flux at its lower (upper) bound in a feasible solution is the minimum (maximum) flux of the reaction. The
+      solution of the objective and the solutions of the LPs which find blocked reactions are used.
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model whose problem is constrained to the solutions of FVA
+        reactions (:obj:`list` of :obj:`cobra.core.reaction.Reaction`): reactions
+        points (:obj:`list` of :obj:`numpy.ndarray`): net fluxes of the reactions in feasible solutions of the
+            problem
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`numpy.ndarray`: minimum flux of each reaction, or NaN if it wasn't determined
+            * :obj:`numpy.ndarray`: maximum flux of each reaction, or NaN if it wasn't determined
+            * :obj:`dict`: number of reactions whose bounds are fixed, number of blocked reactions, number of other
+              minima and maxima at bounds, number of LPs solved by the pre-pass, and number of LPs saved
+    """
+    lower_bounds = numpy.array([reaction.lower_bound for reaction in reactions], dtype=float)
+    upper_bounds = numpy.array([reaction.upper_bound for reaction in reactions], dtype=float)
+    minimum = numpy.full((len(reactions),), numpy.nan)
+    maximum = numpy.full((len(reactions),), numpy.nan)
+
+    fixed = lower_bounds == upper_bounds
+    minimum[fixed] = lower_bounds[fixed]
+    maximum[fixed] = upper_bounds[fixed]
+
+    blocked, blocked_points, num_lps = _find_blocked_reactions(model, reactions, lower_bounds, upper_bounds, ~fixed,
+                                                               points)
+    minimum[blocked] = 0.
+    maximum[blocked] = 0.
+
+    num_determined = 2 * int(numpy.sum(fixed | blocked))
+    for point in points + blocked_points:
+        at_lower_bound = numpy.isnan(minimum) & (point <= lower_bounds + PREPASS_TOLERANCE)
+        at_upper_bound = numpy.isnan(maximum) & (point >= upper_bounds - PREPASS_TOLERANCE)
+        minimum[at_lower_bound] = lower_bounds[at_lower_bound]
+        maximum[at_upper_bound] = upper_bounds[at_upper_bound]
+    num_skipped = int(numpy.sum(~numpy.isnan(minimum)) + numpy.sum(~numpy.isnan(maximum)))
+
+    return minimum, maximum, {
+        'fixedReactions': int(numpy.sum(fixed)),
+        'blockedReactions': int(numpy.sum(blocked)),
+        'boundsAtLimits': num_skipped - num_determined,
+        'prepassLps': num_lps,
+        'savedLps': num_skipped - num_lps,
+    }
+
+
+def _find_blocked_reactions(model, reactions, lower_bounds, upper_bounds, candidates, points):
+    """ Find blocked reactions among the reactions which can only carry flux in one direction
+
+    For each direction, an LP maximizes the sum of the fluxes, capped at one, of the candidate reactions which can
+    only carry flux in that direction (as LP7 of FASTCORE). If the maximum is zero, none of the reactions can carry
+    flux. Otherwise, the reactions which carry flux are removed, and the LP is solved again, up to
+    :obj:`PREPASS_MAX_ROUNDS` times. Reversible reactions aren't considered because constraining them to one direction
+    would shrink the space of solutions which the LP explores.
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model whose problem is constrained to the solutions of FVA
+        reactions (:obj:`list` of :obj:`cobra.core.reaction.Reaction`): reactions
+        lower_bounds (:obj:`numpy.ndarray`): lower bound of each reaction
+        upper_bounds (:obj:`numpy.ndarray`): upper bound of each reaction
+        candidates (:obj:`numpy.ndarray`): whether each reaction should be considered
+        points (:obj:`list` of :obj:`numpy.ndarray`): net fluxes of the reactions in feasible solutions of the
+            problem, whose non-zero fluxes show that reactions aren't blocked
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`numpy.ndarray`: whether each reaction is blocked
+            * :obj:`list` of :obj:`numpy.ndarray`: net fluxes of the reactions in the solutions of the LPs
+            * :obj:`int`: number of LPs solved
+    """
+    blocked = numpy.zeros((len(reactions),), dtype=bool)
+    blocked_points = []
+    num_lps = 0
+    prob = model.problem
+
+    can_carry_positive_flux = upper_bounds > 0.
+    can_carry_negative_flux = lower_bounds < 0.
+    for sign, can_carry_flux, can_carry_opposite_flux in (
+        (1., can_carry_positive_flux, can_carry_negative_flux),
+        (-1., can_carry_negative_flux, can_carry_positive_flux),
+    ):
+        # reactions which can only carry flux in the direction, and haven't carried flux in a feasible solution
+        unknown = candidates & can_carry_flux & ~can_carry_opposite_flux
+        for point in points:
+            unknown &= sign * point <= PREPASS_TOLERANCE
+        i_unknown = list(numpy.flatnonzero(unknown))
+        if not i_unknown:
+            continue
+
+        with model:
+            flux_vars = {}
+            flux_constraints = {}
+            for i_reaction in i_unknown:
+                flux_vars[i_reaction] = prob.Variable('fva_prepass_flux_' + reactions[i_reaction].id, lb=0., ub=1.)
+                flux_constraints[i_reaction] = prob.Constraint(
+                    Zero, lb=0., name='fva_prepass_flux_constraint_' + reactions[i_reaction].id, sloppy=True)
+            model.add_cons_vars(list(flux_vars.values()) + list(flux_constraints.values()), sloppy=True)
+            model.solver.update()
+            for i_reaction in i_unknown:
+                reaction = reactions[i_reaction]
+                flux_constraints[i_reaction].set_linear_coefficients({
+                    reaction.forward_variable: sign,
+                    reaction.reverse_variable: -sign,
+                    flux_vars[i_reaction]: -1.,
+                })
+            model.objective = prob.Objective(Zero, direction='max', sloppy=True)
+            model.objective.set_linear_coefficients({flux_var: 1. for flux_var in flux_vars.values()})
+
+            for _ in range(PREPASS_MAX_ROUNDS):
+                status = model.solver.optimize()
+                num_lps += 1
+                if status != 'optimal':
+                    break
+
+                point = _get_net_fluxes(model, reactions)
+                blocked_points.append(point)
+                if model.solver.objective.value <= PREPASS_TOLERANCE:
+                    blocked[i_unknown] = True
+                    break
+
+                carry_flux = [i_reaction for i_reaction in i_unknown if sign * point[i_reaction] > PREPASS_TOLERANCE]
+                if not carry_flux:
+                    break
+                for i_reaction in carry_flux:
+                    flux_vars[i_reaction].ub = 0.
+                    flux_constraints[i_reaction].lb = None
+                i_unknown = [i_reaction for i_reaction in i_unknown if sign * point[i_reaction] <= PREPASS_TOLERANCE]
+                if not i_unknown:
+                    break
+
+    return blocked, blocked_points, num_lps
+
+
+def get_loopless_method(loopless):
+    """ Get the method of :obj:`cobra.flux_analysis.flux_variability_analysis` for removing loops
+
+    Args:
+        loopless (:obj:`bool` or :obj:`str`): whether to return only loopless solutions, or the method for
+            removing loops (``cycleFreeFlux`` or ``fastSNP``)
+
+    Returns:
+        :obj:`str`: method for removing loops, or :obj:`None` if loops shouldn't be removed
+
+    Raises:
+        :obj:`ValueError`: if :obj:`loopless` is not a loopless method
+    """
+    if loopless is None or loopless is False:
+        return None
+    if loopless is True:
+        return LOOPLESS_METHODS[0]
+    if loopless not in LOOPLESS_METHODS:
+        raise ValueError('`{}` is not a loopless method. The loopless method must be one of the following:\n  - {}'.format(
+            loopless, '\n  - '.join('`' + method + '`' for method in LOOPLESS_METHODS)))
+    return loopless
+
+
+def _loopless_flux_variability_analysis(model, reaction_ids, loopless, fraction_of_optimum, pfba_factor, processes, deadline):
+    """ Execute loopless flux variability analysis (FVA) with :obj:`cobra.flux_analysis.flux_variability_analysis`,
+    in batches of reactions if there is a time budget
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        reaction_ids (:obj:`list` of :obj:`str`): ids of the reactions to analyze
+        loopless (:obj:`str`): method for removing loops (``cycleFreeFlux`` or ``fastSNP``)
+        fraction_of_optimum (:obj:`float`): lower bound on the objective value relative to the optimal FBA solution
+        pfba_factor (:obj:`float`): upper bound on the total sum of absolute fluxes relative to the smallest feasible
+            sum of absolute fluxes
+        processes (:obj:`int`): number of processes
+        deadline (:obj:`float`): deadline of the time budget on the :obj:`time.monotonic` clock
+
+    Returns:
+        :obj:`pandas.DataFrame`: minimum and maximum flux of each reaction
+
+    Raises:
+        :obj:`TimeLimitExceededError`: if the budget ran out before all of the reactions were analyzed
+    """
+    kwargs = {
+        'loopless': loopless,
+        'fraction_of_optimum': fraction_of_optimum,
+        'pfba_factor': pfba_factor,
+        'processes': processes,
+    }
+
+    if deadline is None:
+        return cobra.flux_analysis.flux_variability_analysis(model, reaction_list=reaction_ids, **kwargs)
+
+    batch_solutions = []
+    for i_batch in range(0, len(reaction_ids), LOOPLESS_FVA_BATCH_SIZE):
+        if is_expired(deadline):
+            break
+        try:
+            with solver_time_limit(model, deadline):
+                batch_solutions.append(cobra.flux_analysis.flux_variability_analysis(
+                    model, reaction_list=reaction_ids[i_batch:i_batch + LOOPLESS_FVA_BATCH_SIZE], **kwargs))
+        except cobra.exceptions.OptimizationError:
+            if not is_expired(deadline) and model.solver.status != 'time_limit':
+                raise
+            break
+
+    solution = pandas.concat(batch_solutions) if batch_solutions else pandas.DataFrame(columns=['minimum', 'maximum'])
+    if len(solution.index) < len(reaction_ids):
+        raise TimeLimitExceededError(
+            'The time budget ran out after analyzing {} of {} reactions.'.format(len(solution.index), len(reaction_ids)),
+            partial_solution=solution.reindex(reaction_ids).astype(float))
+    return solution
+
+
+def geometric_fba(model, epsilon=1e-06, max_tries=200, processes=None, deadline=None, model_key=None):
+    """ Execute geometric flux-balance analysis (gFBA)
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        epsilon (:obj:`float`, optional): convergence tolerance for the difference between the minimum and maximum
+            flux of each reaction
+        max_tries (:obj:`int`, optional): maximum number of iterations
+        processes (:obj:`int`, optional): number of worker processes for the FVA of each iteration; defaults to the
+            number configured for COBRApy
+        deadline (:obj:`float`, optional): deadline of the time budget on the :obj:`time.monotonic` clock
+        model_key (:obj:`str`, optional): key of the model (e.g., hash of its source), which is used to push the
+            optimization problems of the iterations to the workers only once
+
+    Returns:
+        :obj:`cobra.Solution`: solution
+
+    Raises:
+        :obj:`RuntimeError`: if the number of iterations reaches :obj:`max_tries`
+        :obj:`TimeLimitExceededError`: if the budget ran out before the analysis converged
+    """
+    fva_kw_args = {
+        'processes': processes,
+        'deadline': deadline,
+        'model_key': model_key,
+    }
+
+    with model:
+        # minimize the solution space to a convex hull
+        # (unlike :obj:`add_pfba`, the objective is fixed with a constraint with a constant name, so that the
+        # problem can be recognized as already pushed to the workers in subsequent calls)
+        prob = model.problem
+        fix_objective_as_constraint(model, name='geometric_fba_fixed_objective')
+        model.objective = prob.Objective(Zero, direction='min', sloppy=True, name='_pfba_objective')
+        model.objective.set_linear_coefficients({
+            variable: 1.0
+            for rxn in model.reactions
+            for variable in (rxn.forward_variable, rxn.reverse_variable)
+        })
+        model.optimize()
+        fva_sol = _geometric_fba_variability(model, fva_kw_args)
+        mean_flux = (fva_sol['maximum'] + fva_sol['minimum']).abs() / 2
+
+        # constrain the distance between the flux distribution and the center of the solution space
+        consts = []
+        obj_vars = []
+        updating_vars_cons = []
+        for rxn in model.reactions:
+            var = prob.Variable('geometric_fba_' + rxn.id, lb=0, ub=mean_flux[rxn.id])
+            upper_const = prob.Constraint(rxn.flux_expression - var, ub=mean_flux[rxn.id],
+                                          name='geometric_fba_upper_const_' + rxn.id)
+            lower_const = prob.Constraint(rxn.flux_expression + var, lb=fva_sol.at[rxn.id, 'minimum'],
+                                          name='geometric_fba_lower_const_' + rxn.id)
+            updating_vars_cons.append((rxn.id, var, upper_const, lower_const))
+            consts.extend([var, upper_const, lower_const])
+            obj_vars.append(var)
+        model.add_cons_vars(consts)
+
+        # minimize the distance
+        model.objective = prob.Objective(Zero, sloppy=True, direction='min')
+        model.objective.set_linear_coefficients({var: 1.0 for var in obj_vars})
+
+        sol = model.optimize()
+        fva_sol = _geometric_fba_variability(model, fva_kw_args)
+        mean_flux = (fva_sol['maximum'] + fva_sol['minimum']).abs() / 2
+        delta = (fva_sol['maximum'] - fva_sol['minimum']).max()
+        count = 1
+
+        # iterate until the distance is below the threshold
+        while delta > epsilon and count < max_tries:
+            for rxn_id, var, upper_const, lower_const in updating_vars_cons:
+                var.ub = mean_flux[rxn_id]
+                upper_const.ub = mean_flux[rxn_id]
+                lower_const.lb = fva_sol.at[rxn_id, 'minimum']
+
+            sol = model.optimize()
+            fva_sol = _geometric_fba_variability(model, fva_kw_args)
+            mean_flux = (fva_sol['maximum'] + fva_sol['minimum']).abs() / 2
+            delta = (fva_sol['maximum'] - fva_sol['minimum']).max()
+            count += 1
+
+        if count == max_tries:
+            raise RuntimeError(
+                'The iterations have exceeded the maximum value of {}. This is probably due to the increased '
+                'complexity of the model and can lead to inaccurate results. Please set a different convergence '
+                'tolerance and/or increase the maximum iterations.'.format(max_tries))
+
+    return sol
+
+
+def _geometric_fba_variability(model, fva_kw_args):
+    """ Execute the FVA of an iteration of gFBA
+
+    Args:
+        model (:obj:`cobra.core.model.Model`): model
+        fva_kw_args (:obj:`dict`): keyword arguments for :obj:`flux_variability_analysis`
+
+    Returns:
+        :obj:`pandas.DataFrame`: minimum and maximum flux of each reaction
+
+    Raises:
+        :obj:`TimeLimitExceededError`: if the budget ran out
+    """
+    try:
+        return flux_variability_analysis(model, **fva_kw_args)
+    except TimeLimitExceededError:
+        raise TimeLimitExceededError('The time budget ran out before geometric FBA converged.')
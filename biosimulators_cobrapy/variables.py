@@ -0,0 +1,215 @@
+""" Index of the targets of variables
+
+The targets of variables are XPaths to reactions, species, and objectives, such as
+``/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux``. Rather than evaluating the XPath of
+each variable against the SBML file of its model, and enumerating each target which the simulation method supports
+to check each variable, both of which take time proportional to the size of the model, the targets of variables are
+parsed into the type, id, and attribute of their model objects with regular expressions which are compiled once,
+and their ids are looked up in an index of the model which is built once per model. Resolving the targets of the
+variables of a task then takes time proportional to the number of variables.
+
+Targets which don't have the usual form of these XPaths (e.g., XPaths which select objects by other attributes), or
+which are invalid, are not resolved by the index. These targets are resolved by evaluating their XPaths, which also
+reports why they are invalid.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from lxml import etree
+import re
+import types
+
+__all__ = [
+    'VariableTargetIndex',
+]
+
+ID_TARGET_PATTERN = re.compile(
+    r"^/(?P<sbml>\w+):sbml/(?P=sbml):model/(?P=sbml):listOf(?:Reactions/(?P=sbml):(?P<reaction>reaction)"
+    r"|Species/(?P=sbml):species)"
+    r"\[@id=(?P<quote>['\"])(?P<id>[^'\"]*)(?P=quote)\]"
+    r"(?:/@(?:(?P<attr_ns>\w+):)?(?P<attr>\w+))?$")
+# :obj:`re.Pattern`: pattern of the XPaths of the targets of variables of reactions and species
+
+OBJECTIVE_TARGET_PATTERN = re.compile(
+    r"^/(?P<sbml>\w+):sbml/(?P=sbml):model/(?P<fbc>\w+):listOfObjectives/(?P=fbc):objective"
+    r"\[@(?P=fbc):id=(?P<quote>['\"])(?P<id>[^'\"]*)(?P=quote)\]"
+    r"(?:/@(?:(?P<attr_ns>\w+):)?(?P<attr>\w+))?$")
+# :obj:`re.Pattern`: pattern of the XPaths of the targets of variables of objectives
+
+
+class VariableTargetIndex(object):
+    """ Index of the model objects which variables can target
+
+    Attributes:
+        sbml_uri (:obj:`str`): URI of the SBML namespace of the model
+        sbml_fbc_uri (:obj:`str`): URI of the SBML-FBC package
+        reactions (:obj:`dict` of :obj:`str` to :obj:`cobra.core.reaction.Reaction`): dictionary that maps the SBML
+            id of each reaction to the reaction
+        species (:obj:`dict` of :obj:`str` to :obj:`cobra.core.metabolite.Metabolite`): dictionary that maps the SBML
+            id of each species to the metabolite
+        objective_sbml_fbc_ids (:obj:`set` of :obj:`str`): SBML-FBC ids of the objectives
+        active_objective_sbml_fbc_id (:obj:`str`): SBML-FBC id of the active objective
+    """
+
+    def __init__(self, model, model_etree, sbml_fbc_uri, active_objective_sbml_fbc_id):
+        """
+        Args:
+            model (:obj:`cobra.core.model.Model`): model
+            model_etree (:obj:`lxml.etree._ElementTree`): element tree of the SBML file of the model
+            sbml_fbc_uri (:obj:`str`): URI of the SBML-FBC package
+            active_objective_sbml_fbc_id (:obj:`str`): SBML-FBC id of the active objective
+        """
+        self.sbml_uri = etree.QName(model_etree.getroot()).namespace
+        self.sbml_fbc_uri = sbml_fbc_uri
+        self.active_objective_sbml_fbc_id = active_objective_sbml_fbc_id
+
+        sbml_id_attr = 'id'
+        sbml_fbc_id_attr = '{{{}}}id'.format(sbml_fbc_uri)
+        self.reactions = self._index_objs(
+            self._get_element_ids(model_etree, self.sbml_uri, 'listOfReactions', 'reaction',
+                                  sbml_id_attr, sbml_fbc_id_attr),
+            model.reactions, 'R_')
+        self.species = self._index_objs(
+            self._get_element_ids(model_etree, self.sbml_uri, 'listOfSpecies', 'species',
+                                  sbml_id_attr, sbml_fbc_id_attr),
+            model.metabolites, 'M_')
+        self.objective_sbml_fbc_ids = self._get_element_ids(model_etree, sbml_fbc_uri, 'listOfObjectives', 'objective',
+                                                            sbml_fbc_id_attr, sbml_id_attr)
+
+    def _get_element_ids(self, model_etree, uri, list_name, element_name, id_attr, other_id_attr):
+        """ Get the ids of the elements of a list of the SBML file of a model
+
+        Elements whose ids aren't unique, or which also have the other id attribute, are excluded, so that the
+        XPaths of the targets of these elements are evaluated.
+
+        Args:
+            model_etree (:obj:`lxml.etree._ElementTree`): element tree of the SBML file of the model
+            uri (:obj:`str`): URI of the namespace of the list and its elements
+            list_name (:obj:`str`): name of the list (e.g., ``listOfReactions``)
+            element_name (:obj:`str`): name of the elements (e.g., ``reaction``)
+            id_attr (:obj:`str`): qualified name of the id attribute which the targets of variables select
+            other_id_attr (:obj:`str`): qualified name of the other id attribute
+
+        Returns:
+            :obj:`set` of :obj:`str`: ids of the elements
+        """
+        ids = set()
+        duplicate_ids = set()
+        for element in model_etree.getroot().iterfind('{{{}}}model/{{{}}}{}/{{{}}}{}'.format(
+                self.sbml_uri, uri, list_name, uri, element_name)):
+            id = element.get(id_attr)
+            if id is None or element.get(other_id_attr) is not None:
+                continue
+            if id in ids:
+                duplicate_ids.add(id)
+            ids.add(id)
+        return ids - duplicate_ids
+
+    @staticmethod
+    def _index_objs(ids, objs, prefix):
+        """ Index the COBRApy objects of the elements of the SBML file of a model by the ids of the elements
+
+        Args:
+            ids (:obj:`set` of :obj:`str`): ids of the elements
+            objs (:obj:`cobra.core.dictlist.DictList`): COBRApy objects (e.g., reactions)
+            prefix (:obj:`str`): prefix of the SBML ids of the objects (e.g., ``R_``)
+
+        Returns:
+            :obj:`dict`: dictionary that maps the id of each element to the corresponding COBRApy object
+        """
+        index = {}
+        for obj in objs:
+            for id in (obj.id, prefix + obj.id):
+                if id in ids:
+                    index[id] = obj
+        return index
+
+    def resolve_target(self, variable):
+        """ Resolve the target of a variable to the type, SBML id, SBML-FBC id, and attribute of its model object
+
+        Args:
+            variable (:obj:`Variable`): variable
+
+        Returns:
+            :obj:`tuple`: type of the target (``reaction``, ``species``, or ``objective``), SBML id, SBML-FBC id, and
+                attribute (without its namespace prefix) of the target, or :obj:`None` if the target doesn't have the
+                usual form or its model object isn't in the index
+        """
+        target = variable.target
+        if not target:
+            return None
+        namespaces = variable.target_namespaces
+
+        match = ID_TARGET_PATTERN.match(target)
+        if match:
+            if match.group('reaction'):
+                target_type = 'reaction'
+                objs = self.reactions
+            else:
+                target_type = 'species'
+                objs = self.species
+            sbml_id = match.group('id')
+            sbml_fbc_id = None
+            if sbml_id not in objs:
+                return None
+
+        else:
+            match = OBJECTIVE_TARGET_PATTERN.match(target)
+            if not match:
+                return None
+            target_type = 'objective'
+            sbml_id = None
+            sbml_fbc_id = match.group('id')
+            if (
+                namespaces.get(match.group('fbc'), None) != self.sbml_fbc_uri
+                or sbml_fbc_id not in self.objective_sbml_fbc_ids
+            ):
+                return None
+
+        if namespaces.get(match.group('sbml'), None) != self.sbml_uri:
+            return None
+
+        attr_ns = match.group('attr_ns')
+        if attr_ns and namespaces.get(attr_ns, None) != self.sbml_fbc_uri:
+            return None
+
+        return (target_type, sbml_id, sbml_fbc_id, match.group('attr'))
+
+    def get_results_path(self, method, resolved_target):
+        """ Get the path to the results of a resolved target of a variable
+
+        Only the targets of the model object of the variable, rather than all of the targets of the model, are
+        enumerated.
+
+        Args:
+            method (:obj:`dict`): properties of the simulation method
+            resolved_target (:obj:`tuple`): type, SBML id, SBML-FBC id, and attribute of the target
+
+        Returns:
+            :obj:`tuple`: type and name of the results of the target, or :obj:`None` if the method doesn't support
+                the target
+        """
+        target_type, sbml_id, sbml_fbc_id, attr = resolved_target
+        if target_type == 'reaction':
+            model = types.SimpleNamespace(reactions=[self.reactions[sbml_id]], metabolites=[])
+            objective_sbml_fbc_ids = []
+        elif target_type == 'species':
+            model = types.SimpleNamespace(reactions=[], metabolites=[self.species[sbml_id]])
+            objective_sbml_fbc_ids = []
+        else:
+            model = types.SimpleNamespace(reactions=[], metabolites=[])
+            objective_sbml_fbc_ids = [sbml_fbc_id]
+
+        results_path = None
+        for variable_pattern in method['variables']:
+            if variable_pattern['target_type'] != target_type:
+                continue
+            for pattern_sbml_id, pattern_sbml_fbc_id, pattern_attr, result_type, result_name in \
+                    variable_pattern['get_target_results_paths'](
+                        model, self.active_objective_sbml_fbc_id, objective_sbml_fbc_ids):
+                if (pattern_sbml_id, pattern_sbml_fbc_id, pattern_attr) == (sbml_id, sbml_fbc_id, attr):
+                    results_path = (result_type, result_name)
+        return results_path
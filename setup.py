@@ -48,6 +48,7 @@ setuptools.setup(
     entry_points={
         'console_scripts': [
             'biosimulators-cobrapy = biosimulators_cobrapy.__main__:main',
+            'biosimulators-cobrapy-batch = biosimulators_cobrapy.batch:main',
         ],
     },
 )
@@ -0,0 +1,162 @@
+""" Builders of SED tasks and COMBINE/OMEX archives which are shared by the tests
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.combine import data_model as combine_data_model
+from biosimulators_utils.combine.io import CombineArchiveWriter
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.sedml.io import SedmlSimulationWriter
+import os
+import shutil
+
+__all__ = [
+    'MODEL_FILENAME',
+    'NAMESPACES',
+    'OBJECTIVE_TARGET',
+    'get_flux_target',
+    'build_task',
+    'build_combine_archive',
+]
+
+MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+# :obj:`str`: path to the textbook model of the central metabolism of E. coli
+
+NAMESPACES = {
+    'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+    'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+}
+# :obj:`dict`: prefixes of the namespaces of the targets
+
+OBJECTIVE_TARGET = "/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']"
+# :obj:`str`: target of the value of the objective of the textbook model
+
+
+def get_flux_target(reaction_id):
+    """ Get the target of the flux of a reaction
+
+    Args:
+        reaction_id (:obj:`str`): SBML id of the reaction (e.g., ``R_PGK``)
+
+    Returns:
+        :obj:`str`: target
+    """
+    return "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='{}']/@flux".format(reaction_id)
+
+
+def build_task(id='task', kisao_id='KISAO_0000437', model_source=MODEL_FILENAME, glucose_uptake=None,
+               variable_targets=None):
+    """ Build a steady-state task of a model, and variables for its results
+
+    Args:
+        id (:obj:`str`, optional): id of the task
+        kisao_id (:obj:`str`, optional): KiSAO id of the algorithm of the simulation of the task
+        model_source (:obj:`str`, optional): path to the model
+        glucose_uptake (:obj:`float`, optional): maximum uptake of glucose; if set, the lower bound of the glucose
+            exchange reaction is changed to its negation
+        variable_targets (:obj:`dict`, optional): dictionary that maps the id of each variable to its target;
+            defaults to a variable ``{id}_PGK_flux`` for the flux of ``R_PGK``
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`sedml_data_model.Task`: task
+            * :obj:`list` of :obj:`sedml_data_model.Variable`: variables
+    """
+    changes = []
+    if glucose_uptake is not None:
+        changes.append(sedml_data_model.ModelAttributeChange(
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_EX_glc__D_e']/@fbc:lowerFluxBound",
+            target_namespaces=NAMESPACES,
+            new_value=str(-glucose_uptake)))
+
+    task = sedml_data_model.Task(
+        id=id,
+        model=sedml_data_model.Model(
+            id='model',
+            source=model_source,
+            language=sedml_data_model.ModelLanguage.SBML.value,
+            changes=changes,
+        ),
+        simulation=sedml_data_model.SteadyStateSimulation(
+            id='sim_' + id,
+            algorithm=sedml_data_model.Algorithm(kisao_id=kisao_id),
+        ),
+    )
+
+    if variable_targets is None:
+        variable_targets = {'{}_PGK_flux'.format(id): get_flux_target('R_PGK')}
+    variables = [
+        sedml_data_model.Variable(id=variable_id, target=target, target_namespaces=NAMESPACES, task=task)
+        for variable_id, target in variable_targets.items()
+    ]
+    return task, variables
+
+
+def build_combine_archive(dirname, name='archive', num_tasks=1, reaction_id='R_PGK'):
+    """ Build a COMBINE/OMEX archive with the textbook model and a SED document with FBA tasks of the model, and a
+    report of the flux of a reaction for each task
+
+    The targets aren't validated against the model, so that archives with invalid targets can be built.
+
+    Args:
+        dirname (:obj:`str`): directory for the archive
+        name (:obj:`str`, optional): name of the archive
+        num_tasks (:obj:`int`, optional): number of tasks (``task_0``, ``task_1``, ...)
+        reaction_id (:obj:`str`, optional): SBML id of the reaction whose flux is reported
+
+    Returns:
+        :obj:`str`: path to the archive (``{dirname}/{name}.omex``)
+    """
+    archive_dirname = os.path.join(dirname, name)
+    os.mkdir(archive_dirname)
+    shutil.copyfile(MODEL_FILENAME, os.path.join(archive_dirname, 'model.xml'))
+
+    doc = sedml_data_model.SedDocument()
+    doc.models.append(sedml_data_model.Model(
+        id='model',
+        source='model.xml',
+        language=sedml_data_model.ModelLanguage.SBML.value,
+    ))
+    doc.simulations.append(sedml_data_model.SteadyStateSimulation(
+        id='sim',
+        algorithm=sedml_data_model.Algorithm(kisao_id='KISAO_0000437'),
+    ))
+    report = sedml_data_model.Report(id='report')
+    doc.outputs.append(report)
+    for i_task in range(num_tasks):
+        task = sedml_data_model.Task(id='task_{}'.format(i_task), model=doc.models[0], simulation=doc.simulations[0])
+        doc.tasks.append(task)
+        data_gen = sedml_data_model.DataGenerator(
+            id='data_gen_{}'.format(i_task),
+            variables=[
+                sedml_data_model.Variable(
+                    id='var_{}'.format(i_task),
+                    target=get_flux_target(reaction_id),
+                    target_namespaces=NAMESPACES,
+                    task=task,
+                ),
+            ],
+            math='var_{}'.format(i_task),
+        )
+        doc.data_generators.append(data_gen)
+        report.data_sets.append(sedml_data_model.DataSet(
+            id='data_set_{}'.format(i_task), label='data_set_{}'.format(i_task), data_generator=data_gen))
+
+    SedmlSimulationWriter().run(doc, os.path.join(archive_dirname, 'sim.sedml'),
+                                validate_targets_with_model_sources=False)
+
+    archive = combine_data_model.CombineArchive(
+        contents=[
+            combine_data_model.CombineArchiveContent(
+                'model.xml', combine_data_model.CombineArchiveContentFormat.SBML.value),
+            combine_data_model.CombineArchiveContent(
+                'sim.sedml', combine_data_model.CombineArchiveContentFormat.SED_ML.value),
+        ],
+    )
+    archive_filename = os.path.join(dirname, name + '.omex')
+    CombineArchiveWriter().run(archive, archive_dirname, archive_filename)
+    return archive_filename
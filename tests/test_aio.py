@@ -0,0 +1,203 @@
+from biosimulators_cobrapy import aio
+from biosimulators_cobrapy import core
+from biosimulators_utils.config import get_config
+from biosimulators_utils.report import data_model as report_data_model
+from helpers import build_combine_archive, build_task, get_flux_target
+from unittest import mock
+import asyncio
+import gc
+import numpy.testing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+
+class AsyncioTestCase(unittest.TestCase):
+    REACTION_IDS = ['R_ACONTa', 'R_TALA', 'R_PGK', 'R_GAPD', 'R_ENO', 'R_PYK', 'R_CS', 'R_FUM']
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def _build_task(self, reaction_id, max_uptake):
+        return build_task(id='task_' + reaction_id, glucose_uptake=max_uptake,
+                          variable_targets={'flux': get_flux_target(reaction_id)})
+
+    def test_load_from_queue(self):
+        jobs = [self._build_task(reaction_id, max_uptake)
+                for max_uptake in [5., 10.]
+                for reaction_id in self.REACTION_IDS]
+
+        expected_results = [core.exec_sed_task(task, variables)[0]['flux'] for task, variables in jobs]
+
+        executor = aio.BoundedExecutor(max_workers=2, max_pending=3)
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def exec_sed_task(task, variables, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            try:
+                return core.exec_sed_task(task, variables, **kwargs)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        async def serve():
+            # stand-in for a job queue of a web service, drained by more consumers than workers
+            queue = asyncio.Queue()
+            for i_job, job in enumerate(jobs):
+                queue.put_nowait((i_job, job))
+
+            results = [None] * len(jobs)
+
+            async def consume():
+                while not queue.empty():
+                    i_job, (task, variables) = queue.get_nowait()
+                    variable_results, _ = await aio.aexec_sed_task(task, variables, executor=executor, timeout=60.)
+                    results[i_job] = variable_results['flux']
+
+            await asyncio.gather(*[consume() for _ in range(6)])
+            return results
+
+        with mock.patch.object(aio, 'exec_sed_task', side_effect=exec_sed_task):
+            results = asyncio.run(serve())
+        executor.shutdown()
+
+        for result, expected_result in zip(results, expected_results):
+            numpy.testing.assert_allclose(result, expected_result)
+        self.assertGreaterEqual(max_in_flight[0], 1)
+        self.assertLessEqual(max_in_flight[0], executor.max_workers)
+
+    def test_bounded_executor_backpressure(self):
+        executor = aio.BoundedExecutor(max_workers=1, max_pending=2)
+        release = threading.Event()
+
+        async def run():
+            calls = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(4)]
+            await asyncio.sleep(0.1)
+            pending = executor._semaphores[asyncio.get_running_loop()]
+            self.assertTrue(pending.locked())
+            release.set()
+            return await asyncio.gather(*calls)
+
+        self.assertEqual(asyncio.run(run()), [True] * 4)
+        executor.shutdown()
+
+    def test_bounded_executor_semaphores_of_closed_loops_are_released(self):
+        executor = aio.BoundedExecutor(max_workers=1)
+        for _ in range(3):
+            self.assertEqual(asyncio.run(executor.run(sum, [1, 2])), 3)
+        gc.collect()
+        self.assertEqual(len(executor._semaphores), 0)
+        executor.shutdown()
+
+    def test_aexec_sed_task_timeout(self):
+        task, variables = self._build_task('R_ACONTa', 10.)
+        executor = aio.BoundedExecutor(max_workers=1)
+
+        def exec_sed_task(task, variables, **kwargs):
+            time.sleep(0.5)
+
+        with mock.patch.object(aio, 'exec_sed_task', side_effect=exec_sed_task):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(aio.aexec_sed_task(task, variables, executor=executor, timeout=0.05))
+        executor.shutdown()
+
+    def _get_config(self):
+        config = get_config()
+        config.REPORT_FORMATS = [report_data_model.ReportFormat.csv]
+        config.COLLECT_COMBINE_ARCHIVE_RESULTS = True
+        return config
+
+    def test_astream_sedml_docs_in_combine_archive(self):
+        archive_filename = build_combine_archive(self.dirname, num_tasks=2)
+        out_dir = os.path.join(self.dirname, 'out')
+
+        async def stream():
+            return [event async for event in aio.astream_sedml_docs_in_combine_archive(
+                archive_filename, out_dir, config=self._get_config(), executor=aio.BoundedExecutor(max_workers=1))]
+
+        events = asyncio.run(stream())
+        self.assertEqual([(event.type, event.task_id) for event in events], [
+            (aio.ProgressEventType.task_started, 'task_0'),
+            (aio.ProgressEventType.task_succeeded, 'task_0'),
+            (aio.ProgressEventType.task_started, 'task_1'),
+            (aio.ProgressEventType.task_succeeded, 'task_1'),
+            (aio.ProgressEventType.archive_succeeded, None),
+        ])
+        self.assertGreaterEqual(events[1].duration, 0.)
+        self.assertEqual(events[-1].log.exception, None)
+        self.assertTrue(os.path.isfile(os.path.join(out_dir, 'sim.sedml', 'report.csv')))
+
+    def test_aexec_sedml_docs_in_combine_archive_log_capture(self):
+        executor = aio.BoundedExecutor(max_workers=2)
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.5)
+            with lock:
+                in_flight[0] -= 1
+            return None, None
+
+        async def run(config):
+            await asyncio.gather(*[
+                aio.aexec_sedml_docs_in_combine_archive('archive.omex', self.dirname, config=config, executor=executor)
+                for _ in range(2)
+            ])
+
+        # archives whose output is captured are executed one at a time
+        config = self._get_config()
+        config.LOG = True
+        with mock.patch.object(aio, 'exec_sedml_docs_in_combine_archive', side_effect=exec_sedml_docs_in_combine_archive):
+            asyncio.run(run(config))
+        self.assertEqual(max_in_flight[0], 1)
+
+        # archives whose output isn't captured are executed concurrently
+        max_in_flight[0] = 0
+        config.LOG = False
+        with mock.patch.object(aio, 'exec_sedml_docs_in_combine_archive', side_effect=exec_sedml_docs_in_combine_archive):
+            asyncio.run(run(config))
+        self.assertEqual(max_in_flight[0], 2)
+
+        executor.shutdown()
+
+    def test_aexec_sedml_docs_in_combine_archive_cancellation(self):
+        archive_filename = build_combine_archive(self.dirname, num_tasks=3)
+        out_dir = os.path.join(self.dirname, 'out')
+        executor = aio.BoundedExecutor(max_workers=1)
+        executed_task_ids = []
+
+        def exec_sed_task(task, variables, **kwargs):
+            executed_task_ids.append(task.id)
+            time.sleep(0.3)
+            return core.exec_sed_task(task, variables, **kwargs)
+
+        async def run():
+            events = asyncio.Queue()
+            archive = asyncio.ensure_future(aio.aexec_sedml_docs_in_combine_archive(
+                archive_filename, out_dir, config=self._get_config(), executor=executor, events=events))
+            event = await events.get()
+            self.assertEqual((event.type, event.task_id), (aio.ProgressEventType.task_started, 'task_0'))
+            archive.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await archive
+
+        with mock.patch.object(aio, 'exec_sed_task', side_effect=exec_sed_task):
+            asyncio.run(run())
+            executor.shutdown(wait=True)
+
+        # the running task completed, but the remaining tasks weren't executed
+        self.assertEqual(executed_task_ids, ['task_0'])
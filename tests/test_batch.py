@@ -0,0 +1,142 @@
+""" Tests of the batch execution of COMBINE/OMEX archives
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import batch
+from biosimulators_cobrapy.batch import BatchItem
+from biosimulators_cobrapy.config import SimulatorConfig
+from biosimulators_cobrapy.core import exec_sedml_docs_in_combine_archive
+from helpers import build_combine_archive
+import cobra
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+def exec_archive_or_terminate(archive_filename, out_dir, config=None, simulator_config=None, model_cache=None):
+    """ Execute an archive, or terminate the process for archives whose names contain ``terminate`` """
+    if 'terminate' in os.path.basename(archive_filename):
+        os._exit(1)
+    return exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config,
+                                              simulator_config=simulator_config, model_cache=model_cache)
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_read_batch_manifest(self):
+        filename = os.path.join(self.dirname, 'manifest.csv')
+        with open(filename, 'w') as file:
+            file.write('archive,out_dir\n')
+            file.write('a.omex,out/a\n')
+            file.write('{},{}\n'.format(os.path.join(self.dirname, 'b.omex'), os.path.join(self.dirname, 'b')))
+        self.assertEqual(batch.read_batch_manifest(filename), [
+            BatchItem(os.path.join(self.dirname, 'a.omex'), os.path.join(self.dirname, 'out', 'a')),
+            BatchItem(os.path.join(self.dirname, 'b.omex'), os.path.join(self.dirname, 'b')),
+        ])
+
+        with open(filename, 'w') as file:
+            file.write('archive\na.omex\n')
+        with self.assertRaisesRegex(ValueError, 'missing `out_dir`'):
+            batch.read_batch_manifest(filename)
+
+        with open(filename, 'w') as file:
+            file.write('archive,out_dir\na.omex,\n')
+        with self.assertRaisesRegex(ValueError, 'Line 2'):
+            batch.read_batch_manifest(filename)
+
+    def test_exec_batch(self):
+        archive_1 = build_combine_archive(self.dirname, 'archive_1')
+        archive_2 = build_combine_archive(self.dirname, 'archive_2', reaction_id='R_TALA')
+        archive_3 = build_combine_archive(self.dirname, 'archive_3', reaction_id='R_UNKNOWN')
+        items = [
+            BatchItem(archive_1, os.path.join(self.dirname, 'out_1')),
+            BatchItem(os.path.join(self.dirname, 'missing.omex'), os.path.join(self.dirname, 'out_missing')),
+            BatchItem(archive_2, os.path.join(self.dirname, 'out_2')),
+            BatchItem(archive_3, os.path.join(self.dirname, 'out_3')),
+        ]
+
+        summary = batch.exec_batch(items, workers=1)
+
+        self.assertEqual(summary['archives'], 4)
+        self.assertEqual(summary['workers'], 1)
+        self.assertEqual(summary['workerProcesses'], os.cpu_count())
+        self.assertEqual(summary['archiveTimeout'], None)
+        self.assertEqual(summary['succeeded'], 2)
+        self.assertEqual(summary['failed'], 2)
+        self.assertGreater(summary['throughput'], 0.)
+        self.assertEqual([result['archive'] for result in summary['results']], [item.archive for item in items])
+        self.assertEqual([result['status'] for result in summary['results']],
+                         ['succeeded', 'failed', 'succeeded', 'failed'])
+        self.assertIn('missing.omex', summary['results'][1]['error'])
+        self.assertIn('R_UNKNOWN', summary['results'][3]['error'])
+        self.assertTrue(os.path.isfile(os.path.join(self.dirname, 'out_2', 'reports.h5')))
+
+        # the archives which the worker executed share its cache of models (the third archive is invalid, and fails
+        # before its model is read)
+        self.assertEqual(len(set(result['worker'] for result in summary['results'])), 1)
+        self.assertEqual(summary['modelCache']['misses'], 1)
+        self.assertEqual(summary['modelCache']['hits'], 1)
+
+    def test_exec_batch_with_terminated_worker(self):
+        archive_1 = build_combine_archive(self.dirname, 'archive_1')
+        archive_2 = build_combine_archive(self.dirname, 'archive_terminate')
+        items = [
+            BatchItem(archive_1, os.path.join(self.dirname, 'out_1')),
+            BatchItem(archive_2, os.path.join(self.dirname, 'out_2')),
+            BatchItem(archive_1, os.path.join(self.dirname, 'out_3')),
+        ]
+
+        summary = batch.exec_batch(items, workers=2, archive_executer=exec_archive_or_terminate)
+
+        self.assertEqual([result['status'] for result in summary['results']], ['succeeded', 'failed', 'succeeded'])
+        self.assertEqual(summary['results'][1]['error'], batch.WORKER_TERMINATED_ERROR)
+
+    def test_exec_batch_with_archive_timeout(self):
+        archive_1 = build_combine_archive(self.dirname, 'archive_1')
+        items = [BatchItem(archive_1, os.path.join(self.dirname, 'out_1'))]
+
+        summary = batch.exec_batch(items, workers=2, simulator_config=SimulatorConfig(ARCHIVE_TIMEOUT=60.))
+
+        self.assertEqual(summary['succeeded'], 1)
+        self.assertEqual(summary['workerProcesses'], max(1, os.cpu_count() // 2))
+        self.assertEqual(summary['archiveTimeout'], 60.)
+
+    def test_init_worker(self):
+        configuration = cobra.Configuration()
+        processes = configuration.processes
+        try:
+            batch._init_worker(None, 3)
+            self.assertEqual(configuration.processes, 3)
+        finally:
+            configuration.processes = processes
+
+    def test_main(self):
+        archive_1 = build_combine_archive(self.dirname, 'archive_1')
+        manifest_filename = os.path.join(self.dirname, 'manifest.csv')
+        with open(manifest_filename, 'w') as file:
+            file.write('archive,out_dir\n')
+            file.write('archive_1.omex,out_1\n')
+
+        self.assertEqual(batch.main([manifest_filename, '--workers', '1']), 0)
+        with open(os.path.join(self.dirname, 'batch-summary.json'), 'r') as file:
+            summary = json.load(file)
+        self.assertEqual(summary['succeeded'], 1)
+        self.assertEqual(summary['results'][0]['archive'], archive_1)
+
+        with open(manifest_filename, 'a') as file:
+            file.write('missing.omex,out_2\n')
+        summary_filename = os.path.join(self.dirname, 'summaries', 'summary.json')
+        self.assertEqual(batch.main([manifest_filename, '--summary', summary_filename]), 1)
+        with open(summary_filename, 'r') as file:
+            self.assertEqual(json.load(file)['failed'], 1)
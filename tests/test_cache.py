@@ -0,0 +1,133 @@
+from biosimulators_cobrapy.cache import (ResultCache, get_result_cache, get_file_hash, get_solver_id, get_solver_ids,
+                                         get_result_cache_key)
+from biosimulators_cobrapy.config import SimulatorConfig
+from biosimulators_utils.report.data_model import VariableResults
+from biosimulators_utils.sedml.data_model import Algorithm, AlgorithmParameterChange, ModelAttributeChange, Variable
+from kisao.data_model import AlgorithmSubstitutionPolicy
+import cobra
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_set(self):
+        cache = ResultCache(os.path.join(self.dirname, 'cache'))
+        variables = [
+            Variable(id='x', target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_A']/@flux"),
+            Variable(id='y', target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_B']/@flux"),
+        ]
+        variable_results = VariableResults({'x': numpy.array(1.), 'y': numpy.array(numpy.nan)})
+
+        self.assertEqual(cache.get('key', variables), None)
+        cache.set('key', variables, variable_results)
+
+        other_variables = [
+            Variable(id='y2', target=variables[1].target),
+            Variable(id='x2', target=variables[0].target),
+        ]
+        results = cache.get('key', other_variables)
+        self.assertEqual(set(results.keys()), set(['x2', 'y2']))
+        numpy.testing.assert_equal(results['x2'], numpy.array(1.))
+        numpy.testing.assert_equal(results['y2'], numpy.array(numpy.nan))
+
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'misses': 1, 'hitRate': 0.5})
+
+        # variable which isn't in the entry
+        self.assertEqual(cache.get('key', [Variable(id='z', target='z')]), None)
+
+    def test_get_metadata(self):
+        cache = ResultCache(os.path.join(self.dirname, 'cache'))
+        variables = [Variable(id='x', target='x')]
+        variable_results = VariableResults({'x': numpy.array(1.)})
+
+        self.assertEqual(cache.get_metadata('key'), None)
+        cache.set('key', variables, variable_results)
+        self.assertEqual(cache.get_metadata('key'), None)
+        cache.set('key', variables, variable_results, metadata={'algorithm': 'KISAO_0000437', 'arguments': {'a': 1}})
+        self.assertEqual(cache.get_metadata('key'), {'algorithm': 'KISAO_0000437', 'arguments': {'a': 1}})
+        numpy.testing.assert_equal(cache.get('key', variables)['x'], numpy.array(1.))
+
+    def test_evict_by_size(self):
+        cache = ResultCache(self.dirname)
+        variables = [Variable(id='x', target='x')]
+        cache.set('key-1', variables, VariableResults({'x': numpy.ones((100,))}))
+        entry_size = os.path.getsize(cache.get_filename('key-1'))
+        os.utime(cache.get_filename('key-1'), (time.time() - 10, time.time() - 10))
+
+        cache.max_size = entry_size
+        cache.set('key-2', variables, VariableResults({'x': numpy.ones((100,))}))
+        self.assertFalse(os.path.isfile(cache.get_filename('key-1')))
+        self.assertTrue(os.path.isfile(cache.get_filename('key-2')))
+
+    def test_evict_by_age(self):
+        cache = ResultCache(self.dirname, max_age=60.)
+        variables = [Variable(id='x', target='x')]
+        cache.set('key-1', variables, VariableResults({'x': numpy.array(1.)}))
+        cache.set('key-2', variables, VariableResults({'x': numpy.array(2.)}))
+        os.utime(cache.get_filename('key-1'), (time.time() - 120, time.time() - 120))
+
+        self.assertEqual(cache.get('key-1', variables), None)
+        self.assertFalse(os.path.isfile(cache.get_filename('key-1')))
+        numpy.testing.assert_equal(cache.get('key-2', variables)['x'], numpy.array(2.))
+
+    def test_get_result_cache(self):
+        self.assertEqual(get_result_cache(SimulatorConfig()), None)
+
+        config = SimulatorConfig(RESULT_CACHE_PATH=self.dirname)
+        cache = get_result_cache(config)
+        self.assertIsInstance(cache, ResultCache)
+        self.assertIs(get_result_cache(config), cache)
+
+    def test_get_solver_ids(self):
+        model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+        self.assertTrue(get_solver_id(model).startswith('glpk '))
+        self.assertIn(get_solver_id(model), get_solver_ids())
+
+    def test_get_result_cache_key(self):
+        model_hash = get_file_hash(self.MODEL_FILENAME)
+        solver_ids = get_solver_ids()
+        policy = AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES
+
+        changes = [ModelAttributeChange(target='target-1', new_value='1')]
+        algorithm = Algorithm(kisao_id='KISAO_0000437')
+        variables = [Variable(id='x', target='x'), Variable(id='y', target='y')]
+        key = get_result_cache_key(model_hash, changes, algorithm, policy, solver_ids, variables)
+        self.assertEqual(
+            get_result_cache_key(model_hash, [ModelAttributeChange(target='target-1', new_value=1.)],
+                                 algorithm, policy, list(reversed(solver_ids)), list(reversed(variables))),
+            key)
+        self.assertNotEqual(
+            get_result_cache_key(model_hash, [ModelAttributeChange(target='target-1', new_value='2')],
+                                 algorithm, policy, solver_ids, variables),
+            key)
+        self.assertNotEqual(
+            get_result_cache_key(model_hash, changes, Algorithm(kisao_id='KISAO_0000528'), policy, solver_ids, variables),
+            key)
+        self.assertNotEqual(
+            get_result_cache_key(model_hash, changes,
+                                 Algorithm(kisao_id='KISAO_0000437', changes=[
+                                     AlgorithmParameterChange(kisao_id='KISAO_0000553', new_value='glpk')]),
+                                 policy, solver_ids, variables),
+            key)
+        self.assertNotEqual(
+            get_result_cache_key(model_hash, changes, algorithm, AlgorithmSubstitutionPolicy.NONE, solver_ids, variables),
+            key)
+        self.assertNotEqual(
+            get_result_cache_key(model_hash, changes, algorithm, policy, solver_ids + ['gurobi 11.0.0'], variables),
+            key)
+        self.assertNotEqual(
+            get_result_cache_key(model_hash, changes, algorithm, policy, solver_ids, variables[:1]),
+            key)
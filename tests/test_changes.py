@@ -0,0 +1,107 @@
+""" Tests of the index of the targets of model changes
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.changes import ModelChangeIndex, apply_model_change
+from biosimulators_utils.sedml.data_model import ModelAttributeChange
+from lxml import etree
+import cobra.io
+import os
+import unittest
+
+
+class ModelChangeIndexTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+    NAMESPACES = {
+        'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+        'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+    }
+    FBC_URI = 'http://www.sbml.org/sbml/level3/version1/fbc/version2'
+
+    def setUp(self):
+        self.model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+        self.model_etree = etree.parse(self.MODEL_FILENAME)
+        self.index = ModelChangeIndex(self.model, self.model_etree, self.FBC_URI, 'obj')
+
+    def _get_change_obj_attrs(self, target, sbml_id):
+        change = ModelAttributeChange(target=target, target_namespaces=self.NAMESPACES)
+        return self.index.get_change_obj_attrs(change, sbml_id, self.model_etree, self.FBC_URI)
+
+    def test_index(self):
+        self.assertEqual(len(self.index.reactions), len(self.model.reactions))
+        self.assertEqual(len(self.index.parameter_bounds['cobra_default_ub']), len(self.model.reactions))
+        self.assertEqual(len(self.index.parameter_bounds['cobra_0_bound']), 48)
+        self.assertEqual(self.index.parameter_bounds['R_EX_glc__D_e_lower_bound'],
+                         [(self.model.reactions.get_by_id('EX_glc__D_e'), 'lower_bound')])
+        self.assertIn('R_PGK', self.index.sbml_ids)
+        self.assertIn('cobra_default_lb', self.index.sbml_ids)
+
+    def test_get_change_obj_attrs(self):
+        pgk = self.model.reactions.get_by_id('PGK')
+        self.assertEqual(
+            self._get_change_obj_attrs("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@fbc:upperFluxBound",
+                                       'R_PGK'),
+            [(pgk, 'upper_bound')])
+        self.assertEqual(
+            self._get_change_obj_attrs("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@fbc:id", 'R_PGK'),
+            None)
+
+        obj_attrs = self._get_change_obj_attrs(
+            "/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='cobra_default_lb']/@value", 'cobra_default_lb')
+        self.assertEqual(len(obj_attrs), 45)
+        self.assertIn((pgk, 'lower_bound'), obj_attrs)
+        self.assertEqual(
+            self._get_change_obj_attrs(
+                "/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='cobra_default_lb']/@units", 'cobra_default_lb'),
+            None)
+
+        self.assertEqual(
+            self._get_change_obj_attrs(
+                "/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']"
+                "/fbc:listOfFluxObjectives/fbc:fluxObjective[@fbc:reaction='R_Biomass_Ecoli_core']/@fbc:coefficient", None),
+            [(self.model.reactions.get_by_id('Biomass_Ecoli_core'), 'objective_coefficient')])
+        self.assertEqual(
+            self._get_change_obj_attrs(
+                "/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='inactive_obj']"
+                "/fbc:listOfFluxObjectives/fbc:fluxObjective[@fbc:reaction='R_ACALD']/@fbc:coefficient", None),
+            None)
+
+        self.assertEqual(
+            self._get_change_obj_attrs("/sbml:sbml/sbml:model/sbml:listOfSpecies/sbml:species[@id='M_glc__D_e']/@initialConcentration",
+                                       'M_glc__D_e'),
+            None)
+
+    def test_apply_model_change(self):
+        obj_attrs = self._get_change_obj_attrs(
+            "/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='cobra_0_bound']/@value", 'cobra_0_bound')
+        apply_model_change(obj_attrs, -1.)
+        for reaction, attr_name in obj_attrs:
+            self.assertEqual(reaction.lower_bound, -1.)
+            self.assertEqual(reaction.forward_variable.lb, 0.)
+            self.assertEqual(reaction.reverse_variable.ub, 1.)
+
+        biomass = self.model.reactions.get_by_id('Biomass_Ecoli_core')
+        objective = self.model.solver.objective
+        apply_model_change([(biomass, 'objective_coefficient')], 3.)
+        self.assertIs(self.model.solver.objective, objective)
+        self.assertEqual(biomass.objective_coefficient, 3.)
+        self.assertEqual(self.model.objective.get_linear_coefficients([biomass.reverse_variable])[biomass.reverse_variable], -3.)
+
+    def test_apply_model_change_in_context(self):
+        pgk = self.model.reactions.get_by_id('PGK')
+        biomass = self.model.reactions.get_by_id('Biomass_Ecoli_core')
+        objective_value = self.model.slim_optimize()
+        with self.model:
+            apply_model_change([(pgk, 'lower_bound')], -5.)
+            apply_model_change([(biomass, 'objective_coefficient')], 3.)
+            self.assertEqual(pgk.lower_bound, -5.)
+            self.assertEqual(biomass.objective_coefficient, 3.)
+
+        self.assertEqual(pgk.lower_bound, -1000.)
+        self.assertEqual(biomass.objective_coefficient, 1.)
+        self.assertEqual(self.model.objective.get_linear_coefficients([biomass.reverse_variable])[biomass.reverse_variable], -1.)
+        self.assertAlmostEqual(self.model.slim_optimize(), objective_value)
@@ -8,6 +8,9 @@
 
 from biosimulators_cobrapy import __main__
 from biosimulators_cobrapy import core
+from biosimulators_cobrapy.config import SimulatorConfig, get_simulator_config
+from biosimulators_cobrapy.model_cache import ModelCache
+from biosimulators_cobrapy.reports import ColumnarReportFormat, read_columnar_report
 from biosimulators_utils.combine import data_model as combine_data_model
 from biosimulators_utils.combine.exceptions import CombineArchiveExecutionError
 from biosimulators_utils.combine.io import CombineArchiveWriter
@@ -31,6 +34,7 @@ import numpy.testing
 import os
 import shutil
 import tempfile
+import time
 import unittest
 
 
@@ -110,7 +114,9 @@ class CliTestCase(unittest.TestCase):
         ]
 
         # FBA
-        variable_results, _ = core.exec_sed_task(task, variables)
+        variable_results, log = core.exec_sed_task(task, variables)
+        self.assertEqual(log.simulator_details['solver'], 'glpk')
+        self.assertIn('KISAO_0000553', log.simulator_details['solverSelectionReason'])
 
         expected_results = {
             'ACONTa_flux': 6.007250,
@@ -120,7 +126,7 @@ class CliTestCase(unittest.TestCase):
             '13dpg_c_price': -0.047105,
             'succ_c_price': -0.050925,
             'active_objective': 0.8739215069684301,
-            'inactive_objective': numpy.nan,
+            'inactive_objective': 0.,
         }
 
         self.assertTrue(set(variable_results.keys()), set(expected_results.keys()))
@@ -140,7 +146,7 @@ class CliTestCase(unittest.TestCase):
             '13dpg_c_price': 18.911111,
             'succ_c_price': 9.844444,
             'active_objective': 0.8739215069684301,
-            'inactive_objective': numpy.nan,
+            'inactive_objective': 0.,
         }
 
         self.assertTrue(set(variable_results.keys()), set(expected_results.keys()))
@@ -160,7 +166,7 @@ class CliTestCase(unittest.TestCase):
             '13dpg_c_price': 0.,
             'succ_c_price': 0.,
             'active_objective': 0.8739215069684301,
-            'inactive_objective': numpy.nan,
+            'inactive_objective': 0.,
         }
 
         self.assertTrue(set(variable_results.keys()), set(expected_results.keys()))
@@ -193,7 +199,10 @@ class CliTestCase(unittest.TestCase):
                 target_namespaces=self.NAMESPACES,
                 task=task),
         ]
-        variable_results, _ = core.exec_sed_task(task, variables)
+        variable_results, log = core.exec_sed_task(task, variables)
+        self.assertEqual(sum(worker['reactions'] for worker in log.simulator_details['scheduler']['workers']), 2)
+        self.assertEqual(set(log.simulator_details['prepass'].keys()),
+                         set(['fixedReactions', 'blockedReactions', 'boundsAtLimits', 'prepassLps', 'savedLps']))
 
         expected_results = {
             'ACONTa_min_flux': 6.007250e+00,
@@ -264,7 +273,7 @@ class CliTestCase(unittest.TestCase):
                 new_value=10,
             ),
             sedml_data_model.ModelAttributeChange(
-                target="/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='R_EX_glc__D_e_lower_bound']/@value",
+                target="/sbml:sbml/sbml:model/sbml:listOfSpecies/sbml:species[@id='M_glc__D_e']/@initialConcentration",
                 target_namespaces=self.NAMESPACES,
                 new_value=10,
             ),
@@ -274,13 +283,287 @@ class CliTestCase(unittest.TestCase):
                 new_value=10,
             ),
         ]
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, r"M_glc__D_e'\]/@initialConcentration` \(similar valid ids: `R_EX_glc__D_e`") as context:
             core.preprocess_sed_task(task, variables)
+        self.assertIn('lower flux bound of a reaction', str(context.exception))
+        self.assertNotIn('R_PGK', str(context.exception))
 
         task.model.source = 'not a file'
         with self.assertRaises(FileNotFoundError):
             core.preprocess_sed_task(task, variables)
 
+    def test_exec_sed_task_with_parameter_and_objective_changes(self):
+        task = sedml_data_model.Task(
+            model=sedml_data_model.Model(
+                source=os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml'),
+                language=sedml_data_model.ModelLanguage.SBML.value,
+            ),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(
+                    kisao_id='KISAO_0000437',
+                ),
+            ),
+        )
+        variables = [
+            sedml_data_model.Variable(
+                id='active_objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+        task.model.changes = [
+            sedml_data_model.ModelAttributeChange(
+                target="/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='R_EX_glc__D_e_lower_bound']/@value",
+                target_namespaces=self.NAMESPACES,
+                new_value='-5',
+            ),
+            sedml_data_model.ModelAttributeChange(
+                target="/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='cobra_default_ub']/@value",
+                target_namespaces=self.NAMESPACES,
+                new_value='20',
+            ),
+            sedml_data_model.ModelAttributeChange(
+                target=("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']"
+                        "/fbc:listOfFluxObjectives/fbc:fluxObjective[@fbc:reaction='R_Biomass_Ecoli_core']/@fbc:coefficient"),
+                target_namespaces=self.NAMESPACES,
+                new_value='2',
+            ),
+        ]
+        results, _ = core.exec_sed_task(task, variables)
+
+        model = cobra.io.read_sbml_model(task.model.source)
+        model.reactions.get_by_id('EX_glc__D_e').lower_bound = -5.
+        for reaction in model.reactions:
+            if reaction.upper_bound == 1000.:
+                reaction.upper_bound = 20.
+        model.reactions.get_by_id('Biomass_Ecoli_core').objective_coefficient = 2.
+        numpy.testing.assert_allclose(results['active_objective'].tolist(), model.slim_optimize(), rtol=1e-6)
+
+        # coefficients of inactive objectives can't be changed
+        task.model.changes = [
+            sedml_data_model.ModelAttributeChange(
+                target=("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='inactive_obj']"
+                        "/fbc:listOfFluxObjectives/fbc:fluxObjective[@fbc:reaction='R_ACALD']/@fbc:coefficient"),
+                target_namespaces=self.NAMESPACES,
+                new_value='2',
+            ),
+        ]
+        with self.assertRaisesRegex(ValueError, 'changes are invalid'):
+            core.exec_sed_task(task, variables)
+
+    def test_exec_sed_task_with_result_cache(self):
+        task = sedml_data_model.Task(
+            model=sedml_data_model.Model(
+                source=os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml'),
+                language=sedml_data_model.ModelLanguage.SBML.value,
+            ),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(
+                    kisao_id='KISAO_0000437',
+                ),
+            ),
+        )
+
+        variables = [
+            sedml_data_model.Variable(
+                id='active_objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+
+        simulator_config = SimulatorConfig(RESULT_CACHE_PATH=os.path.join(self.dirname, 'cache'))
+
+        results, log = core.exec_sed_task(task, variables, simulator_config=simulator_config)
+        self.assertEqual(log.simulator_details['resultCache'], {'hits': 0, 'misses': 1, 'hitRate': 0., 'hit': False})
+        self.assertEqual(log.simulator_details['solver'], 'glpk')
+        self.assertIn('only available solver', log.simulator_details['solverSelectionReason'])
+
+        # hits are returned without preprocessing the task (e.g., reading its model)
+        with mock.patch.object(core, 'preprocess_sed_task', side_effect=Exception('should not be called')):
+            results2, log = core.exec_sed_task(task, variables, simulator_config=simulator_config)
+        self.assertEqual(log.simulator_details['resultCache'], {'hits': 1, 'misses': 1, 'hitRate': 0.5, 'hit': True})
+        self.assertEqual(log.algorithm, 'KISAO_0000437')
+        self.assertEqual(log.simulator_details['solver'], 'glpk')
+        numpy.testing.assert_allclose(results2['active_objective'], results['active_objective'])
+
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_EX_glc__D_e']/@fbc:lowerFluxBound",
+            target_namespaces=self.NAMESPACES,
+            new_value=-1,
+        ))
+        results3, log = core.exec_sed_task(task, variables, simulator_config=simulator_config)
+        self.assertFalse(log.simulator_details['resultCache']['hit'])
+        self.assertLess(results3['active_objective'].tolist(), results['active_objective'].tolist())
+
+    def test_exec_sed_task_with_model_cache(self):
+        task = sedml_data_model.Task(
+            model=sedml_data_model.Model(
+                source=os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml'),
+                language=sedml_data_model.ModelLanguage.SBML.value,
+            ),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(
+                    kisao_id='KISAO_0000437',
+                ),
+            ),
+        )
+
+        variables = [
+            sedml_data_model.Variable(
+                id='active_objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+            sedml_data_model.Variable(
+                id='PGK_flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+
+        model_cache = ModelCache()
+        results, log = core.exec_sed_task(task, variables, model_cache=model_cache)
+        stats = log.simulator_details['modelCache']
+        self.assertEqual({key: stats[key] for key in ['hits', 'misses', 'hitRate', 'hit', 'models']},
+                         {'hits': 0, 'misses': 1, 'hitRate': 0., 'hit': False, 'models': 1})
+        self.assertEqual(stats['size'], 16 * os.path.getsize(task.model.source))
+        cobra_model = list(model_cache.models.values())[0]['model']
+
+        # the changes of a task are reverted for the other tasks which share the model
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_EX_glc__D_e']/@fbc:lowerFluxBound",
+            target_namespaces=self.NAMESPACES,
+            new_value=-1,
+        ))
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target=("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']"
+                    "/fbc:listOfFluxObjectives/fbc:fluxObjective[@fbc:reaction='R_Biomass_Ecoli_core']/@fbc:coefficient"),
+            target_namespaces=self.NAMESPACES,
+            new_value=2,
+        ))
+        results2, log = core.exec_sed_task(task, variables, model_cache=model_cache)
+        stats = log.simulator_details['modelCache']
+        self.assertEqual({key: stats[key] for key in ['hits', 'misses', 'hitRate', 'hit']},
+                         {'hits': 1, 'misses': 1, 'hitRate': 0.5, 'hit': True})
+        self.assertLess(results2['active_objective'].tolist(), results['active_objective'].tolist())
+        self.assertEqual(cobra_model.reactions.EX_glc__D_e.lower_bound, -10.)
+        self.assertEqual(cobra_model.reactions.Biomass_Ecoli_core.objective_coefficient, 1.)
+
+        # other algorithms are executed with the same model
+        task.model.changes = []
+        for kisao_id in ['KISAO_0000528', 'KISAO_0000437']:
+            task.simulation.algorithm.kisao_id = kisao_id
+            results3, log = core.exec_sed_task(task, variables, model_cache=model_cache)
+            self.assertTrue(log.simulator_details['modelCache']['hit'])
+            self.assertIs(list(model_cache.models.values())[0]['model'], cobra_model)
+            numpy.testing.assert_allclose(results3['active_objective'], results['active_objective'])
+        numpy.testing.assert_allclose(results3['PGK_flux'], results['PGK_flux'])
+
+    def test_exec_sed_doc_releases_unused_models(self):
+        doc = sedml_data_model.SedDocument()
+        for i_model in range(2):
+            model_filename = os.path.join(self.dirname, 'model_{}.xml'.format(i_model))
+            shutil.copyfile(os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml'), model_filename)
+            with open(model_filename, 'a') as file:
+                file.write('\n' * i_model)
+            doc.models.append(sedml_data_model.Model(id='model_{}'.format(i_model), source=os.path.basename(model_filename),
+                                                     language=sedml_data_model.ModelLanguage.SBML.value))
+
+        data_sets = []
+        for i_task, (model, kisao_id) in enumerate([(doc.models[0], 'KISAO_0000437'), (doc.models[0], 'KISAO_0000528'),
+                                                    (doc.models[1], 'KISAO_0000437')]):
+            sim = sedml_data_model.SteadyStateSimulation(id='sim_{}'.format(i_task),
+                                                         algorithm=sedml_data_model.Algorithm(kisao_id=kisao_id))
+            task = sedml_data_model.Task(id='task_{}'.format(i_task), model=model, simulation=sim)
+            variable = sedml_data_model.Variable(
+                id='flux_{}'.format(i_task),
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux",
+                target_namespaces=self.NAMESPACES,
+                task=task)
+            data_generator = sedml_data_model.DataGenerator(id='data_generator_{}'.format(i_task), variables=[variable],
+                                                            math=variable.id)
+            doc.simulations.append(sim)
+            doc.tasks.append(task)
+            doc.data_generators.append(data_generator)
+            data_sets.append(sedml_data_model.DataSet(id='data_set_{}'.format(i_task), label=variable.id,
+                                                      data_generator=data_generator))
+        doc.outputs.append(sedml_data_model.Report(id='report', data_sets=data_sets))
+
+        results, log = core.exec_sed_doc(doc, self.dirname, os.path.join(self.dirname, 'out'),
+                                         simulator_config=SimulatorConfig(MODEL_CACHE_MAX_MODELS=2))
+        stats = [log.tasks['task_{}'.format(i_task)].simulator_details['modelCache'] for i_task in range(3)]
+        self.assertEqual([task_stats['hit'] for task_stats in stats], [False, True, False])
+        self.assertEqual([task_stats['releases'] for task_stats in stats], [0, 0, 1])
+        self.assertEqual([task_stats['models'] for task_stats in stats], [1, 1, 1])
+
+    def test_exec_sed_task_with_time_budget(self):
+        task = sedml_data_model.Task(
+            id='task',
+            model=sedml_data_model.Model(
+                source=os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml'),
+                language=sedml_data_model.ModelLanguage.SBML.value,
+            ),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(
+                    kisao_id='KISAO_0000437',
+                ),
+            ),
+        )
+
+        variables = [
+            sedml_data_model.Variable(
+                id='active_objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+            sedml_data_model.Variable(
+                id='ACONTa_flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_ACONTa']/@flux",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+
+        # task completes within its budget
+        results, log = core.exec_sed_task(task, variables, simulator_config=SimulatorConfig(TASK_TIMEOUT=60.))
+        self.assertAlmostEqual(results['active_objective'].tolist(), 0.8739215069684301, delta=1e-6)
+        self.assertFalse(log.simulator_details['timedOut'])
+        self.assertAlmostEqual(log.simulator_details['timeLimit'], 60., delta=1.)
+
+        # budget runs out
+        with self.assertWarnsRegex(BioSimulatorsWarning, 'ran out of its time budget'):
+            results, log = core.exec_sed_task(task, variables, simulator_config=SimulatorConfig(TASK_TIMEOUT=0.))
+        self.assertTrue(numpy.isnan(results['active_objective']))
+        self.assertTrue(numpy.isnan(results['ACONTa_flux']))
+        self.assertTrue(log.simulator_details['timedOut'])
+
+        # budget of the archive runs out
+        with self.assertWarnsRegex(BioSimulatorsWarning, 'ran out of its time budget'):
+            results, log = core.exec_sed_task(task, variables, simulator_config=SimulatorConfig(TASK_TIMEOUT=60.),
+                                              deadline=time.monotonic() - 1.)
+        self.assertTrue(log.simulator_details['timedOut'])
+
+        # results computed before the budget ran out are returned
+        task.simulation.algorithm.kisao_id = 'KISAO_0000526'
+        variables = [
+            sedml_data_model.Variable(
+                id='ACONTa_min_flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_ACONTa']/@minFlux",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+            sedml_data_model.Variable(
+                id='TALA_min_flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_TALA']/@minFlux",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+        with mock.patch('biosimulators_cobrapy.variability.is_expired', side_effect=[False, False, True]):
+            with self.assertWarnsRegex(BioSimulatorsWarning, 'ran out of its time budget'):
+                results, log = core.exec_sed_task(task, variables, simulator_config=SimulatorConfig(TASK_TIMEOUT=60.))
+        self.assertAlmostEqual(results['ACONTa_min_flux'].tolist(), 6.00725, delta=1e-4)
+        self.assertTrue(numpy.isnan(results['TALA_min_flux']))
+        self.assertTrue(log.simulator_details['timedOut'])
+
     def test_exec_sed_task_error_handling(self):
         # unsupported algorithm
         with self.assertRaisesRegex(ValueError, 'invalid KiSAO id'):
@@ -372,9 +655,63 @@ class CliTestCase(unittest.TestCase):
             raise log.exception
 
         json.dumps(log.to_json())
+        task_log = log.sed_documents['sim_1.sedml'].tasks['task_1']
+        self.assertEqual(task_log.simulator_details['modelCache']['misses'], 1)
 
         self._assert_combine_archive_outputs(doc, out_dir)
 
+    def test_exec_sedml_docs_in_combine_archive_with_columnar_reports(self):
+        doc, archive_filename = self._build_combine_archive()
+
+        out_dir = os.path.join(self.dirname, 'out')
+
+        config = get_config()
+        config.REPORT_FORMATS = [report_data_model.ReportFormat.csv]
+        config.COLLECT_COMBINE_ARCHIVE_RESULTS = False
+        config.COLLECT_SED_DOCUMENT_RESULTS = False
+        simulator_config = SimulatorConfig(COLUMNAR_REPORT_FORMATS=[ColumnarReportFormat.arrow, ColumnarReportFormat.parquet])
+
+        results, log = core.exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config,
+                                                               simulator_config=simulator_config)
+        if log.exception:
+            raise log.exception
+        self.assertEqual(results, None)
+
+        report = doc.outputs[0]
+        expected_results = ReportReader().run(report, out_dir, os.path.join('sim_1.sedml', report.id),
+                                              format=report_data_model.ReportFormat.csv)
+        for format in ColumnarReportFormat:
+            data_set_results = read_columnar_report(report, out_dir, os.path.join('sim_1.sedml', report.id), format=format)
+            self.assertEqual(set(data_set_results.keys()), set(expected_results.keys()))
+            for data_set_id, expected_result in expected_results.items():
+                numpy.testing.assert_allclose(data_set_results[data_set_id], expected_result)
+
+    def test_get_simulator_config_columnar_report_formats(self):
+        with mock.patch.dict(os.environ, {'COLUMNAR_REPORT_FORMATS': 'Parquet, arrow'}):
+            simulator_config = get_simulator_config()
+        self.assertEqual(simulator_config.COLUMNAR_REPORT_FORMATS, [ColumnarReportFormat.parquet, ColumnarReportFormat.arrow])
+
+        with mock.patch.dict(os.environ, {'COLUMNAR_REPORT_FORMATS': ''}):
+            self.assertEqual(get_simulator_config().COLUMNAR_REPORT_FORMATS, [])
+
+    def test_exec_sedml_docs_in_combine_archive_with_time_budget(self):
+        doc, archive_filename = self._build_combine_archive()
+
+        out_dir = os.path.join(self.dirname, 'out')
+
+        config = get_config()
+        config.REPORT_FORMATS = [report_data_model.ReportFormat.h5]
+        config.COLLECT_COMBINE_ARCHIVE_RESULTS = True
+
+        with self.assertWarnsRegex(BioSimulatorsWarning, 'ran out of its time budget'):
+            results, log = core.exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config,
+                                                                   simulator_config=SimulatorConfig(ARCHIVE_TIMEOUT=0.))
+        self.assertEqual(log.exception, None)
+
+        task_log = log.sed_documents['sim_1.sedml'].tasks['task_1']
+        self.assertTrue(task_log.simulator_details['timedOut'])
+        self.assertTrue(numpy.isnan(results['sim_1.sedml']['report_1']['data_set_ACONTa_flux']))
+
     def _build_combine_archive(self, model_changes=None, algorithm=None):
         doc = self._build_sed_doc(model_changes=model_changes, algorithm=algorithm)
 
@@ -546,6 +883,38 @@ class CliTestCase(unittest.TestCase):
                                              data_generator=doc.data_generators[5]),
                 ],
             ))
+        elif algorithm.kisao_id in ['KISAO_0000588', 'KISAO_0000590']:
+            doc.data_generators.append(sedml_data_model.DataGenerator(
+                id='data_gen_objective',
+                variables=[
+                    sedml_data_model.Variable(
+                        id='var_objective',
+                        target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                        target_namespaces=self.NAMESPACES,
+                        task=doc.tasks[0],
+                    ),
+                ],
+                math='var_objective',
+            ))
+            doc.data_generators.append(sedml_data_model.DataGenerator(
+                id='data_gen_ACONTa_flux',
+                variables=[
+                    sedml_data_model.Variable(
+                        id='var_ACONTa_flux',
+                        target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='ACONTa']/@flux",
+                        target_namespaces=self.NAMESPACES,
+                        task=doc.tasks[0],
+                    ),
+                ],
+                math='var_ACONTa_flux',
+            ))
+            doc.outputs.append(sedml_data_model.Report(
+                id='report_1',
+                data_sets=[
+                    sedml_data_model.DataSet(id='data_set_objective', label='objective', data_generator=doc.data_generators[0]),
+                    sedml_data_model.DataSet(id='data_set_ACONTa_flux', label='ACONTa_flux', data_generator=doc.data_generators[1]),
+                ],
+            ))
         else:
             doc.data_generators.append(sedml_data_model.DataGenerator(
                 id='data_gen_ACONTa_min_flux',
@@ -618,6 +987,14 @@ class CliTestCase(unittest.TestCase):
         self.assertEqual(sorted(report_results.keys()), sorted([d.id for d in doc.outputs[0].data_sets]))
 
         sim = doc.tasks[0].simulation
+        if sim.algorithm.kisao_id in ['KISAO_0000588', 'KISAO_0000590']:
+            num_samples = int(next(change.new_value for change in sim.algorithm.changes if change.kisao_id == 'KISAO_0000326'))
+            self.assertEqual(report_results['data_set_objective'].shape, (num_samples,))
+            self.assertEqual(report_results['data_set_ACONTa_flux'].shape, (num_samples,))
+            self.assertTrue(numpy.all(report_results['data_set_objective'] >= -1e-6))
+            self.assertTrue(numpy.all(report_results['data_set_objective'] <= 0.8739215069684301 + 1e-6))
+            return
+
         self.assertEqual(report_results[report.data_sets[0].id].size, 1)
 
         if sim.algorithm.kisao_id == 'KISAO_0000437':
@@ -0,0 +1,124 @@
+from biosimulators_cobrapy import gurobi
+from unittest import mock
+import cobra.io
+from cobra.util.solver import interface_to_str
+import copy
+import importlib.util
+import os
+import pickle
+import sys
+import unittest
+
+MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+
+
+class GurobiEnvironmentPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        gurobi._is_available = None
+
+    def tearDown(self):
+        gurobi._is_available = None
+
+    def test_is_gurobi_available(self):
+        with mock.patch('biosimulators_utils.licensing.gurobi.GurobiLicenseManager.is_package_available',
+                        return_value=False) as is_package_available:
+            self.assertFalse(gurobi.is_gurobi_available())
+            self.assertFalse(gurobi.is_gurobi_available())
+        is_package_available.assert_called_once()
+
+    def test_start_gurobi_env_not_available(self):
+        gurobi._is_available = False
+        self.assertEqual(gurobi.start_gurobi_env(), None)
+        gurobi.close_gurobi_env()
+
+    def test_start_close_gurobi_env(self):
+        gurobi._is_available = True
+        gurobipy = mock.Mock()
+
+        with mock.patch.dict(sys.modules, {'gurobipy': gurobipy}):
+            with mock.patch.dict('os.environ', {'GRB_LICENSEID': '1', 'GRB_WLSACCESSID': 'a'}):
+                env = gurobi.start_gurobi_env()
+            self.assertIs(env, gurobipy.Env.return_value)
+            gurobipy.Env.assert_called_once_with(params={'LICENSEID': 1, 'WLSACCESSID': 'a'})
+            env.setParam.assert_called_once_with('OutputFlag', 0)
+
+            # the environment is reused
+            self.assertIs(gurobi.start_gurobi_env(), env)
+            gurobipy.Env.assert_called_once()
+
+            gurobi.close_gurobi_env()
+            env.dispose.assert_called_once_with()
+
+            gurobi.close_gurobi_env()
+            env.dispose.assert_called_once_with()
+
+    def test_set_solver(self):
+        model = cobra.io.read_sbml_model(MODEL_FILENAME)
+        gurobi.set_solver(model, 'glpk')
+        self.assertEqual(interface_to_str(model.problem), 'glpk')
+
+        with mock.patch.object(gurobi, 'set_gurobi_solver') as set_gurobi_solver:
+            gurobi.set_solver(model, 'gurobi')
+        set_gurobi_solver.assert_called_once_with(model)
+
+    def test_set_gurobi_solver_with_unsupported_versions(self):
+        gurobi._is_available = True
+        model = mock.Mock()
+        with mock.patch.object(gurobi, 'start_gurobi_env', return_value=mock.Mock()):
+            with mock.patch.dict(gurobi.SUPPORTED_VERSIONS, {'optlang': ((0, 1), (0, 2))}):
+                self.assertFalse(gurobi._is_env_supported())
+                gurobi.set_gurobi_solver(model)
+        self.assertEqual(model.solver, 'gurobi')
+        self.assertTrue(gurobi._is_env_supported())
+
+    def test_set_gurobi_solver_not_available(self):
+        gurobi._is_available = False
+        model = mock.Mock()
+        gurobi.set_gurobi_solver(model)
+        self.assertEqual(model.solver, 'gurobi')
+
+    @unittest.skipIf(importlib.util.find_spec('gurobipy') is None, 'Gurobi is not installed')
+    def test_set_gurobi_solver(self):
+        from optlang import gurobi_interface
+
+        gurobi._is_available = True
+        env = gurobi.start_gurobi_env()
+        try:
+            env.setParam('Threads', 3)
+
+            model = cobra.io.read_sbml_model(MODEL_FILENAME)
+            model.solver = 'glpk'
+            model.tolerance = 1e-8
+            objective_value = model.slim_optimize()
+
+            # the problem is created in the environment
+            gurobi.set_gurobi_solver(model)
+            self.assertIsInstance(model.solver, gurobi_interface.Model)
+            self.assertEqual(model.solver.problem.Params.Threads, 3)
+            self.assertEqual(model.tolerance, 1e-8)
+            self.assertEqual(model.solver.objective.direction, 'max')
+            self.assertAlmostEqual(model.slim_optimize(), objective_value)
+
+            with model:
+                model.reactions.get_by_id('PGK').knock_out()
+                self.assertAlmostEqual(model.slim_optimize(), 0.)
+            self.assertAlmostEqual(model.slim_optimize(), objective_value)
+
+            # models which are unpickled or copied are created in the default environment
+            for copied_model in [pickle.loads(pickle.dumps(model)), copy.deepcopy(model), model.copy()]:
+                self.assertIsInstance(copied_model.solver, gurobi_interface.Model)
+                self.assertEqual(copied_model.solver.problem.Params.Threads, 0)
+                self.assertAlmostEqual(copied_model.slim_optimize(), objective_value)
+
+            # problems with ranged constraints are cloned by COBRApy
+            model = cobra.io.read_sbml_model(MODEL_FILENAME)
+            model.solver = 'glpk'
+            reaction = model.reactions.get_by_id('PGK')
+            model.add_cons_vars(model.problem.Constraint(reaction.flux_expression, lb=-10., ub=-1., name='ranged'))
+            objective_value = model.slim_optimize()
+            gurobi.set_gurobi_solver(model)
+            self.assertIsInstance(model.solver, gurobi_interface.Model)
+            self.assertEqual(model.solver.problem.Params.Threads, 0)
+            self.assertAlmostEqual(model.slim_optimize(), objective_value)
+        finally:
+            gurobi.close_gurobi_env()
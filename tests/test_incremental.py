@@ -0,0 +1,156 @@
+""" Tests of the incremental re-execution of SED documents
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import core
+from biosimulators_cobrapy.config import SimulatorConfig
+from biosimulators_cobrapy.incremental import IncrementalStore, get_incremental_store, get_task_fingerprint
+from biosimulators_utils.config import get_config
+from biosimulators_utils.report.data_model import VariableResults
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from helpers import MODEL_FILENAME, build_task
+from unittest import mock
+import copy
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class IncrementalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_task_fingerprint(self):
+        config = get_config()
+        task, variables = build_task('task')
+        fingerprint = get_task_fingerprint(task, variables, config)
+        self.assertEqual(get_task_fingerprint(copy.deepcopy(task), variables, config), fingerprint)
+
+        # ids of tasks and variables, and the order of variables, don't change the fingerprint
+        task2 = copy.deepcopy(task)
+        task2.id = 'task2'
+        variables2 = [sedml_data_model.Variable(id='other', target=variables[0].target)]
+        self.assertEqual(get_task_fingerprint(task2, variables2 + variables2, config), fingerprint)
+
+        # changes of the model, the algorithm, its parameters, and the targets of the variables
+        task2 = copy.deepcopy(task)
+        task2.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_EX_glc__D_e']/@fbc:lowerFluxBound",
+            new_value='-1'))
+        self.assertNotEqual(get_task_fingerprint(task2, variables, config), fingerprint)
+
+        task2 = copy.deepcopy(task)
+        task2.simulation.algorithm.kisao_id = 'KISAO_0000528'
+        self.assertNotEqual(get_task_fingerprint(task2, variables, config), fingerprint)
+
+        task2 = copy.deepcopy(task)
+        task2.simulation.algorithm.changes.append(sedml_data_model.AlgorithmParameterChange(
+            kisao_id='KISAO_0000531', new_value='0.9'))
+        self.assertNotEqual(get_task_fingerprint(task2, variables, config), fingerprint)
+
+        variables2 = [sedml_data_model.Variable(
+            id=variables[0].id,
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_TALA']/@flux")]
+        self.assertNotEqual(get_task_fingerprint(task, variables2, config), fingerprint)
+
+        # content of the model
+        model_filename = os.path.join(self.dirname, 'model.xml')
+        shutil.copyfile(MODEL_FILENAME, model_filename)
+        task2 = copy.deepcopy(task)
+        task2.model.source = model_filename
+        self.assertEqual(get_task_fingerprint(task2, variables, config), fingerprint)
+        with open(model_filename, 'a') as file:
+            file.write('\n')
+        self.assertNotEqual(get_task_fingerprint(task2, variables, config), fingerprint)
+
+    def test_incremental_store(self):
+        store = get_incremental_store(self.dirname, 'sim.sedml')
+        self.assertIsInstance(store, IncrementalStore)
+        self.assertEqual(store.dirname, os.path.join(self.dirname, '.incremental', 'sim.sedml'))
+
+        variables = [sedml_data_model.Variable(id='x', target='x')]
+        store.set('a', variables, VariableResults({'x': numpy.array(1.)}))
+        store.set('b', variables, VariableResults({'x': numpy.array(2.)}))
+
+        store = get_incremental_store(self.dirname, 'sim.sedml')
+        self.assertEqual(store.get('c', variables), None)
+        numpy.testing.assert_equal(store.get('b', variables)['x'], numpy.array(2.))
+        self.assertEqual(store.used_keys, set(['b']))
+
+        self.assertEqual(store.prune(), 1)
+        self.assertEqual(os.listdir(store.dirname), ['b.npz'])
+
+    def test_exec_sed_doc_incrementally(self):
+        task_1, variables_1 = build_task('task_1')
+        task_2, variables_2 = build_task('task_2', kisao_id='KISAO_0000528')
+        doc = sedml_data_model.SedDocument(
+            models=[task_1.model],
+            simulations=[task_1.simulation, task_2.simulation],
+            tasks=[task_1, task_2],
+        )
+        task_2.model = task_1.model
+        data_generators = []
+        data_sets = []
+        for variable in variables_1 + variables_2:
+            data_generator = sedml_data_model.DataGenerator(
+                id='data_generator_' + variable.id,
+                variables=[variable],
+                math=variable.id,
+            )
+            data_generators.append(data_generator)
+            data_sets.append(sedml_data_model.DataSet(id='data_set_' + variable.id, label=variable.id,
+                                                      data_generator=data_generator))
+        doc.data_generators = data_generators
+        doc.outputs = [sedml_data_model.Report(id='report', data_sets=data_sets)]
+
+        config = get_config()
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+        simulator_config = SimulatorConfig(INCREMENTAL=True)
+        out_dir = os.path.join(self.dirname, 'out')
+
+        results, log = core.exec_sed_doc(doc, self.dirname, out_dir, rel_out_path='sim.sedml', config=config,
+                                         simulator_config=simulator_config)
+        for task_log in log.tasks.values():
+            self.assertFalse(task_log.simulator_details['incremental']['hit'])
+        store_dirname = os.path.join(out_dir, '.incremental', 'sim.sedml')
+        self.assertEqual(len(os.listdir(store_dirname)), 2)
+
+        # tasks which didn't change are not executed again
+        with mock.patch.object(core, 'preprocess_sed_task', side_effect=AssertionError('task was executed')):
+            results2, log = core.exec_sed_doc(doc, self.dirname, out_dir, rel_out_path='sim.sedml', config=config,
+                                              simulator_config=simulator_config)
+        for task_id, task_log in log.tasks.items():
+            self.assertTrue(task_log.simulator_details['incremental']['hit'])
+            self.assertEqual(task_log.algorithm, doc.tasks[int(task_id[-1]) - 1].simulation.algorithm.kisao_id)
+            self.assertIn('method', task_log.simulator_details)
+        for data_set_id, result in results['report'].items():
+            numpy.testing.assert_allclose(results2['report'][data_set_id], result)
+
+        # only the task which changed is executed again, and the results of its previous version are removed
+        doc.tasks[1].simulation.algorithm.kisao_id = 'KISAO_0000527'
+        results3, log = core.exec_sed_doc(doc, self.dirname, out_dir, rel_out_path='sim.sedml', config=config,
+                                          simulator_config=simulator_config)
+        self.assertTrue(log.tasks['task_1'].simulator_details['incremental']['hit'])
+        self.assertFalse(log.tasks['task_2'].simulator_details['incremental']['hit'])
+        self.assertEqual(len(os.listdir(store_dirname)), 2)
+        numpy.testing.assert_allclose(results3['report']['data_set_task_1_PGK_flux'],
+                                      results['report']['data_set_task_1_PGK_flux'])
+
+        # identical tasks share their results
+        doc.tasks[1].simulation.algorithm.kisao_id = 'KISAO_0000437'
+        results4, log = core.exec_sed_doc(doc, self.dirname, out_dir, rel_out_path='sim.sedml', config=config,
+                                          simulator_config=simulator_config)
+        self.assertTrue(log.tasks['task_2'].simulator_details['incremental']['hit'])
+        self.assertEqual(len(os.listdir(store_dirname)), 1)
+        numpy.testing.assert_allclose(results4['report']['data_set_task_2_PGK_flux'],
+                                      results['report']['data_set_task_1_PGK_flux'])
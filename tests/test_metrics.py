@@ -0,0 +1,220 @@
+""" Tests of the metrics of the execution of tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import core
+from biosimulators_cobrapy import metrics
+from biosimulators_cobrapy.config import SimulatorConfig
+from biosimulators_cobrapy.metrics import MetricsRegistry, Metrics, get_metrics
+from biosimulators_cobrapy.model_cache import ModelCache
+from biosimulators_cobrapy.reports import ColumnarReportFormat
+from biosimulators_utils.config import get_config
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from helpers import NAMESPACES, build_task
+from unittest import mock
+import os
+import shutil
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+
+
+class MetricsRegistryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_counter(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('solves', 'Number of "solves".\nOf tasks.', ('status',))
+        self.assertIs(registry.counter('solves', 'Number of solves.', ('status',)), counter)
+
+        counter.inc(status='succeeded')
+        counter.inc(2, status='succeeded')
+        counter.inc(status='a "quoted"\\value')
+        self.assertEqual(counter.get(status='succeeded'), 3.)
+        self.assertEqual(counter.get(status='failed'), 0.)
+
+        self.assertEqual(registry.expose(), '\n'.join([
+            '# HELP solves_total Number of "solves".\\nOf tasks.',
+            '# TYPE solves_total counter',
+            'solves_total{status="a \\"quoted\\"\\\\value"} 1.0',
+            'solves_total{status="succeeded"} 3.0',
+        ]) + '\n')
+        self.assertEqual(registry.expose(openmetrics=True), '\n'.join([
+            '# HELP solves Number of "solves".\\nOf tasks.',
+            '# TYPE solves counter',
+            'solves_total{status="a \\"quoted\\"\\\\value"} 1.0',
+            'solves_total{status="succeeded"} 3.0',
+            '# EOF',
+        ]) + '\n')
+
+        with self.assertRaisesRegex(ValueError, 'non-negative'):
+            counter.inc(-1, status='succeeded')
+        with self.assertRaisesRegex(ValueError, 'has labels'):
+            counter.inc(algorithm='FBA')
+        with self.assertRaisesRegex(ValueError, 'already registered'):
+            registry.histogram('solves', 'Number of solves.', ('status',))
+        with self.assertRaisesRegex(ValueError, 'already registered'):
+            registry.counter('solves', 'Number of solves.')
+
+    def test_histogram(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram('duration_seconds', 'Duration.', buckets=(0.1, 1.))
+        self.assertEqual(histogram.buckets, (0.1, 1., float('inf')))
+        self.assertEqual(registry.expose(), '# HELP duration_seconds Duration.\n# TYPE duration_seconds histogram\n')
+
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(5.)
+        self.assertEqual(histogram.get_count(), 4)
+        self.assertEqual(registry.expose(), '\n'.join([
+            '# HELP duration_seconds Duration.',
+            '# TYPE duration_seconds histogram',
+            'duration_seconds_bucket{le="0.1"} 2.0',
+            'duration_seconds_bucket{le="1.0"} 3.0',
+            'duration_seconds_bucket{le="+Inf"} 4.0',
+            'duration_seconds_count 4.0',
+            'duration_seconds_sum {}'.format(repr(0.05 + 0.1 + 0.5 + 5.)),
+        ]) + '\n')
+
+        with histogram.time():
+            pass
+        self.assertEqual(histogram.get_count(), 5)
+
+        labeled_histogram = registry.histogram('solve_duration_seconds', 'Duration.', ('algorithm',), buckets=(1.,))
+        labeled_histogram.observe(2., algorithm='KISAO_0000437')
+        self.assertIn('solve_duration_seconds_bucket{algorithm="KISAO_0000437",le="1.0"} 0.0\n', registry.expose())
+        self.assertIn('solve_duration_seconds_bucket{algorithm="KISAO_0000437",le="+Inf"} 1.0\n', registry.expose())
+        self.assertIn('solve_duration_seconds_sum{algorithm="KISAO_0000437"} 2.0\n', registry.expose())
+
+    def test_write(self):
+        registry = MetricsRegistry()
+        registry.counter('solves', 'Number of solves.').inc()
+
+        filename = os.path.join(self.dirname, 'metrics', 'metrics.prom')
+        registry.write(filename)
+        with open(filename, 'r') as file:
+            self.assertEqual(file.read(), registry.expose())
+
+        registry.write(filename, openmetrics=True)
+        with open(filename, 'r') as file:
+            self.assertEqual(file.read(), registry.expose(openmetrics=True))
+        self.assertEqual(os.listdir(os.path.dirname(filename)), ['metrics.prom'])
+
+    def test_serve(self):
+        registry = MetricsRegistry()
+        registry.counter('solves', 'Number of solves.').inc()
+        server = registry.serve(0)
+        try:
+            url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+            with urllib.request.urlopen(url + '/metrics') as response:
+                self.assertEqual(response.headers['Content-Type'], metrics.PROMETHEUS_CONTENT_TYPE)
+                self.assertEqual(response.read().decode(), registry.expose())
+
+            request = urllib.request.Request(url + '/metrics', headers={'Accept': 'application/openmetrics-text'})
+            with urllib.request.urlopen(request) as response:
+                self.assertEqual(response.headers['Content-Type'], metrics.OPENMETRICS_CONTENT_TYPE)
+                self.assertEqual(response.read().decode(), registry.expose(openmetrics=True))
+
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                urllib.request.urlopen(url + '/other')
+            self.assertEqual(context.exception.code, 404)
+            context.exception.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_metrics_serve_port_in_use(self):
+        package_metrics = Metrics()
+        server = package_metrics.serve(0)
+        try:
+            port = server.server_address[1]
+            self.assertIsNone(Metrics().serve(port))
+            self.assertIs(package_metrics.serve(0), server)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class ExecutionMetricsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.metrics = Metrics()
+        patcher = mock.patch.object(metrics, '_metrics', self.metrics)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_metrics(self):
+        self.assertIsNone(get_metrics(SimulatorConfig()))
+        self.assertIs(get_metrics(SimulatorConfig(METRICS=True)), self.metrics)
+        self.assertIs(get_metrics(SimulatorConfig(METRICS_PATH='metrics.prom')), self.metrics)
+
+        with mock.patch.object(self.metrics, 'serve') as serve:
+            self.assertIs(get_metrics(SimulatorConfig(METRICS_PORT=9464)), self.metrics)
+        serve.assert_called_once_with(9464)
+
+    def test_exec_sed_task(self):
+        simulator_config = SimulatorConfig(METRICS=True)
+        model_cache = ModelCache()
+        task, variables = build_task()
+        core.exec_sed_task(task, variables, simulator_config=simulator_config, model_cache=model_cache)
+        core.exec_sed_task(task, variables, simulator_config=simulator_config, model_cache=model_cache)
+
+        self.assertEqual(self.metrics.preprocess_duration.get_count(), 2)
+        self.assertEqual(self.metrics.model_load_duration.get_count(), 1)
+        self.assertEqual(self.metrics.model_cache_lookups.get(result='hit'), 1.)
+        self.assertEqual(self.metrics.model_cache_lookups.get(result='miss'), 1.)
+        self.assertEqual(self.metrics.solve_duration.get_count(algorithm='KISAO_0000437'), 2)
+        self.assertEqual(self.metrics.solves.get(algorithm='KISAO_0000437', status='succeeded'), 2.)
+
+        # failed solves are counted
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_ATPM']/@fbc:lowerFluxBound",
+            target_namespaces=NAMESPACES,
+            new_value='1000'))
+        with self.assertRaises(Exception):
+            core.exec_sed_task(task, variables, simulator_config=simulator_config)
+        self.assertEqual(self.metrics.solves.get(algorithm='KISAO_0000437', status='failed'), 1.)
+
+        # metrics are not recorded when they are disabled
+        core.exec_sed_task(*build_task(), simulator_config=SimulatorConfig())
+        self.assertEqual(self.metrics.solve_duration.get_count(algorithm='KISAO_0000437'), 3)
+
+    def test_exec_sed_doc(self):
+        task, variables = build_task()
+        data_generator = sedml_data_model.DataGenerator(id='data_generator', variables=variables, math=variables[0].id)
+        doc = sedml_data_model.SedDocument(
+            models=[task.model],
+            simulations=[task.simulation],
+            tasks=[task],
+            data_generators=[data_generator],
+            outputs=[sedml_data_model.Report(id='report', data_sets=[
+                sedml_data_model.DataSet(id='data_set', label='flux', data_generator=data_generator)])],
+        )
+        metrics_filename = os.path.join(self.dirname, 'metrics.prom')
+        simulator_config = SimulatorConfig(METRICS_PATH=metrics_filename,
+                                           COLUMNAR_REPORT_FORMATS=[ColumnarReportFormat.arrow])
+        config = get_config()
+        config.REPORT_FORMATS = []
+
+        core.exec_sed_doc(doc, self.dirname, os.path.join(self.dirname, 'out'), rel_out_path='sim.sedml', config=config,
+                          simulator_config=simulator_config)
+
+        self.assertEqual(self.metrics.report_write_duration.get_count(format='arrow'), 1)
+        with open(metrics_filename, 'r') as file:
+            text = file.read()
+        self.assertIn('biosimulators_cobrapy_solves_total{algorithm="KISAO_0000437",status="succeeded"} 1.0\n', text)
+        self.assertIn('biosimulators_cobrapy_report_write_duration_seconds_count{format="arrow"} 1.0\n', text)
@@ -0,0 +1,116 @@
+""" Tests of the cache of the models of the tasks of a SED document
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.model_cache import (ModelCache, get_model_schedule, prepare_model, estimate_model_size,
+                                               free_memory, get_resident_size)
+from biosimulators_utils.sedml import data_model as sedml_data_model
+import os
+import unittest
+
+
+class ModelCacheTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+
+    def test_get_set(self):
+        cache = ModelCache(max_models=2)
+        self.assertEqual(cache.get('a'), None)
+
+        cache.set('a', {'model': 1})
+        cache.set('b', {'model': 2})
+        self.assertEqual(cache.get('a'), {'model': 1})
+
+        # the least recently used model is evicted
+        cache.set('c', {'model': 3})
+        self.assertEqual(list(cache.models.keys()), ['a', 'c'])
+        self.assertEqual(cache.get('b'), None)
+        stats = cache.get_stats()
+        self.assertEqual({key: stats[key] for key in ['hits', 'misses', 'hitRate', 'models', 'evictions']},
+                         {'hits': 1, 'misses': 2, 'hitRate': 1 / 3, 'models': 2, 'evictions': 1})
+
+    def test_disabled(self):
+        cache = ModelCache(max_models=0)
+        cache.set('a', {'model': 1})
+        self.assertEqual(cache.get('a'), None)
+        stats = cache.get_stats()
+        self.assertEqual({key: stats[key] for key in ['hits', 'misses', 'hitRate', 'models', 'size']},
+                         {'hits': 0, 'misses': 1, 'hitRate': 0., 'models': 0, 'size': 0})
+
+    def test_max_size(self):
+        cache = ModelCache(max_size=100)
+        cache.set('a', {'model': 1}, size=40)
+        cache.set('b', {'model': 2}, size=40)
+        self.assertEqual(cache.size, 80)
+
+        # the least recently used models are evicted to respect the size limit
+        cache.get('a')
+        cache.set('c', {'model': 3}, size=50)
+        self.assertEqual(list(cache.models.keys()), ['a', 'c'])
+        self.assertEqual(cache.size, 90)
+        self.assertEqual(cache.evictions, 1)
+
+        # models which alone exceed the limit are not saved
+        cache.set('d', {'model': 4}, size=101)
+        self.assertEqual(list(cache.models.keys()), ['a', 'c'])
+
+        cache.clear()
+        self.assertEqual(cache.models, {})
+        self.assertEqual(cache.size, 0)
+
+    def test_release_unused_models(self):
+        model_1 = sedml_data_model.Model(id='model_1')
+        model_2 = sedml_data_model.Model(id='model_2')
+        task_1 = sedml_data_model.Task(id='task_1', model=model_1)
+        task_2 = sedml_data_model.Task(id='task_2', model=model_2)
+        task_3 = sedml_data_model.Task(id='task_3', model=model_1)
+        task_4 = sedml_data_model.Task(id='task_4', model=model_2)
+        repeated_task = sedml_data_model.RepeatedTask(id='repeated_task', sub_tasks=[
+            sedml_data_model.SubTask(task=task_4)])
+        doc = sedml_data_model.SedDocument(models=[model_1, model_2],
+                                           tasks=[task_1, task_2, task_3, repeated_task, task_4])
+
+        schedule = get_model_schedule(doc)
+        self.assertEqual(schedule.task_positions, {
+            'task_1': 0, 'task_2': 1, 'task_3': 2, 'task_4': 3, 'repeated_task': 3})
+        self.assertEqual(schedule.model_last_positions, {'model_1': 2, 'model_2': 4})
+
+        cache = ModelCache(schedule=schedule)
+        cache.set('a', {'model': 1}, model_id='model_1')
+        self.assertEqual(cache.release_unused_models(task_2), 0)
+        cache.set('b', {'model': 2}, model_id='model_2')
+        self.assertEqual(cache.release_unused_models(task_3), 0)
+        cache.get('a', model_id='model_1')
+
+        # model 1 isn't referenced by the remaining tasks
+        self.assertEqual(cache.release_unused_models(task_4), 1)
+        self.assertEqual(list(cache.models.keys()), ['b'])
+        self.assertEqual(cache.releases, 1)
+
+        # the position of the execution never moves backward
+        self.assertEqual(cache.release_unused_models(task_1), 0)
+        self.assertEqual(list(cache.models.keys()), ['b'])
+
+        # models which are shared by several SED models are released when none of them is referenced
+        cache = ModelCache(schedule=schedule)
+        cache.set('a', {'model': 1}, model_id='model_1')
+        cache.get('a', model_id='model_2')
+        self.assertEqual(cache.release_unused_models(task_4), 0)
+
+    def test_estimate_model_size(self):
+        self.assertEqual(estimate_model_size(self.MODEL_FILENAME), 16 * os.path.getsize(self.MODEL_FILENAME))
+
+    def test_free_memory(self):
+        free_memory()
+        self.assertGreater(get_resident_size(), 0)
+
+    def test_prepare_model(self):
+        prepared_model = prepare_model(self.MODEL_FILENAME)
+        self.assertEqual(prepared_model['sbml_fbc_uri'], 'http://www.sbml.org/sbml/level3/version1/fbc/version2')
+        self.assertEqual(len(prepared_model['model'].reactions), 95)
+        self.assertEqual(prepared_model['active_objective_sbml_fbc_id'], 'obj')
+        self.assertEqual(list(prepared_model['objectives'].keys()), ['obj', 'inactive_obj'])
+        self.assertIs(prepared_model['model_change_index'].reactions['R_PGK'], prepared_model['model'].reactions.PGK)
@@ -0,0 +1,78 @@
+""" Tests of the objectives of models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy.data_model import KISAO_ALGORITHMS_PARAMETERS_MAP
+from biosimulators_cobrapy.objectives import (Objective, get_objectives, get_objective_required_results,
+                                              optimize_objectives, evaluate_objectives)
+from biosimulators_cobrapy.solution import SlimSolution
+from lxml import etree
+import cobra.io
+import numpy
+import numpy.testing
+import os
+import unittest
+
+
+class ObjectivesTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+    FBC_URI = 'http://www.sbml.org/sbml/level3/version1/fbc/version2'
+
+    def setUp(self):
+        self.model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+
+    def test_get_objectives(self):
+        active_objective_id, objectives = get_objectives(etree.parse(self.MODEL_FILENAME), self.FBC_URI)
+        self.assertEqual(active_objective_id, 'obj')
+        self.assertEqual(list(objectives.keys()), ['obj', 'inactive_obj'])
+        self.assertEqual(objectives['obj'].direction, 'max')
+        self.assertEqual(objectives['obj'].coefficients, {'Biomass_Ecoli_core': 1.})
+        self.assertEqual(objectives['inactive_obj'].coefficients, {'ACALD': 1.})
+
+    def test_get_objective_required_results(self):
+        objectives = {'obj_2': Objective('obj_2', 'max', {'ACALD': 1., 'PGK': 2.})}
+        required_results = {'fluxes': set(['TALA']), 'objective_values': set(['obj_2'])}
+
+        self.assertIs(get_objective_required_results(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000437'],
+                                                     required_results, objectives),
+                      required_results)
+
+        sampling_required_results = get_objective_required_results(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000588'],
+                                                                   required_results, objectives)
+        self.assertEqual(sampling_required_results['fluxes'], set(['ACALD', 'PGK', 'TALA']))
+        self.assertEqual(required_results['fluxes'], set(['TALA']))
+
+    def test_optimize_objectives(self):
+        objectives = {
+            'min_pgk': Objective('min_pgk', 'min', {'PGK': 1.}),
+            'max_tala': Objective('max_tala', 'max', {'TALA': 2.}),
+        }
+        solver_objective = self.model.solver.objective
+        biomass = self.model.reactions.get_by_id('Biomass_Ecoli_core')
+        self.model.slim_optimize()
+
+        values = optimize_objectives(self.model, objectives, ['min_pgk', 'max_tala'])
+
+        # the objective of the problem is restored, rather than rebuilt
+        self.assertIs(self.model.solver.objective, solver_objective)
+        self.assertEqual(self.model.solver.objective.direction, 'max')
+        self.assertEqual(cobra.util.solver.linear_reaction_coefficients(self.model), {biomass: 1.})
+        numpy.testing.assert_allclose(self.model.slim_optimize(), 0.8739215069684301)
+
+        for objective_id, objective in objectives.items():
+            with self.model:
+                self.model.objective = {self.model.reactions.get_by_id(reaction_id): coefficient
+                                        for reaction_id, coefficient in objective.coefficients.items()}
+                self.model.objective_direction = objective.direction
+                numpy.testing.assert_allclose(values[objective_id], self.model.slim_optimize())
+
+    def test_evaluate_objectives(self):
+        objectives = {'obj_2': Objective('obj_2', 'max', {'ACALD': 1., 'PGK': 2.})}
+        solution = SlimSolution('optimal', reaction_index={'ACALD': 0, 'PGK': 1},
+                                fluxes=numpy.array([[1., 2., 3.], [4., 5., 6.]]))
+        values = evaluate_objectives(solution, objectives, ['obj_2'])
+        numpy.testing.assert_allclose(values['obj_2'], [9., 12., 15.])
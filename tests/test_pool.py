@@ -0,0 +1,176 @@
+from biosimulators_cobrapy import pool
+from unittest import mock
+import cobra.io
+import os
+import signal
+import unittest
+
+
+def _get_bounds(problem, variable_name, constraint_name):
+    return (
+        problem.variables[variable_name].lb,
+        problem.variables[variable_name].ub,
+        problem.constraints[constraint_name].lb,
+        problem.constraints[constraint_name].ub,
+    )
+
+
+def _get_data(data):
+    return data
+
+
+def _get_worker_keys(data):
+    return list(pool._worker_problems.keys())
+
+
+class PoolTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+
+    def setUp(self):
+        self.model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+
+    def tearDown(self):
+        pool.close_worker_pools()
+
+    def test_get_problem_key(self):
+        key = pool.get_problem_key('model', self.model.solver)
+        self.assertTrue(key.startswith('model:'))
+        self.assertEqual(pool.get_problem_key('model', self.model.solver), key)
+
+        # bounds aren't part of the key
+        self.model.reactions.get_by_id('EX_glc__D_e').lower_bound = -5.
+        self.assertEqual(pool.get_problem_key('model', self.model.solver), key)
+
+        self.assertNotEqual(pool.get_problem_key('other_model', self.model.solver), key)
+
+        with self.model:
+            self.model.objective = 'PGK'
+            self.assertNotEqual(pool.get_problem_key('model', self.model.solver), key)
+
+        with self.model:
+            self.model.add_cons_vars([self.model.problem.Variable('extra')])
+            self.assertNotEqual(pool.get_problem_key('model', self.model.solver), key)
+
+        # coefficients of constraints are part of the key
+        with self.model:
+            self.model.reactions.get_by_id('PGK').add_metabolites({'atp_c': 1.})
+            self.assertNotEqual(pool.get_problem_key('model', self.model.solver), key)
+
+    def test_get_set_problem_bounds(self):
+        problem = self.model.solver
+        bounds = pool.get_problem_bounds(problem)
+        self.assertEqual(bounds[('variable', 'EX_glc__D_e')], (0., 1000.))
+        self.assertEqual(bounds[('constraint', 'glc__D_e')], (0., 0.))
+
+        pool.set_problem_bounds(problem, {
+            ('variable', 'EX_glc__D_e'): (1., 2.),
+            ('constraint', 'glc__D_e'): (3., 4.),
+        })
+        self.assertEqual(_get_bounds(problem, 'EX_glc__D_e', 'glc__D_e'), (1., 2., 3., 4.))
+
+        pool.set_problem_bounds(problem, {
+            ('variable', 'EX_glc__D_e'): (-2., -1.),
+            ('constraint', 'glc__D_e'): (-4., -3.),
+        })
+        self.assertEqual(_get_bounds(problem, 'EX_glc__D_e', 'glc__D_e'), (-2., -1., -4., -3.))
+
+    def test_worker_pool(self):
+        worker_pool = pool.get_worker_pool(2)
+        self.assertIs(pool.get_worker_pool(2), worker_pool)
+        self.assertEqual(worker_pool.processes, 2)
+
+        key = pool.get_problem_key('model', self.model.solver)
+        results = list(worker_pool.imap_unordered(_get_bounds, key, self.model.solver,
+                                                  [('EX_glc__D_e', 'glc__D_e')] * 4))
+        self.assertEqual(results, [(0., 1000., 0., 0.)] * 4)
+
+        # changed bounds are applied for the call, without pushing the problem again
+        self.model.reactions.get_by_id('EX_glc__D_e').bounds = (-5., 5.)
+        with mock.patch.object(pool.pickle, 'dump') as dump:
+            results = list(worker_pool.imap_unordered(_get_bounds, key, self.model.solver,
+                                                      [('EX_glc__D_e', 'glc__D_e')] * 4))
+        dump.assert_not_called()
+        self.assertEqual(results, [(0., 5., 0., 0.)] * 4)
+
+        # the pushed bounds are restored after each call
+        self.model.reactions.get_by_id('EX_glc__D_e').bounds = (-10., 1000.)
+        results = list(worker_pool.imap_unordered(_get_bounds, key, self.model.solver,
+                                                  [('EX_glc__D_e', 'glc__D_e')] * 4))
+        self.assertEqual(results, [(0., 1000., 0., 0.)] * 4)
+
+    def test_worker_pool_evicts_pushed_problems(self):
+        worker_pool = pool.get_worker_pool(1)
+        with mock.patch.object(pool, 'PUSHED_PROBLEM_CACHE_SIZE', 2):
+            self.assertTrue(worker_pool.push_problem('a', self.model.solver))
+            self.assertTrue(worker_pool.push_problem('b', self.model.solver))
+            self.assertFalse(worker_pool.push_problem('a', self.model.solver))
+            self.assertTrue(worker_pool.push_problem('c', self.model.solver))
+        self.assertEqual(list(worker_pool._pushed_problems.keys()), ['a', 'c'])
+        self.assertEqual(len(os.listdir(worker_pool._dirname)), 2)
+
+    def test_worker_pool_doesnt_evict_problems_which_calls_use(self):
+        worker_pool = pool.get_worker_pool(1)
+        with mock.patch.object(pool, 'PUSHED_PROBLEM_CACHE_SIZE', 2):
+            results = worker_pool.imap_unordered(_get_bounds, 'a', self.model.solver, [('EX_glc__D_e', 'glc__D_e')] * 4)
+            worker_pool.push_problem('b', self.model.solver)
+            worker_pool.push_problem('c', self.model.solver)
+            self.assertEqual(list(worker_pool._pushed_problems.keys()), ['a', 'c'])
+
+            worker_pool.push_problem('d', self.model.solver)
+            worker_pool.push_problem('e', self.model.solver)
+            self.assertEqual(list(worker_pool._pushed_problems.keys()), ['a', 'e'])
+            self.assertEqual(list(results), [(0., 1000., 0., 0.)] * 4)
+
+            # the problem can be evicted once its results have been read
+            worker_pool.push_problem('f', self.model.solver)
+            self.assertEqual(list(worker_pool._pushed_problems.keys()), ['e', 'f'])
+        self.assertEqual(len(os.listdir(worker_pool._dirname)), 2)
+
+    def test_worker_pool_releases_pushed_objects(self):
+        worker_pool = pool.get_worker_pool(1)
+        self.assertEqual(list(worker_pool.imap_unordered_with_data(_get_worker_keys, 'a', 1, [()])), [['a']])
+
+        self.assertTrue(worker_pool.release('a'))
+        self.assertFalse(worker_pool.release('a'))
+        self.assertEqual(list(worker_pool._pushed_problems.keys()), [])
+        self.assertEqual(os.listdir(worker_pool._dirname), [])
+
+        # the worker drops the released object the next time it is called
+        self.assertEqual(list(worker_pool.imap_unordered_with_data(_get_worker_keys, 'b', 2, [()])), [['b']])
+
+        # objects which calls use are removed once the calls finish
+        results = worker_pool.imap_unordered_with_data(_get_data, 'd', 5, [()] * 2)
+        self.assertTrue(worker_pool.release('d'))
+        self.assertIn('d', worker_pool._pushed_problems)
+        self.assertEqual(list(results), [5, 5])
+        self.assertNotIn('d', worker_pool._pushed_problems)
+
+        results = worker_pool.imap_unordered_with_data(_get_data, 'd', 6, [()] * 2)
+        self.assertEqual(next(results), 6)
+        results.close()
+        self.assertTrue(worker_pool.release('d'))
+        self.assertNotIn('d', worker_pool._pushed_problems)
+
+        # the worker doesn't reuse its copy of an object which was released and pushed again
+        self.assertEqual(list(worker_pool.imap_unordered_with_data(_get_data, 'c', 3, [()])), [3])
+        worker_pool.release('c')
+        self.assertEqual(list(worker_pool.imap_unordered_with_data(_get_data, 'c', 4, [()])), [4])
+
+    def test_close_worker_pools(self):
+        worker_pool = pool.get_worker_pool(1)
+        worker_pool.push_problem('a', self.model.solver)
+        dirname = worker_pool._dirname
+
+        pool.close_worker_pools()
+        self.assertFalse(os.path.isdir(dirname))
+        self.assertIsNot(pool.get_worker_pool(1), worker_pool)
+
+    def test_worker_pool_restores_default_sigterm_handler(self):
+        # otherwise, the pool can't stop workers which inherited a handler which doesn't exit
+        pool.close_worker_pools()
+        prev_handler = signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        try:
+            worker_pool = pool.get_worker_pool(1)
+        finally:
+            signal.signal(signal.SIGTERM, prev_handler)
+        self.assertEqual(worker_pool._pool.apply(signal.getsignal, (signal.SIGTERM,)), signal.SIG_DFL)
@@ -0,0 +1,97 @@
+""" Tests of columnar reports
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import reports
+from biosimulators_cobrapy.reports import ColumnarReportFormat, ColumnarReportWriter
+from biosimulators_utils.report.data_model import DataSetResults
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from unittest import mock
+import numpy
+import numpy.testing
+import os
+import pyarrow.parquet
+import shutil
+import tempfile
+import unittest
+
+
+class ReportsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.report = sedml_data_model.Report(
+            id='report_1',
+            name='Report 1',
+            data_sets=[
+                sedml_data_model.DataSet(id='data_set_1', label='x', name='X'),
+                sedml_data_model.DataSet(id='data_set_2', label='y'),
+                sedml_data_model.DataSet(id='data_set_3', label='z'),
+            ],
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_columnar_report_filename(self):
+        self.assertEqual(reports.get_columnar_report_filename('out', 'sim.sedml/report_1', 'arrow'),
+                         os.path.join('out', 'sim.sedml', 'report_1.arrow'))
+        self.assertEqual(reports.get_columnar_report_filename('out', './report_1', ColumnarReportFormat.parquet),
+                         os.path.join('out', 'report_1.parquet'))
+
+    def test_write_read_columnar_report(self):
+        data_set_results = DataSetResults({
+            'data_set_1': numpy.array([1., 2., 3.]),
+            'data_set_2': numpy.array(4.),
+            'data_set_3': numpy.arange(6.).reshape((2, 3)),
+        })
+
+        for format in ColumnarReportFormat:
+            filename = reports.write_columnar_report(self.report, data_set_results, self.dirname, 'sim.sedml/report_1',
+                                                     format=format)
+            self.assertEqual(filename, os.path.join(self.dirname, 'sim.sedml', 'report_1.' + format.value))
+
+            results = reports.read_columnar_report(self.report, self.dirname, 'sim.sedml/report_1', format=format)
+            self.assertEqual(set(results.keys()), set(data_set_results.keys()))
+            numpy.testing.assert_allclose(results['data_set_1'], [1., 2., 3., numpy.nan, numpy.nan, numpy.nan])
+            numpy.testing.assert_allclose(results['data_set_2'], [4.] + [numpy.nan] * 5)
+            numpy.testing.assert_allclose(results['data_set_3'], data_set_results['data_set_3'])
+
+        # only the data sets of the report are read
+        report = sedml_data_model.Report(data_sets=[self.report.data_sets[1]])
+        results = reports.read_columnar_report(report, self.dirname, 'sim.sedml/report_1')
+        self.assertEqual(list(results.keys()), ['data_set_2'])
+
+        # metadata
+        schema = pyarrow.parquet.read_schema(os.path.join(self.dirname, 'sim.sedml', 'report_1.parquet'))
+        self.assertEqual(schema.metadata[b'sedmlId'], b'report_1')
+        self.assertEqual(schema.metadata[b'sedmlName'], b'Report 1')
+        self.assertEqual(schema.field('data_set_1').metadata, {b'sedmlLabel': b'x', b'sedmlName': b'X'})
+        self.assertEqual(schema.field('data_set_3').metadata[b'shape'], b'2,3')
+
+    def test_write_points_in_batches(self):
+        for format in ColumnarReportFormat:
+            filename = reports.get_columnar_report_filename(self.dirname, 'report_1', format)
+            with ColumnarReportWriter(self.report, filename, format=format, batch_size=4) as writer:
+                for i_point in range(5):
+                    writer.write({'data_set_1': float(i_point), 'data_set_2': numpy.array([i_point, -i_point])})
+                self.assertEqual(writer.num_points, 10)
+                self.assertEqual(writer._num_buffered_points, 2)
+
+            results = reports.read_columnar_report(self.report, self.dirname, 'report_1', format=format)
+            numpy.testing.assert_allclose(results['data_set_1'], [0., numpy.nan, 1., numpy.nan, 2., numpy.nan,
+                                                                  3., numpy.nan, 4., numpy.nan])
+            numpy.testing.assert_allclose(results['data_set_2'], [0., 0., 1., -1., 2., -2., 3., -3., 4., -4.])
+            self.assertTrue(numpy.all(numpy.isnan(results['data_set_3'])))
+
+        self.assertEqual(pyarrow.parquet.ParquetFile(os.path.join(self.dirname, 'report_1.parquet')).num_row_groups, 3)
+
+    def test_pyarrow_not_installed(self):
+        with mock.patch.object(reports, 'pyarrow', None):
+            with self.assertRaisesRegex(ModuleNotFoundError, 'pip install biosimulators_cobrapy\\[arrow\\]'):
+                reports.write_columnar_report(self.report, DataSetResults(), self.dirname, 'report_1')
+            with self.assertRaisesRegex(ModuleNotFoundError, 'must be installed'):
+                reports.read_columnar_report(self.report, self.dirname, 'report_1', format='arrow')
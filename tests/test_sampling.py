@@ -0,0 +1,180 @@
+""" Tests of flux sampling
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import core
+from biosimulators_cobrapy import pool
+from biosimulators_cobrapy import sampling
+from biosimulators_cobrapy.timeouts import TimeLimitExceededError
+from biosimulators_utils.report.data_model import ReportFormat
+from biosimulators_utils.report.io import ReportReader
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from unittest import mock
+import cobra
+import cobra.sampling
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class SamplingTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+    NAMESPACES = {
+        'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+        'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+    }
+    REACTION_IDS = ['ACONTa', 'Biomass_Ecoli_core', 'PGK', 'SUCDi']
+
+    def setUp(self):
+        self.model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+        pool.close_worker_pools()
+
+    def _assert_feasible(self, solution, n):
+        fva = cobra.flux_analysis.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, fraction_of_optimum=0.)
+        self.assertEqual(solution.fluxes.shape, (len(self.REACTION_IDS), n))
+        for reaction_id in self.REACTION_IDS:
+            fluxes = solution.get_result('fluxes', (reaction_id,))
+            self.assertTrue(numpy.all(fluxes >= fva.loc[reaction_id, 'minimum'] - 1e-6))
+            self.assertTrue(numpy.all(fluxes <= fva.loc[reaction_id, 'maximum'] + 1e-6))
+        numpy.testing.assert_allclose(solution.objective_value, solution.get_result('fluxes', ('Biomass_Ecoli_core',)))
+
+    def test_achr_sample(self):
+        required_results = {'fluxes': set(self.REACTION_IDS), 'objective_value': set()}
+        solution = sampling.achr_sample(self.model, required_results, n=50, thinning=10, seed=3)
+        self._assert_feasible(solution, 50)
+
+        # the chain is the same as that of COBRApy, including when it is resumed in chunks
+        expected_samples = cobra.sampling.sample(self.model, 50, method='achr', thinning=10, seed=3)
+        numpy.testing.assert_allclose(solution.fluxes, expected_samples[self.REACTION_IDS].values.T)
+
+        with mock.patch.object(sampling, 'CHUNK_SIZE', 7):
+            chunked_solution = sampling.achr_sample(self.model, required_results, n=50, thinning=10, seed=3)
+        numpy.testing.assert_allclose(chunked_solution.fluxes, solution.fluxes)
+
+    def test_sample_restores_global_random_state(self):
+        required_results = {'fluxes': set(self.REACTION_IDS)}
+        numpy.random.seed(7)
+        expected_random_numbers = numpy.random.rand(3)
+        numpy.random.seed(7)
+        sampling.achr_sample(self.model, required_results, n=10, thinning=10, seed=3)
+        sampling.optgp_sample(self.model, required_results, n=10, thinning=10, seed=3)
+        numpy.testing.assert_array_equal(numpy.random.rand(3), expected_random_numbers)
+
+    def test_optgp_sample(self):
+        required_results = {'fluxes': set(self.REACTION_IDS), 'objective_value': set()}
+        solution = sampling.optgp_sample(self.model, required_results, n=50, thinning=10, seed=3)
+        self._assert_feasible(solution, 50)
+
+        with mock.patch.object(sampling, 'CHUNK_SIZE', 7):
+            chunked_solution = sampling.optgp_sample(self.model, required_results, n=50, thinning=10, seed=3)
+        numpy.testing.assert_allclose(chunked_solution.fluxes, solution.fluxes)
+
+        # the samples don't repeat across chunks
+        self.assertEqual(len(numpy.unique(chunked_solution.fluxes[0, :])), 50)
+
+    def test_optgp_sample_with_parallel_chains(self):
+        required_results = {'fluxes': set(self.REACTION_IDS), 'objective_value': set()}
+        with mock.patch.object(sampling, 'CHUNK_SIZE', 20):
+            solution = sampling.optgp_sample(self.model, required_results, n=45, thinning=10, seed=3, processes=2)
+            solution_2 = sampling.optgp_sample(self.model, required_results, n=45, thinning=10, seed=3, processes=2)
+        self._assert_feasible(solution, 45)
+        numpy.testing.assert_allclose(solution_2.fluxes, solution.fluxes)
+
+        # the chains are different
+        self.assertEqual(len(numpy.unique(solution.fluxes[0, :])), 45)
+
+        # the samplers are released from the pool
+        worker_pool = pool.get_worker_pool(2)
+        self.assertEqual(list(worker_pool._pushed_problems.keys()), [])
+        self.assertEqual(os.listdir(worker_pool._dirname), [])
+
+    def test_sample_infeasible_model(self):
+        self.model.reactions.get_by_id('EX_glc__D_e').lower_bound = 10.
+        solution = sampling.optgp_sample(self.model, {'fluxes': set(['PGK'])}, n=10)
+        self.assertEqual(solution.status, 'infeasible')
+
+    def test_sample_with_deadline(self):
+        required_results = {'fluxes': set(self.REACTION_IDS)}
+        with mock.patch.object(sampling, 'CHUNK_SIZE', 7):
+            with mock.patch('biosimulators_cobrapy.sampling.is_expired', side_effect=[False, False, True]):
+                with self.assertRaisesRegex(TimeLimitExceededError, '14 of 50 samples') as context:
+                    sampling.achr_sample(self.model, required_results, n=50, thinning=10, seed=3)
+        self.assertEqual(context.exception.partial_solution.fluxes.shape, (len(self.REACTION_IDS), 14))
+
+    def test_write_flux_samples_report(self):
+        with mock.patch.object(sampling, 'CHUNK_SIZE', 7):
+            num_samples = sampling.write_flux_samples_report(self.model, self.dirname, 'sim.sedml/samples',
+                                                             n=30, method='achr', thinning=10, seed=3)
+        self.assertEqual(num_samples, 30)
+
+        expected_samples = cobra.sampling.sample(self.model, 30, method='achr', thinning=10, seed=3)
+
+        results = sampling.read_flux_samples_report(self.dirname, 'sim.sedml/samples')
+        self.assertEqual(len(results), len(self.model.reactions))
+        numpy.testing.assert_allclose(results['R_PGK'], expected_samples['PGK'].values)
+
+        report = sedml_data_model.Report(id='samples', data_sets=[
+            sedml_data_model.DataSet(id='R_PGK', label='R_PGK'),
+            sedml_data_model.DataSet(id='R_TALA', label='R_TALA'),
+        ])
+        results = ReportReader().run(report, self.dirname, 'sim.sedml/samples', format=ReportFormat.h5)
+        numpy.testing.assert_allclose(results['R_TALA'], expected_samples['TALA'].values)
+
+    def test_exec_sed_task(self):
+        task = sedml_data_model.Task(
+            model=sedml_data_model.Model(
+                source=self.MODEL_FILENAME,
+                language=sedml_data_model.ModelLanguage.SBML.value,
+            ),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(
+                    kisao_id='KISAO_0000588',
+                    changes=[
+                        sedml_data_model.AlgorithmParameterChange(kisao_id='KISAO_0000326', new_value='40'),
+                        sedml_data_model.AlgorithmParameterChange(kisao_id='KISAO_0000684', new_value='10'),
+                        sedml_data_model.AlgorithmParameterChange(kisao_id='KISAO_0000488', new_value='3'),
+                        sedml_data_model.AlgorithmParameterChange(kisao_id='KISAO_0000529', new_value='2'),
+                    ],
+                ),
+            ),
+        )
+        variables = [
+            sedml_data_model.Variable(
+                id='objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+            sedml_data_model.Variable(
+                id='inactive_objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='inactive_obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+            sedml_data_model.Variable(
+                id='PGK_flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+
+        variable_results, log = core.exec_sed_task(task, variables)
+        self.assertEqual(variable_results['objective'].shape, (40,))
+        self.assertEqual(variable_results['PGK_flux'].shape, (40,))
+        self.assertEqual(log.simulator_details['arguments'], {'n': 40, 'thinning': 10, 'seed': 3, 'processes': 2})
+
+        expected_solution = sampling.optgp_sample(self.model, {'fluxes': set(['ACALD', 'PGK'])}, n=40, thinning=10, seed=3,
+                                                  processes=2)
+        numpy.testing.assert_allclose(variable_results['PGK_flux'], expected_solution.get_result('fluxes', ('PGK',)))
+
+        # the inactive objective is evaluated at each sample
+        numpy.testing.assert_allclose(variable_results['inactive_objective'], expected_solution.get_result('fluxes', ('ACALD',)))
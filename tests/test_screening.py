@@ -0,0 +1,247 @@
+""" Tests of knockout screens
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import core
+from biosimulators_cobrapy import pool
+from biosimulators_cobrapy import screening
+from biosimulators_cobrapy.reports import ColumnarReportFormat, read_columnar_report
+from biosimulators_utils.report.data_model import ReportFormat
+from biosimulators_utils.report.io import ReportReader
+from biosimulators_utils.sedml import data_model as sedml_data_model
+import copy
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class ScreeningTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+    NAMESPACES = {
+        'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+        'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+    }
+    REACTION_IDS = ['R_PGK', 'R_TALA', 'R_ACALD', 'R_FRD7', 'R_PFK', 'R_ENO']
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+        pool.close_worker_pools()
+
+    def _get_task_variables(self, kisao_id='KISAO_0000437'):
+        task = sedml_data_model.Task(
+            id='task',
+            model=sedml_data_model.Model(
+                source=self.MODEL_FILENAME,
+                language=sedml_data_model.ModelLanguage.SBML.value,
+                changes=[
+                    sedml_data_model.ModelAttributeChange(
+                        target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_EX_glc__D_e']/@fbc:lowerFluxBound",
+                        target_namespaces=self.NAMESPACES,
+                        new_value='-8',
+                    ),
+                ],
+            ),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(kisao_id=kisao_id),
+            ),
+        )
+        variables = [
+            sedml_data_model.Variable(
+                id='objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+            sedml_data_model.Variable(
+                id='PGI_flux',
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGI']/@flux",
+                target_namespaces=self.NAMESPACES,
+                task=task),
+        ]
+        return task, variables
+
+    def _exec_knockouts_sequentially(self, task, variables, knockouts):
+        expected_results = {variable.id: [] for variable in variables}
+        for changes in knockouts.values():
+            knockout_task = copy.copy(task)
+            knockout_task.model = copy.copy(task.model)
+            knockout_task.model.changes = task.model.changes + changes
+            try:
+                variable_results, _ = core.exec_sed_task(knockout_task, variables)
+            except Exception:
+                variable_results = {variable.id: numpy.nan for variable in variables}
+            for variable in variables:
+                expected_results[variable.id].append(float(variable_results[variable.id]))
+        return expected_results
+
+    def test_get_reaction_knockouts(self):
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=['R_PGK', 'R_TALA', 'R_ENO'], order=2)
+        self.assertEqual(list(knockouts.keys()), ['R_PGK+R_TALA', 'R_PGK+R_ENO', 'R_TALA+R_ENO'])
+        self.assertEqual(len(knockouts['R_PGK+R_TALA']), 4)
+        self.assertEqual(set(change.new_value for change in knockouts['R_PGK+R_TALA']), set(['0']))
+
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME)
+        self.assertEqual(len(knockouts), 95)
+        self.assertIn('R_PGK', knockouts)
+
+    def test_get_gene_knockouts(self):
+        # ACALD is catalyzed by the isozymes of b0351 and b1241, and AKGDH by a complex which includes b0726
+        knockouts = screening.get_gene_knockouts(self.MODEL_FILENAME, gene_ids=['G_b0351', 'G_b1241', 'G_b0726'])
+        self.assertEqual(list(knockouts.keys()), ['G_b0351', 'G_b1241', 'G_b0726'])
+        self.assertEqual(knockouts['G_b0351'], [])
+        self.assertEqual(knockouts['G_b1241'], [])
+        self.assertEqual([change.target for change in knockouts['G_b0726']], [
+            "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_AKGDH']/@fbc:lowerFluxBound",
+            "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_AKGDH']/@fbc:upperFluxBound",
+        ])
+
+        knockouts = screening.get_gene_knockouts(self.MODEL_FILENAME, gene_ids=['G_b0351', 'G_b1241'], order=2)
+        self.assertEqual(list(knockouts.keys()), ['G_b0351+G_b1241'])
+        self.assertEqual([change.target for change in knockouts['G_b0351+G_b1241']], [
+            "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_ACALD']/@fbc:lowerFluxBound",
+            "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_ACALD']/@fbc:upperFluxBound",
+        ])
+        self.assertEqual(set(change.new_value for change in knockouts['G_b0351+G_b1241']), set(['0']))
+
+        self.assertEqual(len(screening.get_gene_knockouts(self.MODEL_FILENAME)), 137)
+
+        with self.assertRaisesRegex(ValueError, 'not a gene'):
+            screening.get_gene_knockouts(self.MODEL_FILENAME, gene_ids=['G_unknown'])
+
+    def test_exec_gene_knockout_screen(self):
+        task, variables = self._get_task_variables()
+        knockouts = screening.get_gene_knockouts(self.MODEL_FILENAME, gene_ids=['G_b0351', 'G_b1241', 'G_b0726', 'G_b1779'])
+        knockouts.update(screening.get_gene_knockouts(self.MODEL_FILENAME, gene_ids=['G_b0351', 'G_b1241'], order=2))
+        expected_results = self._exec_knockouts_sequentially(task, variables, knockouts)
+
+        results, log = screening.exec_knockout_screen(task, variables, knockouts)
+        for variable in variables:
+            numpy.testing.assert_allclose(results[variable.id], expected_results[variable.id], rtol=1e-6, atol=1e-8)
+        # the knockouts of the isozymes of ACALD don't knock out any reaction, and ACALD carries no flux
+        self.assertEqual(log.simulator_details['skippedKnockouts'], 3)
+
+    def test_exec_knockout_screen(self):
+        task, variables = self._get_task_variables()
+        variables.append(sedml_data_model.Variable(
+            id='inactive_objective',
+            target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='inactive_obj']/@value",
+            target_namespaces=self.NAMESPACES,
+            task=task))
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=self.REACTION_IDS)
+        expected_results = self._exec_knockouts_sequentially(task, variables, knockouts)
+
+        for processes in [1, 2]:
+            results, log = screening.exec_knockout_screen(task, variables, knockouts, processes=processes)
+            for variable in variables:
+                self.assertEqual(results[variable.id].shape, (len(knockouts),))
+                numpy.testing.assert_allclose(results[variable.id], expected_results[variable.id], rtol=1e-6, atol=1e-8)
+
+            self.assertEqual(log.simulator_details['knockouts'], self.REACTION_IDS)
+            self.assertEqual(log.simulator_details['processes'], processes)
+            self.assertEqual(log.simulator_details['simulatedKnockouts'], len(knockouts))
+            # FRD7 and ACALD carry no flux in the wild-type solution, but they are simulated because the optimum of the
+            # inactive objective could depend on them
+            self.assertEqual(log.simulator_details['skippedKnockouts'], 0)
+
+        # the task isn't modified
+        self.assertEqual(len(task.model.changes), 1)
+
+    def test_exec_knockout_screen_without_skipping(self):
+        task, variables = self._get_task_variables()
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=self.REACTION_IDS)
+        skipped_results, log = screening.exec_knockout_screen(task, variables, knockouts)
+        # FRD7 and ACALD carry no flux in the wild-type solution
+        self.assertEqual(log.simulator_details['skippedKnockouts'], 2)
+        results, log = screening.exec_knockout_screen(task, variables, knockouts, skip_zero_flux_knockouts=False)
+        self.assertEqual(log.simulator_details['skippedKnockouts'], 0)
+        for variable in variables:
+            numpy.testing.assert_allclose(results[variable.id], skipped_results[variable.id], rtol=1e-6, atol=1e-8)
+
+    def test_exec_knockout_screen_inactive_objective_of_zero_flux_reaction(self):
+        # the inactive objective maximizes the flux of FRD7, which carries no flux in the wild-type solution
+        with open(self.MODEL_FILENAME, 'r') as file:
+            model = file.read()
+        model = model.replace('<fbc:fluxObjective fbc:reaction="R_ACALD" fbc:coefficient="1"/>',
+                              '<fbc:fluxObjective fbc:reaction="R_FRD7" fbc:coefficient="1"/>')
+        self.assertIn('fbc:reaction="R_FRD7" fbc:coefficient="1"', model)
+        model_filename = os.path.join(self.dirname, 'model.xml')
+        with open(model_filename, 'w') as file:
+            file.write(model)
+
+        for kisao_id in screening.SCREENING_ALGORITHMS:
+            task, variables = self._get_task_variables(kisao_id=kisao_id)
+            task.model.source = model_filename
+            variables.append(sedml_data_model.Variable(
+                id='inactive_objective',
+                target="/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='inactive_obj']/@value",
+                target_namespaces=self.NAMESPACES,
+                task=task))
+            knockouts = screening.get_reaction_knockouts(model_filename, reaction_ids=['R_FRD7', 'R_PGK'])
+            expected_results = self._exec_knockouts_sequentially(task, variables, knockouts)
+            self.assertEqual(expected_results['inactive_objective'][0], 0.)
+
+            results, log = screening.exec_knockout_screen(task, variables, knockouts)
+            self.assertEqual(log.simulator_details['skippedKnockouts'], 0)
+            for variable in variables:
+                numpy.testing.assert_allclose(results[variable.id], expected_results[variable.id], rtol=1e-6, atol=1e-8)
+
+    def test_exec_knockout_screen_pfba(self):
+        task, variables = self._get_task_variables(kisao_id='KISAO_0000528')
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=self.REACTION_IDS)
+        expected_results = self._exec_knockouts_sequentially(task, variables, knockouts)
+
+        results, _ = screening.exec_knockout_screen(task, variables, knockouts, processes=2)
+        for variable in variables:
+            numpy.testing.assert_allclose(results[variable.id], expected_results[variable.id], rtol=1e-6, atol=1e-8)
+
+    def test_exec_knockout_screen_infeasible_knockout(self):
+        task, variables = self._get_task_variables()
+        # without glucose, the ATP maintenance requirement can't be met
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=['R_EX_glc__D_e', 'R_PGK'])
+        results, _ = screening.exec_knockout_screen(task, variables, knockouts)
+        self.assertTrue(numpy.isnan(results['objective'][0]))
+        self.assertFalse(numpy.isnan(results['objective'][1]))
+
+    def test_exec_knockout_screen_errors(self):
+        task, variables = self._get_task_variables()
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=['R_PGK'])
+        knockouts['R_PGK'][1].new_value = '10'
+        with self.assertRaisesRegex(ValueError, 'both flux bounds'):
+            screening.exec_knockout_screen(task, variables, knockouts)
+
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=['R_PGK'])
+        task, variables = self._get_task_variables(kisao_id='KISAO_0000526')
+        variables = []
+        with self.assertRaisesRegex(NotImplementedError, 'not supported'):
+            screening.exec_knockout_screen(task, variables, knockouts)
+
+    def test_write_knockout_screen_report(self):
+        task, variables = self._get_task_variables()
+        knockouts = screening.get_reaction_knockouts(self.MODEL_FILENAME, reaction_ids=self.REACTION_IDS)
+        results, _ = screening.exec_knockout_screen(task, variables, knockouts)
+
+        for format in [ReportFormat.h5, ReportFormat.csv]:
+            screening.write_knockout_screen_report(results, knockouts, variables, self.dirname, 'screen', format=format)
+
+            report = sedml_data_model.Report(
+                id='knockout_screen',
+                data_sets=[sedml_data_model.DataSet(id=variable.id, label=variable.id) for variable in variables],
+            )
+            data_set_results = ReportReader().run(report, self.dirname, 'screen', format=format)
+            for variable in variables:
+                numpy.testing.assert_allclose(data_set_results[variable.id], results[variable.id])
+
+        for format in ColumnarReportFormat:
+            screening.write_knockout_screen_report(results, knockouts, variables, self.dirname, 'screen', format=format)
+            data_set_results = read_columnar_report(report, self.dirname, 'screen', format=format)
+            for variable in variables:
+                numpy.testing.assert_allclose(data_set_results[variable.id], results[variable.id])
@@ -0,0 +1,76 @@
+from biosimulators_cobrapy.solution import SlimSolution, BlockVariableResults, stack_results
+from biosimulators_utils.report.data_model import VariableResults
+import numpy
+import numpy.testing
+import unittest
+
+
+class SlimSolutionTestCase(unittest.TestCase):
+    def test_get_result(self):
+        solution = SlimSolution(
+            'optimal',
+            objective_value=1.5,
+            reaction_index={'A': 0, 'B': 1},
+            metabolite_index={'X': 0},
+            fluxes=numpy.array([2., 3.]),
+            shadow_prices=numpy.array([4.]),
+            minimum=numpy.array([-1., 0.]),
+            maximum=numpy.array([1., 5.]),
+            objective_values={'obj_2': 2.5},
+        )
+        self.assertEqual(solution.get_result('objective_value'), 1.5)
+        self.assertEqual(solution.get_result('objective_values', ('obj_2',)), 2.5)
+        self.assertTrue(numpy.isnan(solution.get_result('objective_values', ('obj_3',))))
+        self.assertEqual(solution.get_result('fluxes', ('B',)), 3.)
+        self.assertEqual(solution.get_result('shadow_prices', ('X',)), 4.)
+        self.assertEqual(solution.get_result('minimum', ('A',)), -1.)
+        self.assertEqual(solution.get_result('maximum', ('B',)), 5.)
+
+        with self.assertRaises(KeyError):
+            solution.get_result('reduced_costs', ('A',))
+        with self.assertRaises(KeyError):
+            solution.get_result('fluxes', ('C',))
+
+    def test_get_results(self):
+        solution = SlimSolution(
+            'optimal',
+            reaction_index={'A': 0, 'B': 1, 'C': 2},
+            fluxes=numpy.array([[2., 3.], [4., 5.], [6., 7.]]),
+            objective_values={'obj_2': numpy.array([1., 2.])},
+        )
+        fluxes = solution.get_results('fluxes', [('C',), ('A',)])
+        numpy.testing.assert_allclose(fluxes, [[6., 7.], [2., 3.]])
+        self.assertTrue(fluxes.flags['C_CONTIGUOUS'])
+
+        objective_values = solution.get_results('objective_values', [('obj_2',), ('obj_3',)])
+        numpy.testing.assert_allclose(objective_values, [[1., 2.], [numpy.nan, numpy.nan]])
+
+        with self.assertRaises(KeyError):
+            solution.get_results('minimum', [('A',)])
+        with self.assertRaises(KeyError):
+            solution.get_results('fluxes', [('D',)])
+
+    def test_block_variable_results(self):
+        blocks = {'fluxes': numpy.array([1., 2.]), 'minimum': numpy.array([[3., 4.]])}
+        results = BlockVariableResults(blocks, {'fluxes': ['flux_a', 'flux_b'], 'minimum': ['min_a']})
+        self.assertIsInstance(results, VariableResults)
+        self.assertEqual(results.offsets, {'flux_a': ('fluxes', 0), 'flux_b': ('fluxes', 1), 'min_a': ('minimum', 0)})
+        self.assertEqual(results['flux_b'].shape, ())
+        self.assertEqual(results['flux_b'].tolist(), 2.)
+        numpy.testing.assert_allclose(results['min_a'], [3., 4.])
+
+        # the results are views of the blocks
+        self.assertTrue(numpy.shares_memory(results['flux_a'], blocks['fluxes']))
+        self.assertTrue(numpy.shares_memory(results['min_a'], blocks['minimum']))
+
+    def test_stack_results(self):
+        numpy.testing.assert_allclose(stack_results([1., 2.]), [1., 2.])
+        numpy.testing.assert_allclose(stack_results([numpy.array([1., 2.]), numpy.nan]), [[1., 2.], [numpy.nan, numpy.nan]])
+
+    def test_slots(self):
+        solution = SlimSolution('infeasible')
+        self.assertTrue(numpy.isnan(solution.objective_value))
+        self.assertEqual(solution.reaction_index, {})
+        self.assertEqual(solution.objective_values, {})
+        with self.assertRaises(AttributeError):
+            solution.unknown = 1.
@@ -0,0 +1,97 @@
+from biosimulators_cobrapy import solvers
+from biosimulators_cobrapy.data_model import KISAO_ALGORITHMS_PARAMETERS_MAP, Solver
+import cobra.io
+import os
+import unittest
+
+
+class SolversTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.model = cobra.io.read_sbml_model(cls.MODEL_FILENAME)
+
+    def test_get_available_solvers(self):
+        self.assertIn(Solver.glpk, solvers.get_available_solvers())
+
+    def test_calibrate_solvers(self):
+        calibration = solvers.calibrate_solvers([Solver.glpk])
+        glpk_calibration = calibration[Solver.glpk]
+        self.assertEqual(set(glpk_calibration.keys()), set(['build', 'solve']))
+        for fixed_time, time_per_non_zero in glpk_calibration.values():
+            self.assertGreaterEqual(fixed_time, 0.)
+            self.assertGreaterEqual(time_per_non_zero, 0.)
+            self.assertGreater(fixed_time + time_per_non_zero, 0.)
+
+        # the calibration is only run once
+        self.assertIs(solvers.calibrate_solvers([Solver.glpk]), calibration)
+        self.assertEqual(solvers.calibrate_solvers([Solver.glpk])[Solver.glpk], glpk_calibration)
+
+    def test_get_problem_type(self):
+        fva = KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000526']
+        self.assertEqual(solvers.get_problem_type(fva, {}), 'LP')
+        self.assertEqual(solvers.get_problem_type(fva, {'loopless': False}), 'LP')
+        self.assertEqual(solvers.get_problem_type(fva, {'loopless': True}), 'LP')
+        self.assertEqual(solvers.get_problem_type(fva, {'loopless': 'cycleFreeFlux'}), 'LP')
+        self.assertEqual(solvers.get_problem_type(fva, {'loopless': 'fastSNP'}), 'MILP')
+        self.assertEqual(solvers.get_problem_type(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000437'], {}), 'LP')
+
+    def test_estimate_num_solves(self):
+        self.assertEqual(solvers.estimate_num_solves(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000437'], {}, 10), 1)
+        self.assertEqual(solvers.estimate_num_solves(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000528'], {}, 10), 2)
+        self.assertEqual(solvers.estimate_num_solves(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000526'], {}, 10), 21)
+        self.assertEqual(solvers.estimate_num_solves(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000526'],
+                                                     {'reaction_list': ['A', 'B']}, 10), 5)
+        self.assertEqual(solvers.estimate_num_solves(KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000527'], {}, 10), 44)
+
+    def test_select_solver(self):
+        fba = KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000437']
+        fva = KISAO_ALGORITHMS_PARAMETERS_MAP['KISAO_0000526']
+
+        solver, reason = solvers.select_solver(self.model, fba, {}, solvers=[Solver.glpk])
+        self.assertEqual(solver, Solver.glpk)
+        self.assertIn('only available solver', reason)
+
+        # solver with the lowest setup time is preferred for a single small LP
+        calibration = {
+            Solver.glpk: {'build': (1e-3, 1e-6), 'solve': (1e-3, 1e-6)},
+            Solver.gurobi: {'build': (1e-2, 1e-7), 'solve': (1e-2, 1e-7)},
+        }
+        solver, reason = solvers.select_solver(self.model, fba, {}, solvers=[Solver.glpk, Solver.gurobi],
+                                               calibration=calibration)
+        self.assertEqual(solver, Solver.glpk)
+        self.assertIn('predicted to be the fastest', reason)
+        self.assertIn('gurobi: ', reason)
+
+        # solver with the lowest time per non-zero is preferred for large models
+        calibration = {
+            Solver.glpk: {'build': (1e-3, 1e-4), 'solve': (1e-3, 1e-4)},
+            Solver.gurobi: {'build': (1e-2, 1e-7), 'solve': (1e-2, 1e-7)},
+        }
+        solver, _ = solvers.select_solver(self.model, fba, {}, solvers=[Solver.glpk, Solver.gurobi],
+                                          calibration=calibration)
+        self.assertEqual(solver, Solver.gurobi)
+
+        # the problem is built once, and solved once for FBA and many times for FVA, so the solver which is slower
+        # to build problems but faster to solve them is preferred for FVA
+        calibration = {
+            Solver.glpk: {'build': (1e-3, 0.), 'solve': (1e-3, 0.)},
+            Solver.gurobi: {'build': (5e-2, 0.), 'solve': (1e-4, 0.)},
+        }
+        solver, _ = solvers.select_solver(self.model, fba, {}, solvers=[Solver.glpk, Solver.gurobi],
+                                          calibration=calibration)
+        self.assertEqual(solver, Solver.glpk)
+        solver, reason = solvers.select_solver(self.model, fva, {}, solvers=[Solver.glpk, Solver.gurobi],
+                                               calibration=calibration)
+        self.assertEqual(solver, Solver.gurobi)
+        self.assertIn('glpk: 0.192 s', reason)
+        self.assertIn('gurobi: 0.0691 s', reason)
+
+        # MILP
+        solver, reason = solvers.select_solver(self.model, fva, {'loopless': 'fastSNP'}, solvers=[Solver.glpk, Solver.cplex])
+        self.assertEqual(solver, Solver.cplex)
+        self.assertIn('MILP', reason)
+
+        with self.assertRaisesRegex(ValueError, 'No solver'):
+            solvers.select_solver(self.model, fba, {}, solvers=[])
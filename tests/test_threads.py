@@ -0,0 +1,133 @@
+""" Tests of the thread-safe execution of tasks which share preprocessed models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import aio
+from biosimulators_cobrapy.core import exec_sed_task, preprocess_sed_task
+from biosimulators_cobrapy.threads import ThreadModelCopies
+from biosimulators_utils.config import get_config
+from helpers import MODEL_FILENAME, OBJECTIVE_TARGET, build_task, get_flux_target
+import asyncio
+import cobra.io
+import concurrent.futures
+import copy
+import gc
+import numpy.testing
+import threading
+import unittest
+
+
+class ThreadModelCopiesTestCase(unittest.TestCase):
+    def test_get(self):
+        model = cobra.io.read_sbml_model(MODEL_FILENAME)
+        model_copies = ThreadModelCopies()
+
+        model_copy = model_copies.get(model)
+        self.assertIsNot(model_copy, model)
+        self.assertEqual(len(model_copy.reactions), len(model.reactions))
+        self.assertIs(model_copies.get(model), model_copy)
+        self.assertEqual(model_copies.get_stats(), {'copies': 1, 'threadCopies': 1})
+
+        # each thread has its own copy
+        other_copies = []
+        thread = threading.Thread(target=lambda: other_copies.append(model_copies.get(model)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other_copies[0], model_copy)
+        self.assertEqual(model_copies.get_stats(), {'copies': 2, 'threadCopies': 1})
+
+        # the objects of the changes of the shared model are mapped to the copy
+        pgk = model.reactions.get_by_id('PGK')
+        self.assertEqual(model_copies.get_change_obj_attrs(model_copy, [(pgk, 'lower_bound')]),
+                         [(model_copy.reactions.get_by_id('PGK'), 'lower_bound')])
+
+        # copies are released with their models
+        del model, pgk, other_copies
+        gc.collect()
+        self.assertEqual(model_copies.get_stats()['threadCopies'], 0)
+
+
+class ThreadSafeExecutionTestCase(unittest.TestCase):
+    VARIABLE_TARGETS = {'obj': OBJECTIVE_TARGET, 'EX_glc': get_flux_target('R_EX_glc__D_e')}
+    NUM_TASKS = 48
+    NUM_THREADS = 4
+
+    def test_exec_sed_task_concurrently(self):
+        """ Stress test: many tasks with different changes of a shared preprocessed model, executed by several
+        threads, have the same results as when they are executed one by one """
+        config = get_config()
+        config.LOG = False
+        tasks = [build_task(glucose_uptake=1. + i_task % 12, variable_targets=self.VARIABLE_TARGETS)
+                 for i_task in range(self.NUM_TASKS)]
+        preprocessed_task = preprocess_sed_task(*tasks[0], config=config)
+        shared_model = preprocessed_task['model']['model']
+        shared_bounds = [(reaction.lower_bound, reaction.upper_bound) for reaction in shared_model.reactions]
+        shared_method_kw_args = copy.deepcopy(preprocessed_task['simulation']['method_kw_args'])
+
+        expected_results = [exec_sed_task(task, variables, preprocessed_task=preprocessed_task, config=config)[0]
+                            for task, variables in tasks]
+        self.assertEqual(len(set(round(float(results['obj']), 6) for results in expected_results)), 12)
+
+        model_copies = ThreadModelCopies()
+        barrier = threading.Barrier(self.NUM_THREADS, timeout=60.)
+
+        def exec_task(task_variables):
+            task, variables = task_variables
+            if model_copies.get_stats()['threadCopies'] == 0:
+                # start the threads together to maximize the contention
+                barrier.wait()
+            return exec_sed_task(task, variables, preprocessed_task=preprocessed_task, config=config,
+                                 thread_model_copies=model_copies)[0]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.NUM_THREADS) as executor:
+            results = list(executor.map(exec_task, tasks))
+
+        for result, expected_result in zip(results, expected_results):
+            for variable_id in ['obj', 'EX_glc']:
+                numpy.testing.assert_allclose(result[variable_id], expected_result[variable_id])
+        self.assertEqual(model_copies.copies, self.NUM_THREADS)
+
+        # the shared preprocessed task and its model were not modified
+        self.assertIs(preprocessed_task['model']['model'], shared_model)
+        self.assertEqual([(reaction.lower_bound, reaction.upper_bound) for reaction in shared_model.reactions],
+                         shared_bounds)
+        self.assertEqual(preprocessed_task['simulation']['method_kw_args'], shared_method_kw_args)
+
+    def test_exec_sed_task_log(self):
+        task, variables = build_task(glucose_uptake=5., variable_targets=self.VARIABLE_TARGETS)
+        preprocessed_task = preprocess_sed_task(task, variables)
+        _, log = exec_sed_task(task, variables, preprocessed_task=preprocessed_task,
+                               thread_model_copies=ThreadModelCopies())
+        self.assertEqual(log.simulator_details['threadModelCopies'], {'copies': 1, 'threadCopies': 1})
+
+    def test_exec_sed_task_without_preprocessed_task(self):
+        task, variables = build_task(variable_targets=self.VARIABLE_TARGETS)
+        with self.assertRaisesRegex(ValueError, 'must be preprocessed'):
+            exec_sed_task(task, variables, thread_model_copies=ThreadModelCopies())
+
+    def test_aexec_sed_task_with_shared_preprocessed_task(self):
+        tasks = [build_task(glucose_uptake=1. + i_task % 4, variable_targets=self.VARIABLE_TARGETS)
+                 for i_task in range(8)]
+        preprocessed_task = preprocess_sed_task(*tasks[0])
+        expected_results = [exec_sed_task(task, variables, preprocessed_task=preprocessed_task)[0]
+                            for task, variables in tasks]
+
+        executor = aio.BoundedExecutor(max_workers=2, max_pending=8)
+
+        async def main():
+            return await asyncio.gather(*[
+                aio.aexec_sed_task(task, variables, preprocessed_task=preprocessed_task, executor=executor)
+                for task, variables in tasks])
+
+        try:
+            results = asyncio.run(main())
+        finally:
+            executor.shutdown()
+
+        for (result, _), expected_result in zip(results, expected_results):
+            numpy.testing.assert_allclose(result['obj'], expected_result['obj'])
+        self.assertGreaterEqual(executor.model_copies.copies, 1)
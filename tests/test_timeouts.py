@@ -0,0 +1,51 @@
+from biosimulators_cobrapy import timeouts
+import cobra.io
+import os
+import time
+import unittest
+
+
+class TimeoutsTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+
+    def test_get_deadline(self):
+        self.assertEqual(timeouts.get_deadline(), None)
+
+        deadline = timeouts.get_deadline(10.)
+        self.assertAlmostEqual(deadline, time.monotonic() + 10., delta=1.)
+
+        # the earlier deadline is used
+        self.assertEqual(timeouts.get_deadline(100., deadline), deadline)
+        self.assertLess(timeouts.get_deadline(1., deadline), deadline)
+        self.assertEqual(timeouts.get_deadline(None, deadline), deadline)
+
+    def test_get_remaining_time(self):
+        self.assertEqual(timeouts.get_remaining_time(None), None)
+        self.assertAlmostEqual(timeouts.get_remaining_time(time.monotonic() + 10.), 10., delta=1.)
+        self.assertEqual(timeouts.get_remaining_time(time.monotonic() - 10.), 0.)
+
+    def test_is_expired(self):
+        self.assertFalse(timeouts.is_expired(None))
+        self.assertFalse(timeouts.is_expired(time.monotonic() + 10.))
+        self.assertTrue(timeouts.is_expired(time.monotonic() - 10.))
+
+    def test_solver_time_limit(self):
+        model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+
+        with timeouts.solver_time_limit(model, None):
+            self.assertEqual(model.solver.configuration.timeout, None)
+
+        with timeouts.solver_time_limit(model, time.monotonic() + 9.5):
+            self.assertEqual(model.solver.configuration.timeout, 10)
+            model.slim_optimize()
+            self.assertEqual(model.solver.status, 'optimal')
+        self.assertEqual(model.solver.configuration.timeout, None)
+
+        with timeouts.solver_time_limit(model, time.monotonic() - 1.):
+            self.assertEqual(model.solver.configuration.timeout, 1)
+        self.assertEqual(model.solver.configuration.timeout, None)
+
+    def test_time_limit_exceeded_error(self):
+        exception = timeouts.TimeLimitExceededError()
+        self.assertEqual(str(exception), 'The time budget was exceeded.')
+        self.assertEqual(exception.partial_solution, None)
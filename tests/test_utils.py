@@ -1,7 +1,11 @@
 from biosimulators_cobrapy.data_model import KISAO_ALGORITHMS_PARAMETERS_MAP
+from biosimulators_cobrapy.solution import SlimSolution
 from biosimulators_cobrapy.utils import (get_objective_sbml_fbc_ids, set_simulation_method_arg,
                                          apply_variables_to_simulation_method_args,
-                                         validate_variables, get_results_of_variables, get_results_paths_for_variables)
+                                         validate_variables, format_invalid_targets,
+                                         get_results_of_variables, get_results_paths_for_variables,
+                                         get_required_results, get_solution, optimize, pfba)
+from biosimulators_cobrapy.variability import get_loopless_method
 from biosimulators_utils.sedml.data_model import AlgorithmParameterChange, Variable
 from unittest import mock
 import attrdict
@@ -33,12 +37,31 @@ class UtilsTestCase(unittest.TestCase):
 
         argument_change = AlgorithmParameterChange(
             kisao_id='KISAO_0000532',
-            new_value='0',
+            new_value='fastSNP',
+        )
+        set_simulation_method_arg(method_props, argument_change, model, method_kw_args)
+        self.assertEqual(method_kw_args, {'loopless': 'fastSNP'})
+
+        argument_change = AlgorithmParameterChange(
+            kisao_id='KISAO_0000532',
+            new_value='false',
         )
         set_simulation_method_arg(method_props, argument_change, model, method_kw_args)
         self.assertEqual(model, {})
         self.assertEqual(method_kw_args, {'loopless': False})
 
+        # every spelling of a boolean, which the parameter accepted when it was a boolean, is accepted
+        for new_value, loopless in [('1', True), ('0', False), ('TRUE', True), ('False', False)]:
+            argument_change = AlgorithmParameterChange(kisao_id='KISAO_0000532', new_value=new_value)
+            set_simulation_method_arg(method_props, argument_change, model, method_kw_args)
+            self.assertIs(method_kw_args['loopless'], loopless)
+        self.assertEqual(get_loopless_method(method_kw_args['loopless']), None)
+        set_simulation_method_arg(method_props, AlgorithmParameterChange(kisao_id='KISAO_0000532', new_value='1'),
+                                  model, method_kw_args)
+        self.assertEqual(get_loopless_method(method_kw_args['loopless']), 'cycleFreeFlux')
+        set_simulation_method_arg(method_props, AlgorithmParameterChange(kisao_id='KISAO_0000532', new_value='0'),
+                                  model, method_kw_args)
+
         argument_change = AlgorithmParameterChange(
             kisao_id='KISAO_0000531',
             new_value='0.99',
@@ -87,6 +110,13 @@ class UtilsTestCase(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'not a valid value'):
             set_simulation_method_arg(method_props, argument_change, model, method_kw_args)
 
+        argument_change = AlgorithmParameterChange(
+            kisao_id='KISAO_0000532',
+            new_value='original',
+        )
+        with self.assertRaisesRegex(ValueError, 'not a valid value'):
+            set_simulation_method_arg(method_props, argument_change, model, method_kw_args)
+
     def test_apply_variables_to_simulation_method_args(self):
         ns = {
             'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
@@ -189,6 +219,35 @@ class UtilsTestCase(unittest.TestCase):
             validate_variables(model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
                                method_props, variables, target_sbml_id_map, target_sbml_fbc_id_map, sbml_fbc_uri)
 
+        # the ids of valid targets which are similar to the id of an invalid target are suggested
+        target = "/sbml:sbml/sbml:model/sbml:listOfSpecies/sbml:species[@id='R_ACALD_c']/@shadowPrice"
+        variables = [
+            Variable(target_namespaces=ns, target=target),
+        ]
+        with self.assertRaisesRegex(ValueError, r"R_ACALD_c'\]/@shadowPrice` \(similar valid ids: `R_ACALD`"):
+            validate_variables(model, active_objective_sbml_fbc_id, objective_sbml_fbc_ids,
+                               method_props, variables, {target: 'R_ACALD_c'}, {target: None}, sbml_fbc_uri)
+
+    def test_format_invalid_targets(self):
+        valid_ids = {'R_' + reaction.id: None for reaction in cobra.io.read_sbml_model(self.MODEL_FILENAME).reactions}
+        invalid_targets = ["/sbml:sbml/sbml:model/sbml:listOfSpecies/sbml:species[@id='M_{:02d}']".format(i) for i in range(25)]
+        target_id_map = {target: 'M_{:02d}'.format(i) for i, target in enumerate(invalid_targets)}
+        invalid_targets.append("/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='R_PGK_upper_bound']/@value")
+        target_id_map[invalid_targets[-1]] = 'R_PGK_upper_bound'
+        invalid_targets.append("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@fbc:id")
+        target_id_map[invalid_targets[-1]] = 'R_PGK'
+
+        # the list is limited to the first targets
+        lines = format_invalid_targets(invalid_targets, target_id_map, valid_ids).split('\n  - ')
+        self.assertEqual(len(lines), 11)
+        self.assertEqual(lines[0], "`/sbml:sbml/sbml:model/sbml:listOfParameters/sbml:parameter[@id='R_PGK_upper_bound']/@value` "
+                                   "(similar valid ids: `R_PGK`)")
+        self.assertEqual(lines[1], "`/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@fbc:id`")
+        self.assertEqual(lines[-1], 'and 17 more')
+
+        lines = format_invalid_targets(invalid_targets[-2:], target_id_map, valid_ids).split('\n  - ')
+        self.assertEqual(len(lines), 2)
+
     def test_get_results_of_variables(self):
         ns = {
             'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
@@ -225,6 +284,7 @@ class UtilsTestCase(unittest.TestCase):
 
         solution = mock.Mock(
             objective_value=1.0,
+            objective_values={'inactive_obj': 5.0},
             fluxes=mock.Mock(
                 get=lambda id: 2.0,
             ),
@@ -256,12 +316,71 @@ class UtilsTestCase(unittest.TestCase):
         result = get_results_of_variables(target_results_path_map, variables, solution)
         self.assertEqual(set(result.keys()), set(var.id for var in variables))
         numpy.testing.assert_allclose(result['obj'], numpy.array(1.0))
-        numpy.testing.assert_allclose(result['inactive_obj'], numpy.array(numpy.nan))
+        numpy.testing.assert_allclose(result['inactive_obj'], numpy.array(5.0))
         numpy.testing.assert_allclose(result['R_ACALD_flux'], numpy.array(2.0))
         numpy.testing.assert_allclose(result['R_ACALD_reduced_cost'], numpy.array(3.0))
         numpy.testing.assert_allclose(result['M_13dpg_c_shadow_price'], numpy.array(4.0))
 
+        solution = SlimSolution('optimal', reaction_index={'ACALD': 0, 'PGK': 1}, fluxes=numpy.array([2., 6.]),
+                                reduced_costs=numpy.array([3., 7.]), metabolite_index={'13dpg_c': 0},
+                                shadow_prices=numpy.array([4.]), objective_value=1.0)
+        result = get_results_of_variables(target_results_path_map, variables, solution)
+        numpy.testing.assert_allclose(result['R_ACALD_flux'], numpy.array(2.0))
+        numpy.testing.assert_allclose(result['inactive_obj'], numpy.array(numpy.nan))
+        self.assertEqual(sorted(result.blocks.keys()), ['fluxes', 'objective_values', 'reduced_costs', 'shadow_prices'])
+        self.assertEqual(result.offsets['R_ACALD_flux'], ('fluxes', 0))
+        self.assertTrue(numpy.shares_memory(result['R_ACALD_flux'], result.blocks['fluxes']))
+
         solution = model.optimize()
+        solution.objective_values = {'inactive_obj': 0.}
         target_results_path_map = get_results_paths_for_variables(
             model, 'obj', ['obj', 'inactive_obj'], method_props, variables, target_to_id, target_to_fbc_id)
         result = get_results_of_variables(target_results_path_map, variables, solution)
+        numpy.testing.assert_allclose(result['inactive_obj'], numpy.array(0.))
+
+    def test_get_required_results(self):
+        target_results_path_map = {
+            'obj': ('objective_value', None),
+            'inactive_obj': ('objective_values', ('inactive_obj',)),
+            'flux_1': ('fluxes', ('ACALD',)),
+            'flux_2': ('fluxes', ('PGK',)),
+            'flux_3': ('fluxes', ('ACALD',)),
+            'price': ('shadow_prices', ('13dpg_c',)),
+        }
+        self.assertEqual(get_required_results(target_results_path_map), {
+            'objective_value': set(),
+            'objective_values': set(['inactive_obj']),
+            'fluxes': set(['ACALD', 'PGK']),
+            'shadow_prices': set(['13dpg_c']),
+        })
+
+    def test_get_solution(self):
+        model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+        expected_solution = model.optimize()
+
+        solution = optimize(model, {'objective_value': set(), 'fluxes': set(['ACALD', 'PGK'])})
+        self.assertIsInstance(solution, SlimSolution)
+        self.assertEqual(solution.status, 'optimal')
+        self.assertAlmostEqual(solution.objective_value, expected_solution.objective_value)
+        self.assertEqual(solution.reaction_index, {'ACALD': 0, 'PGK': 1})
+        numpy.testing.assert_allclose(solution.get_result('fluxes', ('PGK',)), expected_solution.fluxes.get('PGK'))
+        self.assertEqual(solution.reduced_costs, None)
+        self.assertEqual(solution.shadow_prices, None)
+
+        solution = get_solution(model, {'reduced_costs': set(['THD2']), 'shadow_prices': set(['13dpg_c'])})
+        self.assertEqual(solution.fluxes, None)
+        numpy.testing.assert_allclose(solution.get_result('reduced_costs', ('THD2',)), expected_solution.reduced_costs.get('THD2'))
+        numpy.testing.assert_allclose(solution.get_result('shadow_prices', ('13dpg_c',)),
+                                      expected_solution.shadow_prices.get('13dpg_c'))
+
+        expected_solution = cobra.flux_analysis.pfba(model, fraction_of_optimum=0.9)
+        solution = pfba(model, {'fluxes': set(['ACALD', 'PGK']), 'reduced_costs': set(['THD2'])}, fraction_of_optimum=0.9)
+        numpy.testing.assert_allclose(solution.get_result('fluxes', ('PGK',)), expected_solution.fluxes.get('PGK'))
+        numpy.testing.assert_allclose(solution.get_result('reduced_costs', ('THD2',)), expected_solution.reduced_costs.get('THD2'))
+
+        # infeasible
+        model.reactions.get_by_id('EX_glc__D_e').lower_bound = 10.
+        solution = optimize(model, {'objective_value': set(), 'fluxes': set(['ACALD'])})
+        self.assertEqual(solution.status, 'infeasible')
+        self.assertTrue(numpy.isnan(solution.objective_value))
+        self.assertEqual(solution.fluxes, None)
@@ -0,0 +1,253 @@
+from biosimulators_cobrapy import pool
+from biosimulators_cobrapy import variability
+from biosimulators_cobrapy.timeouts import TimeLimitExceededError
+from unittest import mock
+import cobra
+import numpy
+import numpy.testing
+import os
+import time
+import unittest
+
+
+class VariabilityTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+    REACTION_IDS = ['ACALD', 'PGK', 'TALA', 'THD2']
+
+    def setUp(self):
+        self.model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+
+    def tearDown(self):
+        pool.close_worker_pools()
+
+    def test_flux_variability_analysis(self):
+        expected_solution = cobra.flux_analysis.flux_variability_analysis(self.model)
+
+        solution = variability.flux_variability_analysis(self.model, processes=1)
+        self.assertEqual(list(solution.index), [reaction.id for reaction in self.model.reactions])
+        numpy.testing.assert_allclose(solution.values, expected_solution.loc[solution.index].values, atol=1e-8)
+
+        solution = variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, processes=2,
+                                                         model_key='textbook')
+        self.assertEqual(list(solution.index), self.REACTION_IDS)
+        numpy.testing.assert_allclose(solution.values, expected_solution.loc[self.REACTION_IDS].values, atol=1e-8)
+
+        # the model isn't modified
+        self.assertEqual(self.model.objective.direction, 'max')
+        self.assertAlmostEqual(self.model.slim_optimize(), expected_solution.loc['Biomass_Ecoli_core', 'maximum'])
+
+    def test_flux_variability_analysis_scheduler_stats(self):
+        solution = variability.flux_variability_analysis(self.model, processes=2, model_key='textbook', prepass=False)
+        stats = solution.attrs['scheduler']
+        self.assertEqual(stats['processes'], 2)
+        self.assertEqual(sum(worker['chunks'] for worker in stats['workers']), stats['chunks'])
+        self.assertEqual(sum(worker['reactions'] for worker in stats['workers']), len(self.model.reactions))
+        self.assertGreater(stats['chunks'], 2)
+        for worker in stats['workers']:
+            self.assertGreater(worker['busyTime'], 0.)
+            self.assertGreater(worker['utilization'], 0.)
+        self.assertFalse(numpy.any(numpy.isnan(solution.values)))
+
+        solution = variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, processes=1,
+                                                         prepass=False)
+        stats = solution.attrs['scheduler']
+        self.assertEqual(stats['chunks'], 1)
+        self.assertEqual(len(stats['workers']), 1)
+        self.assertEqual(stats['workers'][0]['reactions'], len(self.REACTION_IDS))
+
+    def test_flux_variability_analysis_prepass(self):
+        self.model.reactions.get_by_id('PGK').bounds = (-5., -5.)
+        for kw_args in [{}, {'fraction_of_optimum': 0.9}, {'fraction_of_optimum': 0.9, 'pfba_factor': 1.1}]:
+            expected_solution = cobra.flux_analysis.flux_variability_analysis(self.model, **kw_args)
+
+            for processes in [1, 2]:
+                solution = variability.flux_variability_analysis(self.model, processes=processes, model_key='textbook',
+                                                                 **kw_args)
+                numpy.testing.assert_allclose(solution.values, expected_solution.loc[solution.index].values, atol=1e-6)
+
+                stats = solution.attrs['prepass']
+                self.assertEqual(stats['fixedReactions'], 1)
+                self.assertEqual(stats['blockedReactions'], 8 if kw_args else 19)
+                self.assertGreater(stats['savedLps'], 0)
+                num_solved_reactions = sum(worker['reactions'] for worker in solution.attrs['scheduler']['workers'])
+                self.assertLess(num_solved_reactions, len(self.model.reactions))
+
+        # at the optimum, all of the blocked reactions which can only carry flux in one direction are found
+        solution = variability.flux_variability_analysis(self.model, processes=1)
+        stats = solution.attrs['prepass']
+        expected_solution = cobra.flux_analysis.flux_variability_analysis(self.model)
+        blocked = (expected_solution['minimum'].abs() < 1e-9) & (expected_solution['maximum'].abs() < 1e-9)
+        irreversible = [reaction.id for reaction in self.model.reactions
+                        if reaction.lower_bound != reaction.upper_bound and (
+                            reaction.lower_bound >= 0. or reaction.upper_bound <= 0.)]
+        self.assertEqual(stats['blockedReactions'], int(blocked[irreversible].sum()))
+
+        # the model isn't modified
+        self.assertEqual(len(self.model.variables), 2 * len(self.model.reactions))
+        self.assertEqual(self.model.objective.direction, 'max')
+
+    def test_get_variability_chunks(self):
+        reactions = [reaction.id for reaction in self.model.reactions]
+        costs = [variability.get_variability_cost(reaction) for reaction in self.model.reactions]
+        self.assertEqual(variability.get_variability_cost(self.model.reactions.get_by_id('ATPM')), 1. + sum(
+            len(metabolite.reactions) for metabolite in self.model.reactions.get_by_id('ATPM').metabolites))
+        self.model.reactions.get_by_id('PGK').bounds = (1., 1.)
+        self.assertEqual(variability.get_variability_cost(self.model.reactions.get_by_id('PGK')), 1.)
+
+        for processes in [1, 4, 32]:
+            chunks = variability.get_variability_chunks(reactions, costs, processes)
+            self.assertEqual(sorted(reaction for chunk in chunks for reaction in chunk), sorted(reactions))
+            self.assertLessEqual(len(chunks), variability.MAX_CHUNKS_PER_PROCESS * processes)
+
+            # the most costly reactions are handed out first, and the chunks get smaller
+            self.assertEqual(chunks[0][0], reactions[int(numpy.argmax(costs))])
+            chunk_sizes = [len(chunk) for chunk in chunks]
+            self.assertEqual(chunk_sizes, sorted(chunk_sizes, reverse=True))
+
+    def test_flux_variability_analysis_with_arguments(self):
+        self.model.reactions.get_by_id('EX_glc__D_e').lower_bound = -5.
+        expected_solution = cobra.flux_analysis.flux_variability_analysis(
+            self.model, reaction_list=self.REACTION_IDS, fraction_of_optimum=0.9, pfba_factor=1.1)
+
+        for processes in [1, 2]:
+            solution = variability.flux_variability_analysis(
+                self.model, reaction_list=self.REACTION_IDS, fraction_of_optimum=0.9, pfba_factor=1.1,
+                processes=processes, model_key='textbook')
+            numpy.testing.assert_allclose(solution.values, expected_solution.loc[self.REACTION_IDS].values, atol=1e-8)
+
+    def test_flux_variability_analysis_reuses_workers(self):
+        solution = variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, processes=2,
+                                                         model_key='textbook')
+        worker_pool = pool.get_worker_pool(2)
+        self.assertEqual(len(worker_pool._pushed_problems), 1)
+
+        # changes to the bounds of the model are sent to the workers rather than the model
+        self.model.reactions.get_by_id('EX_glc__D_e').lower_bound = -5.
+        solution_2 = variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, processes=2,
+                                                           model_key='textbook')
+        self.assertEqual(len(worker_pool._pushed_problems), 1)
+
+        expected_solution_2 = cobra.flux_analysis.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS)
+        numpy.testing.assert_allclose(solution_2.values, expected_solution_2.loc[self.REACTION_IDS].values, atol=1e-8)
+        self.assertFalse(numpy.allclose(solution.values, solution_2.values))
+
+        # changes to the structure of the model are pushed
+        variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, processes=2,
+                                              pfba_factor=1.1, model_key='textbook')
+        self.assertEqual(len(worker_pool._pushed_problems), 2)
+
+    def test_flux_variability_analysis_infeasible(self):
+        self.model.reactions.get_by_id('EX_glc__D_e').lower_bound = 10.
+        with self.assertRaises(cobra.exceptions.OptimizationError):
+            variability.flux_variability_analysis(self.model, processes=1)
+
+    def test_flux_variability_analysis_with_deadline(self):
+        expected_solution = cobra.flux_analysis.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS)
+
+        solution = variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS,
+                                                         deadline=time.monotonic() + 60.)
+        numpy.testing.assert_allclose(solution.values, expected_solution.loc[self.REACTION_IDS].values, atol=1e-8)
+        self.assertEqual(self.model.solver.configuration.timeout, None)
+
+        # the budget runs out after the first reaction
+        with mock.patch.object(variability, 'is_expired', side_effect=[False, False, True]):
+            with self.assertRaisesRegex(TimeLimitExceededError, '1 of 4 reactions') as exception_context:
+                variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS,
+                                                      deadline=time.monotonic() + 60., prepass=False)
+        solution = exception_context.exception.partial_solution
+        self.assertEqual(list(solution.index), self.REACTION_IDS)
+        numpy.testing.assert_allclose(solution.loc[['ACALD']].values, expected_solution.loc[['ACALD']].values, atol=1e-8)
+        self.assertTrue(numpy.all(numpy.isnan(solution.loc[['PGK', 'TALA', 'THD2']].values)))
+
+        # the budget ran out before the analysis started
+        with self.assertRaisesRegex(TimeLimitExceededError, '0 of 4 reactions') as exception_context:
+            variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS, processes=2,
+                                                  deadline=time.monotonic() - 1.)
+        self.assertTrue(numpy.all(numpy.isnan(exception_context.exception.partial_solution.values)))
+
+    def test_loopless_flux_variability_analysis(self):
+        reaction_ids = ['FRD7', 'PGK', 'SUCDi']
+        solution = variability.flux_variability_analysis(self.model, reaction_list=reaction_ids, fraction_of_optimum=0.9)
+        self.assertEqual(solution.loc['SUCDi', 'maximum'], 1000.)
+
+        solutions = {}
+        for method in ['cycleFreeFlux', 'fastSNP']:
+            expected_solution = cobra.flux_analysis.flux_variability_analysis(
+                self.model, reaction_list=reaction_ids, fraction_of_optimum=0.9, loopless=method)
+            solutions[method] = variability.flux_variability_analysis(self.model, reaction_list=reaction_ids,
+                                                                      fraction_of_optimum=0.9, loopless=method)
+            numpy.testing.assert_allclose(solutions[method].values, expected_solution.loc[reaction_ids].values, atol=1e-6)
+
+            # the loop between FRD7 and SUCDi is removed
+            self.assertLess(solutions[method].loc['SUCDi', 'maximum'], 1000.)
+
+        # `True` is CycleFreeFlux
+        solution = variability.flux_variability_analysis(self.model, reaction_list=reaction_ids,
+                                                         fraction_of_optimum=0.9, loopless=True)
+        numpy.testing.assert_allclose(solution.values, solutions['cycleFreeFlux'].values, atol=1e-6)
+
+        with self.assertRaisesRegex(ValueError, 'not a loopless method'):
+            variability.flux_variability_analysis(self.model, loopless='unknown')
+
+    def test_get_loopless_method(self):
+        self.assertEqual(variability.get_loopless_method(False), None)
+        self.assertEqual(variability.get_loopless_method(None), None)
+        self.assertEqual(variability.get_loopless_method(True), 'cycleFreeFlux')
+        self.assertEqual(variability.get_loopless_method('fastSNP'), 'fastSNP')
+        with self.assertRaisesRegex(ValueError, 'not a loopless method'):
+            variability.get_loopless_method('original')
+
+    def test_loopless_flux_variability_analysis_with_deadline(self):
+        expected_solution = cobra.flux_analysis.flux_variability_analysis(
+            self.model, reaction_list=self.REACTION_IDS, loopless='cycleFreeFlux')
+
+        solution = variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS,
+                                                         loopless='cycleFreeFlux', deadline=time.monotonic() + 60.)
+        numpy.testing.assert_allclose(solution.values, expected_solution.loc[self.REACTION_IDS].values, atol=1e-8)
+
+        # the budget runs out after the first batch
+        with mock.patch.object(variability, 'LOOPLESS_FVA_BATCH_SIZE', 2):
+            with mock.patch.object(variability, 'is_expired', side_effect=[False, True]):
+                with self.assertRaisesRegex(TimeLimitExceededError, '2 of 4 reactions') as exception_context:
+                    variability.flux_variability_analysis(self.model, reaction_list=self.REACTION_IDS,
+                                                          loopless='cycleFreeFlux', deadline=time.monotonic() + 60.)
+        solution = exception_context.exception.partial_solution
+        self.assertEqual(list(solution.index), self.REACTION_IDS)
+        numpy.testing.assert_allclose(solution.loc[['ACALD', 'PGK']].values, expected_solution.loc[['ACALD', 'PGK']].values,
+                                      atol=1e-8)
+        self.assertTrue(numpy.all(numpy.isnan(solution.loc[['TALA', 'THD2']].values)))
+
+    def test_geometric_fba(self):
+        expected_solution = cobra.flux_analysis.geometric_fba(self.model)
+
+        solution = variability.geometric_fba(self.model, processes=1)
+        numpy.testing.assert_allclose(solution.fluxes.values, expected_solution.fluxes.loc[solution.fluxes.index].values,
+                                      atol=1e-8)
+
+        solution = variability.geometric_fba(self.model, processes=2, model_key='textbook')
+        numpy.testing.assert_allclose(solution.fluxes.values, expected_solution.fluxes.loc[solution.fluxes.index].values,
+                                      atol=1e-8)
+
+        # the problems of the iterations are pushed to the workers once
+        worker_pool = pool.get_worker_pool(2)
+        num_pushed_problems = len(worker_pool._pushed_problems)
+        self.assertEqual(num_pushed_problems, 2)
+        variability.geometric_fba(self.model, processes=2, model_key='textbook')
+        self.assertEqual(len(worker_pool._pushed_problems), num_pushed_problems)
+
+        # the model isn't modified
+        self.assertEqual(len(self.model.variables), 2 * len(self.model.reactions))
+
+        # problems whose objectives were folded into constraints with the same names aren't confused
+        with self.model:
+            self.model.objective = 'ATPM'
+            expected_solution = cobra.flux_analysis.geometric_fba(self.model)
+            solution = variability.geometric_fba(self.model, processes=2, model_key='textbook')
+        numpy.testing.assert_allclose(solution.fluxes.values, expected_solution.fluxes.loc[solution.fluxes.index].values,
+                                      atol=1e-8)
+
+        with self.assertRaisesRegex(RuntimeError, 'exceeded the maximum'):
+            variability.geometric_fba(self.model, max_tries=1)
+
+        with self.assertRaisesRegex(TimeLimitExceededError, 'geometric FBA'):
+            variability.geometric_fba(self.model, deadline=time.monotonic() - 1.)
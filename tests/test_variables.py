@@ -0,0 +1,176 @@
+""" Tests of the index of the targets of variables
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-19
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_cobrapy import core
+from biosimulators_cobrapy.data_model import KISAO_ALGORITHMS_PARAMETERS_MAP
+from biosimulators_cobrapy.utils import get_results_paths_for_variables
+from biosimulators_cobrapy.variables import VariableTargetIndex
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.sedml import validation
+from lxml import etree
+from unittest import mock
+import cobra.io
+import os
+import unittest
+
+
+class VariableTargetIndexTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'textbook.xml')
+    NAMESPACES = {
+        'sbml': 'http://www.sbml.org/sbml/level3/version1/core',
+        'fbc': 'http://www.sbml.org/sbml/level3/version1/fbc/version2',
+    }
+    FBC_URI = 'http://www.sbml.org/sbml/level3/version1/fbc/version2'
+
+    def setUp(self):
+        self.model = cobra.io.read_sbml_model(self.MODEL_FILENAME)
+        self.model_etree = etree.parse(self.MODEL_FILENAME)
+        self.index = VariableTargetIndex(self.model, self.model_etree, self.FBC_URI, 'obj')
+
+    def _resolve_target(self, target, namespaces=None):
+        variable = sedml_data_model.Variable(target=target, target_namespaces=namespaces or self.NAMESPACES)
+        return self.index.resolve_target(variable)
+
+    def test_index(self):
+        self.assertEqual(self.index.sbml_uri, self.NAMESPACES['sbml'])
+        self.assertEqual(len(self.index.reactions), len(self.model.reactions))
+        self.assertEqual(self.index.reactions['R_PGK'], self.model.reactions.get_by_id('PGK'))
+        self.assertEqual(len(self.index.species), len(self.model.metabolites))
+        self.assertEqual(self.index.species['M_atp_c'], self.model.metabolites.get_by_id('atp_c'))
+        self.assertEqual(self.index.objective_sbml_fbc_ids, set(['obj', 'inactive_obj']))
+
+    def test_resolve_target(self):
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux"),
+            ('reaction', 'R_PGK', None, 'flux'))
+        self.assertEqual(
+            self._resolve_target('/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id="R_PGK"]'),
+            ('reaction', 'R_PGK', None, None))
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfSpecies/sbml:species[@id='M_atp_c']/@shadowPrice"),
+            ('species', 'M_atp_c', None, 'shadowPrice'))
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj']/@value"),
+            ('objective', None, 'obj', 'value'))
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@fbc:flux"),
+            ('reaction', 'R_PGK', None, 'flux'))
+
+        # other prefixes of namespaces
+        self.assertEqual(
+            self._resolve_target("/core:sbml/core:model/core:listOfReactions/core:reaction[@id='R_PGK']/@flux",
+                                 {'core': self.NAMESPACES['sbml']}),
+            ('reaction', 'R_PGK', None, 'flux'))
+
+        # targets which aren't resolved
+        self.assertEqual(self._resolve_target(None), None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_UNKNOWN']/@flux"),
+            None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@name='PGK']/@flux"),
+            None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='M_atp_c']/@flux"),
+            None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux",
+                                 {'sbml': 'http://www.sbml.org/sbml/level2'}),
+            None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@other:flux",
+                                 dict(other='http://other', **self.NAMESPACES)),
+            None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@id='obj']"),
+            None)
+        self.assertEqual(
+            self._resolve_target("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='obj2']"),
+            None)
+
+    def test_get_results_path_matches_xpaths(self):
+        """ The results paths of the targets of all of the model objects for all of the methods match those obtained by
+        evaluating the XPaths of the targets and enumerating the targets of the methods """
+        objective_sbml_fbc_ids = sorted(self.index.objective_sbml_fbc_ids)
+        targets = []
+        for attr in ['', '/@flux', '/@reducedCost', '/@minFlux', '/@maxFlux', '/@shadowPrice']:
+            for reaction in self.model.reactions:
+                targets.append("/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_{}']{}".format(
+                    reaction.id, attr))
+            for metabolite in self.model.metabolites:
+                targets.append("/sbml:sbml/sbml:model/sbml:listOfSpecies/sbml:species[@id='M_{}']{}".format(
+                    metabolite.id, attr))
+        for attr in ['', '/@value']:
+            for objective_sbml_fbc_id in objective_sbml_fbc_ids:
+                targets.append("/sbml:sbml/sbml:model/fbc:listOfObjectives/fbc:objective[@fbc:id='{}']{}".format(
+                    objective_sbml_fbc_id, attr))
+        variables = [sedml_data_model.Variable(target=target, target_namespaces=self.NAMESPACES) for target in targets]
+
+        target_sbml_id_map = validation.validate_target_xpaths(variables, self.model_etree, attr='id')
+        target_sbml_fbc_id_map = validation.validate_target_xpaths(variables, self.model_etree, attr={
+            'namespace': {'prefix': 'fbc', 'uri': self.FBC_URI},
+            'name': 'id',
+        })
+
+        num_supported = 0
+        for method in KISAO_ALGORITHMS_PARAMETERS_MAP.values():
+            for variable in variables:
+                resolved_target = self.index.resolve_target(variable)
+                self.assertEqual(resolved_target[1:3],
+                                 (target_sbml_id_map[variable.target], target_sbml_fbc_id_map[variable.target]))
+
+                results_path = self.index.get_results_path(method, resolved_target)
+                try:
+                    expected_results_path = get_results_paths_for_variables(
+                        self.model, 'obj', objective_sbml_fbc_ids, method, [variable],
+                        target_sbml_id_map, target_sbml_fbc_id_map)[variable.target]
+                    num_supported += 1
+                except KeyError:
+                    expected_results_path = None
+                self.assertEqual(results_path, expected_results_path)
+        self.assertGreater(num_supported, 0)
+
+    def test_preprocess_sed_task(self):
+        task = sedml_data_model.Task(
+            model=sedml_data_model.Model(source=self.MODEL_FILENAME, language=sedml_data_model.ModelLanguage.SBML.value),
+            simulation=sedml_data_model.SteadyStateSimulation(
+                algorithm=sedml_data_model.Algorithm(kisao_id='KISAO_0000526')),
+        )
+        variables = [
+            sedml_data_model.Variable(
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@minFlux",
+                target_namespaces=self.NAMESPACES),
+            sedml_data_model.Variable(
+                target="/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@name='transaldolase']/@maxFlux",
+                target_namespaces=self.NAMESPACES),
+        ]
+
+        # only the XPaths of the targets which aren't resolved with the index are evaluated
+        with mock.patch.object(validation, 'validate_target_xpaths',
+                               side_effect=validation.validate_target_xpaths) as validate_target_xpaths:
+            preprocessed_task = core.preprocess_sed_task(task, variables)
+        for call in validate_target_xpaths.call_args_list[-2:]:
+            self.assertEqual(call.args[0], variables[1:])
+
+        self.assertEqual(preprocessed_task['model']['variable_target_results_path_map'], {
+            variables[0].target: ('minimum', ('PGK',)),
+            variables[1].target: ('maximum', ('TALA',)),
+        })
+        self.assertEqual(preprocessed_task['model']['variable_xpath_sbml_id_map'], {
+            variables[0].target: 'R_PGK',
+            variables[1].target: 'R_TALA',
+        })
+
+        # targets which the method doesn't support are reported as before
+        variables[0].target = "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_PGK']/@flux"
+        with self.assertRaisesRegex(ValueError, "doesn't support variables with the following target XPaths"):
+            core.preprocess_sed_task(task, variables)
+
+        variables[0].target = "/sbml:sbml/sbml:model/sbml:listOfReactions/sbml:reaction[@id='R_UNKNOWN']/@minFlux"
+        with self.assertRaisesRegex(ValueError, 'XPaths must reference unique objects'):
+            core.preprocess_sed_task(task, variables)